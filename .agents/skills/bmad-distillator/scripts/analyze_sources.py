@@ -32,6 +32,8 @@ import json
 import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 # Extensions to include when scanning folders
@@ -79,42 +81,115 @@ GROUP_PATTERNS = [
 ]
 
 
-def resolve_inputs(inputs: list[str]) -> list[Path]:
-    """Resolve input arguments to a flat list of file paths."""
-    files: list[Path] = []
-    for inp in inputs:
-        path = Path(inp)
-        if path.is_file():
-            files.append(path.resolve())
-        elif path.is_dir():
-            for root, dirs, filenames in os.walk(path):
-                dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-                for fn in sorted(filenames):
-                    fp = Path(root) / fn
-                    if fp.suffix.lower() in INCLUDE_EXTENSIONS:
-                        files.append(fp.resolve())
-        else:
-            # Try as glob
-            matches = glob.glob(inp, recursive=True)
-            for m in sorted(matches):
-                mp = Path(m)
-                if mp.is_file() and mp.suffix.lower() in INCLUDE_EXTENSIONS:
-                    files.append(mp.resolve())
+# Worker threads for directory scans and stat calls (I/O bound, so threads scale fine)
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_DOC_TYPE_REGEXES = [(re.compile(pattern), doc_type) for pattern, doc_type in DOC_TYPE_PATTERNS]
+_GROUP_REGEXES = [(re.compile(pattern, re.IGNORECASE), base) for pattern, base in GROUP_PATTERNS]
+
+
+def _scan_directory(directory: Path) -> tuple[list[tuple[Path, int]], list[Path]]:
+    """List one directory the way os.walk would: (name-sorted matching files with sizes, subdirs to descend)."""
+    named: list[tuple[str, Path, int]] = []
+    subdirs: list[Path] = []
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return [], subdirs
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if entry.name not in SKIP_DIRS and not entry.is_symlink():
+                subdirs.append(directory / entry.name)
+            continue
+        if Path(entry.name).suffix.lower() not in INCLUDE_EXTENSIONS:
+            continue
+        # DirEntry.stat() is served from the directory listing on Windows; symlinks still resolve to their target
+        fp = Path(entry.path).resolve() if entry.is_symlink() else directory / entry.name
+        try:
+            size = entry.stat().st_size
+        except OSError:
+            size = -1
+        named.append((entry.name, fp, size))
+    named.sort(key=lambda item: item[0])
+    return [(fp, size) for _, fp, size in named], subdirs
+
+
+def _walk_tree(root: Path, pool: ThreadPoolExecutor) -> list[tuple[Path, int]]:
+    """Scan every directory under root concurrently, then emit files in os.walk (top-down) order."""
+    scans: dict[Path, Future] = {root: pool.submit(_scan_directory, root)}
+    discovery = deque([root])
+    while discovery:
+        _, subdirs = scans[discovery.popleft()].result()
+        for sub in subdirs:
+            scans[sub] = pool.submit(_scan_directory, sub)
+            discovery.append(sub)
+
+    collected: list[tuple[Path, int]] = []
+    stack = [root]
+    while stack:
+        files, subdirs = scans[stack.pop()].result()
+        collected.extend(files)
+        stack.extend(reversed(subdirs))
+    return collected
+
+
+def _stat_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return -1
+
+
+def collect_file_sizes(inputs: list[str]) -> list[tuple[Path, int]]:
+    """Resolve inputs to deduplicated (path, size_bytes) pairs, scanning folders and stat-ing files in a thread pool."""
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        pending: list[list[tuple[Path, int]] | tuple[Path, Future]] = []
+        for inp in inputs:
+            path = Path(inp)
+            if path.is_file():
+                fp = path.resolve()
+                pending.append((fp, pool.submit(_stat_size, fp)))
+            elif path.is_dir():
+                pending.append(_walk_tree(path.resolve(), pool))
+            else:
+                # Try as glob
+                for m in sorted(glob.glob(inp, recursive=True)):
+                    mp = Path(m)
+                    if mp.is_file() and mp.suffix.lower() in INCLUDE_EXTENSIONS:
+                        fp = mp.resolve()
+                        pending.append((fp, pool.submit(_stat_size, fp)))
+
+        files: list[tuple[Path, int]] = []
+        for item in pending:
+            if isinstance(item, tuple):
+                files.append((item[0], item[1].result()))
+            else:
+                files.extend(item)
+
     # Deduplicate while preserving order
     seen: set[Path] = set()
-    deduped: list[Path] = []
-    for f in files:
+    deduped: list[tuple[Path, int]] = []
+    for f, size in files:
         if f not in seen:
             seen.add(f)
-            deduped.append(f)
+            deduped.append((f, size))
     return deduped
 
 
+def resolve_inputs(inputs: list[str]) -> list[Path]:
+    """Resolve input arguments to a flat list of file paths."""
+    return [f for f, _ in collect_file_sizes(inputs)]
+
+
 def detect_doc_type(filename: str) -> str:
     """Detect document type from filename."""
     name_lower = filename.lower()
-    for pattern, doc_type in DOC_TYPE_PATTERNS:
-        if re.search(pattern, name_lower):
+    for pattern, doc_type in _DOC_TYPE_REGEXES:
+        if pattern.search(name_lower):
             return doc_type
     return "unknown"
 
@@ -133,11 +208,11 @@ def suggest_groups(files: list[Path]) -> list[dict]:
             continue
 
         matched = False
-        for pattern, base_pattern in GROUP_PATTERNS:
-            m = re.match(pattern, f.name, re.IGNORECASE)
+        for pattern, base_pattern in _GROUP_REGEXES:
+            m = pattern.match(f.name)
             if m:
                 # This file is a companion — find its base
-                base_name = re.sub(pattern, base_pattern, f.name, flags=re.IGNORECASE)
+                base_name = pattern.sub(base_pattern, f.name)
                 group_key = base_name
                 if group_key not in groups:
                     groups[group_key] = []
@@ -185,7 +260,8 @@ def suggest_groups(files: list[Path]) -> list[dict]:
 
 def analyze(inputs: list[str], output_path: str | None = None) -> None:
     """Main analysis function."""
-    files = resolve_inputs(inputs)
+    sized_files = collect_file_sizes(inputs)
+    files = [f for f, _ in sized_files]
 
     if not files:
         result = {
@@ -199,8 +275,9 @@ def analyze(inputs: list[str], output_path: str | None = None) -> None:
     # Analyze each file
     file_details = []
     total_chars = 0
-    for f in files:
-        size = f.stat().st_size
+    for f, size in sized_files:
+        if size < 0:
+            size = f.stat().st_size
         total_chars += size
         file_details.append({
             "path": str(f),
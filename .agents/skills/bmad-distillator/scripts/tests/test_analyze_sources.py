@@ -13,6 +13,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from analyze_sources import (
+    collect_file_sizes,
     resolve_inputs,
     detect_doc_type,
     suggest_groups,
@@ -93,6 +94,27 @@ class TestResolveInputs:
         result = resolve_inputs(["/nonexistent/path/file.md"])
         assert len(result) == 0
 
+    def test_folder_order_matches_os_walk(self, temp_dir):
+        for sub in ("b", "a", "a/deep", "c"):
+            (Path(temp_dir) / sub).mkdir(parents=True, exist_ok=True)
+            (Path(temp_dir) / sub / "z.md").write_text("z")
+            (Path(temp_dir) / sub / "y.yaml").write_text("y")
+        expected = []
+        for root, dirs, filenames in os.walk(temp_dir):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for fn in sorted(filenames):
+                fp = Path(root) / fn
+                if fp.suffix.lower() in INCLUDE_EXTENSIONS:
+                    expected.append(fp.resolve())
+        assert resolve_inputs([temp_dir]) == expected
+
+    def test_collect_file_sizes_reports_stat_sizes(self, temp_dir):
+        (Path(temp_dir) / "sized.md").write_text("x" * 123)
+        sizes = dict(collect_file_sizes([temp_dir, str(Path(temp_dir) / "subdir" / "prd-v2.md")]))
+        for path, size in sizes.items():
+            assert size == path.stat().st_size
+        assert sizes[(Path(temp_dir) / "sized.md").resolve()] == 123
+
 
 class TestDetectDocType:
     @pytest.mark.parametrize("filename,expected", [
@@ -5,8 +5,14 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import struct
+import tempfile
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 from PIL import Image
 
@@ -59,7 +65,8 @@ def placement_xy(prop: dict[str, Any], width: int, height: int) -> tuple[int, in
     return round(left), round(top)
 
 
-def paste_prop(canvas: Image.Image, prop: dict[str, Any], roots: list[Path]) -> dict[str, Any]:
+def resolve_placement(prop: dict[str, Any], roots: list[Path]) -> dict[str, Any]:
+    """Validate one placement and compute its box without decoding pixels (only the image header is read)."""
     image_key = prop.get("image") or prop.get("path")
     if not image_key:
         raise ValueError(f"Prop is missing image/path: {prop}")
@@ -67,33 +74,279 @@ def paste_prop(canvas: Image.Image, prop: dict[str, Any], roots: list[Path]) ->
     if not image_path.exists():
         raise FileNotFoundError(f"Prop image not found: {image_path}")
 
-    img = Image.open(image_path).convert("RGBA")
-    width = int(prop.get("w", prop.get("width", img.width)))
-    height = int(prop.get("h", prop.get("height", img.height)))
+    with Image.open(image_path) as img:
+        native_size = img.size
+    width = int(prop.get("w", prop.get("width", native_size[0])))
+    height = int(prop.get("h", prop.get("height", native_size[1])))
     if width <= 0 or height <= 0:
         raise ValueError(f"Invalid prop size for {image_path}: {width}x{height}")
-    if (width, height) != img.size:
-        img = img.resize((width, height), Image.Resampling.LANCZOS)
-
-    opacity = float(prop.get("opacity", 1.0))
-    if opacity < 1:
-        alpha = img.getchannel("A").point(lambda value: int(value * max(0.0, min(1.0, opacity))))
-        img.putalpha(alpha)
 
     left, top = placement_xy(prop, width, height)
-    canvas.alpha_composite(img, (left, top))
     return {
-        "id": prop.get("id", image_path.stem),
-        "image": str(image_path),
+        "image_path": str(image_path),
+        "width": width,
+        "height": height,
+        "opacity": float(prop.get("opacity", 1.0)),
         "left": left,
         "top": top,
-        "w": width,
-        "h": height,
-        "sortY": prop.get("sortY", prop.get("y", top + height)),
-        "layer": prop.get("layer", "props"),
+        "report": {
+            "id": prop.get("id", image_path.stem),
+            "image": str(image_path),
+            "left": left,
+            "top": top,
+            "w": width,
+            "h": height,
+            "sortY": prop.get("sortY", prop.get("y", top + height)),
+            "layer": prop.get("layer", "props"),
+        },
     }
 
 
+_PROP_CACHE: OrderedDict[tuple[str, int, int, float], Image.Image] = OrderedDict()
+_PROP_CACHE_BYTES = 0
+_PROP_CACHE_LIMIT = 256 * 1024 * 1024
+
+
+def _init_worker(cache_limit_bytes: int) -> None:
+    global _PROP_CACHE_LIMIT
+    _PROP_CACHE_LIMIT = cache_limit_bytes
+
+
+def load_prop_image(spec: dict[str, Any]) -> Image.Image:
+    """Decode, resize and fade a prop once per process; evict least recently used images past the byte budget."""
+    global _PROP_CACHE_BYTES
+    key = (spec["image_path"], spec["width"], spec["height"], spec["opacity"])
+    cached = _PROP_CACHE.get(key)
+    if cached is not None:
+        _PROP_CACHE.move_to_end(key)
+        return cached
+
+    img = Image.open(spec["image_path"]).convert("RGBA")
+    if (spec["width"], spec["height"]) != img.size:
+        img = img.resize((spec["width"], spec["height"]), Image.Resampling.LANCZOS)
+    opacity = spec["opacity"]
+    if opacity < 1:
+        alpha = img.getchannel("A").point(lambda value: int(value * max(0.0, min(1.0, opacity))))
+        img.putalpha(alpha)
+
+    _PROP_CACHE[key] = img
+    _PROP_CACHE_BYTES += img.width * img.height * 4
+    while _PROP_CACHE_BYTES > _PROP_CACHE_LIMIT and len(_PROP_CACHE) > 1:
+        _, evicted = _PROP_CACHE.popitem(last=False)
+        _PROP_CACHE_BYTES -= evicted.width * evicted.height * 4
+    return img
+
+
+def build_tile_index(
+    specs: list[dict[str, Any]], width: int, height: int, tile_size: int
+) -> dict[tuple[int, int], list[int]]:
+    """Spatial hash from (tile column, tile row) to the z-ordered placements overlapping that tile."""
+    index: dict[tuple[int, int], list[int]] = {}
+    for order, spec in enumerate(specs):
+        x0 = max(0, spec["left"])
+        y0 = max(0, spec["top"])
+        x1 = min(width, spec["left"] + spec["width"])
+        y1 = min(height, spec["top"] + spec["height"])
+        if x0 >= x1 or y0 >= y1:
+            continue
+        for row in range(y0 // tile_size, (y1 - 1) // tile_size + 1):
+            for col in range(x0 // tile_size, (x1 - 1) // tile_size + 1):
+                index.setdefault((col, row), []).append(order)
+    return index
+
+
+def tile_name(box: tuple[int, int, int, int], tile_size: int) -> str:
+    return f"tile-{box[1] // tile_size:04d}-{box[0] // tile_size:04d}"
+
+
+def iter_tile_boxes(width: int, height: int, tile_size: int) -> Iterator[tuple[int, int, int, int]]:
+    for top in range(0, height, tile_size):
+        for left in range(0, width, tile_size):
+            yield left, top, min(width, left + tile_size), min(height, top + tile_size)
+
+
+def split_base(base_path: Path, tile_size: int, work_dir: Path) -> tuple[int, int]:
+    """Store the base map as one raw RGBA file per tile under ``work_dir`` and return its size.
+
+    Pillow decodes a PNG as a whole, so this is the one step that holds the full base (in its own mode;
+    tiles are converted to RGBA one at a time). The decoded image is released before compositing starts.
+    """
+    with Image.open(base_path) as img:
+        width, height = img.size
+        for box in iter_tile_boxes(width, height, tile_size):
+            tile = img.crop(box)
+            if tile.mode != "RGBA":
+                tile = tile.convert("RGBA")
+            (work_dir / f"{tile_name(box, tile_size)}.rgba").write_bytes(tile.tobytes())
+    return width, height
+
+
+def read_base_tile(work_dir: Path, box: tuple[int, int, int, int], tile_size: int) -> Image.Image:
+    data = (work_dir / f"{tile_name(box, tile_size)}.rgba").read_bytes()
+    return Image.frombytes("RGBA", (box[2] - box[0], box[3] - box[1]), data)
+
+
+def render_tile(
+    job: tuple[tuple[int, int, int, int], str, int, list[dict[str, Any]]],
+) -> tuple[tuple[int, int, int, int], bytes]:
+    box, work_dir, tile_size, specs = job
+    left, top = box[:2]
+    tile = read_base_tile(Path(work_dir), box, tile_size)
+    for spec in specs:
+        tile.alpha_composite(load_prop_image(spec), (spec["left"] - left, spec["top"] - top))
+    return box, tile.tobytes()
+
+
+class PngRowWriter:
+    """Write an 8-bit RGBA PNG a band of rows at a time, so the full image is never held in memory.
+
+    Rows use PNG filter type 0 (none); the file is written next to ``path`` and moved into place on close.
+    """
+
+    IDAT_BYTES = 1 << 20
+
+    def __init__(self, path: Path, width: int, height: int) -> None:
+        self.path = path
+        self.width = width
+        self.part = path.with_name(path.name + ".part")
+        self.handle = self.part.open("wb")
+        self.compressor = zlib.compressobj(6)
+        self.pending = bytearray()
+        self.handle.write(b"\x89PNG\r\n\x1a\n")
+        self._chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+
+    def _chunk(self, kind: bytes, data: bytes) -> None:
+        self.handle.write(struct.pack(">I", len(data)) + kind + data)
+        self.handle.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+    def write_rows(self, data: bytes) -> None:
+        stride = self.width * 4
+        for offset in range(0, len(data), stride):
+            self.pending += self.compressor.compress(b"\x00" + data[offset : offset + stride])
+            if len(self.pending) >= self.IDAT_BYTES:
+                self._chunk(b"IDAT", bytes(self.pending))
+                self.pending.clear()
+
+    def close(self) -> None:
+        self.pending += self.compressor.flush()
+        self._chunk(b"IDAT", bytes(self.pending))
+        self._chunk(b"IEND", b"")
+        self.handle.close()
+        os.replace(self.part, self.path)
+
+    def abort(self) -> None:
+        self.handle.close()
+        self.part.unlink(missing_ok=True)
+
+
+def compose_tiles(
+    work_dir: Path,
+    size: tuple[int, int],
+    specs: list[dict[str, Any]],
+    tile_size: int,
+    jobs: int,
+    cache_limit_bytes: int,
+    write_band: Callable[[int, Image.Image], None],
+    tiles_dir: Path | None = None,
+) -> list[dict[str, Any]]:
+    """Composite placements over the split base tile by tile; tiles with props are rendered across ``jobs`` processes.
+
+    Workers read their base tile from ``work_dir``. At most ``2 * jobs`` tiles are in flight; finished tiles are
+    collected in raster order into one row band, which is handed to ``write_band(top, band)`` as soon as it is
+    complete, and optionally written to ``tiles_dir`` as they arrive.
+    """
+    width, height = size
+    index = build_tile_index(specs, width, height, tile_size)
+    written: list[dict[str, Any]] = []
+    band: Image.Image | None = None
+
+    def _jobs() -> Iterator[tuple[tuple[int, int, int, int], str, int, list[dict[str, Any]]]]:
+        for box in iter_tile_boxes(width, height, tile_size):
+            members = index.get((box[0] // tile_size, box[1] // tile_size)) or []
+            yield box, str(work_dir), tile_size, [specs[order] for order in members]
+
+    def _store(box: tuple[int, int, int, int], tile: Image.Image) -> None:
+        nonlocal band
+        if band is None:
+            band = Image.new("RGBA", (width, box[3] - box[1]))
+        band.paste(tile, (box[0], 0))
+        if tiles_dir is not None:
+            tile_path = tiles_dir / f"{tile_name(box, tile_size)}.png"
+            tile.save(tile_path)
+            written.append({"box": list(box), "path": str(tile_path)})
+        if box[2] == width:
+            write_band(box[1], band)
+            band = None
+
+    def _finish(box: tuple[int, int, int, int], tile_bytes: bytes) -> None:
+        _store(box, Image.frombytes("RGBA", (box[2] - box[0], box[3] - box[1]), tile_bytes))
+
+    if tiles_dir is not None:
+        tiles_dir.mkdir(parents=True, exist_ok=True)
+    if jobs <= 1 or len(index) <= 1:
+        _init_worker(cache_limit_bytes)
+        for job in _jobs():
+            _finish(*render_tile(job))
+        return written
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(cache_limit_bytes,)) as pool:
+        in_flight: deque[Future | tuple[tuple[int, int, int, int], None]] = deque()
+
+        def _drain_one() -> None:
+            head = in_flight.popleft()
+            if isinstance(head, Future):
+                _finish(*head.result())
+            else:
+                _store(head[0], read_base_tile(work_dir, head[0], tile_size))
+
+        for job in _jobs():
+            # Tiles without props are copied from the split base here rather than sent to a worker.
+            in_flight.append(pool.submit(render_tile, job) if job[3] else (job[0], None))
+            if len(in_flight) >= jobs * 2:
+                _drain_one()
+        while in_flight:
+            _drain_one()
+    return written
+
+
+def render_preview(
+    base_path: Path,
+    specs: list[dict[str, Any]],
+    output: Path,
+    tile_size: int,
+    jobs: int,
+    cache_limit_bytes: int,
+    tiles_dir: Path | None = None,
+) -> list[dict[str, Any]]:
+    """Split the base, composite ``specs`` over it and write ``output``; returns the tiles written to ``tiles_dir``.
+
+    A ``.png`` output is streamed one row band at a time; other formats are assembled in memory before saving.
+    """
+    with tempfile.TemporaryDirectory(prefix="layered-preview-") as work:
+        work_dir = Path(work)
+        size = split_base(base_path, tile_size, work_dir)
+        if output.suffix.lower() != ".png":
+            canvas = Image.new("RGBA", size)
+            tiles = compose_tiles(
+                work_dir, size, specs, tile_size, jobs, cache_limit_bytes,
+                lambda top, band: canvas.paste(band, (0, top)), tiles_dir,
+            )
+            canvas.save(output)
+            return tiles
+
+        writer = PngRowWriter(output, *size)
+        try:
+            tiles = compose_tiles(
+                work_dir, size, specs, tile_size, jobs, cache_limit_bytes,
+                lambda _top, band: writer.write_rows(band.tobytes()), tiles_dir,
+            )
+        except BaseException:
+            writer.abort()
+            raise
+        writer.close()
+        return tiles
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--base", required=True, type=Path)
@@ -101,12 +354,17 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--output", required=True, type=Path)
     parser.add_argument("--report", type=Path)
     parser.add_argument("--project-root", type=Path, default=Path.cwd())
+    parser.add_argument("--tile-size", type=int, default=512)
+    parser.add_argument("--jobs", type=int, default=max(1, os.cpu_count() or 1))
+    parser.add_argument("--cache-mb", type=int, default=256, help="Per-process LRU budget for decoded prop images.")
+    parser.add_argument("--tiles-dir", type=Path, help="Also write each finished tile as a PNG.")
     return parser
 
 
 def main() -> None:
     args = build_parser().parse_args()
-    base = Image.open(args.base).convert("RGBA")
+    if args.tile_size <= 0:
+        raise ValueError("--tile-size must be positive.")
     data = read_json(args.placements)
     props = load_props(data)
     roots = [args.placements.parent, args.base.parent, args.project_root]
@@ -116,26 +374,24 @@ def main() -> None:
     props_layer.sort(key=lambda item: float(item.get("sortY", item.get("y", 0))))
     foreground_layer.sort(key=lambda item: float(item.get("sortY", item.get("y", 0))))
 
-    pasted = []
-    for prop in props_layer + foreground_layer:
-        pasted.append(paste_prop(base, prop, roots))
-
+    specs = [resolve_placement(prop, roots) for prop in props_layer + foreground_layer]
+    pasted = [spec["report"] for spec in specs]
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    base.save(args.output)
+    cache_limit_bytes = args.cache_mb * 1024 * 1024
+
+    tiles = render_preview(args.base, specs, args.output, args.tile_size, args.jobs, cache_limit_bytes, args.tiles_dir)
     if args.report:
+        report: dict[str, Any] = {
+            "base": str(args.base),
+            "placements": str(args.placements),
+            "output": str(args.output),
+            "pasted": pasted,
+        }
+        if args.tiles_dir is not None:
+            report["tile_size"] = args.tile_size
+            report["tiles"] = tiles
         args.report.parent.mkdir(parents=True, exist_ok=True)
-        args.report.write_text(
-            json.dumps(
-                {
-                    "base": str(args.base),
-                    "placements": str(args.placements),
-                    "output": str(args.output),
-                    "pasted": pasted,
-                },
-                indent=2,
-            ),
-            encoding="utf-8",
-        )
+        args.report.write_text(json.dumps(report, indent=2), encoding="utf-8")
     print(str(args.output.resolve()))
 
 
@@ -5,64 +5,20 @@ from __future__ import annotations
 
 import argparse
 import json
-import math
 import re
-from collections import deque
+import sys
+from functools import partial
 from pathlib import Path
 from typing import Iterable
 
 from PIL import Image
 
+SPRITE_SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "generate2dsprite" / "scripts"
+if str(SPRITE_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SPRITE_SCRIPTS_DIR))
 
-MAGENTA = (255, 0, 255)
-
-
-def color_distance(rgb: tuple[int, int, int], target: tuple[int, int, int] = MAGENTA) -> float:
-    r, g, b = rgb
-    tr, tg, tb = target
-    return math.sqrt((r - tr) ** 2 + (g - tg) ** 2 + (b - tb) ** 2)
-
-
-def remove_bg_magenta(img: Image.Image, threshold: int, edge_threshold: int) -> Image.Image:
-    img = img.convert("RGBA")
-    pixels = img.load()
-    width, height = img.size
-
-    for x in range(width):
-        for y in range(height):
-            r, g, b, a = pixels[x, y]
-            if a > 0 and color_distance((r, g, b)) < threshold:
-                pixels[x, y] = (0, 0, 0, 0)
-
-    visited: set[tuple[int, int]] = set()
-    queue: deque[tuple[int, int]] = deque()
-    for x in range(width):
-        queue.append((x, 0))
-        queue.append((x, height - 1))
-    for y in range(height):
-        queue.append((0, y))
-        queue.append((width - 1, y))
-
-    while queue:
-        x, y = queue.popleft()
-        if (x, y) in visited or x < 0 or x >= width or y < 0 or y >= height:
-            continue
-        visited.add((x, y))
-        r, g, b, a = pixels[x, y]
-        should_expand = a == 0
-        if a > 0 and color_distance((r, g, b)) < edge_threshold:
-            pixels[x, y] = (0, 0, 0, 0)
-            should_expand = True
-        if should_expand:
-            for dx in (-1, 0, 1):
-                for dy in (-1, 0, 1):
-                    if dx == 0 and dy == 0:
-                        continue
-                    nxt = (x + dx, y + dy)
-                    if nxt not in visited:
-                        queue.append(nxt)
-
-    return img
+from sprite_batch import collect_inputs, default_jobs, file_sha256, run_batch  # noqa: E402
+from sprite_image_ops import clean_edges, connected_components, mask_to_component, remove_bg_magenta  # noqa: E402
 
 
 def trim_border(img: Image.Image, px: int) -> Image.Image:
@@ -74,74 +30,6 @@ def trim_border(img: Image.Image, px: int) -> Image.Image:
     return img.crop((px, px, width - px, height - px))
 
 
-def clean_edges(img: Image.Image, depth: int) -> Image.Image:
-    if depth <= 0:
-        return img
-    pixels = img.load()
-    width, height = img.size
-    for d in range(depth):
-        for x in range(width):
-            for y in (d, height - 1 - d):
-                if 0 <= y < height:
-                    r, g, b, a = pixels[x, y]
-                    if a > 0 and ((r < 40 and g < 40 and b < 40) or color_distance((r, g, b)) < 150):
-                        pixels[x, y] = (0, 0, 0, 0)
-        for y in range(height):
-            for x in (d, width - 1 - d):
-                if 0 <= x < width:
-                    r, g, b, a = pixels[x, y]
-                    if a > 0 and ((r < 40 and g < 40 and b < 40) or color_distance((r, g, b)) < 150):
-                        pixels[x, y] = (0, 0, 0, 0)
-    return img
-
-
-def connected_components(img: Image.Image, min_area: int) -> list[dict[str, object]]:
-    alpha = img.getchannel("A")
-    pixels = alpha.load()
-    width, height = img.size
-    visited = [[False] * width for _ in range(height)]
-    components: list[dict[str, object]] = []
-
-    for y in range(height):
-        for x in range(width):
-            if pixels[x, y] == 0 or visited[y][x]:
-                continue
-            queue: deque[tuple[int, int]] = deque([(x, y)])
-            visited[y][x] = True
-            coords: list[tuple[int, int]] = []
-            min_x = max_x = x
-            min_y = max_y = y
-            touches_edge = x == 0 or y == 0 or x == width - 1 or y == height - 1
-
-            while queue:
-                cx, cy = queue.popleft()
-                coords.append((cx, cy))
-                min_x = min(min_x, cx)
-                min_y = min(min_y, cy)
-                max_x = max(max_x, cx)
-                max_y = max(max_y, cy)
-                if cx == 0 or cy == 0 or cx == width - 1 or cy == height - 1:
-                    touches_edge = True
-                for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                    nx, ny = cx + dx, cy + dy
-                    if 0 <= nx < width and 0 <= ny < height and pixels[nx, ny] > 0 and not visited[ny][nx]:
-                        visited[ny][nx] = True
-                        queue.append((nx, ny))
-
-            if len(coords) >= min_area:
-                components.append(
-                    {
-                        "area": len(coords),
-                        "bbox": (min_x, min_y, max_x + 1, max_y + 1),
-                        "touches_edge": touches_edge,
-                        "coords": coords,
-                    }
-                )
-
-    components.sort(key=lambda item: int(item["area"]), reverse=True)
-    return components
-
-
 def pad_bbox(bbox: tuple[int, int, int, int], padding: int, width: int, height: int) -> tuple[int, int, int, int]:
     x0, y0, x1, y1 = bbox
     return (
@@ -191,22 +79,13 @@ def alpha_bbox(img: Image.Image) -> tuple[int, int, int, int] | None:
     return img.getchannel("A").getbbox()
 
 
-def mask_to_component(img: Image.Image, component: dict[str, object]) -> Image.Image:
-    selected = Image.new("RGBA", img.size, (0, 0, 0, 0))
-    src = img.load()
-    dst = selected.load()
-    for x, y in component["coords"]:  # type: ignore[index]
-        dst[x, y] = src[x, y]
-    return selected
-
-
 def extract_cell(
     cell: Image.Image,
     args: argparse.Namespace,
 ) -> tuple[Image.Image | None, dict[str, object]]:
     frame = trim_border(cell, args.trim_border)
     frame = clean_edges(frame, args.edge_clean_depth)
-    components = connected_components(frame, args.min_component_area)
+    components = connected_components(frame, args.min_component_area, with_runs=args.component_mode == "largest")
     selected_component = None
     bbox = alpha_bbox(frame)
 
@@ -245,7 +124,12 @@ def iter_cells(img: Image.Image, rows: int, cols: int) -> Iterable[tuple[int, in
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("--input", required=True, type=Path)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", type=Path)
+    source.add_argument(
+        "--inputs",
+        help="Batch mode: directory, image path, or glob (supports **); each sheet goes to <output-dir>/<stem>/.",
+    )
     parser.add_argument("--rows", required=True, type=int)
     parser.add_argument("--cols", required=True, type=int)
     parser.add_argument("--output-dir", required=True, type=Path)
@@ -262,11 +146,12 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--edge-touch-margin", type=int, default=0)
     parser.add_argument("--reject-edge-touch", action="store_true")
     parser.add_argument("--keep-empty", action="store_true")
+    parser.add_argument("--jobs", type=int, default=default_jobs(), help="Batch mode worker processes.")
+    parser.add_argument("--force", action="store_true", help="Batch mode: ignore the previous manifest cache.")
     return parser
 
 
-def main() -> None:
-    args = build_parser().parse_args()
+def extract_pack(args: argparse.Namespace) -> dict[str, object]:
     expected_count = args.rows * args.cols
     labels = parse_labels(args, expected_count)
     args.output_dir.mkdir(parents=True, exist_ok=True)
@@ -329,8 +214,61 @@ def main() -> None:
 
     if args.reject_edge_touch and edge_touch_props:
         raise ValueError(f"Accepted props touch a cell edge: {edge_touch_props}")
+    return manifest
+
+
+BATCH_ONLY_ARGS = {"inputs", "output_dir", "manifest", "jobs", "force"}
+
+
+def build_batch_job(args: argparse.Namespace, input_path: Path, output_dir: Path) -> argparse.Namespace:
+    item_args = argparse.Namespace(**{key: value for key, value in vars(args).items() if key not in BATCH_ONLY_ARGS})
+    item_args.input = input_path
+    item_args.output_dir = output_dir
+    item_args.manifest = None
+    return item_args
+
+
+def run_batch_item(item_args: argparse.Namespace) -> dict[str, object]:
+    manifest = extract_pack(item_args)
+    return {
+        "manifest": str(item_args.output_dir / "prop-pack.json"),
+        "accepted": manifest["accepted"],
+        "rejected": manifest["rejected"],
+        "edge_touch_props": manifest["edge_touch_props"],
+    }
+
 
+def run_batch_mode(args: argparse.Namespace) -> None:
+    inputs = collect_inputs(args.inputs)
+    if not inputs:
+        raise ValueError(f"No input images matched: {args.inputs}")
+    params = {key: value for key, value in vars(args).items() if key not in BATCH_ONLY_ARGS}
+    if args.labels_file:
+        params["labels_file_sha256"] = file_sha256(args.labels_file)
+    manifest_path = args.manifest or (args.output_dir / "prop-pack-batch.json")
+    manifest = run_batch(
+        kind="extract_prop_pack",
+        inputs=inputs,
+        output_root=args.output_dir,
+        params=params,
+        build_job=partial(build_batch_job, args),
+        worker=run_batch_item,
+        manifest_path=manifest_path,
+        jobs=args.jobs,
+        force=args.force,
+    )
     print(str(manifest_path.resolve()))
+    if manifest["summary"]["failed"]:
+        raise SystemExit(1)
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if args.inputs:
+        run_batch_mode(args)
+        return
+    extract_pack(args)
+    print(str((args.manifest or (args.output_dir / "prop-pack.json")).resolve()))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,113 @@
+"""Tests for compose_layered_preview.py"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import compose_layered_preview as preview
+from compose_layered_preview import load_props, main, placement_xy, render_preview, resolve_placement
+
+
+def _gradient(size, mode):
+    img = Image.new("RGBA", size)
+    img.putdata([((x * 7) % 256, (y * 11) % 256, (x * y) % 256, 255 - (x + y) % 200) for y in range(size[1]) for x in range(size[0])])
+    return img.convert(mode)
+
+
+def _reference(base_path, placements_path, roots):
+    """The sequential paste the tiled renderer must reproduce."""
+    canvas = Image.open(base_path).convert("RGBA")
+    props = load_props(json.loads(placements_path.read_text(encoding="utf-8")))
+    back = sorted((p for p in props if p.get("layer", "props") != "foreground"), key=lambda p: float(p.get("sortY", p.get("y", 0))))
+    front = sorted((p for p in props if p.get("layer", "props") == "foreground"), key=lambda p: float(p.get("sortY", p.get("y", 0))))
+    for prop in back + front:
+        img = Image.open(preview.resolve_path(prop["image"], roots)).convert("RGBA")
+        width, height = int(prop.get("w", img.width)), int(prop.get("h", img.height))
+        if (width, height) != img.size:
+            img = img.resize((width, height), Image.Resampling.LANCZOS)
+        opacity = float(prop.get("opacity", 1.0))
+        if opacity < 1:
+            img.putalpha(img.getchannel("A").point(lambda value: int(value * opacity)))
+        canvas.alpha_composite(img, placement_xy(prop, width, height))
+    return canvas
+
+
+@pytest.fixture
+def scene(tmp_path):
+    _gradient((53, 41), "RGB").save(tmp_path / "base.png")
+    _gradient((12, 9), "RGBA").save(tmp_path / "rock.png")
+    _gradient((6, 14), "RGBA").transpose(Image.Transpose.FLIP_LEFT_RIGHT).save(tmp_path / "tree.png")
+    props = [
+        {"image": "rock.png", "x": 10, "y": 12},
+        {"image": "tree.png", "x": 30, "y": 30, "w": 11, "h": 20, "opacity": 0.6},
+        {"image": "rock.png", "x": -3, "y": 2, "anchor": "top-left"},
+        {"image": "rock.png", "x": 50, "y": 40, "anchor": "center", "sortY": 1},
+        {"image": "tree.png", "x": 26, "y": 21, "anchor": "center", "layer": "foreground"},
+    ]
+    (tmp_path / "placements.json").write_text(json.dumps({"props": props}), encoding="utf-8")
+    return tmp_path
+
+
+def _specs(scene):
+    roots = [scene]
+    props = load_props(json.loads((scene / "placements.json").read_text(encoding="utf-8")))
+    back = sorted((p for p in props if p.get("layer", "props") != "foreground"), key=lambda p: float(p.get("sortY", p.get("y", 0))))
+    front = [p for p in props if p.get("layer", "props") == "foreground"]
+    return [resolve_placement(prop, roots) for prop in back + front]
+
+
+@pytest.mark.parametrize("tile_size,jobs", [(512, 1), (16, 1), (7, 2), (16, 2)])
+def test_tiled_output_matches_sequential_paste(scene, tile_size, jobs):
+    expected = _reference(scene / "base.png", scene / "placements.json", [scene])
+    output = scene / "out" / "preview.png"
+    output.parent.mkdir()
+
+    render_preview(scene / "base.png", _specs(scene), output, tile_size, jobs, 1024)
+
+    with Image.open(output) as result:
+        assert result.mode == "RGBA"
+        assert result.tobytes() == expected.tobytes()
+    assert not list(output.parent.glob("*.part"))
+
+
+def test_palette_base_and_non_png_output_match(scene):
+    _gradient((53, 41), "RGBA").convert("P").save(scene / "base.png", transparency=3)
+    expected = _reference(scene / "base.png", scene / "placements.json", [scene])
+    output = scene / "preview.tiff"
+
+    render_preview(scene / "base.png", _specs(scene), output, 10, 1, 1 << 20)
+
+    with Image.open(output) as result:
+        assert result.convert("RGBA").tobytes() == expected.tobytes()
+
+
+def test_tiles_dir_writes_every_listed_tile(scene):
+    report_path = scene / "report.json"
+    argv = [
+        "compose_layered_preview.py",
+        "--base", str(scene / "base.png"),
+        "--placements", str(scene / "placements.json"),
+        "--output", str(scene / "preview.png"),
+        "--report", str(report_path),
+        "--tile-size", "20",
+        "--jobs", "2",
+        "--tiles-dir", str(scene / "tiles"),
+    ]
+    with patch.object(sys, "argv", argv):
+        main()
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["tile_size"] == 20
+    boxes = [tuple(tile["box"]) for tile in report["tiles"]]
+    assert boxes == list(preview.iter_tile_boxes(53, 41, 20))
+    assert sorted(Path(tile["path"]).name for tile in report["tiles"]) == sorted(p.name for p in (scene / "tiles").iterdir())
+    with Image.open(scene / "preview.png") as full:
+        for tile in report["tiles"]:
+            with Image.open(tile["path"]) as img:
+                assert img.tobytes() == full.crop(tuple(tile["box"])).tobytes()
@@ -6,15 +6,25 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
-import math
 import random
 import re
-from collections import deque
+from functools import partial
 from pathlib import Path
 
-import numpy as np
 from PIL import Image
 
+from sprite_batch import collect_inputs, default_jobs, file_sha256, run_batch
+from sprite_image_ops import (
+    build_shared_palette,
+    clean_edges,
+    compose_grid,
+    connected_components,
+    hard_alpha,
+    palette_indices,
+    remove_bg_magenta,
+    rgba_array,
+)
+
 
 ART_STYLE = (
     "Original digital monster creature. Digimon/Pokemon inspired pixel art, "
@@ -386,54 +396,6 @@ def build_prompt(target: str, mode: str, prompt: str, role: str | None = None, s
     return result, seed
 
 
-def remove_bg_magenta(img: Image.Image, threshold: int = 100, edge_threshold: int = 150) -> Image.Image:
-    pixels = img.load()
-    width, height = img.size
-
-    def dist(r: int, g: int, b: int) -> float:
-        return math.sqrt((r - 255) ** 2 + g**2 + (b - 255) ** 2)
-
-    for x in range(width):
-        for y in range(height):
-            r, g, b, a = pixels[x, y]
-            if a == 0:
-                continue
-            if dist(r, g, b) < threshold:
-                pixels[x, y] = (0, 0, 0, 0)
-
-    visited: set[tuple[int, int]] = set()
-    queue: deque[tuple[int, int]] = deque()
-    for x in range(width):
-        queue.append((x, 0))
-        queue.append((x, height - 1))
-    for y in range(height):
-        queue.append((0, y))
-        queue.append((width - 1, y))
-
-    while queue:
-        x, y = queue.popleft()
-        if (x, y) in visited or x < 0 or x >= width or y < 0 or y >= height:
-            continue
-        visited.add((x, y))
-        r, g, b, a = pixels[x, y]
-        if a == 0:
-            for dx in (-1, 0, 1):
-                for dy in (-1, 0, 1):
-                    if dx == 0 and dy == 0:
-                        continue
-                    if (x + dx, y + dy) not in visited:
-                        queue.append((x + dx, y + dy))
-        elif dist(r, g, b) < edge_threshold:
-            pixels[x, y] = (0, 0, 0, 0)
-            for dx in (-1, 0, 1):
-                for dy in (-1, 0, 1):
-                    if dx == 0 and dy == 0:
-                        continue
-                    if (x + dx, y + dy) not in visited:
-                        queue.append((x + dx, y + dy))
-    return img
-
-
 def trim_border(img: Image.Image, px: int = 4) -> Image.Image:
     width, height = img.size
     if width > px * 2 and height > px * 2:
@@ -441,77 +403,6 @@ def trim_border(img: Image.Image, px: int = 4) -> Image.Image:
     return img
 
 
-def clean_edges(img: Image.Image, depth: int = 3) -> Image.Image:
-    pixels = img.load()
-    width, height = img.size
-    for d in range(depth):
-        for x in range(width):
-            for y in (d, height - 1 - d):
-                if y < 0 or y >= height:
-                    continue
-                r, g, b, a = pixels[x, y]
-                if a == 0:
-                    continue
-                if (r < 40 and g < 40 and b < 40) or math.sqrt((r - 255) ** 2 + g**2 + (b - 255) ** 2) < 150:
-                    pixels[x, y] = (0, 0, 0, 0)
-        for y in range(height):
-            for x in (d, width - 1 - d):
-                if x < 0 or x >= width:
-                    continue
-                r, g, b, a = pixels[x, y]
-                if a == 0:
-                    continue
-                if (r < 40 and g < 40 and b < 40) or math.sqrt((r - 255) ** 2 + g**2 + (b - 255) ** 2) < 150:
-                    pixels[x, y] = (0, 0, 0, 0)
-    return img
-
-
-def connected_components(img: Image.Image, min_area: int = 1) -> list[dict[str, object]]:
-    alpha = img.getchannel("A")
-    pixels = alpha.load()
-    width, height = img.size
-    visited = [[False] * width for _ in range(height)]
-    components: list[dict[str, object]] = []
-
-    for y in range(height):
-        for x in range(width):
-            if pixels[x, y] == 0 or visited[y][x]:
-                continue
-            queue: deque[tuple[int, int]] = deque([(x, y)])
-            visited[y][x] = True
-            area = 0
-            min_x = max_x = x
-            min_y = max_y = y
-            touches_edge = x == 0 or y == 0 or x == width - 1 or y == height - 1
-
-            while queue:
-                cx, cy = queue.popleft()
-                area += 1
-                min_x = min(min_x, cx)
-                min_y = min(min_y, cy)
-                max_x = max(max_x, cx)
-                max_y = max(max_y, cy)
-                if cx == 0 or cy == 0 or cx == width - 1 or cy == height - 1:
-                    touches_edge = True
-                for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                    nx, ny = cx + dx, cy + dy
-                    if 0 <= nx < width and 0 <= ny < height and pixels[nx, ny] > 0 and not visited[ny][nx]:
-                        visited[ny][nx] = True
-                        queue.append((nx, ny))
-
-            if area >= min_area:
-                components.append(
-                    {
-                        "area": area,
-                        "bbox": (min_x, min_y, max_x + 1, max_y + 1),
-                        "touches_edge": touches_edge,
-                    }
-                )
-
-    components.sort(key=lambda item: int(item["area"]), reverse=True)
-    return components
-
-
 def pad_bbox(bbox: tuple[int, int, int, int], padding: int, width: int, height: int) -> tuple[int, int, int, int]:
     x0, y0, x1, y1 = bbox
     return (
@@ -634,69 +525,32 @@ def split_grid(
 
 
 def compose_sheet(frames: list[Image.Image], rows: int, cols: int, cell_size: int) -> Image.Image:
-    canvas = Image.new("RGBA", (cols * cell_size, rows * cell_size), (0, 0, 0, 0))
-    for index, frame in enumerate(frames):
-        row, col = divmod(index, cols)
-        canvas.paste(frame, (col * cell_size, row * cell_size), frame)
-    return canvas
+    if any(frame.size != (cell_size, cell_size) for frame in frames) or len(frames) > rows * cols:
+        canvas = Image.new("RGBA", (cols * cell_size, rows * cell_size), (0, 0, 0, 0))
+        for index, frame in enumerate(frames):
+            row, col = divmod(index, cols)
+            canvas.paste(frame, (col * cell_size, row * cell_size), frame)
+        return canvas
+    return Image.fromarray(compose_grid([rgba_array(frame) for frame in frames], rows, cols, cell_size), "RGBA")
 
 
 def save_transparent_gif(frames: list[Image.Image], out_path: Path, duration: int) -> None:
     if not frames:
         raise ValueError("No frames to encode.")
 
-    key = (255, 0, 254)
-    width, height = frames[0].size
-    stacked = Image.new("RGB", (width, height * len(frames)), key)
-
-    for index, frame in enumerate(frames):
-        r, g, b, a = frame.split()
-        hard_mask = a.point(lambda value: 255 if value >= 128 else 0)
-        rgb = Image.merge("RGB", (r, g, b))
-        stacked.paste(rgb, (0, index * height), hard_mask)
-
-    paletted = stacked.convert("P", palette=Image.Palette.ADAPTIVE, colors=256, dither=Image.Dither.NONE)
-    palette = list(paletted.getpalette() or [])
-    while len(palette) < 256 * 3:
-        palette.append(0)
-
-    key_index = None
-    for index in range(256):
-        if palette[index * 3 : index * 3 + 3] == list(key):
-            key_index = index
-            break
-    if key_index is None:
-        best_distance = None
-        best_index = 0
-        for index in range(256):
-            r, g, b = palette[index * 3], palette[index * 3 + 1], palette[index * 3 + 2]
-            distance = (r - key[0]) ** 2 + (g - key[1]) ** 2 + (b - key[2]) ** 2
-            if best_distance is None or distance < best_distance:
-                best_distance = distance
-                best_index = index
-        key_index = best_index
-
-    if key_index != 0:
-        lut = np.arange(256, dtype=np.uint8)
-        lut[0], lut[key_index] = key_index, 0
-        arr = np.array(paletted)
-        arr = lut[arr]
-        paletted = Image.fromarray(arr, mode="P")
-        for channel in range(3):
-            zero_idx = channel
-            key_idx = key_index * 3 + channel
-            palette[zero_idx], palette[key_idx] = palette[key_idx], palette[zero_idx]
+    lut, palette = build_shared_palette(rgba_array(frame) for frame in frames)
+    encoded: list[Image.Image] = []
+    for frame in frames:
+        paletted = Image.fromarray(palette_indices(rgba_array(frame), lut), "P")
         paletted.putpalette(palette)
+        encoded.append(paletted)
 
-    out_frames = [
-        paletted.crop((0, index * height, width, (index + 1) * height))
-        for index in range(len(frames))
-    ]
-    out_frames[0].save(
+    first, rest = encoded[0], encoded[1:]
+    first.save(
         out_path,
         format="GIF",
         save_all=True,
-        append_images=out_frames[1:],
+        append_images=rest,
         duration=duration,
         loop=0,
         disposal=2,
@@ -705,6 +559,35 @@ def save_transparent_gif(frames: list[Image.Image], out_path: Path, duration: in
     )
 
 
+ANIMATION_FORMATS = {"apng": ("PNG", ".apng"), "webp": ("WEBP", ".webp")}
+
+
+def save_transparent_animation(frames: list[Image.Image], out_path: Path, duration: int, fmt: str) -> None:
+    """APNG/WebP export with the same binary transparency as the GIF (alpha < 128 becomes fully transparent)."""
+    if not frames:
+        raise ValueError("No frames to encode.")
+    pil_format, _ = ANIMATION_FORMATS[fmt]
+    encoded = [Image.fromarray(hard_alpha(rgba_array(frame)), "RGBA") for frame in frames]
+    options: dict[str, object] = {"duration": duration, "loop": 0}
+    if pil_format == "PNG":
+        options.update(disposal=1, blend=0)
+    else:
+        options.update(lossless=True, exact=True)
+    encoded[0].save(out_path, format=pil_format, save_all=True, append_images=encoded[1:], **options)
+
+
+def save_animations(
+    frames: list[Image.Image], out_dir: Path, stem: str, duration: int, extra_formats: list[str]
+) -> list[str]:
+    names = [f"{stem}.gif"]
+    save_transparent_gif(frames, out_dir / names[0], duration)
+    for fmt in extra_formats:
+        name = f"{stem}{ANIMATION_FORMATS[fmt][1]}"
+        save_transparent_animation(frames, out_dir / name, duration, fmt)
+        names.append(name)
+    return names
+
+
 def sanitize_slug(text: str) -> str:
     slug = re.sub(r"[^a-zA-Z0-9]+", "-", text.strip().lower()).strip("-")
     return slug or "sprite"
@@ -747,7 +630,7 @@ def cmd_build_prompt(args: argparse.Namespace) -> None:
     print(prompt_text)
 
 
-def cmd_process(args: argparse.Namespace) -> None:
+def process_image(args: argparse.Namespace) -> dict[str, object]:
     if args.target not in PROCESS_TARGETS:
         raise ValueError(f"Unknown process target '{args.target}'. Valid targets: {', '.join(PROCESS_TARGETS)}")
     out_dir = args.output_dir
@@ -806,15 +689,20 @@ def cmd_process(args: argparse.Namespace) -> None:
 
         compose_sheet(frames, rows, cols, cell_size).save(out_dir / "sheet-transparent.png")
 
+        animations: list[str] = []
         if args.mode == "player_sheet" and not has_custom_grid and (rows, cols) == (4, 4):
             directions = ["down", "left", "right", "up"]
             for row_index, direction in enumerate(directions):
                 row_frames = frames[row_index * cols : (row_index + 1) * cols]
                 compose_sheet(row_frames, 1, cols, cell_size).save(out_dir / f"{direction}-strip.png")
-                save_transparent_gif(row_frames, out_dir / f"{direction}.gif", args.duration)
+                animations.extend(
+                    save_animations(row_frames, out_dir, direction, args.duration, args.extra_animation_formats)
+                )
             metadata["directions"] = directions
         else:
-            save_transparent_gif(frames, out_dir / "animation.gif", args.duration)
+            animations.extend(save_animations(frames, out_dir, "animation", args.duration, args.extra_animation_formats))
+        metadata["gifs"] = [name for name in animations if name.endswith(".gif")]
+        metadata["animations"] = animations
 
         metadata["rows"] = rows
         metadata["cols"] = cols
@@ -848,26 +736,65 @@ def cmd_process(args: argparse.Namespace) -> None:
         (out_dir / "prompt-used.txt").write_text(args.prompt, encoding="utf-8")
 
     (out_dir / "pipeline-meta.json").write_text(json.dumps(metadata, indent=2), encoding="utf-8")
-    print(str(out_dir.resolve()))
+    return metadata
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description=__doc__)
-    subparsers = parser.add_subparsers(dest="command", required=True)
+def cmd_process(args: argparse.Namespace) -> None:
+    process_image(args)
+    print(str(args.output_dir.resolve()))
 
-    subparsers.add_parser("list-options", help="Print supported targets, modes, and NPC roles.")
 
-    build_prompt_parser = subparsers.add_parser("build-prompt", help="Build a generation prompt.")
-    build_prompt_parser.add_argument("--target", required=True, choices=sorted(TARGET_MODES))
-    build_prompt_parser.add_argument("--mode", required=True)
-    build_prompt_parser.add_argument("--prompt", required=True)
-    build_prompt_parser.add_argument("--role")
-    build_prompt_parser.add_argument("--seed", type=int)
-    build_prompt_parser.add_argument("--write", type=Path)
-    build_prompt_parser.add_argument("--write-json", type=Path)
+BATCH_ONLY_ARGS = {"command", "inputs", "output_dir", "manifest", "jobs", "force"}
 
-    process_parser = subparsers.add_parser("process", help="Postprocess a generated sprite image.")
-    process_parser.add_argument("--input", required=True, type=Path)
+
+def build_batch_job(args: argparse.Namespace, input_path: Path, output_dir: Path) -> argparse.Namespace:
+    item_args = argparse.Namespace(**{key: value for key, value in vars(args).items() if key not in BATCH_ONLY_ARGS})
+    item_args.input = input_path
+    item_args.output_dir = output_dir
+    return item_args
+
+
+def run_batch_item(item_args: argparse.Namespace) -> dict[str, object]:
+    metadata = process_image(item_args)
+    return {
+        "rows": metadata.get("rows"),
+        "cols": metadata.get("cols"),
+        "frame_labels": metadata.get("frame_labels", []),
+        "frames": metadata.get("frames", []),
+        "edge_touch_frames": metadata.get("edge_touch_frames", []),
+        "gifs": [str(item_args.output_dir / name) for name in metadata.get("gifs", [])],  # type: ignore[union-attr]
+        "animations": [str(item_args.output_dir / name) for name in metadata.get("animations", [])],  # type: ignore[union-attr]
+        "meta": str(item_args.output_dir / "pipeline-meta.json"),
+    }
+
+
+def cmd_batch(args: argparse.Namespace) -> None:
+    if args.target not in PROCESS_TARGETS:
+        raise ValueError(f"Unknown process target '{args.target}'. Valid targets: {', '.join(PROCESS_TARGETS)}")
+    inputs = collect_inputs(args.inputs)
+    if not inputs:
+        raise ValueError(f"No input images matched: {args.inputs}")
+    params = {key: value for key, value in vars(args).items() if key not in BATCH_ONLY_ARGS}
+    if args.prompt_file and args.prompt_file.exists():
+        params["prompt_file_sha256"] = file_sha256(args.prompt_file)
+    manifest_path = args.manifest or (args.output_dir / "batch-manifest.json")
+    manifest = run_batch(
+        kind="generate2dsprite.process",
+        inputs=inputs,
+        output_root=args.output_dir,
+        params=params,
+        build_job=partial(build_batch_job, args),
+        worker=run_batch_item,
+        manifest_path=manifest_path,
+        jobs=args.jobs,
+        force=args.force,
+    )
+    print(str(manifest_path.resolve()))
+    if manifest["summary"]["failed"]:
+        raise SystemExit(1)
+
+
+def add_process_arguments(process_parser: argparse.ArgumentParser) -> None:
     process_parser.add_argument("--target", required=True, choices=PROCESS_TARGETS)
     process_parser.add_argument("--mode", required=True)
     process_parser.add_argument("--output-dir", required=True, type=Path)
@@ -892,6 +819,42 @@ def build_parser() -> argparse.ArgumentParser:
     process_parser.add_argument("--reject-edge-touch", action="store_true")
     process_parser.add_argument("--single-size", type=int, default=256)
     process_parser.add_argument("--duration", type=int, default=200)
+    process_parser.add_argument(
+        "--extra-animation-formats",
+        nargs="*",
+        choices=sorted(ANIMATION_FORMATS),
+        default=[],
+        help="Also export APNG/WebP animations next to each GIF.",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list-options", help="Print supported targets, modes, and NPC roles.")
+
+    build_prompt_parser = subparsers.add_parser("build-prompt", help="Build a generation prompt.")
+    build_prompt_parser.add_argument("--target", required=True, choices=sorted(TARGET_MODES))
+    build_prompt_parser.add_argument("--mode", required=True)
+    build_prompt_parser.add_argument("--prompt", required=True)
+    build_prompt_parser.add_argument("--role")
+    build_prompt_parser.add_argument("--seed", type=int)
+    build_prompt_parser.add_argument("--write", type=Path)
+    build_prompt_parser.add_argument("--write-json", type=Path)
+
+    process_parser = subparsers.add_parser("process", help="Postprocess a generated sprite image.")
+    process_parser.add_argument("--input", required=True, type=Path)
+    add_process_arguments(process_parser)
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Postprocess every image in a directory or glob across a process pool."
+    )
+    batch_parser.add_argument("--inputs", required=True, help="Directory, image path, or glob (supports **).")
+    batch_parser.add_argument("--manifest", type=Path, help="Defaults to <output-dir>/batch-manifest.json.")
+    batch_parser.add_argument("--jobs", type=int, default=default_jobs())
+    batch_parser.add_argument("--force", action="store_true", help="Ignore the previous manifest cache.")
+    add_process_arguments(batch_parser)
 
     return parser
 
@@ -903,6 +866,8 @@ def main() -> None:
         cmd_list_options()
     elif args.command == "build-prompt":
         cmd_build_prompt(args)
+    elif args.command == "batch":
+        cmd_batch(args)
     else:
         cmd_process(args)
 
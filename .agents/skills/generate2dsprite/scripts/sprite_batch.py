@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Fan sprite/prop-pack processing out over a process pool and keep a consolidated, cache-aware manifest."""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp"}
+
+
+def collect_inputs(source: str) -> list[Path]:
+    """Resolve a directory (non-recursive), a single file, or a glob (``**`` allowed) to sorted image paths."""
+    path = Path(source)
+    if path.is_dir():
+        candidates = [item for item in path.iterdir() if item.is_file()]
+    elif path.is_file():
+        return [path]
+    else:
+        candidates = [Path(item) for item in glob.glob(source, recursive=True) if Path(item).is_file()]
+    return sorted(item for item in candidates if item.suffix.lower() in IMAGE_SUFFIXES)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def params_sha256(params: dict[str, Any]) -> str:
+    payload = json.dumps(params, sort_keys=True, ensure_ascii=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def item_slugs(inputs: list[Path]) -> list[str]:
+    """Stable per-input output folder names; duplicate stems get a numeric suffix in input order."""
+    seen: dict[str, int] = {}
+    slugs: list[str] = []
+    for path in inputs:
+        base = re.sub(r"[^a-zA-Z0-9]+", "-", path.stem.strip().lower()).strip("-") or "image"
+        count = seen.get(base, 0) + 1
+        seen[base] = count
+        slugs.append(base if count == 1 else f"{base}-{count}")
+    return slugs
+
+
+def load_previous_items(manifest_path: Path) -> dict[str, dict[str, Any]]:
+    if not manifest_path.is_file():
+        return {}
+    try:
+        payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    items = payload.get("items") if isinstance(payload, dict) else None
+    if not isinstance(items, list):
+        return {}
+    return {str(item.get("input")): item for item in items if isinstance(item, dict) and item.get("input")}
+
+
+def _reusable(previous: dict[str, Any] | None, source_sha: str, params_hash: str) -> bool:
+    if not previous or previous.get("status") != "ok":
+        return False
+    if previous.get("source_sha256") != source_sha or previous.get("params_sha256") != params_hash:
+        return False
+    output_dir = previous.get("output_dir")
+    return bool(output_dir) and Path(str(output_dir)).is_dir()
+
+
+def _timed_call(worker: Callable[[Any], dict[str, Any]], job: Any) -> tuple[dict[str, Any], float]:
+    started = time.perf_counter()
+    result = worker(job)
+    return result, round(time.perf_counter() - started, 3)
+
+
+def run_batch(
+    *,
+    kind: str,
+    inputs: list[Path],
+    output_root: Path,
+    params: dict[str, Any],
+    build_job: Callable[[Path, Path], Any],
+    worker: Callable[[Any], dict[str, Any]],
+    manifest_path: Path,
+    jobs: int,
+    force: bool = False,
+) -> dict[str, Any]:
+    """Process every input whose (source hash, params) changed since the last manifest; isolate failures per image.
+
+    ``build_job`` and ``worker`` must be picklable module-level callables when ``jobs > 1``.
+    """
+    params_hash = params_sha256(params)
+    previous = {} if force else load_previous_items(manifest_path)
+    items: list[dict[str, Any] | None] = [None] * len(inputs)
+    pending: list[tuple[int, Any]] = []
+
+    for index, (path, slug) in enumerate(zip(inputs, item_slugs(inputs))):
+        entry: dict[str, Any] = {
+            "input": str(path),
+            "source_sha256": file_sha256(path),
+            "params_sha256": params_hash,
+            "output_dir": str(output_root / slug),
+        }
+        prior = previous.get(entry["input"])
+        if _reusable(prior, entry["source_sha256"], params_hash) and prior.get("output_dir") == entry["output_dir"]:
+            items[index] = {**prior, "reused": True}
+            continue
+        items[index] = entry
+        pending.append((index, build_job(path, output_root / slug)))
+
+    def _record(index: int, outcome: Callable[[], tuple[dict[str, Any], float]]) -> None:
+        entry = dict(items[index] or {})
+        try:
+            result, elapsed = outcome()
+        except Exception as exc:  # noqa: BLE001 - per-image failures must not abort the batch
+            entry.update({"status": "failed", "error": f"{type(exc).__name__}: {exc}", "reused": False})
+        else:
+            entry.update(result)
+            entry.update({"status": "ok", "elapsed_sec": elapsed, "reused": False})
+        items[index] = entry
+
+    workers = max(1, min(int(jobs), len(pending))) if pending else 1
+    if workers == 1:
+        for index, job in pending:
+            _record(index, lambda job=job: _timed_call(worker, job))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures: list[tuple[int, Future]] = [(index, pool.submit(_timed_call, worker, job)) for index, job in pending]
+            for index, future in futures:
+                _record(index, future.result)
+
+    final_items = [item for item in items if item is not None]
+    manifest = {
+        "kind": kind,
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "output_root": str(output_root),
+        "params": params,
+        "params_sha256": params_hash,
+        "jobs": workers,
+        "summary": {
+            "total": len(final_items),
+            "processed": sum(1 for item in final_items if not item.get("reused") and item.get("status") == "ok"),
+            "reused": sum(1 for item in final_items if item.get("reused")),
+            "failed": sum(1 for item in final_items if item.get("status") == "failed"),
+        },
+        "items": final_items,
+    }
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def default_jobs() -> int:
+    return max(1, os.cpu_count() or 1)
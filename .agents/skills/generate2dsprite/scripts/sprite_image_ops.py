@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""Array-based chroma-key cleanup and component labeling shared by the sprite and prop-pack processors."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+from PIL import Image
+
+
+MAGENTA = (255, 0, 255)
+
+
+def rgba_array(img: Image.Image) -> np.ndarray:
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    return np.array(img, dtype=np.uint8)
+
+
+def magenta_distance(rgb: np.ndarray, target: tuple[int, int, int] = MAGENTA) -> np.ndarray:
+    diff = rgb[..., :3].astype(np.int32) - np.asarray(target, dtype=np.int32)
+    return np.sqrt(np.einsum("...c,...c->...", diff, diff), dtype=np.float64)
+
+
+def _mask_runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (row, start, end) of every horizontal run of True pixels in raster order."""
+    height, width = mask.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    steps = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(steps == 1)
+    _, ends = np.nonzero(steps == -1)
+    return rows.astype(np.int64), starts.astype(np.int64), ends.astype(np.int64)
+
+
+def _run_edges(
+    rows: np.ndarray, starts: np.ndarray, ends: np.ndarray, width: int, diagonal: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pair every run with the touching runs of the next row (4- or 8-connectivity)."""
+    stride = width + 2
+    start_keys = rows * stride + starts
+    end_keys = rows * stride + ends
+    next_row = (rows + 1) * stride
+    reach = 1 if diagonal else 0
+    lo = np.searchsorted(end_keys, next_row + starts - reach, side="right")
+    hi = np.searchsorted(start_keys, next_row + ends + reach, side="left")
+    counts = np.maximum(hi - lo, 0)
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    upper = np.repeat(np.arange(rows.size, dtype=np.int64), counts)
+    offsets = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+    lower = np.repeat(lo, counts) + offsets
+    return upper, lower
+
+
+def _union_roots(count: int, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Array union-find: hook larger roots onto smaller ones, then pointer-jump to full compression."""
+    parent = np.arange(count, dtype=np.int64)
+    while left.size:
+        left_roots = parent[left]
+        right_roots = parent[right]
+        pending = left_roots != right_roots
+        if not pending.any():
+            break
+        left, right = left[pending], right[pending]
+        left_roots, right_roots = left_roots[pending], right_roots[pending]
+        np.minimum.at(parent, np.maximum(left_roots, right_roots), np.minimum(left_roots, right_roots))
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+    return parent
+
+
+def _runs_to_mask(
+    shape: tuple[int, int], rows: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> np.ndarray:
+    height, width = shape
+    mask = np.zeros(height * width, dtype=bool)
+    lengths = ends - starts
+    total = int(lengths.sum())
+    if total:
+        base = np.repeat(rows * width + starts - (np.cumsum(lengths) - lengths), lengths)
+        mask[base + np.arange(total, dtype=np.int64)] = True
+    return mask.reshape(shape)
+
+
+def remove_bg_magenta(img: Image.Image, threshold: float = 100, edge_threshold: float = 150) -> Image.Image:
+    """Clear near-magenta pixels, then flood-fill (8-connected) softer magenta fringes in from the border."""
+    arr = rgba_array(img)
+    height, width = arr.shape[:2]
+    visible = arr[..., 3] > 0
+    distance = magenta_distance(arr)
+    clear = visible & (distance < threshold)
+    passable = ~visible | clear | (distance < edge_threshold)
+
+    rows, starts, ends = _mask_runs(passable)
+    if rows.size:
+        upper, lower = _run_edges(rows, starts, ends, width, diagonal=True)
+        roots = _union_roots(rows.size, upper, lower)
+        on_border = (rows == 0) | (rows == height - 1) | (starts == 0) | (ends == width)
+        reached = np.isin(roots, np.unique(roots[on_border]))
+        flooded = _runs_to_mask((height, width), rows[reached], starts[reached], ends[reached])
+        clear |= flooded & visible
+    arr[clear] = 0
+    return Image.fromarray(arr, "RGBA")
+
+
+def clean_edges(img: Image.Image, depth: int = 3) -> Image.Image:
+    """Clear dark or magenta-ish visible pixels within `depth` pixels of the image border."""
+    if depth <= 0:
+        return img
+    arr = rgba_array(img)
+    height, width = arr.shape[:2]
+    for strip in (arr[:depth], arr[max(0, height - depth) :], arr[:, :depth], arr[:, max(0, width - depth) :]):
+        dark = (strip[..., :3] < 40).all(axis=-1)
+        strip[(strip[..., 3] > 0) & (dark | (magenta_distance(strip) < 150))] = 0
+    return Image.fromarray(arr, "RGBA")
+
+
+def connected_components(img: Image.Image, min_area: int = 1, with_runs: bool = False) -> list[dict[str, object]]:
+    """Label 4-connected alpha components, largest first (ties keep raster discovery order)."""
+    alpha = np.asarray(img.getchannel("A"))
+    height, width = alpha.shape
+    rows, starts, ends = _mask_runs(alpha > 0)
+    if not rows.size:
+        return []
+    upper, lower = _run_edges(rows, starts, ends, width, diagonal=False)
+    roots = _union_roots(rows.size, upper, lower)
+    labels, run_label = np.unique(roots, return_inverse=True)
+    count = labels.size
+
+    area = np.bincount(run_label, weights=ends - starts, minlength=count).astype(np.int64)
+    min_x = np.full(count, width, dtype=np.int64)
+    min_y = np.full(count, height, dtype=np.int64)
+    max_x = np.zeros(count, dtype=np.int64)
+    max_y = np.zeros(count, dtype=np.int64)
+    np.minimum.at(min_x, run_label, starts)
+    np.minimum.at(min_y, run_label, rows)
+    np.maximum.at(max_x, run_label, ends)
+    np.maximum.at(max_y, run_label, rows)
+    run_on_edge = (rows == 0) | (rows == height - 1) | (starts == 0) | (ends == width)
+    touches_edge = np.bincount(run_label, weights=run_on_edge, minlength=count) > 0
+
+    kept = np.nonzero(area >= min_area)[0]
+    kept = kept[np.argsort(-area[kept], kind="stable")]
+    if with_runs:
+        run_order = np.argsort(run_label, kind="stable")
+        run_bounds = np.searchsorted(run_label[run_order], np.arange(count + 1))
+    components: list[dict[str, object]] = []
+    for index, size, x0, y0, x1, y1, edge in zip(
+        kept.tolist(),
+        area[kept].tolist(),
+        min_x[kept].tolist(),
+        min_y[kept].tolist(),
+        max_x[kept].tolist(),
+        (max_y[kept] + 1).tolist(),
+        touches_edge[kept].tolist(),
+    ):
+        component: dict[str, object] = {"area": size, "bbox": (x0, y0, x1, y1), "touches_edge": edge}
+        if with_runs:
+            selected = run_order[run_bounds[index] : run_bounds[index + 1]]
+            component["runs"] = (rows[selected], starts[selected], ends[selected])
+        components.append(component)
+    return components
+
+
+def mask_to_component(img: Image.Image, component: dict[str, object]) -> Image.Image:
+    """Keep only the pixels of a component returned by `connected_components(..., with_runs=True)`."""
+    arr = rgba_array(img)
+    rows, starts, ends = component["runs"]  # type: ignore[misc]
+    arr[~_runs_to_mask(arr.shape[:2], rows, starts, ends)] = 0
+    return Image.fromarray(arr, "RGBA")
+
+
+TRANSPARENT_KEY = (255, 0, 254)
+
+
+def pack_rgb(arr: np.ndarray) -> np.ndarray:
+    """24-bit color keys (R | G << 8 | B << 16) read straight from the RGBA bytes without per-channel copies."""
+    rgba = np.ascontiguousarray(arr, dtype=np.uint8)
+    return rgba.view("<u4")[..., 0] & np.uint32(0xFFFFFF)
+
+
+def _unpack_rgb(packed: np.ndarray) -> np.ndarray:
+    return np.stack([packed & 0xFF, (packed >> 8) & 0xFF, (packed >> 16) & 0xFF], axis=-1).astype(np.int64)
+
+
+def _median_cut(colors: np.ndarray, counts: np.ndarray, max_colors: int) -> tuple[np.ndarray, np.ndarray]:
+    """Weighted median cut over unique colors; returns (palette RGB rows, box index per input color)."""
+    boxes = [np.arange(colors.shape[0])]
+    spans = [int(np.ptp(colors, axis=0).max())]
+    while len(boxes) < max_colors:
+        target = max(range(len(boxes)), key=lambda index: (spans[index], boxes[index].size))
+        if spans[target] == 0:
+            break
+        members = boxes[target]
+        channel = int(np.argmax(np.ptp(colors[members], axis=0)))
+        members = members[np.argsort(colors[members, channel], kind="stable")]
+        weights = np.cumsum(counts[members])
+        cut = int(np.searchsorted(weights, weights[-1] / 2.0, side="left")) + 1
+        cut = min(max(cut, 1), members.size - 1)
+        left, right = members[:cut], members[cut:]
+        boxes[target : target + 1] = [left, right]
+        spans[target : target + 1] = [int(np.ptp(colors[left], axis=0).max()), int(np.ptp(colors[right], axis=0).max())]
+
+    palette = np.zeros((len(boxes), 3), dtype=np.uint8)
+    assignment = np.zeros(colors.shape[0], dtype=np.int64)
+    for index, members in enumerate(boxes):
+        weights = counts[members].astype(np.float64)
+        palette[index] = np.clip(np.rint((colors[members] * weights[:, None]).sum(axis=0) / weights.sum()), 0, 255)
+        assignment[members] = index
+    return palette, assignment
+
+
+def build_shared_palette(
+    frames: Iterable[np.ndarray], alpha_cutoff: int = 128, max_colors: int = 255
+) -> tuple[np.ndarray, list[int]]:
+    """Quantize the opaque pixels of all frames once.
+
+    Returns ``(24-bit color -> palette index LUT, 768-entry palette)``; index 0 is reserved for transparency
+    and carries ``TRANSPARENT_KEY``.
+    """
+    per_frame_colors: list[np.ndarray] = []
+    per_frame_counts: list[np.ndarray] = []
+    for arr in frames:
+        keys = pack_rgb(arr)[arr[..., 3] >= alpha_cutoff]
+        frame_colors, frame_counts = np.unique(keys, return_counts=True)
+        per_frame_colors.append(frame_colors)
+        per_frame_counts.append(frame_counts)
+    uniques, inverse = np.unique(np.concatenate(per_frame_colors), return_inverse=True)
+    counts = np.bincount(inverse, weights=np.concatenate(per_frame_counts), minlength=uniques.size).astype(np.int64)
+
+    if uniques.size <= max_colors:
+        palette_rgb = _unpack_rgb(uniques).astype(np.uint8)
+        assignment = np.arange(uniques.size, dtype=np.int64)
+    else:
+        palette_rgb, assignment = _median_cut(_unpack_rgb(uniques), counts, max_colors)
+
+    lut = np.zeros(1 << 24, dtype=np.uint8)
+    lut[uniques] = assignment + 1
+    palette = list(TRANSPARENT_KEY) + palette_rgb.reshape(-1).tolist()
+    palette.extend([0] * (768 - len(palette)))
+    return lut, palette
+
+
+def palette_indices(arr: np.ndarray, lut: np.ndarray, alpha_cutoff: int = 128) -> np.ndarray:
+    """Map an RGBA frame onto the shared palette; pixels below the alpha cutoff get the transparent index 0."""
+    opaque = arr[..., 3] >= alpha_cutoff
+    indices = np.zeros(arr.shape[:2], dtype=np.uint8)
+    indices[opaque] = lut[pack_rgb(arr)[opaque]]
+    return indices
+
+
+def hard_alpha(arr: np.ndarray, alpha_cutoff: int = 128) -> np.ndarray:
+    """Binary alpha with fully transparent pixels zeroed, matching what the GIF encoder keeps."""
+    out = arr.copy()
+    opaque = out[..., 3] >= alpha_cutoff
+    out[..., 3] = np.where(opaque, 255, 0).astype(np.uint8)
+    out[~opaque] = 0
+    return out
+
+
+def _div255(values: np.ndarray) -> np.ndarray:
+    values = values + 128
+    return (values + (values >> 8)) >> 8
+
+
+def compose_grid(frames: list[np.ndarray], rows: int, cols: int, cell_size: int) -> np.ndarray:
+    """Tile equal-size RGBA cells into a sheet, blending each cell by its own alpha onto transparency.
+
+    Matches ``Image.paste(frame, box, frame)`` on an empty canvas bit for bit.
+    """
+    grid = np.zeros((rows * cols, cell_size, cell_size, 4), dtype=np.uint8)
+    if frames:
+        stacked = np.stack(frames[: rows * cols]).astype(np.uint32)
+        alpha = stacked[..., 3:4]
+        grid[: stacked.shape[0]] = _div255(stacked * alpha).astype(np.uint8)
+    return grid.reshape(rows, cols, cell_size, cell_size, 4).transpose(0, 2, 1, 3, 4).reshape(rows * cell_size, cols * cell_size, 4)
@@ -0,0 +1,64 @@
+"""Tests for the GIF/APNG/WebP exports of generate2dsprite.py: all three keep the same binary transparency."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence, features
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from generate2dsprite import save_transparent_animation, save_transparent_gif
+
+
+def _frames():
+    """Three 12x10 frames: opaque body, a half-transparent band on both sides of the cutoff, a clear corner."""
+    frames = []
+    for index in range(3):
+        arr = np.zeros((10, 12, 4), dtype=np.uint8)
+        arr[2:8, 2 + index : 8 + index] = (40 * index + 30, 160, 60, 255)
+        arr[0, :] = (200, 10, 10, 127)  # below the cutoff: must come out fully transparent
+        arr[9, :] = (10, 10, 200, 128)  # at the cutoff: must come out opaque
+        frames.append(Image.fromarray(arr, "RGBA"))
+    return frames
+
+
+def _expected_alpha(frame):
+    return np.where(np.asarray(frame)[..., 3] >= 128, 255, 0)
+
+
+def _decoded(path):
+    with Image.open(path) as img:
+        return [frame.convert("RGBA") for frame in ImageSequence.Iterator(img)]
+
+
+def test_gif_uses_index_zero_for_transparent_pixels(tmp_path):
+    frames = _frames()
+    path = tmp_path / "anim.gif"
+    save_transparent_gif(frames, path, 100)
+
+    with Image.open(path) as img:
+        assert (img.mode, img.info["transparency"], img.n_frames) == ("P", 0, len(frames))
+        assert ((np.asarray(img) == 0) == (_expected_alpha(frames[0]) == 0)).all()
+    # Later frames are composited by the decoder; their alpha must follow the same cutoff.
+    for decoded, source in zip(_decoded(path), frames):
+        assert (np.asarray(decoded)[..., 3] == _expected_alpha(source)).all()
+
+
+@pytest.mark.parametrize("fmt", ["apng", "webp"])
+def test_apng_and_webp_keep_the_gif_transparency(tmp_path, fmt):
+    if fmt == "webp" and not features.check("webp"):
+        pytest.skip("Pillow was built without WebP support")
+    frames = _frames()
+    path = tmp_path / f"anim.{fmt}"
+    save_transparent_animation(frames, path, 100, fmt)
+
+    decoded = _decoded(path)
+    assert len(decoded) == len(frames)
+    for image, source in zip(decoded, frames):
+        arr = np.asarray(image)
+        expected = _expected_alpha(source)
+        assert (arr[..., 3] == expected).all()
+        assert not arr[expected == 0].any()  # transparent pixels carry no stray colour
+        assert (arr[expected == 255][:, :3] == np.asarray(source)[expected == 255][:, :3]).all()
@@ -0,0 +1,102 @@
+"""Tests for the batch mode of generate2dsprite.py (sprite_batch.run_batch)."""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import generate2dsprite
+
+
+def _sheet(path, color):
+    """2x2 idle sheet: one square per quadrant on flat magenta."""
+    img = Image.new("RGBA", (64, 64), (255, 0, 255, 255))
+    for left, top in ((8, 8), (40, 8), (8, 40), (40, 40)):
+        img.paste(Image.new("RGBA", (16, 16), color), (left, top))
+    img.save(path)
+
+
+def _run_batch(inputs, output_dir, jobs, *extra):
+    argv = [
+        "generate2dsprite.py", "batch",
+        "--inputs", str(inputs),
+        "--target", "asset",
+        "--mode", "idle",
+        "--output-dir", str(output_dir),
+        "--cell-size", "24",
+        "--jobs", str(jobs),
+        *extra,
+    ]
+    with patch.object(sys, "argv", argv):
+        try:
+            generate2dsprite.main()
+        except SystemExit as exc:
+            return exc.code
+    return 0
+
+
+def _manifest(output_dir):
+    return json.loads((output_dir / "batch-manifest.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def sheets(tmp_path):
+    source = tmp_path / "in"
+    source.mkdir()
+    _sheet(source / "slime.png", (40, 160, 60, 255))
+    _sheet(source / "bat.png", (30, 60, 200, 255))
+    (source / "broken.png").write_bytes(b"not a png")
+    (source / "notes.txt").write_text("ignored", encoding="utf-8")
+    return source
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_failing_image_is_isolated_and_manifest_is_consolidated(sheets, tmp_path, jobs):
+    out = tmp_path / "out"
+
+    assert _run_batch(sheets, out, jobs) == 1
+
+    manifest = _manifest(out)
+    items = {Path(item["input"]).name: item for item in manifest["items"]}
+    assert list(items) == ["bat.png", "broken.png", "slime.png"]
+    assert manifest["summary"] == {"total": 3, "processed": 2, "reused": 0, "failed": 1}
+    assert items["broken.png"]["status"] == "failed"
+    assert items["broken.png"]["error"].startswith("UnidentifiedImageError")
+    for name in ("bat.png", "slime.png"):
+        item = items[name]
+        assert item["status"] == "ok"
+        assert item["frame_labels"] == ["idle-1", "idle-2", "idle-3", "idle-4"]
+        assert Path(item["meta"]).is_file()
+        assert all(Path(path).is_file() for path in item["gifs"])
+        assert Path(item["output_dir"]).parent == out
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_unchanged_images_are_skipped_and_changes_reprocess_only_what_moved(sheets, tmp_path, jobs):
+    (sheets / "broken.png").unlink()
+    out = tmp_path / "out"
+    assert _run_batch(sheets, out, jobs) == 0
+    first = {Path(item["input"]).name: item for item in _manifest(out)["items"]}
+    gif = Path(first["bat.png"]["gifs"][0])
+    gif_mtime = gif.stat().st_mtime_ns
+
+    assert _run_batch(sheets, out, jobs) == 0
+    second = _manifest(out)
+    assert second["summary"] == {"total": 2, "processed": 0, "reused": 2, "failed": 0}
+    assert gif.stat().st_mtime_ns == gif_mtime
+
+    _sheet(sheets / "slime.png", (200, 120, 40, 255))
+    assert _run_batch(sheets, out, jobs) == 0
+    third = {Path(item["input"]).name: item for item in _manifest(out)["items"]}
+    assert (third["bat.png"]["reused"], third["slime.png"]["reused"]) == (True, False)
+    assert third["slime.png"]["source_sha256"] != first["slime.png"]["source_sha256"]
+
+    assert _run_batch(sheets, out, jobs, "--duration", "120") == 0
+    assert _manifest(out)["summary"]["processed"] == 2
+    assert _run_batch(sheets, out, jobs, "--duration", "120", "--force") == 0
+    assert _manifest(out)["summary"]["reused"] == 0
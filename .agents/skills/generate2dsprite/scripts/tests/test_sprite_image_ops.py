@@ -0,0 +1,181 @@
+"""Tests for sprite_image_ops.py: the array versions must match the per-pixel originals exactly."""
+
+import math
+import sys
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sprite_image_ops import clean_edges, connected_components, mask_to_component, remove_bg_magenta
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+# Per-pixel reference implementations, as they were before vectorization.
+
+
+def _dist(r, g, b):
+    return math.sqrt((r - 255) ** 2 + g**2 + (b - 255) ** 2)
+
+
+def reference_remove_bg_magenta(img, threshold=100, edge_threshold=150):
+    pixels = img.load()
+    width, height = img.size
+    for x in range(width):
+        for y in range(height):
+            r, g, b, a = pixels[x, y]
+            if a and _dist(r, g, b) < threshold:
+                pixels[x, y] = (0, 0, 0, 0)
+
+    visited = set()
+    queue = deque()
+    for x in range(width):
+        queue.append((x, 0))
+        queue.append((x, height - 1))
+    for y in range(height):
+        queue.append((0, y))
+        queue.append((width - 1, y))
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) in visited or x < 0 or x >= width or y < 0 or y >= height:
+            continue
+        visited.add((x, y))
+        r, g, b, a = pixels[x, y]
+        if a != 0 and _dist(r, g, b) >= edge_threshold:
+            continue
+        if a != 0:
+            pixels[x, y] = (0, 0, 0, 0)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if (dx or dy) and (x + dx, y + dy) not in visited:
+                    queue.append((x + dx, y + dy))
+    return img
+
+
+def reference_clean_edges(img, depth=3):
+    pixels = img.load()
+    width, height = img.size
+
+    def _clear(x, y):
+        r, g, b, a = pixels[x, y]
+        if a and ((r < 40 and g < 40 and b < 40) or _dist(r, g, b) < 150):
+            pixels[x, y] = (0, 0, 0, 0)
+
+    for d in range(depth):
+        for x in range(width):
+            for y in (d, height - 1 - d):
+                if 0 <= y < height:
+                    _clear(x, y)
+        for y in range(height):
+            for x in (d, width - 1 - d):
+                if 0 <= x < width:
+                    _clear(x, y)
+    return img
+
+
+def reference_components(img, min_area=1):
+    """BFS labeling (4-connected) in raster discovery order; also returns each component's pixel set."""
+    pixels = img.getchannel("A").load()
+    width, height = img.size
+    visited = [[False] * width for _ in range(height)]
+    components = []
+    for y in range(height):
+        for x in range(width):
+            if pixels[x, y] == 0 or visited[y][x]:
+                continue
+            queue = deque([(x, y)])
+            visited[y][x] = True
+            members = set()
+            touches_edge = False
+            while queue:
+                cx, cy = queue.popleft()
+                members.add((cx, cy))
+                touches_edge |= cx in (0, width - 1) or cy in (0, height - 1)
+                for nx, ny in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+                    if 0 <= nx < width and 0 <= ny < height and pixels[nx, ny] > 0 and not visited[ny][nx]:
+                        visited[ny][nx] = True
+                        queue.append((nx, ny))
+            if len(members) >= min_area:
+                xs = [px for px, _ in members]
+                ys = [py for _, py in members]
+                bbox = (min(xs), min(ys), max(xs) + 1, max(ys) + 1)
+                components.append({"area": len(members), "bbox": bbox, "touches_edge": touches_edge, "pixels": members})
+    components.sort(key=lambda item: item["area"], reverse=True)
+    return components
+
+
+def _fixture(name):
+    with Image.open(FIXTURES / name) as img:
+        return img.convert("RGBA")
+
+
+def _random_sheets():
+    rng = np.random.default_rng(7)
+    for height, width in ((1, 1), (1, 9), (9, 1), (13, 17), (31, 24)):
+        arr = rng.integers(0, 256, size=(height, width, 4), dtype=np.uint8)
+        arr[rng.random((height, width)) < 0.5, :3] = (255, 0, 255)
+        arr[rng.random((height, width)) < 0.2, 3] = 0
+        arr[rng.random((height, width)) < 0.2, :3] = (200, 50, 190)
+        yield f"random-{height}x{width}", Image.fromarray(arr, "RGBA")
+
+
+def _cases():
+    yield "magenta_sheet", _fixture("magenta_sheet.png")
+    yield "alpha_components", _fixture("alpha_components.png")
+    yield from _random_sheets()
+
+
+CASES = list(_cases())
+IDS = [name for name, _ in CASES]
+IMAGES = [img for _, img in CASES]
+
+
+@pytest.mark.parametrize("img", IMAGES, ids=IDS)
+@pytest.mark.parametrize("threshold,edge_threshold", [(100, 150), (60, 200)])
+def test_remove_bg_magenta_matches_reference(img, threshold, edge_threshold):
+    expected = reference_remove_bg_magenta(img.copy(), threshold, edge_threshold)
+    assert remove_bg_magenta(img.copy(), threshold, edge_threshold).tobytes() == expected.tobytes()
+
+
+@pytest.mark.parametrize("img", IMAGES, ids=IDS)
+@pytest.mark.parametrize("depth", [1, 3, 20])
+def test_clean_edges_matches_reference(img, depth):
+    expected = reference_clean_edges(img.copy(), depth)
+    assert clean_edges(img.copy(), depth).tobytes() == expected.tobytes()
+
+
+@pytest.mark.parametrize("img", IMAGES, ids=IDS)
+@pytest.mark.parametrize("min_area", [1, 4])
+def test_connected_components_match_reference_labels_and_boxes(img, min_area):
+    expected = reference_components(img, min_area)
+    actual = connected_components(img, min_area, with_runs=True)
+
+    assert [(c["area"], c["bbox"], c["touches_edge"]) for c in actual] == [
+        (c["area"], c["bbox"], c["touches_edge"]) for c in expected
+    ]
+    assert [(c["area"], c["bbox"], c["touches_edge"]) for c in connected_components(img, min_area)] == [
+        (c["area"], c["bbox"], c["touches_edge"]) for c in expected
+    ]
+    for component, reference in zip(actual, expected):
+        alpha = np.asarray(mask_to_component(img, component).getchannel("A"))
+        ys, xs = np.nonzero(alpha)
+        assert set(zip(xs.tolist(), ys.tolist())) == reference["pixels"]
+
+
+def test_fixture_components_cover_the_tricky_shapes():
+    components = reference_components(_fixture("alpha_components.png"))
+    areas = [c["area"] for c in components]
+    assert areas.count(9) >= 2  # equal-area tie keeps discovery order
+    assert any(c["touches_edge"] for c in components)
+    assert sum(1 for c in components if c["area"] == 1) >= 5
+
+
+def test_fixture_magenta_sheet_exercises_the_border_flood():
+    alpha = np.asarray(reference_remove_bg_magenta(_fixture("magenta_sheet.png")).getchannel("A"))
+    assert not alpha[3, 3:11].any()  # soft fringe reached from the border
+    assert alpha[7:9, 6:8].all()  # same colour, enclosed by the sprite
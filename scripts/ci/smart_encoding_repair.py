@@ -6,18 +6,24 @@ Repairs garbled Chinese text by comparing with backup versions.
 
 import os
 import re
+import sys
 import difflib
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict
 
-# Garbled patterns to detect (single characters that commonly appear in garbled text)
-GARBLED_CHARS = set(['闁', '鐟', '閻', '濡', '缂', '婵', '鐜', '鍑', '鍑', '鍑', '鍑', '鍑',
-                      '鍑', '鍑', '鍑', '鍑', '鍑', '鍑', '鍑', '鍑', '鍑', '鍑', '鍑'])
+try:
+    from _encoding_engine import RULES_BY_NAME, text_hits
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'sc'))
+    from _encoding_engine import RULES_BY_NAME, text_hits
+
+# Garbled patterns to detect: runs of characters that commonly appear in garbled text
+# (rule "repair_garbled_run" of _encoding_engine).
+GARBLED_PATTERNS = [RULES_BY_NAME['repair_garbled_run'].pattern]
 
 def is_likely_garbled(text: str) -> bool:
     """Check if text contains likely garbled characters."""
-    garbled_count = sum(1 for char in text if char in GARBLED_CHARS)
-    return garbled_count > 0
+    return bool(text_hits(text, ['repair_garbled_run']))
 
 class GarbledTextRepair:
     def __init__(self, current_file: Path, backup_file: Path):
@@ -296,5 +302,4 @@ def main():
     return 0 if len(failed_files) == 0 else 1
 
 if __name__ == '__main__':
-    import sys
     sys.exit(main())
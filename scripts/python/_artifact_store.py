@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Content-addressed blob store for pipeline / light-lane artifact snapshots.
+
+Blobs live under logs/ci/.cas/blobs/<sha[:2]>/<sha256>. A snapshot directory is
+materialized from blobs with hardlinks (reflink or plain copy as fallback) and
+registered as a ref manifest under logs/ci/.cas/refs/, which gc_artifact_store
+uses as the reference count once retention has removed snapshot directories.
+
+Snapshots are write-once: rewriting a snapshot file in place would also rewrite
+the shared blob, so callers replace snapshot directories instead of editing them.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import json
+import os
+import shutil
+import sys
+import uuid
+from pathlib import Path
+from typing import Any, Iterable
+
+
+_CHUNK_BYTES = 1 << 20
+_FICLONE = 0x40049409
+
+
+def store_root(root: Path) -> Path:
+    return root / "logs" / "ci" / ".cas"
+
+
+def owning_root(target_dir: Path, *, default: Path | None = None) -> Path:
+    """Repo root whose logs/ci contains ``target_dir``; snapshots outside logs/ci use ``default`` (or cwd)."""
+    resolved = target_dir.resolve()
+    for parent in resolved.parents:
+        if parent.name == "ci" and parent.parent.name == "logs":
+            return parent.parent.parent
+    return default or Path.cwd()
+
+
+def store_enabled() -> bool:
+    return str(os.environ.get("SC_ARTIFACT_STORE") or "").strip().lower() not in {"0", "off", "false", "no"}
+
+
+def _blob_path(store: Path, digest: str) -> Path:
+    return store / "blobs" / digest[:2] / digest
+
+
+def _ref_path(store: Path, snapshot_key: str) -> Path:
+    return store / "refs" / f"{hashlib.sha1(snapshot_key.encode('utf-8')).hexdigest()}.json"
+
+
+def _snapshot_key(root: Path, target_dir: Path) -> str:
+    resolved = target_dir.resolve()
+    try:
+        return str(resolved.relative_to(root.resolve())).replace("\\", "/")
+    except ValueError:
+        return str(resolved).replace("\\", "/")
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def put_file(store: Path, source: Path) -> str:
+    """Copy ``source`` into the store once and return its sha256."""
+    digest = file_sha256(source)
+    blob = _blob_path(store, digest)
+    if not blob.exists():
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        staging = blob.parent / f".{digest}.{uuid.uuid4().hex}.tmp"
+        try:
+            shutil.copy2(source, staging)
+            os.replace(staging, blob)
+        finally:
+            if staging.exists():
+                staging.unlink()
+    return digest
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover
+        return False
+    try:
+        with source.open("rb") as src, target.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        if target.exists():
+            target.unlink()
+        return False
+    shutil.copystat(source, target)
+    return True
+
+
+def materialize(blob: Path, target: Path) -> str:
+    """Place ``blob`` at ``target``; returns the method used: hardlink, reflink or copy."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists() or target.is_symlink():
+        target.unlink()
+    try:
+        os.link(blob, target)
+        return "hardlink"
+    except OSError:
+        pass
+    if _reflink(blob, target):
+        return "reflink"
+    shutil.copy2(blob, target)
+    return "copy"
+
+
+def _write_ref(store: Path, *, snapshot_key: str, files: dict[str, str]) -> None:
+    path = _ref_path(store, snapshot_key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "snapshot": snapshot_key,
+        "created_at": dt.datetime.now().astimezone().isoformat(timespec="seconds"),
+        "files": files,
+    }
+    staging = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+    staging.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(staging, path)
+
+
+def snapshot_files(
+    *,
+    target_dir: Path,
+    files: Iterable[tuple[Path, str]],
+    replace: bool = False,
+    root: Path | None = None,
+) -> dict[str, Any]:
+    """Snapshot ``(source file, relative target)`` pairs into ``target_dir`` through the store.
+
+    With ``replace`` the previous snapshot directory is removed first; otherwise files are merged
+    into it and the ref manifest is extended. Falls back to plain copies when the store is disabled.
+    """
+    if replace and target_dir.exists():
+        shutil.rmtree(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    pairs = list(files)
+    methods: dict[str, int] = {}
+    if not store_enabled():
+        for source, rel in pairs:
+            target = target_dir / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
+        return {"files": len(pairs), "methods": {"copy": len(pairs)} if pairs else {}, "store": ""}
+
+    root = owning_root(target_dir, default=root)
+    store = store_root(root)
+    snapshot_key = _snapshot_key(root, target_dir)
+    manifest: dict[str, str] = {}
+    if not replace:
+        manifest.update(_load_ref(_ref_path(store, snapshot_key)).get("files") or {})
+    for source, rel in pairs:
+        digest = put_file(store, source)
+        try:
+            method = materialize(_blob_path(store, digest), target_dir / rel)
+        except FileNotFoundError:
+            # put_file found the blob, but a concurrent gc_artifact_store removed it before the link:
+            # it was in no ref yet and had a single link. Store it again from the source.
+            digest = put_file(store, source)
+            method = materialize(_blob_path(store, digest), target_dir / rel)
+        methods[method] = methods.get(method, 0) + 1
+        manifest[str(rel).replace("\\", "/")] = digest
+    _write_ref(store, snapshot_key=snapshot_key, files=manifest)
+    return {"files": len(pairs), "methods": methods, "store": str(store).replace("\\", "/")}
+
+
+def snapshot_tree(*, source_dir: Path, target_dir: Path, root: Path | None = None) -> dict[str, Any]:
+    """``shutil.copytree`` replacement: mirror ``source_dir`` into a fresh ``target_dir`` from blobs."""
+    pairs: list[tuple[Path, str]] = []
+    empty_dirs: list[str] = []
+    for current, dirnames, filenames in os.walk(source_dir):
+        dirnames.sort()
+        current_path = Path(current)
+        rel_dir = current_path.relative_to(source_dir)
+        if not dirnames and not filenames and current_path != source_dir:
+            empty_dirs.append(str(rel_dir))
+        for name in sorted(filenames):
+            path = current_path / name
+            if path.is_file():
+                pairs.append((path, str(rel_dir / name)))
+    result = snapshot_files(target_dir=target_dir, files=pairs, replace=True, root=root)
+    for rel in empty_dirs:
+        (target_dir / rel).mkdir(parents=True, exist_ok=True)
+    return result
+
+
+def _load_ref(path: Path) -> dict[str, Any]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def gc_artifact_store(root: Path, *, dry_run: bool = False) -> dict[str, Any]:
+    """Drop refs whose snapshot directory is gone, then delete blobs no live ref or hardlink still uses."""
+    store = store_root(root)
+    removed_refs: list[str] = []
+    live: set[str] = set()
+    refs_dir = store / "refs"
+    for ref_path in sorted(refs_dir.glob("*.json")) if refs_dir.exists() else []:
+        payload = _load_ref(ref_path)
+        snapshot = str(payload.get("snapshot") or "")
+        snapshot_dir = Path(snapshot) if Path(snapshot).is_absolute() else root / snapshot
+        if not snapshot or not snapshot_dir.is_dir():
+            removed_refs.append(snapshot or ref_path.name)
+            if not dry_run:
+                ref_path.unlink(missing_ok=True)
+            continue
+        live.update(str(digest) for digest in dict(payload.get("files") or {}).values())
+
+    deleted_blobs = 0
+    freed_bytes = 0
+    kept_linked = 0
+    blobs_dir = store / "blobs"
+    for blob in sorted(blobs_dir.glob("*/*")) if blobs_dir.exists() else []:
+        if not blob.is_file() or blob.name.endswith(".tmp") or blob.name in live:
+            continue
+        stat = blob.stat()
+        if stat.st_nlink > 1:
+            kept_linked += 1
+            continue
+        deleted_blobs += 1
+        freed_bytes += int(stat.st_size)
+        if not dry_run:
+            blob.unlink(missing_ok=True)
+
+    return {
+        "store": str(store).replace("\\", "/"),
+        "dry_run": dry_run,
+        "removed_ref_count": len(removed_refs),
+        "removed_refs": removed_refs,
+        "live_blob_count": len(live),
+        "kept_linked_blob_count": kept_linked,
+        "deleted_blob_count": deleted_blobs,
+        "freed_bytes": freed_bytes,
+    }
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Deterministic synthetic repo for the sc/python toolchain benchmarks.
+
+generate_synthetic_repo() writes, from a seed and a scale:
+- a task triplet (.taskmaster/tasks/tasks.json, tasks_back.json, tasks_gameplay.json) with N tasks;
+- M code files split over Game.Core, Game.Core.Tests, Game.Godot and Tests.Godot (.cs / .gd);
+- overlay and ADR docs the tasks refer to, mixed ASCII / CJK text with a few seeded encoding defects;
+- K days of logs/ci review-pipeline runs (summary.json, run-events.jsonl, per-task latest.json);
+- a stub LLM reply script for the local-stub backend (SC_LLM_STUB_CMD) and a ``py`` launcher shim.
+
+Entry points resolve the repo from their own location, so macro benchmarks need the toolchain
+inside the synthetic repo: copy_scripts=True copies scripts/sc and scripts/python (without tests).
+The same seed and scale always produce byte-identical files, including the timestamps in logs.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import random
+import shutil
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    from _pipeline_events import build_run_event
+except ImportError:
+    _SC_DIR = Path(__file__).resolve().parents[1] / "sc"
+    if str(_SC_DIR) not in sys.path:
+        sys.path.insert(0, str(_SC_DIR))
+    from _pipeline_events import build_run_event
+
+
+BENCH_PRD = "PRD-Bench"
+TASKS_DIR = ".taskmaster/tasks"
+OVERLAY_DIR = f"docs/architecture/overlays/{BENCH_PRD}/08"
+STUB_LLM_SCRIPT = "scripts/bench/llm_stub.py"
+PY_SHIM_DIR = "scripts/bench/bin"
+PY_SHIM_ENV = "SC_BENCH_PYTHON"
+DEFAULT_END_DATE = dt.date(2026, 3, 31)
+PIPELINE_STEPS = ("sc-test", "sc-acceptance-check", "sc-llm-review")
+_TOOLCHAIN_DIRS = ("scripts/sc", "scripts/python")
+_COPY_IGNORE = shutil.ignore_patterns("tests", "__pycache__", "*.pyc")
+_WORDS = (
+    "inventory", "combat", "quest", "save", "load", "audit", "event", "bus", "scene", "wave",
+    "spawn", "loot", "damage", "shield", "timer", "reward", "config", "profile", "route", "state",
+)
+_CJK_LINES = (
+    "验收标准：核心规则必须在 Game.Core 中实现，不依赖 Godot。",
+    "场景层只负责适配，领域事件通过事件总线广播。",
+    "存档写入失败时必须记录审计日志并保持旧数据。",
+)
+_DEFECT_LINES = (
+    "garbled " + "?" * 4 + " leftover from a broken export",
+    "broken \ufffd replacement char",
+    "cp1252 mojibake \u00e2\u20ac\u0153quoted\u00e2\u20ac text",
+)
+_STUB_LLM_SOURCE = '''#!/usr/bin/env python3
+"""Benchmark stub for the local-stub llm backend: read the prompt, answer with a fixed review."""
+import sys
+
+prompt = sys.stdin.read()
+print("## Findings")
+print(f"- prompt_chars: {len(prompt)}")
+print("- no blocking issues in the synthetic diff")
+print("Verdict: OK")
+'''
+
+# Pipeline steps spawn "py -3 ..."; off Windows the shim stands in for the launcher.
+_PY_SHIM_SOURCE = f'''#!/bin/sh
+if [ "$1" = "-3" ]; then shift; fi
+exec "${{{PY_SHIM_ENV}:-python3}}" "$@"
+'''
+
+
+@dataclass(frozen=True)
+class SyntheticRepoSpec:
+    tasks: int = 50
+    code_files: int = 200
+    log_days: int = 7
+    runs_per_day: int = 10
+    docs: int = 20
+    seed: int = 0
+    end_date: dt.date = DEFAULT_END_DATE
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["end_date"] = self.end_date.isoformat()
+        return payload
+
+
+def _write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8", newline="\n")
+
+
+def _write_json(path: Path, payload: Any) -> None:
+    _write_text(path, json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
+
+
+def _phrase(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _pascal(text: str) -> str:
+    return "".join(part.capitalize() for part in text.split())
+
+
+def _code_paths(spec: SyntheticRepoSpec) -> list[str]:
+    """Stable file list: the i-th file rotates over core, core test, godot script and godot test."""
+    paths: list[str] = []
+    for index in range(spec.code_files):
+        slot, group = index % 4, index // 4
+        module = f"Feature{group:04d}"
+        if slot == 0:
+            paths.append(f"Game.Core/Domain/{module}.cs")
+        elif slot == 1:
+            paths.append(f"Game.Core.Tests/Domain/{module}Tests.cs")
+        elif slot == 2:
+            paths.append(f"Game.Godot/Scripts/{module.lower()}_node.gd")
+        else:
+            paths.append(f"Tests.Godot/tests/Domain/test_{module.lower()}_node.gd")
+    return paths
+
+
+def _code_text(path: str, rng: random.Random) -> str:
+    name = Path(path).stem
+    methods = rng.randint(2, 6)
+    if path.endswith(".cs"):
+        namespace = ".".join(Path(path).parent.parts)
+        body = [f"namespace {namespace};", "", f"public sealed class {name}", "{"]
+        for index in range(methods):
+            verb = _pascal(_phrase(rng, 2))
+            if path.startswith("Game.Core.Tests/"):
+                body += ["    [Fact]", f"    public void {verb}ShouldHold{index}()", "    {", f"        Assert.Equal({index}, {index});", "    }", ""]
+            else:
+                body += [f"    public int {verb}{index}(int value)", "    {", f"        return value + {rng.randint(1, 99)};", "    }", ""]
+        return "\n".join(body).rstrip() + "\n}\n"
+    body = ["extends Node", ""]
+    for index in range(methods):
+        verb = _phrase(rng, 2).replace(" ", "_")
+        prefix = "test_" if path.startswith("Tests.Godot/") else ""
+        body += [f"func {prefix}{verb}_{index}() -> void:", f"\tvar value := {rng.randint(1, 99)}", "\tprint(value)", ""]
+    return "\n".join(body)
+
+
+def _doc_paths(spec: SyntheticRepoSpec) -> list[str]:
+    adr_count = max(1, spec.docs // 2)
+    overlay_count = max(1, spec.docs - adr_count)
+    paths = [f"docs/adr/ADR-{9000 + index:04d}-bench-{index}.md" for index in range(adr_count)]
+    paths += [f"{OVERLAY_DIR}/_index.md"] + [f"{OVERLAY_DIR}/08-Bench-Slice-{index:03d}.md" for index in range(1, overlay_count)]
+    return paths
+
+
+def _doc_text(path: str, rng: random.Random, *, index: int) -> str:
+    lines = [f"# {Path(path).stem}", "", "## Context", ""]
+    for _ in range(rng.randint(6, 16)):
+        roll = rng.random()
+        if roll < 0.35:
+            lines.append(rng.choice(_CJK_LINES))
+        else:
+            lines.append(_phrase(rng, rng.randint(6, 14)).capitalize() + ".")
+    # Every seventh doc carries one defect so the gate scanners have findings to report.
+    if index % 7 == 3:
+        lines.append(_DEFECT_LINES[(index // 7) % len(_DEFECT_LINES)])
+    return "\n".join(lines) + "\n"
+
+
+def _task_views(spec: SyntheticRepoSpec, rng: random.Random, code_paths: list[str], doc_paths: list[str]) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]]]:
+    overlays = [path for path in doc_paths if path.startswith(OVERLAY_DIR)]
+    adrs = [Path(path).name.split("-bench-")[0] for path in doc_paths if path.startswith("docs/adr/")]
+    core_tests = [path for path in code_paths if path.startswith("Game.Core.Tests/")] or ["Game.Core.Tests/Domain/BenchTests.cs"]
+    godot_tests = [path for path in code_paths if path.startswith("Tests.Godot/")] or ["Tests.Godot/tests/Domain/test_bench.gd"]
+    master: list[dict[str, Any]] = []
+    back: list[dict[str, Any]] = []
+    gameplay: list[dict[str, Any]] = []
+    for number in range(1, spec.tasks + 1):
+        title = f"Bench task {number}: {_phrase(rng, 3)}"
+        status = "in-progress" if number == 1 else rng.choice(("pending", "pending", "done"))
+        overlay = rng.choice(overlays)
+        adr_refs = sorted(set(rng.sample(adrs, k=min(len(adrs), rng.randint(1, 3)))))
+        core_ref = rng.choice(core_tests)
+        godot_ref = rng.choice(godot_tests)
+        master.append(
+            {
+                "id": str(number),
+                "title": title,
+                "status": status,
+                "priority": rng.choice(("P1", "P2", "P3")),
+                "details": _phrase(rng, 24).capitalize() + ".",
+                "testStrategy": "xUnit for core rules, GdUnit4 for scene glue.",
+                "dependencies": [str(dep) for dep in range(max(1, number - 2), number)],
+                "adrRefs": adr_refs,
+                "archRefs": ["CH01", "CH07"],
+                "overlay": overlay,
+            }
+        )
+        view_base = {
+            "taskmaster_id": number,
+            "semantic_review_tier": rng.choice(("minimal", "targeted", "full")),
+            "adr_refs": adr_refs,
+            "chapter_refs": ["CH01", "CH07"],
+            "overlay_refs": [f"{OVERLAY_DIR}/_index.md", overlay],
+        }
+        back.append(
+            {
+                "id": f"BK-{number:04d}",
+                **view_base,
+                "title": f"{title} (back view)",
+                "layer": "core",
+                "details": rng.choice(_CJK_LINES) + " " + _phrase(rng, 12),
+                "acceptance": [f"Core rule for {_phrase(rng, 2)} holds. Refs: {core_ref}"],
+                "test_refs": [core_ref],
+            }
+        )
+        gameplay.append(
+            {
+                "id": f"GM-{number:04d}",
+                **view_base,
+                "title": f"{title} (gameplay view)",
+                "layer": "ui",
+                "details": _phrase(rng, 12),
+                "acceptance": [f"Scene reacts to {_phrase(rng, 2)}. Refs: {godot_ref}"],
+                "test_refs": [godot_ref],
+            }
+        )
+    return {"master": {"tasks": master}}, back, gameplay
+
+
+def _iso(moment: dt.datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _write_pipeline_runs(root: Path, spec: SyntheticRepoSpec, rng: random.Random) -> int:
+    written = 0
+    latest: dict[tuple[str, str], dict[str, Any]] = {}
+    for day_offset in range(spec.log_days - 1, -1, -1):
+        day = spec.end_date - dt.timedelta(days=day_offset)
+        date_dir = root / "logs" / "ci" / day.isoformat()
+        for run_index in range(spec.runs_per_day):
+            task_id = str(rng.randint(1, max(1, spec.tasks)))
+            started = dt.datetime.combine(day, dt.time(8, 0)) + dt.timedelta(minutes=run_index * 17 + rng.randint(0, 9))
+            run_id = f"{started.strftime('%Y%m%dT%H%M%SZ')}-{task_id}"
+            out_dir = date_dir / f"sc-review-pipeline-task-{task_id}-{run_id}"
+            out_rel = out_dir.relative_to(root).as_posix()
+            events: list[dict[str, Any]] = []
+            steps: list[dict[str, Any]] = []
+            clock = started
+
+            def _event(event: str, **kwargs: Any) -> None:
+                payload = build_run_event(
+                    event=event,
+                    task_id=task_id,
+                    run_id=run_id,
+                    delivery_profile="fast-ship",
+                    security_profile="host-safe",
+                    **kwargs,
+                )
+                payload["ts"] = _iso(clock)
+                events.append(payload)
+
+            _event("run_started", details={"entrypoint": "run_review_pipeline.py"})
+            status = "ok"
+            for step in PIPELINE_STEPS:
+                command = f"py -3 scripts/sc/{step.removeprefix('sc-').replace('-', '_')}.py --task-id {task_id}"
+                _event("step_planned", step_name=step, status="planned", details={"command": command})
+                _event("step_started", step_name=step, status="running", details={"command": command})
+                duration = rng.randint(3, 240)
+                clock += dt.timedelta(seconds=duration)
+                step_status = "fail" if rng.random() < 0.15 else "ok"
+                _event("step_failed" if step_status == "fail" else "step_completed", step_name=step, status=step_status, details={"rc": 1 if step_status == "fail" else 0})
+                steps.append({"name": step, "cmd": command.split(), "rc": 1 if step_status == "fail" else 0, "status": step_status, "log": f"{out_rel}/{step}.log", "duration_sec": duration})
+                if step_status == "fail":
+                    status = "fail"
+                    break
+            _event("run_completed", status=status, details={"steps": len(steps)})
+            summary = {
+                "cmd": "sc-review-pipeline",
+                "task_id": task_id,
+                "requested_run_id": run_id,
+                "run_id": run_id,
+                "status": status,
+                "steps": steps,
+                "started_at_utc": _iso(started),
+                "finished_at_utc": _iso(clock),
+                "elapsed_sec": int((clock - started).total_seconds()),
+                "run_type": "full",
+                "reason": "pipeline_clean" if status == "ok" else f"step_failed:{steps[-1]['name']}",
+                "reuse_mode": "none",
+            }
+            _write_json(out_dir / "summary.json", summary)
+            _write_text(out_dir / "run-events.jsonl", "".join(json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n" for item in events))
+            latest[(day.isoformat(), task_id)] = {
+                "task_id": task_id,
+                "run_id": run_id,
+                "status": status,
+                "date": day.isoformat(),
+                "latest_out_dir": out_rel,
+                "summary_path": f"{out_rel}/summary.json",
+                "run_events_path": f"{out_rel}/run-events.jsonl",
+            }
+            written += 1
+    for (day_text, task_id), payload in sorted(latest.items()):
+        _write_json(root / "logs" / "ci" / day_text / f"sc-review-pipeline-task-{task_id}" / "latest.json", payload)
+    # run_review_pipeline refuses to start until the active task has a green refactor-stage sc-build-tdd run.
+    _write_json(
+        root / "logs" / "ci" / spec.end_date.isoformat() / "sc-build-tdd" / "summary.json",
+        {"cmd": "sc-build-tdd", "stage": "refactor", "status": "ok", "task_id": "1", "task": {"task_id": "1"}},
+    )
+    return written
+
+
+def _copy_toolchain(source_root: Path, root: Path) -> None:
+    for rel in _TOOLCHAIN_DIRS:
+        target = root / rel
+        if target.exists():
+            shutil.rmtree(target)
+        shutil.copytree(source_root / rel, target, ignore=_COPY_IGNORE)
+
+
+def _git_init(root: Path) -> None:
+    def _git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=str(root), check=True, capture_output=True, text=True)
+
+    _git("init", "-q")
+    _git("-c", "user.name=bench", "-c", "user.email=bench@example.invalid", "add", "-A")
+    _git("-c", "user.name=bench", "-c", "user.email=bench@example.invalid", "commit", "-q", "-m", "synthetic benchmark repo")
+
+
+def generate_synthetic_repo(
+    root: Path,
+    spec: SyntheticRepoSpec,
+    *,
+    source_root: Path | None = None,
+    copy_scripts: bool = False,
+    git: bool = False,
+) -> dict[str, Any]:
+    """Write the synthetic repo under ``root`` and return its manifest (also stored as bench-manifest.json).
+
+    Paths in the manifest and in the generated logs are repo-relative.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(spec.seed)
+    code_paths = _code_paths(spec)
+    for path in code_paths:
+        _write_text(root / path, _code_text(path, rng))
+    doc_paths = _doc_paths(spec)
+    for index, path in enumerate(doc_paths):
+        _write_text(root / path, _doc_text(path, rng, index=index))
+
+    master, back, gameplay = _task_views(spec, rng, code_paths, doc_paths)
+    tasks_dir = root / TASKS_DIR
+    _write_json(tasks_dir / "tasks.json", master)
+    _write_json(tasks_dir / "tasks_back.json", back)
+    _write_json(tasks_dir / "tasks_gameplay.json", gameplay)
+    _write_text(root / STUB_LLM_SCRIPT, _STUB_LLM_SOURCE)
+    shim = root / PY_SHIM_DIR / "py"
+    _write_text(shim, _PY_SHIM_SOURCE)
+    shim.chmod(0o755)
+    _write_text(root / ".gitignore", "logs/\n")
+    runs = _write_pipeline_runs(root, spec, rng)
+
+    if copy_scripts:
+        _copy_toolchain(source_root or Path(__file__).resolve().parents[2], root)
+    if git:
+        _git_init(root)
+    manifest = {
+        "spec": spec.to_dict(),
+        "tasks": spec.tasks,
+        "code_files": len(code_paths),
+        "docs": len(doc_paths),
+        "pipeline_runs": runs,
+        "tasks_json_path": f"{TASKS_DIR}/tasks.json",
+        "tasks_back_path": f"{TASKS_DIR}/tasks_back.json",
+        "tasks_gameplay_path": f"{TASKS_DIR}/tasks_gameplay.json",
+        "stub_llm_script": STUB_LLM_SCRIPT,
+        "py_shim_dir": PY_SHIM_DIR,
+        "toolchain_copied": bool(copy_scripts),
+    }
+    _write_json(root / "bench-manifest.json", manifest)
+    return manifest
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro and macro benchmarks for the sc/python toolchain, run against a synthetic repo.
+
+- micro: hot functions called in-process (resolve_triplet, build_report_catalog cold/warm,
+  scan_task_text_integrity, the encoding engine cold/warm, the llm_review diff packer);
+- macro: entry points run as subprocesses inside a synthetic repo that carries its own copy of
+  the toolchain (run_review_pipeline with the local-stub LLM backend, project_health_scan and
+  the encoding gates).
+
+Each case reports min / median / p90 / mean wall time over ``repeat`` samples after ``warmup``
+untimed runs. compare_results() matches cases by (name, scale) against a stored baseline and flags
+a regression when the median grows by more than ``max_regression_pct`` and by at least
+``min_delta_ms`` (the noise floor for very fast cases).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fnmatch
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+try:
+    from _benchmark_repo import PY_SHIM_DIR, PY_SHIM_ENV, STUB_LLM_SCRIPT, SyntheticRepoSpec, generate_synthetic_repo
+    from _project_health_common import build_report_catalog, report_catalog_index_path
+except ImportError:
+    from scripts.python._benchmark_repo import PY_SHIM_DIR, PY_SHIM_ENV, STUB_LLM_SCRIPT, SyntheticRepoSpec, generate_synthetic_repo
+    from scripts.python._project_health_common import build_report_catalog, report_catalog_index_path
+
+_SC_DIR = Path(__file__).resolve().parents[1] / "sc"
+if str(_SC_DIR) not in sys.path:
+    sys.path.insert(0, str(_SC_DIR))
+
+import _encoding_engine as encoding_engine  # noqa: E402
+from _diff_packer import pack_diff_sections  # noqa: E402
+from _garbled_gate import scan_task_text_integrity  # noqa: E402
+from _taskmaster import resolve_triplet  # noqa: E402
+
+
+RESULTS_SCHEMA_VERSION = "1.0.0"
+SUITES = ("micro", "macro")
+DEFAULT_MAX_REGRESSION_PCT = 20.0
+DEFAULT_MIN_DELTA_MS = 2.0
+MACRO_TIMEOUT_SEC = 600
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    name: str
+    suite: str
+    run: Callable[[], Any]
+    setup: Callable[[], None] | None = None
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize_samples(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "min_sec": round(ordered[0], 6) if ordered else 0.0,
+        "median_sec": round(statistics.median(ordered), 6) if ordered else 0.0,
+        "p90_sec": round(_percentile(ordered, 90), 6),
+        "mean_sec": round(statistics.fmean(ordered), 6) if ordered else 0.0,
+    }
+
+
+@contextlib.contextmanager
+def _env(values: dict[str, str]) -> Iterator[None]:
+    saved = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _synthetic_diff(root: Path, code_paths: list[str]) -> str:
+    chunks: list[str] = []
+    for rel in code_paths:
+        lines = (root / rel).read_text(encoding="utf-8").splitlines()
+        chunks.append(f"diff --git a/{rel} b/{rel}\nnew file mode 100644\n--- /dev/null\n+++ b/{rel}")
+        chunks.append(f"@@ -0,0 +1,{len(lines)} @@")
+        chunks.extend("+" + line for line in lines)
+    return "\n".join(chunks)
+
+
+def micro_cases(root: Path, spec: SyntheticRepoSpec) -> list[BenchCase]:
+    tasks_dir = root / ".taskmaster" / "tasks"
+    triplet_paths = {
+        "tasks_json_path": tasks_dir / "tasks.json",
+        "tasks_back_path": tasks_dir / "tasks_back.json",
+        "tasks_gameplay_path": tasks_dir / "tasks_gameplay.json",
+    }
+    last_task = str(max(1, spec.tasks))
+    text_files = sorted(path for pattern in ("docs/**/*.md", "Game.*/**/*.cs", "**/*.gd") for path in root.glob(pattern))
+    code_paths = sorted(path.relative_to(root).as_posix() for path in root.glob("Game.*/**/*.cs"))
+    diff_text = _synthetic_diff(root, code_paths)
+    warm_cache = root / "logs" / "bench-encoding-cache.json"
+
+    def _resolve() -> Any:
+        return resolve_triplet(task_id=last_task, **{key: str(value) for key, value in triplet_paths.items()})
+
+    def _drop_catalog_index() -> None:
+        report_catalog_index_path(root).unlink(missing_ok=True)
+
+    def _scan_all(cache: str) -> int:
+        with _env({encoding_engine.CACHE_ENV: cache}):
+            return sum(encoding_engine.scan_file(path).size for path in text_files)
+
+    def _cold_engine() -> None:
+        encoding_engine.reset_encoding_engine()
+
+    def _warm_engine() -> None:
+        # The first sample after a reset fills the memo; later samples are pure cache hits.
+        _scan_all(str(warm_cache))
+
+    return [
+        BenchCase("resolve_triplet", "micro", _resolve),
+        BenchCase("scan_task_text_integrity", "micro", lambda: scan_task_text_integrity(**triplet_paths)),
+        BenchCase("build_report_catalog.cold", "micro", lambda: build_report_catalog(root), setup=_drop_catalog_index),
+        BenchCase("build_report_catalog.warm", "micro", lambda: build_report_catalog(root), setup=lambda: build_report_catalog(root)),
+        BenchCase("encoding_engine.scan.cold", "micro", lambda: _scan_all("off"), setup=_cold_engine),
+        BenchCase("encoding_engine.scan.warm", "micro", lambda: _scan_all(str(warm_cache)), setup=_warm_engine),
+        BenchCase(
+            "diff_packer.pack",
+            "micro",
+            lambda: pack_diff_sections([("## Staged diff", "diff", diff_text)], budget_chars=24000, agent="code-reviewer", ref_paths=code_paths[:4]),
+        ),
+    ]
+
+
+def macro_env(root: Path) -> dict[str, str]:
+    env = dict(os.environ)
+    env["PATH"] = str(root / PY_SHIM_DIR) + os.pathsep + env.get("PATH", "")
+    env[PY_SHIM_ENV] = sys.executable
+    env["SC_LLM_STUB_CMD"] = f'"{sys.executable}" {STUB_LLM_SCRIPT}'
+    env["SC_LLM_BACKEND"] = "local-stub"
+    env.pop("CI", None)
+    return env
+
+
+def macro_commands(spec: SyntheticRepoSpec) -> dict[str, list[str]]:
+    """Entry points measured end to end; paths are relative to the synthetic repo."""
+    return {
+        "run_review_pipeline": [
+            "scripts/sc/run_review_pipeline.py",
+            "--task-id",
+            "1",
+            "--delivery-profile",
+            "fast-ship",
+            "--skip-test",
+            "--skip-acceptance",
+            "--skip-agent-review",
+            "--llm-backend",
+            "local-stub",
+        ],
+        "project_health_scan": ["scripts/python/project_health_scan.py", "--repo-root", "."],
+        "encoding_hard_gate": ["scripts/python/encoding_hard_gate.py", "--target", "docs", "--target", ".taskmaster"],
+        "check_docs_utf8_integrity": ["scripts/python/check_docs_utf8_integrity.py", "--roots", "docs", ".taskmaster"],
+        # Cold start of the CLIs the pipeline and recovery loop spawn most often: interpreter + imports + argparse.
+        "startup.run_review_pipeline": ["scripts/sc/run_review_pipeline.py", "--help"],
+        "startup.sc_test": ["scripts/sc/test.py", "--help"],
+        "startup.acceptance_check": ["scripts/sc/acceptance_check.py", "--help"],
+        "startup.llm_review": ["scripts/sc/llm_review.py", "--help"],
+        "startup.inspect_run": ["scripts/python/inspect_run.py", "--help"],
+    }
+
+
+def macro_cases(root: Path, spec: SyntheticRepoSpec) -> list[BenchCase]:
+    env = macro_env(root)
+
+    def _runner(name: str, argv: list[str]) -> Callable[[], Any]:
+        def _run() -> Any:
+            proc = subprocess.run(
+                [sys.executable, *argv],
+                cwd=str(root),
+                env=env,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=MACRO_TIMEOUT_SEC,
+            )
+            # Gates are expected to report the seeded encoding defects (rc=1); only crashes are fatal.
+            if proc.returncode not in (0, 1) or "Traceback (most recent call last)" in proc.stderr:
+                tail = (proc.stdout + proc.stderr).strip().splitlines()[-5:]
+                raise RuntimeError(f"{name} exited rc={proc.returncode}: " + " | ".join(tail))
+            return proc.returncode
+
+        return _run
+
+    return [BenchCase(name, "macro", _runner(name, argv)) for name, argv in macro_commands(spec).items()]
+
+
+def run_case(case: BenchCase, *, repeat: int, warmup: int) -> dict[str, Any]:
+    samples: list[float] = []
+    last: Any = None
+    try:
+        for index in range(max(0, warmup) + max(1, repeat)):
+            if case.setup is not None:
+                case.setup()
+            started = time.perf_counter()
+            last = case.run()
+            elapsed = time.perf_counter() - started
+            if index >= warmup:
+                samples.append(elapsed)
+    except Exception as exc:  # noqa: BLE001
+        return {"name": case.name, "suite": case.suite, "status": "error", "error": f"{type(exc).__name__}: {exc}", "samples_sec": [round(value, 6) for value in samples]}
+    result: dict[str, Any] = {"name": case.name, "suite": case.suite, "status": "ok", "samples_sec": [round(value, 6) for value in samples]}
+    result.update(summarize_samples(samples))
+    if case.suite == "macro":
+        result["rc"] = last
+    return result
+
+
+def scale_label(spec: SyntheticRepoSpec) -> str:
+    return f"t{spec.tasks}-c{spec.code_files}-d{spec.log_days}x{spec.runs_per_day}"
+
+
+def scaled_spec(base: SyntheticRepoSpec, factor: int) -> SyntheticRepoSpec:
+    return SyntheticRepoSpec(
+        tasks=base.tasks * factor,
+        code_files=base.code_files * factor,
+        log_days=base.log_days,
+        runs_per_day=base.runs_per_day * factor,
+        docs=base.docs * factor,
+        seed=base.seed,
+        end_date=base.end_date,
+    )
+
+
+def run_suite(
+    work_dir: Path,
+    spec: SyntheticRepoSpec,
+    *,
+    suites: tuple[str, ...] = SUITES,
+    repeat: int = 5,
+    warmup: int = 1,
+    name_filter: str = "",
+    source_root: Path | None = None,
+) -> list[dict[str, Any]]:
+    """Generate the synthetic repo for ``spec`` under ``work_dir`` and run the selected cases on it."""
+    label = scale_label(spec)
+    root = work_dir / label
+    manifest = generate_synthetic_repo(root, spec, source_root=source_root, copy_scripts="macro" in suites, git="macro" in suites)
+    cases: list[BenchCase] = []
+    if "micro" in suites:
+        cases.extend(micro_cases(root, spec))
+    if "macro" in suites:
+        cases.extend(macro_cases(root, spec))
+    if name_filter:
+        patterns = [item.strip() for item in name_filter.split(",") if item.strip()]
+        cases = [case for case in cases if any(fnmatch.fnmatchcase(case.name, pattern) or pattern in case.name for pattern in patterns)]
+
+    results: list[dict[str, Any]] = []
+    try:
+        for case in cases:
+            result = run_case(case, repeat=repeat, warmup=warmup)
+            result["scale"] = label
+            result["spec"] = manifest["spec"]
+            results.append(result)
+    finally:
+        encoding_engine.reset_encoding_engine()
+    return results
+
+
+def _result_key(item: dict[str, Any]) -> tuple[str, str]:
+    return str(item.get("name") or ""), str(item.get("scale") or "")
+
+
+def compare_results(
+    current: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    *,
+    max_regression_pct: float = DEFAULT_MAX_REGRESSION_PCT,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> dict[str, Any]:
+    """Median-to-median comparison keyed by (name, scale); cases only in one side are listed, not judged."""
+    base_by_key = {_result_key(item): item for item in baseline if item.get("status") == "ok"}
+    rows: list[dict[str, Any]] = []
+    for item in current:
+        key = _result_key(item)
+        row: dict[str, Any] = {"name": key[0], "scale": key[1]}
+        base = base_by_key.pop(key, None)
+        if item.get("status") != "ok":
+            row["verdict"] = "error"
+        elif base is None:
+            row["verdict"] = "new"
+        else:
+            now_sec = float(item["median_sec"])
+            base_sec = float(base["median_sec"])
+            delta_ms = (now_sec - base_sec) * 1000.0
+            delta_pct = (delta_ms / (base_sec * 1000.0) * 100.0) if base_sec > 0 else 0.0
+            row.update({"baseline_median_sec": base_sec, "median_sec": now_sec, "delta_ms": round(delta_ms, 3), "delta_pct": round(delta_pct, 2)})
+            if delta_pct > max_regression_pct and delta_ms >= min_delta_ms:
+                row["verdict"] = "regression"
+            elif delta_pct < -max_regression_pct and -delta_ms >= min_delta_ms:
+                row["verdict"] = "improvement"
+            else:
+                row["verdict"] = "same"
+        rows.append(row)
+    rows.extend({"name": name, "scale": scale, "verdict": "missing"} for name, scale in sorted(base_by_key))
+    counts: dict[str, int] = {}
+    for row in rows:
+        counts[row["verdict"]] = counts.get(row["verdict"], 0) + 1
+    return {
+        "max_regression_pct": max_regression_pct,
+        "min_delta_ms": min_delta_ms,
+        "counts": counts,
+        "regressions": [row for row in rows if row["verdict"] == "regression"],
+        "rows": rows,
+    }
@@ -0,0 +1,379 @@
+"""Parsed C# contract model shared by the contract gates.
+
+validate_contracts, check_domain_contracts and generate_contracts_catalog used to read and regex
+every file under Game.Core/Contracts on their own, on every run. parse_contract_source() is a
+lightweight declaration parser that extracts what all three need in one pass:
+
+- the first namespace declaration, every using directive and whether the file touches Godot;
+- public type declarations (kind, name, modifiers, position) and whether the 12 lines above
+  them carry an XML <summary> / <remarks>;
+- ``public const string`` declarations with their raw initializer and string literal value;
+- ``Domain event: <type>`` markers in the doc comments.
+
+load_contract_model() caches the parse by content hash, in process and in
+logs/ci/.contract-cache/model-cache.json, so an unchanged file costs one read and one hash on the
+next run, whichever gate asks. cached_result() keeps results derived from parsed files (per-file
+validation issues, overlay contract references) in the same cache under a caller-built key; a
+caller puts every input of the result in the key (content digests, EventTypes fingerprint, rule
+version), so a result is recomputed only when one of them changes.
+
+SC_CONTRACT_CACHE=off disables the cache file; any other non-empty value is the cache file path.
+"""
+
+from __future__ import annotations
+
+import atexit
+import bisect
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+
+CACHE_ENV = "SC_CONTRACT_CACHE"
+CACHE_MAX_ENTRIES = 20000
+XML_DOC_LOOKBACK_LINES = 12
+
+NAMESPACE_RE = re.compile(r"^\s*namespace\s+([A-Za-z_][A-Za-z0-9_\.]*)\s*(?:;|\{)", re.MULTILINE)
+USING_RE = re.compile(r"^\s*using\s+([A-Za-z_][A-Za-z0-9_\.]*)\s*;", re.MULTILINE)
+GODOT_USING_RE = re.compile(r"^\s*using\s+Godot(?:\.|;)", re.MULTILINE)
+GODOT_QUALIFIED_RE = re.compile(r"\bGodot\.")
+TYPE_DECL_RE = re.compile(
+    r"\bpublic\s+((?:(?:sealed|abstract|static|partial|readonly)\s+)*)"
+    r"(record|class|interface|enum|struct)\s+([A-Za-z_][A-Za-z0-9_]*)"
+)
+CONST_STRING_RE = re.compile(r"\bpublic\s+const\s+string\s+([A-Za-z_][A-Za-z0-9_]*)\s*=\s*([^;]+);")
+STRING_LITERAL_RE = re.compile(r"\"([^\"]+)\"\s*;")
+DOC_DOMAIN_EVENT_RE = re.compile(r"\bDomain\s+event:\s*([a-z0-9._]+)\b", re.IGNORECASE)
+
+# The parser is this file: any edit to it invalidates every cached model and derived result.
+MODEL_VERSION = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class TypeDecl:
+    kind: str
+    name: str
+    modifiers: tuple[str, ...]
+    line: int
+    start: int
+    end: int
+    line_start: bool  # only whitespace before ``public`` on its line
+    has_summary: bool
+    has_remarks: bool
+
+
+@dataclass(frozen=True)
+class ConstString:
+    name: str
+    rhs: str  # initializer up to the first ';', unstripped
+    literal: str | None  # value when the initializer is a single string literal
+    line: int
+    start: int
+
+
+@dataclass(frozen=True)
+class ContractModel:
+    digest: str
+    utf8_ok: bool
+    namespace: str | None
+    namespace_line: int
+    usings: tuple[tuple[str, int], ...]
+    godot_dependency: bool
+    types: tuple[TypeDecl, ...]
+    consts: tuple[ConstString, ...]
+    domain_event_docs: tuple[tuple[int, str], ...]  # (offset, value)
+    cached: bool = False
+
+    def consts_named(self, name: str) -> list[ConstString]:
+        return [item for item in self.consts if item.name == name]
+
+
+def content_digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def decode_source(raw: bytes) -> tuple[str, bool]:
+    """Text with universal newlines (as ``read_text`` returns it) and whether it was valid UTF-8."""
+    try:
+        text, ok = raw.decode("utf-8"), True
+    except UnicodeDecodeError:
+        text, ok = raw.decode("utf-8", errors="ignore"), False
+    return text.replace("\r\n", "\n").replace("\r", "\n"), ok
+
+
+def iter_source_files(base: Path, root: Path, *, skip_dirs: frozenset[str] = frozenset()) -> list[tuple[Path, str]]:
+    """``(path, root-relative posix path)`` of every ``*.cs`` file under ``base``, in Path sort order.
+
+    os.walk and string joins instead of rglob + relative_to, which used to dominate the gates'
+    wall time on large contract trees. Directories named in ``skip_dirs`` are not descended.
+    """
+    top = str(base)
+    rel_top = base.relative_to(root).as_posix()
+    out: list[tuple[Path, str]] = []
+    for dirpath, dirnames, filenames in os.walk(top, followlinks=True):
+        if skip_dirs:
+            dirnames[:] = [name for name in dirnames if name not in skip_dirs]
+        rel_dir = rel_top + dirpath[len(top) :].replace(os.sep, "/")
+        for name in filenames:
+            full = os.path.join(dirpath, name)
+            if os.path.normcase(name).endswith(".cs") and os.path.isfile(full):
+                out.append((Path(full), f"{rel_dir}/{name}"))
+    out.sort(key=lambda item: [os.path.normcase(part) for part in item[1].split("/")])
+    return out
+
+
+def _may_have_doc_marker(text: str) -> bool:
+    # IGNORECASE also folds a few non-ASCII letters onto ASCII ones, so only ASCII text is prefiltered.
+    return not text.isascii() or "event:" in text.lower()
+
+
+def parse_contract_source(text: str, *, digest: str = "", utf8_ok: bool = True) -> ContractModel:
+    lines = text.splitlines(keepends=True)
+    line_offsets: list[int] = []
+    offset = 0
+    for line in lines:
+        line_offsets.append(offset)
+        offset += len(line)
+
+    def _line_of(position: int) -> int:
+        return max(1, bisect.bisect_right(line_offsets, position))
+
+    def _doc_header(line_no: int) -> str:
+        return "".join(lines[max(0, line_no - 1 - XML_DOC_LOOKBACK_LINES) : line_no - 1])
+
+    ns_match = NAMESPACE_RE.search(text)
+    types: list[TypeDecl] = []
+    for m in TYPE_DECL_RE.finditer(text):
+        line_no = _line_of(m.start())
+        header = _doc_header(line_no)
+        types.append(
+            TypeDecl(
+                kind=m.group(2),
+                name=m.group(3),
+                modifiers=tuple(m.group(1).split()),
+                line=line_no,
+                start=m.start(),
+                end=m.end(),
+                line_start=not text[line_offsets[line_no - 1] : m.start()].strip(),
+                has_summary="<summary>" in header,
+                has_remarks="<remarks>" in header,
+            )
+        )
+    consts: list[ConstString] = []
+    for m in CONST_STRING_RE.finditer(text) if "const" in text else ():
+        literal = STRING_LITERAL_RE.match(text, m.start(2))
+        consts.append(
+            ConstString(
+                name=m.group(1),
+                rhs=m.group(2),
+                literal=literal.group(1) if literal else None,
+                line=_line_of(m.start()),
+                start=m.start(),
+            )
+        )
+    return ContractModel(
+        digest=digest,
+        utf8_ok=utf8_ok,
+        namespace=ns_match.group(1) if ns_match else None,
+        namespace_line=_line_of(ns_match.start()) if ns_match else 1,
+        usings=tuple((m.group(1), _line_of(m.start())) for m in USING_RE.finditer(text)),
+        godot_dependency="Godot" in text and bool(GODOT_USING_RE.search(text) or GODOT_QUALIFIED_RE.search(text)),
+        types=tuple(types),
+        consts=tuple(consts),
+        domain_event_docs=tuple((m.start(), m.group(1).strip()) for m in DOC_DOMAIN_EVENT_RE.finditer(text)) if _may_have_doc_marker(text) else (),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Content-hash cache
+# ---------------------------------------------------------------------------
+
+_LOCK = threading.Lock()
+_MODELS: dict[str, dict[str, Any]] = {}
+_RESULTS: dict[str, Any] = {}
+_NEW_MODELS: dict[str, dict[str, Any]] = {}
+_NEW_RESULTS: dict[str, Any] = {}
+_LOADED_FROM: Path | None = None
+_BOUND_KEY: tuple[str, str] | None = None
+_ATEXIT_REGISTERED = False
+_STATS: dict[str, int] = {}
+
+
+def _reset_stats() -> None:
+    _STATS.clear()
+    _STATS.update({"files": 0, "model_hits": 0, "parsed": 0, "result_hits": 0, "computed": 0})
+
+
+_reset_stats()
+
+
+def cache_path(root: Path) -> Path | None:
+    value = str(os.environ.get(CACHE_ENV) or "").strip()
+    if value.lower() == "off":
+        return None
+    if value:
+        return Path(value)
+    return root / "logs" / "ci" / ".contract-cache" / "model-cache.json"
+
+
+def _read_cache_file(path: Path) -> tuple[dict[str, Any], dict[str, Any]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}, {}
+    if not isinstance(payload, dict) or payload.get("version") != MODEL_VERSION:
+        return {}, {}
+    models = payload.get("models")
+    results = payload.get("results")
+    return (models if isinstance(models, dict) else {}), (results if isinstance(results, dict) else {})
+
+
+def _bind(root: Path) -> Path | None:
+    """Point the in-process cache at ``root``'s cache file; caller holds _LOCK."""
+    global _LOADED_FROM, _BOUND_KEY, _ATEXIT_REGISTERED
+    key = (str(root), str(os.environ.get(CACHE_ENV) or ""))
+    if key == _BOUND_KEY:
+        return _LOADED_FROM
+    path = cache_path(root)
+    if path != _LOADED_FROM:
+        if _LOADED_FROM is not None:
+            _save_locked()
+        models, results = _read_cache_file(path) if path is not None else ({}, {})
+        _MODELS.clear()
+        _MODELS.update(models)
+        _RESULTS.clear()
+        _RESULTS.update(results)
+        _NEW_MODELS.clear()
+        _NEW_RESULTS.clear()
+    _LOADED_FROM, _BOUND_KEY = path, key
+    if path is not None and not _ATEXIT_REGISTERED:
+        atexit.register(save_contract_cache)
+        _ATEXIT_REGISTERED = True
+    return path
+
+
+def _trim(entries: dict[str, Any]) -> dict[str, Any]:
+    if len(entries) <= CACHE_MAX_ENTRIES:
+        return entries
+    return dict(list(entries.items())[-CACHE_MAX_ENTRIES:])
+
+
+def _save_locked() -> Path | None:
+    path = _LOADED_FROM
+    if path is None or not (_NEW_MODELS or _NEW_RESULTS):
+        return None
+    models, results = _read_cache_file(path)
+    models.update(_NEW_MODELS)
+    results.update(_NEW_RESULTS)
+    payload = {"version": MODEL_VERSION, "models": _trim(models), "results": _trim(results)}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        return None
+    _NEW_MODELS.clear()
+    _NEW_RESULTS.clear()
+    return path
+
+
+def save_contract_cache() -> Path | None:
+    """Merge this process's new entries into the cache file (called at exit; safe to call early)."""
+    with _LOCK:
+        return _save_locked()
+
+
+def reset_contract_model() -> None:
+    """Forget the in-process cache and counters (tests, long-lived processes)."""
+    global _LOADED_FROM, _BOUND_KEY
+    with _LOCK:
+        _MODELS.clear()
+        _RESULTS.clear()
+        _NEW_MODELS.clear()
+        _NEW_RESULTS.clear()
+        _LOADED_FROM = _BOUND_KEY = None
+        _reset_stats()
+
+
+def model_stats() -> dict[str, int]:
+    with _LOCK:
+        return dict(_STATS)
+
+
+def _to_payload(model: ContractModel) -> dict[str, Any]:
+    payload = asdict(model)
+    payload.pop("digest")
+    payload.pop("cached")
+    return payload
+
+
+def _from_payload(digest: str, payload: dict[str, Any]) -> ContractModel:
+    return ContractModel(
+        digest=digest,
+        utf8_ok=bool(payload["utf8_ok"]),
+        namespace=payload["namespace"],
+        namespace_line=int(payload["namespace_line"]),
+        usings=tuple((str(name), int(line)) for name, line in payload["usings"]),
+        godot_dependency=bool(payload["godot_dependency"]),
+        types=tuple(TypeDecl(**{**item, "modifiers": tuple(item["modifiers"])}) for item in payload["types"]),
+        consts=tuple(ConstString(**item) for item in payload["consts"]),
+        domain_event_docs=tuple((int(start), str(value)) for start, value in payload["domain_event_docs"]),
+        cached=True,
+    )
+
+
+def load_contract_model(path: Path, *, root: Path, strict: bool = False) -> ContractModel:
+    """Parsed model of the C# file at ``path``; ``strict`` raises UnicodeDecodeError like read_text()."""
+    raw = path.read_bytes()
+    digest = content_digest(raw)
+    model: ContractModel | None = None
+    with _LOCK:
+        _STATS["files"] += 1
+        use_cache = _bind(root) is not None
+        payload = _MODELS.get(digest) if use_cache else None
+    if payload is not None:
+        try:
+            model = _from_payload(digest, payload)
+        except (KeyError, TypeError, ValueError):
+            model = None
+    if model is None:
+        text, utf8_ok = decode_source(raw)
+        model = parse_contract_source(text, digest=digest, utf8_ok=utf8_ok)
+        with _LOCK:
+            _STATS["parsed"] += 1
+            if use_cache:
+                _MODELS[digest] = _NEW_MODELS[digest] = _to_payload(model)
+    else:
+        with _LOCK:
+            _STATS["model_hits"] += 1
+    if strict and not model.utf8_ok:
+        raw.decode("utf-8")
+    return model
+
+
+def cached_result(root: Path, key: str, compute: Callable[[], T]) -> T:
+    """``compute()``, reused from the cache while ``key`` is unchanged; values must be JSON data."""
+    with _LOCK:
+        use_cache = _bind(root) is not None
+        if use_cache and key in _RESULTS:
+            _STATS["result_hits"] += 1
+            return _RESULTS[key]
+    value = compute()
+    with _LOCK:
+        _STATS["computed"] += 1
+        if use_cache:
+            _RESULTS[key] = _NEW_RESULTS[key] = value
+    return value
+
+
+def fingerprint(value: Any) -> str:
+    """Short stable hash of JSON-serializable ``value`` for cache keys."""
+    return hashlib.blake2b(json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8"), digest_size=8).hexdigest()
@@ -0,0 +1,112 @@
+"""Minimal YAML front matter reader for overlay docs (ACCEPTANCE_CHECKLIST.md and 08/ pages).
+
+extract_front_matter() parses a block of text. read_head() reads an open Markdown file only up
+to the closing ``---`` of its front matter (one chunk when it has none), and parse_front_matter()
+memoizes extract_front_matter() by the content hash of that head, so docs that share a header are
+parsed once. The memo is thread-safe; callers must not mutate the returned dicts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from typing import Any, Optional, TextIO
+
+
+FRONT_MATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+HEAD_CHUNK_CHARS = 4096
+
+_LOCK = threading.Lock()
+_PARSED: dict[str, Optional[dict[str, Any]]] = {}
+
+
+def extract_front_matter(content: str) -> Optional[dict[str, Any]]:
+    """Extract a minimal YAML front matter block from a Markdown file."""
+
+    match = FRONT_MATTER_RE.match(content)
+    if not match:
+        return None
+
+    fm_text = match.group(1)
+    result: dict[str, Any] = {
+        "PRD-ID": None,
+        "Title": None,
+        "Status": None,
+        "ADR-Refs": [],
+        "Test-Refs": [],
+    }
+
+    current_key: Optional[str] = None
+    for raw_line in fm_text.split("\n"):
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        if ":" in line and not line.startswith("-"):
+            key, value = line.split(":", 1)
+            key = key.strip()
+            value = value.strip()
+
+            if key in result:
+                current_key = key
+                if value:
+                    if key in {"ADR-Refs", "Test-Refs"}:
+                        result[key] = [value]
+                    else:
+                        result[key] = value
+                else:
+                    result[key] = []
+            else:
+                # Unknown front-matter keys are ignored. Reset the list context so
+                # list items under unknown keys (e.g. Arch-Refs) do not get
+                # mistakenly appended to the previous recognized key.
+                current_key = None
+            continue
+
+        if line.startswith("-") and current_key:
+            value = line[1:].strip()
+            if "#" in value:
+                value = value.split("#", 1)[0].strip()
+            if value:
+                result[current_key].append(value)
+
+    return result
+
+
+def read_head(handle: TextIO) -> str:
+    """Read ``handle`` up to the end of its front matter block; the rest stays unread.
+
+    The block ends at the first ``\\n---`` after the opening ``---`` line, exactly where
+    FRONT_MATTER_RE stops, so extract_front_matter(head) equals extract_front_matter(whole file).
+    """
+    head = ""
+    while True:
+        chunk = handle.read(HEAD_CHUNK_CHARS)
+        if not chunk:
+            return head
+        head += chunk
+        if len(head) >= 3 and not head.startswith("---"):
+            return head
+        # A match only counts once the whitespace after the opening --- has ended, because the
+        # regex's greedy \s* could still extend into text that has not been read yet.
+        if head[3:].lstrip() and FRONT_MATTER_RE.match(head):
+            return head
+
+
+def parse_front_matter(head: str) -> Optional[dict[str, Any]]:
+    """extract_front_matter(), memoized by the content hash of ``head``."""
+    digest = hashlib.blake2b(head.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+    with _LOCK:
+        if digest in _PARSED:
+            return _PARSED[digest]
+    parsed = extract_front_matter(head)
+    with _LOCK:
+        _PARSED[digest] = parsed
+    return parsed
+
+
+def reset_front_matter_cache() -> None:
+    """Forget memoized parses (tests, long-lived processes)."""
+    with _LOCK:
+        _PARSED.clear()
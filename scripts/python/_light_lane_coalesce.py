@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Cross-task request coalescing for per-task LLM steps of the light lane.
+
+With --jobs > 1 several task workers reach the same step at about the same time. Instead of one
+subprocess (and one LLM prompt) per task, RequestCoalescer parks the per-task requests and runs
+them as one batch once the batch is full, every running task is waiting, or the oldest request has
+waited max_wait_sec. The batch result is split back into per-task results by the caller-supplied
+``run_batch``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+
+class _Batch:
+    def __init__(self) -> None:
+        self.items: list[tuple[int, Any]] = []
+        self.results: dict[int, Any] = {}
+        self.error: BaseException | None = None
+        self.done = threading.Event()
+        self.opened_at = time.monotonic()
+
+
+class RequestCoalescer:
+    """Collects ``submit(task_id, request)`` calls into batches for ``run_batch(items) -> {task_id: result}``.
+
+    The submitter that opens a batch is its leader: it waits for followers and then runs the batch
+    on its own thread, so no extra scheduler thread is needed.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[list[tuple[int, Any]]], dict[int, Any]],
+        *,
+        max_batch: int,
+        max_wait_sec: float,
+    ) -> None:
+        self.run_batch = run_batch
+        self.max_batch = max(1, int(max_batch))
+        self.max_wait_sec = max(0.0, float(max_wait_sec))
+        self.batches_run = 0
+        self.requests_seen = 0
+        self._cond = threading.Condition()
+        self._open: _Batch | None = None
+        self._active_tasks = 0
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def track_task(self) -> Iterator[None]:
+        """Count this worker as a possible submitter until it submits or leaves.
+
+        A batch is flushed early once every counted worker is already waiting in it.
+        """
+        with self._cond:
+            self._active_tasks += 1
+        self._local.tracked = True
+        try:
+            yield
+        finally:
+            self._release_tracked()
+
+    def _release_tracked(self) -> None:
+        if not getattr(self._local, "tracked", False):
+            return
+        self._local.tracked = False
+        with self._cond:
+            self._active_tasks -= 1
+            self._cond.notify_all()
+
+    def _ready(self, batch: _Batch) -> bool:
+        if len(batch.items) >= self.max_batch:
+            return True
+        if self._active_tasks <= 0:
+            return True
+        return time.monotonic() - batch.opened_at >= self.max_wait_sec
+
+    def submit(self, task_id: int, request: Any) -> Any:
+        self._release_tracked()
+        with self._cond:
+            self.requests_seen += 1
+            batch = self._open
+            leader = batch is None
+            if batch is None:
+                batch = self._open = _Batch()
+            batch.items.append((int(task_id), request))
+            if len(batch.items) >= self.max_batch:
+                self._open = None  # full: later submitters open the next batch
+            self._cond.notify_all()
+            if leader:
+                while not self._ready(batch):
+                    remaining = self.max_wait_sec - (time.monotonic() - batch.opened_at)
+                    self._cond.wait(timeout=max(0.01, remaining))
+                if self._open is batch:
+                    self._open = None
+                self.batches_run += 1
+        if leader:
+            try:
+                batch.results = dict(self.run_batch(list(batch.items)))
+            except BaseException as exc:  # noqa: BLE001 - re-raised on every waiting task
+                batch.error = exc
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+        if batch.error is not None:
+            raise batch.error
+        return batch.results[int(task_id)]
+
+    def stats(self) -> dict[str, int]:
+        return {"requests": int(self.requests_seen), "batches": int(self.batches_run)}
+
+
+def option_value(cmd: list[str], option: str) -> str:
+    if option in cmd:
+        index = cmd.index(option)
+        if index + 1 < len(cmd):
+            return str(cmd[index + 1])
+    return ""
+
+
+def replace_option(cmd: list[str], option: str, value: str) -> list[str]:
+    updated = list(cmd)
+    if option in updated and updated.index(option) + 1 < len(updated):
+        updated[updated.index(option) + 1] = value
+    else:
+        updated.extend([option, value])
+    return updated
+
+
+def _tsv_line_task_id(line: str) -> int | None:
+    token = line.strip().replace("\\t", "\t").split("\t", 1)[0].strip()
+    if token.lower().startswith("t"):
+        token = token[1:].strip()
+    return int(token) if token.isdigit() else None
+
+
+def split_semantic_gate_summary(batch_summary: dict[str, Any], task_id: int) -> dict[str, Any]:
+    """Per-task view of a coalesced sc-semantic-gate-all summary, judged by the batch's own limits."""
+    findings = [item for item in list(batch_summary.get("findings") or []) if int(item.get("task_id") or 0) == int(task_id)]
+    needs_fix = [tid for tid in list(batch_summary.get("needs_fix") or []) if int(tid) == int(task_id)]
+    unknown = [tid for tid in list(batch_summary.get("unknown") or []) if int(tid) == int(task_id)]
+    max_needs_fix = int(batch_summary.get("max_needs_fix") or 0)
+    max_unknown = int(batch_summary.get("max_unknown") or 0)
+    fail_reasons: list[str] = []
+    if len(needs_fix) > max_needs_fix:
+        fail_reasons.append(f"needs_fix>{max_needs_fix}")
+    if len(unknown) > max_unknown:
+        fail_reasons.append(f"unknown>{max_unknown}")
+    if not findings:
+        fail_reasons.append("task_missing_from_batch")
+    summary = dict(batch_summary)
+    summary.update(
+        {
+            "total_tasks": 1,
+            "counts": {
+                "ok": sum(1 for item in findings if item.get("verdict") == "OK"),
+                "needs_fix": len(needs_fix),
+                "unknown": len(unknown),
+            },
+            "needs_fix": needs_fix,
+            "unknown": unknown,
+            "findings": findings,
+            "fail_reasons": fail_reasons,
+            "status": "fail" if fail_reasons else "ok",
+        }
+    )
+    return summary
+
+
+def write_semantic_gate_task_dir(
+    *,
+    batch_dir: Path,
+    task_dir: Path,
+    batch_summary: dict[str, Any],
+    task_id: int,
+    coalesced: dict[str, Any],
+) -> dict[str, Any]:
+    """Write today's per-task artifact layout (summary.json + filtered batch TSVs) for one coalesced task."""
+    task_dir.mkdir(parents=True, exist_ok=True)
+    summary = split_semantic_gate_summary(batch_summary, task_id)
+    summary["coalesced"] = coalesced
+    for tsv in sorted(batch_dir.glob("batch-*.tsv")):
+        lines = tsv.read_text(encoding="utf-8", errors="ignore").splitlines()
+        kept = [line for line in lines if _tsv_line_task_id(line) == int(task_id)]
+        (task_dir / tsv.name).write_text("\n".join(kept) + ("\n" if kept else ""), encoding="utf-8")
+    (task_dir / "summary.json").write_text(json.dumps(summary, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return summary
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Policy-driven lifecycle for dated log trees (logs/ci, logs/unit, logs/e2e).
+
+Unit of retention: one first-level entry of a dated day dir, e.g.
+logs/ci/2026-03-31/sc-review-pipeline-task-56-run-a. Each entry belongs to the
+first policy family whose glob matches its name.
+
+- Entries older than ``hot_days`` move into a per-day zip under <area>/.archive/
+  and are listed in <area>/.archive/manifest.json.
+- Entries older than ``keep_days`` are deleted (hot or archived) unless they are
+  among the family's newest ``keep_last`` entries.
+- Entries referenced by a latest index (``reference_globs``) written within
+  ``reference_max_age_days`` are never archived or deleted when the family sets
+  ``keep_if_referenced``.
+
+restore_archived_path rehydrates an archived entry in place, so readers such as
+inspect_run can resolve archived runs lazily.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import fnmatch
+import json
+import os
+import re
+import shutil
+import zipfile
+from pathlib import Path
+from typing import Any
+
+try:
+    from _artifact_store import gc_artifact_store
+except ImportError:
+    from scripts.python._artifact_store import gc_artifact_store
+
+
+DEFAULT_POLICY_FILE = "scripts/python/config/log-lifecycle-policy.json"
+ARCHIVE_DIRNAME = ".archive"
+_DAY_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_LOG_REF_RE = re.compile(r"(logs/(?:ci|unit|e2e))/(\d{4}-\d{2}-\d{2})/([^/\"']+)")
+_COMPRESSION = {"deflate": zipfile.ZIP_DEFLATED, "lzma": zipfile.ZIP_LZMA, "store": zipfile.ZIP_STORED}
+
+
+def _posix(path: Path | str) -> str:
+    return str(path).replace("\\", "/")
+
+
+def load_policy(root: Path, policy_file: str = "") -> dict[str, Any]:
+    path = Path(policy_file or DEFAULT_POLICY_FILE)
+    if not path.is_absolute():
+        path = root / path
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError("log lifecycle policy must be a JSON object")
+    families = payload.get("families")
+    if not isinstance(families, list) or not families:
+        raise ValueError("log lifecycle policy requires a non-empty families array")
+    for family in families:
+        if not isinstance(family, dict) or not str(family.get("name") or "").strip():
+            raise ValueError("each family needs a name")
+        if not isinstance(family.get("match"), list):
+            raise ValueError(f"family {family.get('name')}: match must be an array of globs")
+    if str(payload.get("archive_compression") or "deflate") not in _COMPRESSION:
+        raise ValueError(f"archive_compression must be one of: {', '.join(sorted(_COMPRESSION))}")
+    return payload
+
+
+def _family_for(name: str, families: list[dict[str, Any]]) -> dict[str, Any] | None:
+    for family in families:
+        if any(fnmatch.fnmatchcase(name, str(pattern)) for pattern in family.get("match") or []):
+            return family
+    return None
+
+
+def _entry_mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _archive_dir(area_root: Path) -> Path:
+    return area_root / ARCHIVE_DIRNAME
+
+
+def _manifest_path(area_root: Path) -> Path:
+    return _archive_dir(area_root) / "manifest.json"
+
+
+def load_archive_manifest(area_root: Path) -> dict[str, Any]:
+    path = _manifest_path(area_root)
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"entries": {}}
+    if not isinstance(payload, dict) or not isinstance(payload.get("entries"), dict):
+        return {"entries": {}}
+    return payload
+
+
+def _write_manifest(area_root: Path, manifest: dict[str, Any]) -> None:
+    path = _manifest_path(area_root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_suffix(".json.tmp")
+    staging.write_text(json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(staging, path)
+
+
+def collect_referenced_entries(root: Path, reference_globs: list[str], *, max_age_days: int | None = None) -> set[str]:
+    """Return ``<area>/<day>/<entry>`` keys mentioned by any latest index / active sidecar.
+
+    Indexes last written more than ``max_age_days`` ago no longer pin anything.
+    """
+    referenced: set[str] = set()
+    cutoff = None if max_age_days is None else dt.datetime.now().timestamp() - max_age_days * 86400
+    for pattern in reference_globs:
+        for path in root.glob(pattern):
+            if not path.is_file() or (cutoff is not None and _entry_mtime(path) < cutoff):
+                continue
+            try:
+                text = path.read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                continue
+            rel = _posix(path.relative_to(root))
+            own = _LOG_REF_RE.match(rel)
+            if own:
+                referenced.add("/".join(own.groups()))
+            for match in _LOG_REF_RE.finditer(re.sub(r"\\+", "/", text)):
+                referenced.add("/".join(match.groups()))
+    return referenced
+
+
+def _iter_entries(area_root: Path) -> list[tuple[dt.date, Path]]:
+    entries: list[tuple[dt.date, Path]] = []
+    if not area_root.is_dir():
+        return entries
+    for day_dir in area_root.iterdir():
+        if not day_dir.is_dir() or not _DAY_RE.match(day_dir.name):
+            continue
+        try:
+            day = dt.date.fromisoformat(day_dir.name)
+        except ValueError:
+            continue
+        for entry in day_dir.iterdir():
+            entries.append((day, entry))
+    return entries
+
+
+def _zip_members(archive: Path) -> set[str]:
+    if not archive.is_file():
+        return set()
+    with zipfile.ZipFile(archive) as handle:
+        return set(handle.namelist())
+
+
+def _rewrite_archive_without(archive: Path, prefix: str, compression: int) -> None:
+    staging = archive.with_suffix(".zip.tmp")
+    with zipfile.ZipFile(archive) as src, zipfile.ZipFile(staging, "w", compression=compression) as dst:
+        for info in src.infolist():
+            if info.filename == prefix.rstrip("/") or info.filename.startswith(prefix):
+                continue
+            dst.writestr(info, src.read(info.filename))
+    os.replace(staging, archive)
+
+
+def _archive_entry(entry: Path, archive: Path, *, compression: int) -> dict[str, int]:
+    prefix = entry.name + "/"
+    members = _zip_members(archive)
+    if entry.name in members or any(name.startswith(prefix) for name in members):
+        _rewrite_archive_without(archive, prefix, compression)
+    archive.parent.mkdir(parents=True, exist_ok=True)
+    files = 0
+    size = 0
+    with zipfile.ZipFile(archive, "a", compression=compression) as handle:
+        if entry.is_file():
+            handle.write(entry, entry.name)
+            return {"files": 1, "bytes": entry.stat().st_size}
+        for current, dirnames, filenames in os.walk(entry):
+            dirnames.sort()
+            current_path = Path(current)
+            if not filenames and not dirnames:
+                handle.writestr(_posix(current_path.relative_to(entry.parent)) + "/", b"")
+            for name in sorted(filenames):
+                path = current_path / name
+                handle.write(path, _posix(path.relative_to(entry.parent)))
+                files += 1
+                size += path.stat().st_size
+    return {"files": files, "bytes": size}
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+
+
+def apply_log_lifecycle(
+    root: Path,
+    policy: dict[str, Any],
+    *,
+    today: dt.date | None = None,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    today = today or dt.date.today()
+    families = list(policy.get("families") or [])
+    hot_days = int(policy.get("hot_days", 3))
+    compression = _COMPRESSION[str(policy.get("archive_compression") or "deflate")]
+    reference_max_age_days = policy.get("reference_max_age_days")
+    referenced = collect_referenced_entries(
+        root,
+        list(policy.get("reference_globs") or []),
+        max_age_days=None if reference_max_age_days is None else int(reference_max_age_days),
+    )
+
+    archived: list[str] = []
+    deleted: list[str] = []
+    protected: list[str] = []
+    failed: list[dict[str, str]] = []
+
+    for area in policy.get("areas") or []:
+        area_root = root / str(area)
+        manifest = load_archive_manifest(area_root)
+        archived_entries: dict[str, Any] = manifest["entries"]
+        expired_members: dict[str, list[str]] = {}
+
+        # Rank hot + archived entries per family, newest first, for keep_last.
+        ranked: dict[str, list[tuple[dt.date, float, str]]] = {}
+        hot: dict[str, tuple[dt.date, Path, dict[str, Any]]] = {}
+        for day, entry in _iter_entries(area_root):
+            family = _family_for(entry.name, families)
+            if family is None:
+                continue
+            key = f"{day.isoformat()}/{entry.name}"
+            hot[key] = (day, entry, family)
+            ranked.setdefault(str(family["name"]), []).append((day, _entry_mtime(entry), key))
+        for key, record in archived_entries.items():
+            if key in hot:
+                continue
+            family = _family_for(key.split("/", 1)[-1], families)
+            if family is None:
+                continue
+            ranked.setdefault(str(family["name"]), []).append(
+                (dt.date.fromisoformat(key.split("/", 1)[0]), float(record.get("mtime") or 0.0), key)
+            )
+        newest: set[str] = set()
+        for family in families:
+            keep_last = int(family.get("keep_last") or 0)
+            items = sorted(ranked.get(str(family["name"]), []), reverse=True)
+            newest.update(key for _, _, key in items[:keep_last])
+
+        def _expired(key: str, family: dict[str, Any]) -> bool:
+            keep_days = family.get("keep_days")
+            if keep_days is None or key in newest:
+                return False
+            return (today - dt.date.fromisoformat(key.split("/", 1)[0])).days > int(keep_days)
+
+        for key, (day, entry, family) in sorted(hot.items()):
+            area_key = f"{_posix(area)}/{key}"
+            if bool(family.get("keep_if_referenced", True)) and area_key in referenced:
+                protected.append(area_key)
+                continue
+            try:
+                if _expired(key, family):
+                    if not dry_run:
+                        _remove(entry)
+                        record = archived_entries.pop(key, None)
+                        if record:
+                            expired_members.setdefault(str(record.get("archive") or ""), []).append(entry.name)
+                    deleted.append(area_key)
+                elif (today - day).days > hot_days:
+                    if not dry_run:
+                        archive = _archive_dir(area_root) / f"{day.isoformat()}.zip"
+                        stats = _archive_entry(entry, archive, compression=compression)
+                        archived_entries[key] = {
+                            "archive": archive.name,
+                            "family": str(family["name"]),
+                            "is_dir": entry.is_dir(),
+                            "mtime": _entry_mtime(entry),
+                            "archived_at": dt.datetime.now().astimezone().isoformat(timespec="seconds"),
+                            **stats,
+                        }
+                        _remove(entry)
+                    archived.append(area_key)
+            except Exception as exc:  # noqa: BLE001
+                failed.append({"path": area_key, "error": str(exc)})
+
+        for key in sorted(set(archived_entries) - set(hot)):
+            family = _family_for(key.split("/", 1)[-1], families)
+            if family is None or not _expired(key, family):
+                continue
+            area_key = f"{_posix(area)}/{key}"
+            if bool(family.get("keep_if_referenced", True)) and area_key in referenced:
+                protected.append(area_key)
+                continue
+            deleted.append(area_key)
+            if not dry_run:
+                record = archived_entries.pop(key, None) or {}
+                expired_members.setdefault(str(record.get("archive") or ""), []).append(key.split("/", 1)[-1])
+
+        if not dry_run:
+            live_archives = {str(record.get("archive")) for record in archived_entries.values()}
+            archive_dir = _archive_dir(area_root)
+            for archive in sorted(archive_dir.glob("*.zip")) if archive_dir.is_dir() else []:
+                if archive.name not in live_archives:
+                    archive.unlink()
+                    continue
+                # The day's zip stays for its other entries; drop the expired members' bytes from it.
+                for name in expired_members.get(archive.name, []):
+                    try:
+                        _rewrite_archive_without(archive, name + "/", compression)
+                    except Exception as exc:  # noqa: BLE001
+                        failed.append({"path": f"{_posix(area)}/{ARCHIVE_DIRNAME}/{archive.name}", "error": str(exc)})
+            for day_dir in area_root.iterdir() if area_root.is_dir() else []:
+                if day_dir.is_dir() and _DAY_RE.match(day_dir.name) and not any(day_dir.iterdir()):
+                    day_dir.rmdir()
+            if archived_entries or _manifest_path(area_root).exists():
+                manifest["entries"] = archived_entries
+                _write_manifest(area_root, manifest)
+
+    for flat in policy.get("flat") or []:
+        flat_root = root / str(flat.get("path") or "")
+        if not flat_root.is_dir():
+            continue
+        files = sorted(flat_root.glob(str(flat.get("glob") or "*")), key=_entry_mtime, reverse=True)
+        keep_last = int(flat.get("keep_last") or 0)
+        keep_days = flat.get("keep_days")
+        for path in files[keep_last:]:
+            if keep_days is None:
+                break
+            age_days = (today - dt.date.fromtimestamp(_entry_mtime(path))).days
+            if age_days <= int(keep_days):
+                continue
+            try:
+                if not dry_run:
+                    path.unlink()
+                deleted.append(_posix(path.relative_to(root)))
+            except OSError as exc:
+                failed.append({"path": _posix(path.relative_to(root)), "error": str(exc)})
+
+    artifact_store_gc = gc_artifact_store(root, dry_run=dry_run)
+    return {
+        "dry_run": dry_run,
+        "today": today.isoformat(),
+        "hot_days": hot_days,
+        "archived_count": len(archived),
+        "archived": archived,
+        "deleted_count": len(deleted),
+        "deleted": sorted(set(deleted)),
+        "protected_count": len(protected),
+        "protected": protected,
+        "failed_count": len(failed),
+        "failed": failed,
+        "artifact_store_gc": artifact_store_gc,
+    }
+
+
+def find_archived_entry(root: Path, path: Path) -> tuple[Path, str, dict[str, Any]] | None:
+    """Map a (missing) path under logs/<area>/<day>/<entry>/... to its archive manifest record."""
+    try:
+        rel = _posix(path.resolve().relative_to(root.resolve()))
+    except ValueError:
+        return None
+    match = _LOG_REF_RE.match(rel)
+    if not match:
+        return None
+    area, day, entry = match.groups()
+    area_root = root / area
+    key = f"{day}/{entry}"
+    record = load_archive_manifest(area_root)["entries"].get(key)
+    if not isinstance(record, dict):
+        return None
+    return area_root, key, record
+
+
+def restore_archived_path(root: Path, path: Path) -> bool:
+    """Rehydrate the archived entry that contains ``path``; returns True when ``path`` exists afterwards."""
+    if path.exists():
+        return True
+    found = find_archived_entry(root, path)
+    if found is None:
+        return False
+    area_root, key, record = found
+    day, entry = key.split("/", 1)
+    archive = _archive_dir(area_root) / str(record.get("archive") or f"{day}.zip")
+    if not archive.is_file():
+        return False
+    target_day = area_root / day
+    prefix = entry + "/"
+    with zipfile.ZipFile(archive) as handle:
+        members = [name for name in handle.namelist() if name == entry or name.startswith(prefix)]
+        for name in members:
+            handle.extract(name, target_day)
+    return path.exists()
@@ -7,11 +7,13 @@ import html
 import json
 import os
 import re
+import zipfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from _chapter6_recovery_common import chapter6_stop_loss_note as _chapter6_stop_loss_note
+from _log_lifecycle import ARCHIVE_DIRNAME, load_archive_manifest, restore_archived_path
 from _project_health_schema import (
     validate_project_health_dashboard_payload,
     validate_project_health_record_payload,
@@ -843,6 +845,22 @@ def _active_task_is_stale_clean(payload: dict[str, Any], *, now: datetime) -> bo
     return (now - updated_at).total_seconds() > (max_age_days * 86400)
 
 
+def active_task_input_paths(sidecar_path: Path, *, root: Path) -> list[Path]:
+    """返回 load_active_task_records 为单个 task-*.active.json 额外读取的文件（summary、latest.json 及其指向的 sidecar）。"""
+    try:
+        payload = read_json(sidecar_path)
+    except Exception:
+        return []
+    paths = payload.get("paths") if isinstance(payload, dict) and isinstance(payload.get("paths"), dict) else {}
+    candidates = [
+        _resolve_report_path(paths.get("summary_json"), root=root),
+        _resolve_report_path(paths.get("latest_json"), root=root),
+        _resolve_active_task_sidecar_path(paths, key="execution_context_json", filename="execution-context.json", root=root),
+        _resolve_active_task_run_events_path(paths, root=root),
+    ]
+    return [path for path in candidates if path is not None]
+
+
 def load_active_task_records(root: Path, *, limit: int = 16) -> list[dict[str, Any]]:
     active_dir = root / "logs" / "ci" / "active-tasks"
     if not active_dir.exists():
@@ -1226,67 +1244,336 @@ def build_active_task_summary(root: Path) -> dict[str, Any]:
     return summary
 
 
-def build_report_catalog(root: Path) -> dict[str, Any]:
-    """汇总 logs/ci 下可读取的 JSON 报告索引，供 latest.html 展示。"""
-    logs_root = root / "logs" / "ci"
-    if not logs_root.exists():
-        return {"total_json": 0, "invalid_json": 0, "entries": []}
+REPORT_CATALOG_INDEX_VERSION = 2
+_REPORT_CATALOG_HEAD_KEYS = ("kind", "cmd", "status", "result", "generated_at", "timestamp", "ts", "summary", "message")
+_REPORT_CATALOG_HEAD_VALUE_RE = r'\s*:\s*("(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null)'
+_REPORT_CATALOG_HEAD_REGEXES = {
+    key: re.compile(r'"' + re.escape(key) + r'"' + _REPORT_CATALOG_HEAD_VALUE_RE) for key in _REPORT_CATALOG_HEAD_KEYS
+}
+_REPORT_CATALOG_PAGE_RE = re.compile(r"^report-catalog\.page-\d+\.json$")
 
-    entries: list[dict[str, Any]] = []
-    invalid = 0
-    for path in sorted(logs_root.rglob("*.json")):
-        rel = repo_rel(path, root=root)
+
+def report_catalog_index_path(root: Path) -> Path:
+    return latest_dir(root) / "report-catalog.index.json"
+
+
+def report_catalog_page_path(root: Path, page: int) -> Path:
+    return latest_dir(root) / f"report-catalog.page-{max(1, int(page)):04d}.json"
+
+
+def report_catalog_page_size() -> int:
+    return max(1, _env_int("PROJECT_HEALTH_REPORT_CATALOG_PAGE_SIZE", 200))
+
+
+def _is_report_catalog_artifact(path: Path, *, root: Path) -> bool:
+    if path.parent != latest_dir(root):
+        return False
+    return path.name == report_catalog_index_path(root).name or bool(_REPORT_CATALOG_PAGE_RE.match(path.name))
+
+
+def _iter_report_json_files(directory: Path) -> list[tuple[Path, os.stat_result]]:
+    """与 rglob("*.json") 相同的范围（不跟随目录符号链接，跳过 .cas/.archive 等隐藏目录），但复用 scandir 的 stat 结果。
+
+    .archive 中的归档运行由 _archived_report_records 单独登记。
+    """
+    found: list[tuple[Path, os.stat_result]] = []
+    pending = [directory]
+    while pending:
+        current = pending.pop()
         try:
-            stat = path.stat()
-            modified_at = datetime.fromtimestamp(stat.st_mtime).astimezone().isoformat(timespec="seconds")
+            with os.scandir(current) as handle:
+                entries = list(handle)
         except OSError:
-            stat = None
-            modified_at = ""
-
-        kind = path.stem
-        status = ""
-        generated_at = ""
-        summary = ""
-        parse_error = ""
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith("."):
+                        pending.append(Path(entry.path))
+                elif entry.name.endswith(".json") and entry.is_file():
+                    found.append((Path(entry.path), entry.stat()))
+            except OSError:
+                continue
+    return found
+
+
+def _head_parse_report(path: Path, *, head_bytes: int) -> tuple[dict[str, Any] | None, str]:
+    """只读取大文件开头的有限字节，按首次出现提取常用字段；开头不是对象时返回 parse_error。"""
+    try:
+        with path.open("rb") as handle:
+            head = handle.read(head_bytes).decode("utf-8", errors="ignore")
+    except OSError:
+        return None, "invalid-json"
+    stripped = head.lstrip("\ufeff \t\r\n")
+    if not stripped.startswith("{"):
+        return None, "json-not-object" if stripped[:1] in {"[", '"'} or stripped[:1].isdigit() else "invalid-json"
+    fields: dict[str, Any] = {}
+    for key, pattern in _REPORT_CATALOG_HEAD_REGEXES.items():
+        match = pattern.search(stripped)
+        if not match:
+            continue
         try:
+            fields[key] = json.loads(match.group(1))
+        except ValueError:
+            continue
+    return fields, ""
+
+
+def _build_report_catalog_entry(
+    path: Path,
+    *,
+    rel: str,
+    stat: os.stat_result | None,
+    full_parse_max_bytes: int,
+    head_bytes: int,
+) -> tuple[dict[str, Any], bool]:
+    modified_at = datetime.fromtimestamp(stat.st_mtime).astimezone().isoformat(timespec="seconds") if stat else ""
+    size_bytes = int(stat.st_size) if stat else 0
+    kind = path.stem
+    status = ""
+    generated_at = ""
+    summary = ""
+    parse_error = ""
+    highlights: dict[str, Any] = {}
+    invalid = False
+    head_only = bool(full_parse_max_bytes) and size_bytes > full_parse_max_bytes
+    try:
+        if head_only:
+            payload, parse_error = _head_parse_report(path, head_bytes=head_bytes)
+            invalid = parse_error == "invalid-json"
+        else:
             payload = read_json(path)
-            if isinstance(payload, dict):
-                kind = _normalize_report_value(payload.get("kind") or payload.get("cmd") or kind, limit=120) or kind
-                status = _normalize_report_value(payload.get("status") or payload.get("result"), limit=40)
-                generated_at = _normalize_report_value(
-                    payload.get("generated_at") or payload.get("timestamp") or payload.get("ts"),
-                    limit=60,
-                )
-                summary = _normalize_report_value(payload.get("summary") or payload.get("message"), limit=200)
-                highlights = _extract_report_highlights(payload)
-            else:
+            if not isinstance(payload, dict):
                 parse_error = "json-not-object"
-                highlights = {}
-        except Exception:
-            invalid += 1
-            parse_error = "invalid-json"
-            highlights = {}
+                payload = None
+        if payload is not None:
+            kind = _normalize_report_value(payload.get("kind") or payload.get("cmd") or kind, limit=120) or kind
+            status = _normalize_report_value(payload.get("status") or payload.get("result"), limit=40)
+            generated_at = _normalize_report_value(
+                payload.get("generated_at") or payload.get("timestamp") or payload.get("ts"),
+                limit=60,
+            )
+            summary = _normalize_report_value(payload.get("summary") or payload.get("message"), limit=200)
+            if not head_only:
+                highlights = _extract_report_highlights(payload)
+    except Exception:
+        invalid = True
+        parse_error = "invalid-json"
+        highlights = {}
+
+    entry = {
+        "path": rel,
+        "kind": kind,
+        "status": status,
+        "generated_at": generated_at,
+        "summary": summary,
+        "size_bytes": size_bytes,
+        "modified_at": modified_at,
+        "parse_error": parse_error,
+        "highlights": highlights,
+    }
+    return entry, invalid
 
-        entries.append(
-            {
+
+def _report_catalog_parse_limits() -> tuple[int, int]:
+    full_parse_max_bytes = _env_int("PROJECT_HEALTH_REPORT_CATALOG_FULL_PARSE_MAX_BYTES", 4 * 1024 * 1024)
+    head_bytes = max(1024, _env_int("PROJECT_HEALTH_REPORT_CATALOG_HEAD_BYTES", 64 * 1024))
+    return full_parse_max_bytes, head_bytes
+
+
+def _archived_report_records(root: Path, logs_root: Path, previous: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+    """登记 log lifecycle 打包进 logs/ci/.archive 的 JSON 报告，返回 (records, changed)。
+
+    只读取 zip 目录（成员名、大小、时间），不解压也不解析；条目 status 为 "archived"，
+    访问时由 resolve_report_catalog_entry 通过 restore_archived_path 还原后再完整解析。
+    zip 的 mtime/size 未变化时直接复用上次的记录。
+    """
+    archive_dir = logs_root / ARCHIVE_DIRNAME
+    logs_rel = repo_rel(logs_root, root=root)
+    by_archive: dict[str, list[str]] = {}
+    for key, record in load_archive_manifest(logs_root)["entries"].items():
+        if isinstance(record, dict) and "/" in key:
+            by_archive.setdefault(str(record.get("archive") or f"{key.split('/', 1)[0]}.zip"), []).append(key)
+
+    previous_by_archive: dict[str, dict[str, Any]] = {}
+    for rel, cached in previous.items():
+        if isinstance(cached, dict) and cached.get("archive"):
+            previous_by_archive.setdefault(str(cached["archive"]), {})[rel] = cached
+
+    records: dict[str, Any] = {}
+    changed = False
+    for name, keys in sorted(by_archive.items()):
+        try:
+            stat = (archive_dir / name).stat()
+        except OSError:
+            continue
+        live_keys = set(keys)
+        cached_records = previous_by_archive.get(name, {})
+        if cached_records and all(
+            item.get("mtime_ns") == stat.st_mtime_ns and item.get("size") == stat.st_size for item in cached_records.values()
+        ):
+            records.update((rel, item) for rel, item in cached_records.items() if item.get("archived_entry") in live_keys)
+            continue
+        changed = True
+        entries_by_name = {key.split("/", 1)[1]: key for key in keys}
+        try:
+            with zipfile.ZipFile(archive_dir / name) as handle:
+                infos = handle.infolist()
+        except (OSError, zipfile.BadZipFile):
+            continue
+        for info in infos:
+            if info.is_dir() or not info.filename.endswith(".json"):
+                continue
+            key = entries_by_name.get(info.filename.split("/", 1)[0])
+            if key is None:
+                continue
+            rel = f"{logs_rel}/{key.split('/', 1)[0]}/{info.filename}"
+            entry = {
                 "path": rel,
-                "kind": kind,
-                "status": status,
-                "generated_at": generated_at,
-                "summary": summary,
-                "size_bytes": int(stat.st_size) if stat else 0,
-                "modified_at": modified_at,
-                "parse_error": parse_error,
-                "highlights": highlights,
+                "kind": Path(info.filename).stem,
+                "status": "archived",
+                "generated_at": "",
+                "summary": "",
+                "size_bytes": int(info.file_size),
+                "modified_at": datetime(*info.date_time).astimezone().isoformat(timespec="seconds"),
+                "parse_error": "",
+                "highlights": {},
             }
+            records[rel] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "invalid": False,
+                "archive": name,
+                "archived_entry": key,
+                "entry": entry,
+            }
+    return records, changed
+
+
+def _load_report_catalog_index(path: Path, *, full_parse_max_bytes: int) -> dict[str, Any]:
+    try:
+        payload = read_json(path)
+    except Exception:
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != REPORT_CATALOG_INDEX_VERSION:
+        return {}
+    if payload.get("full_parse_max_bytes") != full_parse_max_bytes:
+        return {}
+    files = payload.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def update_report_catalog_index(root: Path) -> list[dict[str, Any]]:
+    """增量刷新 logs/ci 的报告索引：只重新解析新增或 mtime/size 变化的 JSON，删除的文件会被移除。
+
+    已归档到 logs/ci/.archive 的运行以 status="archived" 的延迟记录保留在目录中。
+
+    返回按 (modified_at, path) 倒序排列的索引记录，每条含 entry 与 invalid 标记。
+    """
+    logs_root = root / "logs" / "ci"
+    index_path = report_catalog_index_path(root)
+    if not logs_root.exists():
+        return []
+    full_parse_max_bytes, head_bytes = _report_catalog_parse_limits()
+    previous = _load_report_catalog_index(index_path, full_parse_max_bytes=full_parse_max_bytes)
+
+    files: dict[str, Any] = {}
+    changed = False
+    for path, stat in _iter_report_json_files(logs_root):
+        if _is_report_catalog_artifact(path, root=root):
+            continue
+        rel = repo_rel(path, root=root)
+        cached = previous.get(rel)
+        if (
+            isinstance(cached, dict)
+            and cached.get("mtime_ns") == stat.st_mtime_ns
+            and cached.get("size") == stat.st_size
+            and isinstance(cached.get("entry"), dict)
+        ):
+            files[rel] = cached
+            continue
+        entry, invalid = _build_report_catalog_entry(
+            path,
+            rel=rel,
+            stat=stat,
+            full_parse_max_bytes=full_parse_max_bytes,
+            head_bytes=head_bytes,
+        )
+        files[rel] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "invalid": invalid, "entry": entry}
+        changed = True
+
+    archived, archived_changed = _archived_report_records(root, logs_root, previous)
+    changed = changed or archived_changed
+    for rel, record in archived.items():
+        # 已被 restore_archived_path 还原的运行按热文件登记。
+        files.setdefault(rel, record)
+
+    if changed or set(files) != set(previous):
+        write_json(
+            index_path,
+            {
+                "version": REPORT_CATALOG_INDEX_VERSION,
+                "full_parse_max_bytes": full_parse_max_bytes,
+                "files": files,
+            },
         )
+    records = list(files.values())
+    records.sort(key=lambda item: (item["entry"].get("modified_at", ""), item["entry"].get("path", "")), reverse=True)
+    return records
 
-    entries.sort(key=lambda item: (item.get("modified_at", ""), item.get("path", "")), reverse=True)
-    return {
-        "total_json": len(entries),
-        "invalid_json": invalid,
-        "entries": entries,
+
+def paginate_report_catalog(records: list[dict[str, Any]], *, page: int = 1, page_size: int = 0) -> dict[str, Any]:
+    """把 update_report_catalog_index 的结果切成 catalog 载荷；page_size=0 返回全部条目。"""
+    catalog: dict[str, Any] = {
+        "total_json": len(records),
+        "invalid_json": sum(1 for item in records if item.get("invalid")),
+        "entries": [],
     }
+    if page_size > 0:
+        total_pages = max(1, -(-len(records) // page_size))
+        page = min(max(1, int(page)), total_pages)
+        records = records[(page - 1) * page_size : page * page_size]
+        catalog.update({"page": page, "page_size": page_size, "total_pages": total_pages})
+    catalog["entries"] = [dict(item["entry"]) for item in records]
+    return catalog
+
+
+def build_report_catalog(root: Path, *, page: int = 1, page_size: int = 0) -> dict[str, Any]:
+    """汇总 logs/ci 下可读取的 JSON 报告索引，供 latest.html 展示。
+
+    page_size=0 返回全部条目；否则只返回第 page 页，并附带分页字段。
+    """
+    return paginate_report_catalog(update_report_catalog_index(root), page=page, page_size=page_size)
+
+
+def resolve_report_catalog_entry(root: Path | str | None, rel: str) -> dict[str, Any] | None:
+    """返回 logs/ci 下单个报告的完整目录条目；已归档的报告先经 restore_archived_path 原地还原再解析。"""
+    resolved_root = resolve_root(root)
+    logs_root = (resolved_root / "logs" / "ci").resolve()
+    path = (resolved_root / rel).resolve()
+    if path.suffix != ".json" or logs_root not in path.parents:
+        return None
+    if not restore_archived_path(resolved_root, path) or not path.is_file():
+        return None
+    full_parse_max_bytes, head_bytes = _report_catalog_parse_limits()
+    entry, _invalid = _build_report_catalog_entry(
+        path,
+        rel=repo_rel(path, root=resolved_root),
+        stat=path.stat(),
+        full_parse_max_bytes=full_parse_max_bytes,
+        head_bytes=head_bytes,
+    )
+    return entry
+
+
+def write_report_catalog_page(root: Path | str | None = None, *, page: int, page_size: int | None = None) -> Path:
+    """按需把索引的第 page 页写成独立 JSON，供页面之外的消费者翻页读取。"""
+    resolved_root = resolve_root(root)
+    catalog = build_report_catalog(resolved_root, page=page, page_size=page_size or report_catalog_page_size())
+    validate_project_health_report_catalog_payload(catalog)
+    path = report_catalog_page_path(resolved_root, int(catalog["page"]))
+    write_json(path, catalog)
+    return path
 
 
 def dashboard_html(
@@ -1297,6 +1584,7 @@ def dashboard_html(
     report_catalog_path: str,
     active_task_summary: dict[str, Any],
     project_overview: dict[str, Any] | None = None,
+    live: bool = False,
 ) -> str:
     project_overview = project_overview or {
         "game_name": "",
@@ -1464,6 +1752,17 @@ def dashboard_html(
     report_total = int(report_catalog.get("total_json", 0))
     report_invalid = int(report_catalog.get("invalid_json", 0))
     report_catalog_path_escaped = html.escape(report_catalog_path)
+    refresh_hint = (
+        "Live updates are on. 页面由 serve_project_health 提供，扫描写入新结果后会自动更新。"
+        if live
+        else "Auto-refresh is disabled. 页面不会自动刷新，请在执行扫描后手动刷新。"
+    )
+    report_page_hint = ""
+    if "total_pages" in report_catalog:
+        report_page_hint = (
+            f"；当前显示第 {int(report_catalog.get('page') or 1)}/{int(report_catalog.get('total_pages') or 1)} 页"
+            f"（每页 {int(report_catalog.get('page_size') or 0)} 条，其余分页按需写入 report-catalog.page-NNNN.json）"
+        )
     overview_documents = project_overview.get("documents") if isinstance(project_overview.get("documents"), dict) else {}
     overview_core = project_overview.get("prototype_core") if isinstance(project_overview.get("prototype_core"), dict) else {}
     overview_specifics = project_overview.get("game_type_specifics") if isinstance(project_overview.get("game_type_specifics"), dict) else {}
@@ -1777,8 +2076,8 @@ def dashboard_html(
         {''.join(active_task_cards) if active_task_cards else '<div class="meta">No active task sidecars found.</div>'}
       </div>
     </details>
-    <div class="hint">JSON 报告总数: {report_total}；解析失败: {report_invalid}；索引文件: {report_catalog_path_escaped}</div>
-    <div class="hint">Auto-refresh is disabled. 页面不会自动刷新，请在执行扫描后手动刷新。</div>
+    <div class="hint">JSON 报告总数: {report_total}；解析失败: {report_invalid}；索引文件: {report_catalog_path_escaped}{html.escape(report_page_hint)}</div>
+    <div class="hint">{refresh_hint}</div>
     <details>
       <summary>展开查看全部 JSON 报告索引</summary>
       <div class="table-wrap">
@@ -1809,7 +2108,7 @@ def refresh_dashboard(root: Path | str | None = None, *, now: datetime | None =
     resolved_root = resolve_root(root)
     stamp = now or now_local()
     records = load_latest_records(resolved_root)
-    report_catalog = build_report_catalog(resolved_root)
+    report_catalog = build_report_catalog(resolved_root, page=1, page_size=report_catalog_page_size())
     active_task_summary = build_active_task_summary(resolved_root)
     project_overview = build_project_overview(resolved_root)
     overall = "ok"
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""Live project-health dashboard server: in-memory model, JSON API, ETag/gzip and SSE push."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import threading
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from _project_health_common import (
+    PROJECT_HEALTH_KINDS,
+    active_task_input_paths,
+    build_active_task_summary,
+    build_project_overview,
+    dashboard_html,
+    latest_dir,
+    load_latest_records,
+    now_local,
+    paginate_report_catalog,
+    report_catalog_page_size,
+    resolve_report_catalog_entry,
+    resolve_root,
+    update_report_catalog_index,
+)
+
+
+DEFAULT_POLL_SEC = 2.0
+SSE_HEARTBEAT_SEC = 15.0
+MIN_GZIP_BYTES = 512
+MAX_CATALOG_PAGE_SIZE = 1000
+LIVE_RELOAD_SCRIPT = """<script>
+(function () {
+  if (!window.EventSource) { return; }
+  var source = new EventSource("/api/events");
+  source.addEventListener("update", function (event) {
+    var sections = (JSON.parse(event.data).sections || []);
+    if (sections.indexOf("html") < 0) { return; }
+    fetch("/latest.html", {cache: "no-cache"}).then(function (resp) { return resp.text(); }).then(function (text) {
+      var doc = new DOMParser().parseFromString(text, "text/html");
+      var open = Array.prototype.map.call(document.querySelectorAll("details"), function (node) { return node.open; });
+      document.querySelector("main").replaceWith(doc.querySelector("main"));
+      Array.prototype.forEach.call(document.querySelectorAll("details"), function (node, idx) {
+        if (idx < open.length) { node.open = open[idx]; }
+      });
+    });
+  });
+})();
+</script>
+"""
+
+
+class CachedBody:
+    """One immutable response body with its ETag and a lazily built gzip variant."""
+
+    def __init__(self, body: bytes, content_type: str) -> None:
+        self.body = body
+        self.content_type = content_type
+        self.etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self._gzip: bytes | None = None
+
+    def gzipped(self) -> bytes:
+        if self._gzip is None:
+            self._gzip = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self._gzip
+
+
+def _json_body(payload: dict[str, Any]) -> CachedBody:
+    return CachedBody(json.dumps(payload, ensure_ascii=True, indent=2).encode("utf-8") + b"\n", "application/json; charset=utf-8")
+
+
+def _stat_signature(paths: list[Path]) -> tuple[tuple[str, int, int], ...]:
+    signature: list[tuple[str, int, int]] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(signature))
+
+
+class DashboardModel:
+    """Keeps the dashboard sections in memory and rebuilds only the ones whose inputs changed."""
+
+    def __init__(self, root: Path, *, page_size: int | None = None) -> None:
+        self.root = root
+        self.page_size = page_size or report_catalog_page_size()
+        self.version = 0
+        self.last_changed: list[str] = []
+        self.changed = threading.Condition()
+        self._lock = threading.Lock()
+        self._signatures: dict[str, Any] = {}
+        self._records: list[dict[str, Any]] = []
+        self._catalog_records: list[dict[str, Any]] = []
+        self._active_task_summary: dict[str, Any] = {}
+        self._bodies: dict[str, CachedBody] = {}
+        self._catalog_pages: dict[tuple[int, int], CachedBody] = {}
+
+    def _records_signature(self) -> Any:
+        return _stat_signature([latest_dir(self.root) / f"{kind}.latest.json" for kind in PROJECT_HEALTH_KINDS])
+
+    def _active_tasks_signature(self) -> Any:
+        active_dir = self.root / "logs" / "ci" / "active-tasks"
+        if not active_dir.exists():
+            return ()
+        signature = []
+        for sidecar in sorted(active_dir.glob("task-*.active.json")):
+            # The summary and latest.json a sidecar points at feed the same records, so they count too.
+            signature.append((sidecar.name, _stat_signature([sidecar]), _stat_signature(active_task_input_paths(sidecar, root=self.root))))
+        return tuple(signature)
+
+    def refresh(self) -> list[str]:
+        """Poll the filesystem once; returns the sections that changed (empty when nothing moved)."""
+        changed: list[str] = []
+        records_signature = self._records_signature()
+        active_signature = self._active_tasks_signature()
+        catalog_records = update_report_catalog_index(self.root)
+        catalog_signature = tuple(
+            (item["entry"].get("path"), item.get("mtime_ns"), item.get("size")) for item in catalog_records
+        )
+        with self._lock:
+            if records_signature != self._signatures.get("records"):
+                self._records = load_latest_records(self.root)
+                self._signatures["records"] = records_signature
+                changed.append("records")
+            if active_signature != self._signatures.get("active-tasks"):
+                self._active_task_summary = build_active_task_summary(self.root)
+                self._signatures["active-tasks"] = active_signature
+                changed.append("active-tasks")
+            if catalog_signature != self._signatures.get("catalog"):
+                self._catalog_records = catalog_records
+                self._catalog_pages = {}
+                self._signatures["catalog"] = catalog_signature
+                changed.append("catalog")
+            if not changed:
+                return []
+            self._rebuild_bodies(changed)
+            changed.append("html")
+        with self.changed:
+            self.version += 1
+            self.last_changed = changed
+            self.changed.notify_all()
+        return changed
+
+    def _rebuild_bodies(self, changed: list[str]) -> None:
+        generated_at = now_local().isoformat(timespec="seconds")
+        overall = "ok"
+        if any(item.get("status") == "fail" for item in self._records):
+            overall = "fail"
+        elif any(item.get("status") == "warn" for item in self._records):
+            overall = "warn"
+        if "records" in changed:
+            self._bodies["records"] = _json_body({"status": overall, "generated_at": generated_at, "records": self._records})
+        if "active-tasks" in changed:
+            self._bodies["active-tasks"] = _json_body(self._active_task_summary)
+        first_page = paginate_report_catalog(self._catalog_records, page=1, page_size=self.page_size)
+        page_html = dashboard_html(
+            self._records,
+            generated_at=generated_at,
+            report_catalog=first_page,
+            report_catalog_path="/api/catalog?page=1",
+            active_task_summary=self._active_task_summary,
+            project_overview=build_project_overview(self.root),
+            live=True,
+        )
+        page_html = page_html.replace("</body>", LIVE_RELOAD_SCRIPT + "</body>", 1)
+        self._bodies["html"] = CachedBody(page_html.encode("utf-8"), "text/html; charset=utf-8")
+
+    def body(self, section: str) -> CachedBody | None:
+        with self._lock:
+            return self._bodies.get(section)
+
+    def catalog_page(self, page: int, page_size: int) -> CachedBody:
+        key = (max(1, page), min(max(1, page_size), MAX_CATALOG_PAGE_SIZE))
+        with self._lock:
+            cached = self._catalog_pages.get(key)
+            if cached is None:
+                cached = _json_body(paginate_report_catalog(self._catalog_records, page=key[0], page_size=key[1]))
+                self._catalog_pages[key] = cached
+            return cached
+
+    def catalog_entry(self, rel: str) -> CachedBody | None:
+        """Full entry for one catalog path; archived runs are restored on this first access."""
+        entry = resolve_report_catalog_entry(self.root, rel)
+        return None if entry is None else _json_body(entry)
+
+    def wait_for_change(self, seen_version: int, timeout: float) -> int:
+        with self.changed:
+            self.changed.wait_for(lambda: self.version != seen_version, timeout=timeout)
+            return self.version
+
+
+def poll_forever(model: DashboardModel, stop: threading.Event, *, interval_sec: float = DEFAULT_POLL_SEC) -> None:
+    while not stop.wait(interval_sec):
+        try:
+            model.refresh()
+        except Exception:  # noqa: BLE001 - a half-written report must not stop the poller
+            continue
+
+
+class DashboardRequestHandler(SimpleHTTPRequestHandler):
+    """Routes /api/* and /latest.html to the in-memory model; other paths fall back to static files."""
+
+    model: DashboardModel
+    stop_event: threading.Event
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        return
+
+    def do_GET(self) -> None:  # noqa: N802 - stdlib naming
+        parts = urlsplit(self.path)
+        route = parts.path.rstrip("/") or "/"
+        if route in {"/", "/latest.html"}:
+            self._send_cached(self.model.body("html"))
+        elif route == "/api/records":
+            self._send_cached(self.model.body("records"))
+        elif route == "/api/active-tasks":
+            self._send_cached(self.model.body("active-tasks"))
+        elif route == "/api/catalog":
+            query = parse_qs(parts.query)
+            page = _query_int(query, "page", 1)
+            page_size = _query_int(query, "page_size", self.model.page_size)
+            self._send_cached(self.model.catalog_page(page, page_size))
+        elif route == "/api/catalog/entry":
+            entry = self.model.catalog_entry((parse_qs(parts.query).get("path") or [""])[0])
+            if entry is None:
+                self.send_error(HTTPStatus.NOT_FOUND, "report not found")
+            else:
+                self._send_cached(entry)
+        elif route == "/api/events":
+            self._stream_events()
+        else:
+            super().do_GET()
+
+    def _send_cached(self, cached: CachedBody | None) -> None:
+        if cached is None:
+            self.send_error(HTTPStatus.SERVICE_UNAVAILABLE, "dashboard model not ready")
+            return
+        if cached.etag in _split_etags(self.headers.get("If-None-Match", "")):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", cached.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = cached.body
+        use_gzip = len(body) >= MIN_GZIP_BYTES and "gzip" in self.headers.get("Accept-Encoding", "")
+        if use_gzip:
+            body = cached.gzipped()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", cached.content_type)
+        self.send_header("ETag", cached.etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_events(self) -> None:
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        seen = self.model.version
+        try:
+            self.wfile.write(f"retry: {int(DEFAULT_POLL_SEC * 1000)}\n\n".encode("ascii"))
+            self.wfile.flush()
+            while not self.stop_event.is_set():
+                current = self.model.wait_for_change(seen, SSE_HEARTBEAT_SEC)
+                if current == seen:
+                    self.wfile.write(b": keep-alive\n\n")
+                else:
+                    seen = current
+                    data = json.dumps({"version": current, "sections": self.model.last_changed})
+                    self.wfile.write(f"id: {current}\nevent: update\ndata: {data}\n\n".encode("ascii"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+
+def _query_int(query: dict[str, list[str]], key: str, default: int) -> int:
+    try:
+        return max(1, int((query.get(key) or [default])[0]))
+    except ValueError:
+        return default
+
+
+def _split_etags(header: str) -> set[str]:
+    return {item.strip().removeprefix("W/") for item in header.split(",") if item.strip()}
+
+
+def build_live_server(
+    *,
+    root: Path | str | None = None,
+    host: str,
+    port: int,
+    poll_sec: float = DEFAULT_POLL_SEC,
+) -> tuple[ThreadingHTTPServer, threading.Event]:
+    """Build the server and start its filesystem poller; callers own ``serve_forever``/``shutdown``."""
+    resolved_root = resolve_root(root)
+    model = DashboardModel(resolved_root)
+    model.refresh()
+    stop = threading.Event()
+    served_dir = str(latest_dir(resolved_root))
+    handler = type(
+        "BoundDashboardRequestHandler",
+        (DashboardRequestHandler,),
+        {
+            "model": model,
+            "stop_event": stop,
+            "__init__": lambda self, *args, **kwargs: DashboardRequestHandler.__init__(self, *args, directory=served_dir, **kwargs),
+        },
+    )
+    server = ThreadingHTTPServer((host, int(port)), handler)
+    server.daemon_threads = True
+    threading.Thread(target=poll_forever, args=(model, stop), kwargs={"interval_sec": poll_sec}, daemon=True).start()
+    return server, stop
+
+
+def run_live_server(*, root: Path | str | None = None, host: str, port: int, poll_sec: float = DEFAULT_POLL_SEC) -> None:
+    server, stop = build_live_server(root=root, host=host, port=port, poll_sec=poll_sec)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
@@ -187,6 +187,9 @@ def _validate_project_health_report_catalog_fallback(payload: dict[str, Any]) ->
     errors: list[str] = []
     _require_non_negative_int(payload, "total_json", errors)
     _require_non_negative_int(payload, "invalid_json", errors)
+    for key in ("page", "page_size", "total_pages"):
+        if key in payload and (not isinstance(payload.get(key), int) or payload.get(key) < 1):
+            errors.append(f"$.{key}: expected integer >= 1")
     entries = payload.get("entries")
     if not isinstance(entries, list):
         errors.append("$.entries: expected array")
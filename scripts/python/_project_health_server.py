@@ -114,13 +114,12 @@ def can_reuse_server(info: dict[str, Any], *, root: Path, preferred_port: int =
 def spawn_detached_http_server(*, root: Path, port: int) -> int:
     cmd = [
         sys.executable,
-        "-m",
-        "http.server",
+        str(Path(__file__).resolve().with_name("serve_project_health.py")),
+        "--repo-root",
+        str(root),
+        "--port",
         str(port),
-        "--bind",
-        HOST,
-        "-d",
-        str(dashboard_dir(root)),
+        "--foreground",
     ]
     kwargs: dict[str, Any] = {
         "cwd": str(root),
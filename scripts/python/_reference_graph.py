@@ -0,0 +1,438 @@
+"""Reference graph over task views, ADRs, overlay docs, contracts and tests.
+
+check_tasks_all_refs, check_tasks_back_references, validate_task_overlays, sync_task_overlay_refs
+and remind_overlay_task_drift each globbed docs/adr and docs/architecture/overlays on their own
+(task_links_validate ran two of them back to back). load_reference_graph() builds one index per
+repo root and process, and they all query it:
+
+- ADR ids from the docs/adr/ADR-*.md file names;
+- overlay folders and their entries (docs/architecture/overlays/<PRD-ID>/08/*);
+- edges from the task views (adr_refs, overlay, overlay_refs, test_refs, depends_on) and from
+  the overlay docs (front matter ADR-Refs / Test-Refs, backticked Game.Core/Contracts/*.cs paths).
+
+Nodes are "<kind>:<key>" strings, kinds being task, adr, overlay, contract and test; a task key is
+"<task file name>#<id>". refs() / back_refs() walk the edges either way, missing_targets() lists
+edges whose target does not exist and orphans() the nodes nothing references.
+
+Each part is built on first use: a caller that only needs ADR ids never reads a task file, and
+task_refs() never reads an overlay doc.
+Directories are listed fresh on every build (a listing costs about what checking its mtime
+would). The edges parsed out of task files and overlay docs are kept in
+logs/ci/.reference-graph/graph.json by path, mtime and size, so an unchanged file is not read
+again on the next run. SC_REFERENCE_GRAPH=off disables the cache file; any other non-empty value
+is the cache file path.
+"""
+
+from __future__ import annotations
+
+import atexit
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from _contract_model import iter_source_files
+from _front_matter import extract_front_matter
+
+
+CACHE_ENV = "SC_REFERENCE_GRAPH"
+CACHE_MAX_ENTRIES = 20000
+
+ADR_DIR = "docs/adr"
+OVERLAYS_ROOT = "docs/architecture/overlays"
+CONTRACTS_ROOT = "Game.Core/Contracts"
+TASKS_DIR = ".taskmaster/tasks"
+TASK_FILES = ("tasks.json", "tasks_back.json", "tasks_gameplay.json")
+
+ADR_FILE_RE = re.compile(r"ADR-(\d{4})")
+CONTRACT_REF_RE = re.compile(r"`(" + re.escape(CONTRACTS_ROOT) + r"/[^`]+?\.cs)`")
+
+# Kinds whose full population is known, so "nothing references it" is meaningful.
+ORPHAN_KINDS = ("adr", "overlay", "contract")
+# (task field, target kind), read in this order from every task.
+TASK_REF_FIELDS = (
+    ("adr_refs", "adr"),
+    ("adrRefs", "adr"),
+    ("overlay", "overlay"),
+    ("overlay_refs", "overlay"),
+    ("test_refs", "test"),
+    ("depends_on", "task"),
+    ("dependencies", "task"),
+)
+DOC_REF_FIELDS = (("ADR-Refs", "adr"), ("Test-Refs", "test"))
+
+# Cached edges are only reused while the parsing rules in this file are unchanged.
+GRAPH_VERSION = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+
+@dataclass(frozen=True)
+class Edge:
+    source: str
+    target: str
+    field: str
+
+    @property
+    def kind(self) -> str:
+        return self.target.split(":", 1)[0]
+
+    @property
+    def key(self) -> str:
+        return self.target.split(":", 1)[1]
+
+
+@dataclass(frozen=True)
+class OverlayFolder:
+    prd_id: str
+    has_08: bool
+    # (name, is_file) for every entry of <PRD-ID>/08, sorted by name; empty when 08 is not a directory.
+    entries: tuple[tuple[str, bool], ...]
+
+
+def node_id(kind: str, key: str) -> str:
+    return f"{kind}:{key}"
+
+
+def _norm(value: object) -> str:
+    return str(value).strip().replace("\\", "/")
+
+
+def _values(raw: object) -> list[str]:
+    items = raw if isinstance(raw, list) else [raw]
+    out: list[str] = []
+    for item in items:
+        if item is None or item == "" or isinstance(item, (dict, list)):
+            continue
+        text = _norm(item)
+        if text:
+            out.append(text)
+    return out
+
+
+def _signature(path: str) -> list[int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _scandir(path: str) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(path) as it:
+            return sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return []
+
+
+def _task_items(payload: Any) -> list[dict[str, Any]]:
+    if isinstance(payload, dict):
+        master = payload.get("master")
+        payload = master.get("tasks") if isinstance(master, dict) else None
+    if not isinstance(payload, list):
+        return []
+    return [item for item in payload if isinstance(item, dict)]
+
+
+def parse_task_refs(text: str, file_name: str) -> list[list[Any]]:
+    """[[task key, [[field, kind, target key], ...]], ...] for one task view file."""
+    try:
+        items = _task_items(json.loads(text))
+    except ValueError:
+        return []
+    out: list[list[Any]] = []
+    for index, item in enumerate(items):
+        task_id = item.get("id")
+        key = f"{file_name}#{task_id if task_id is not None else f'@{index}'}"
+        refs: list[list[str]] = []
+        for field, kind in TASK_REF_FIELDS:
+            if field not in item:
+                continue
+            for value in _values(item[field]):
+                refs.append([field, kind, f"{file_name}#{value}" if kind == "task" else value])
+        out.append([key, refs])
+    return out
+
+
+def parse_doc_refs(text: str) -> list[list[str]]:
+    """[[field, kind, target key], ...] for one overlay doc, without duplicates."""
+    refs: list[list[str]] = []
+    front_matter = extract_front_matter(text) or {}
+    for field, kind in DOC_REF_FIELDS:
+        refs.extend([field, kind, value] for value in _values(front_matter.get(field) or []))
+    refs.extend(["contract", "contract", match] for match in CONTRACT_REF_RE.findall(text))
+    seen: set[tuple[str, ...]] = set()
+    unique: list[list[str]] = []
+    for ref in refs:
+        marker = tuple(ref)
+        if marker not in seen:
+            seen.add(marker)
+            unique.append(ref)
+    return unique
+
+
+class ReferenceGraph:
+    """Index of one repo root; see the module docstring. Use load_reference_graph()."""
+
+    def __init__(self, root: Path, cache_file: Path | None) -> None:
+        self.root = root
+        self.cache_file = cache_file
+        self.stats = {"parsed": 0, "reused": 0}
+        self._root = str(root)
+        self._lock = threading.RLock()
+        self._records: dict[str, dict[str, Any]] | None = None
+        self._new: dict[str, dict[str, Any]] = {}
+        self._adr_ids: frozenset[str] | None = None
+        self._folders: tuple[OverlayFolder, ...] | None = None
+        self._overlay_files: frozenset[str] = frozenset()
+        self._task_edge_list: tuple[Edge, ...] | None = None
+        self._edges: tuple[Edge, ...] | None = None
+        self._tasks: frozenset[str] = frozenset()
+        self._outgoing: dict[str, list[Edge]] = {}
+        self._incoming: dict[str, list[Edge]] = {}
+        self._file_exists: dict[str, bool] = {}
+        self._contract_files: frozenset[str] | None = None
+
+    def _adr_id_set(self) -> frozenset[str]:
+        with self._lock:
+            if self._adr_ids is None:
+                ids: set[str] = set()
+                for entry in _scandir(os.path.join(self._root, ADR_DIR)):
+                    # fnmatch follows the platform's case rules, like Path.glob("ADR-*.md").
+                    if fnmatch.fnmatch(entry.name, "ADR-*.md"):
+                        match = ADR_FILE_RE.match(os.path.splitext(entry.name)[0])
+                        if match:
+                            ids.add(f"ADR-{match.group(1)}")
+                self._adr_ids = frozenset(ids)
+            return self._adr_ids
+
+    def adr_ids(self) -> set[str]:
+        """ADR-NNNN ids that have a docs/adr/ADR-*.md file."""
+        return set(self._adr_id_set())
+
+    def overlay_folders(self) -> tuple[OverlayFolder, ...]:
+        """Directories under docs/architecture/overlays, sorted by name."""
+        with self._lock:
+            if self._folders is None:
+                folders: list[OverlayFolder] = []
+                for prd in _scandir(os.path.join(self._root, OVERLAYS_ROOT)):
+                    if not prd.is_dir():
+                        continue
+                    chapter = os.path.join(prd.path, "08")
+                    entries = tuple((entry.name, entry.is_file()) for entry in _scandir(chapter))
+                    folders.append(OverlayFolder(prd.name, os.path.exists(chapter), entries))
+                self._folders = tuple(folders)
+                self._overlay_files = frozenset(
+                    f"{OVERLAYS_ROOT}/{folder.prd_id}/08/{name}" for folder in folders for name, is_file in folder.entries if is_file
+                )
+            return self._folders
+
+    def overlay_folder(self, prd_id: str) -> OverlayFolder | None:
+        wanted = os.path.normcase(prd_id)
+        for folder in self.overlay_folders():
+            if os.path.normcase(folder.prd_id) == wanted:
+                return folder
+        return None
+
+    def overlay_paths(self, *, include_dirs: bool = False) -> set[str]:
+        """Repo-relative posix paths of the entries of every <PRD-ID>/08 folder."""
+        if not include_dirs:
+            self.overlay_folders()
+            return set(self._overlay_files)
+        return {
+            f"{OVERLAYS_ROOT}/{folder.prd_id}/08/{name}"
+            for folder in self.overlay_folders()
+            for name, is_file in folder.entries
+        }
+
+    def overlay_indexes(self) -> list[str]:
+        """Existing <PRD-ID>/08/_index.md files, sorted."""
+        return [
+            f"{OVERLAYS_ROOT}/{folder.prd_id}/08/_index.md"
+            for folder in self.overlay_folders()
+            if ("_index.md", True) in folder.entries
+        ]
+
+    def contract_files(self) -> frozenset[str]:
+        with self._lock:
+            if self._contract_files is None:
+                base = self.root / CONTRACTS_ROOT
+                files = iter_source_files(base, self.root, skip_dirs=frozenset({"bin", "obj"})) if base.is_dir() else []
+                self._contract_files = frozenset(rel for _path, rel in files)
+            return self._contract_files
+
+    def _load_records(self) -> dict[str, dict[str, Any]]:
+        if self._records is None:
+            self._records = _read_cache_file(self.cache_file) if self.cache_file is not None else {}
+        return self._records
+
+    def _parsed(self, rel: str, parse: Any) -> Any:
+        path = os.path.join(self._root, rel)
+        signature = _signature(path)
+        if signature is None:
+            return None
+        record = self._load_records().get(rel)
+        if record is not None and record.get("sig") == signature:
+            self.stats["reused"] += 1
+            return record.get("refs")
+        try:
+            with open(path, encoding="utf-8", errors="replace") as handle:
+                text = handle.read()
+        except OSError:
+            return None
+        refs = parse(text)
+        self.stats["parsed"] += 1
+        record = {"sig": signature, "refs": refs}
+        self._records[rel] = record  # type: ignore[index]
+        self._new[rel] = record
+        return refs
+
+    def _task_edges(self) -> tuple[Edge, ...]:
+        with self._lock:
+            if self._task_edge_list is None:
+                edges: list[Edge] = []
+                tasks: set[str] = set()
+                for file_name in TASK_FILES:
+                    parsed = self._parsed(f"{TASKS_DIR}/{file_name}", lambda text, name=file_name: parse_task_refs(text, name))
+                    for task_key, refs in parsed or []:
+                        source = node_id("task", task_key)
+                        tasks.add(source)
+                        edges.extend(Edge(source, node_id(kind, target), field) for field, kind, target in refs)
+                self._tasks = frozenset(tasks)
+                self._task_edge_list = tuple(edges)
+            return self._task_edge_list
+
+    def edges(self) -> tuple[Edge, ...]:
+        """Every reference, task files first (in TASK_FILES order), then overlay docs by path."""
+        with self._lock:
+            if self._edges is None:
+                edges = list(self._task_edges())
+                for rel in sorted(path for path in self.overlay_paths() if path.endswith(".md")):
+                    source = node_id("overlay", rel)
+                    for field, kind, target in self._parsed(rel, parse_doc_refs) or []:
+                        edges.append(Edge(source, node_id(kind, target), field))
+                for edge in edges:
+                    self._outgoing.setdefault(edge.source, []).append(edge)
+                    self._incoming.setdefault(edge.target, []).append(edge)
+                self._edges = tuple(edges)
+            return self._edges
+
+    def refs(self, node: str) -> list[Edge]:
+        self.edges()
+        return list(self._outgoing.get(node, ()))
+
+    def back_refs(self, node: str) -> list[Edge]:
+        self.edges()
+        return list(self._incoming.get(node, ()))
+
+    def task_refs(self, fields: Iterable[str]) -> list[Edge]:
+        """Task edges from the given fields, in file and task order; does not read overlay docs."""
+        wanted = set(fields)
+        return [edge for edge in self._task_edges() if edge.field in wanted]
+
+    def exists(self, node: str) -> bool:
+        kind, _, key = node.partition(":")
+        if kind == "task":
+            self._task_edges()
+            return node in self._tasks
+        if kind == "adr":
+            return key in self._adr_id_set()
+        if kind == "overlay":
+            self.overlay_folders()
+            return key in self._overlay_files
+        with self._lock:
+            if key not in self._file_exists:
+                self._file_exists[key] = os.path.isfile(os.path.join(self._root, key))
+            return self._file_exists[key]
+
+    def missing_targets(self, kind: str | None = None) -> list[Edge]:
+        """Edges whose target does not exist, optionally only those pointing at ``kind``."""
+        return [edge for edge in self.edges() if (kind is None or edge.kind == kind) and not self.exists(edge.target)]
+
+    def orphans(self, kind: str) -> list[str]:
+        """Existing ``kind`` nodes (adr, overlay or contract) that nothing references, sorted."""
+        if kind == "adr":
+            keys: Iterable[str] = self._adr_id_set()
+        elif kind == "overlay":
+            keys = self.overlay_paths()
+        elif kind == "contract":
+            keys = self.contract_files()
+        else:
+            raise ValueError(f"orphans() supports {ORPHAN_KINDS}, got {kind!r}")
+        self.edges()
+        return sorted(node_id(kind, key) for key in keys if node_id(kind, key) not in self._incoming)
+
+    def save(self) -> Path | None:
+        with self._lock:
+            if self.cache_file is None or not self._new:
+                return None
+            records = _read_cache_file(self.cache_file)
+            records.update(self._new)
+            if len(records) > CACHE_MAX_ENTRIES:
+                records = dict(list(records.items())[-CACHE_MAX_ENTRIES:])
+            payload = {"version": GRAPH_VERSION, "files": records}
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+                tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+                os.replace(tmp, self.cache_file)
+            except OSError:
+                return None
+            self._new.clear()
+            return self.cache_file
+
+
+def cache_path(root: Path) -> Path | None:
+    value = str(os.environ.get(CACHE_ENV) or "").strip()
+    if value.lower() == "off":
+        return None
+    if value:
+        return Path(value)
+    return root / "logs" / "ci" / ".reference-graph" / "graph.json"
+
+
+def _read_cache_file(path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != GRAPH_VERSION:
+        return {}
+    files = payload.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+_LOCK = threading.Lock()
+_GRAPHS: dict[tuple[str, str], ReferenceGraph] = {}
+_ATEXIT_REGISTERED = False
+
+
+def load_reference_graph(root: Path) -> ReferenceGraph:
+    """The graph of ``root`` for this process; built lazily, saved at exit."""
+    global _ATEXIT_REGISTERED
+    key = (str(root), str(os.environ.get(CACHE_ENV) or ""))
+    with _LOCK:
+        graph = _GRAPHS.get(key)
+        if graph is None:
+            graph = _GRAPHS[key] = ReferenceGraph(root, cache_path(root))
+            if graph.cache_file is not None and not _ATEXIT_REGISTERED:
+                atexit.register(save_reference_graph)
+                _ATEXIT_REGISTERED = True
+        return graph
+
+
+def save_reference_graph() -> list[Path]:
+    """Write the new cache entries of every graph built in this process."""
+    with _LOCK:
+        graphs = list(_GRAPHS.values())
+    return [path for path in (graph.save() for graph in graphs) if path is not None]
+
+
+def reset_reference_graph() -> None:
+    """Forget every graph built in this process (tests, or after rewriting task files)."""
+    with _LOCK:
+        _GRAPHS.clear()
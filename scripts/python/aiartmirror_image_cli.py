@@ -16,6 +16,14 @@ from pathlib import Path
 from typing import Any
 from urllib.request import urlopen
 
+try:
+    from _llm_client_pool import shared_openai_client
+except ImportError:
+    _SC_DIR = Path(__file__).resolve().parents[1] / "sc"
+    if str(_SC_DIR) not in sys.path:
+        sys.path.insert(0, str(_SC_DIR))
+    from _llm_client_pool import shared_openai_client
+
 
 DEFAULT_BASE_URL = "https://www.aiartmirror.com/v1"
 DEFAULT_MODEL = "gpt-image-2"
@@ -209,15 +217,17 @@ def main() -> int:
 
     api_key = _resolve_api_key(args)
     OpenAI = _load_openai()
-    client = OpenAI(
+    client = shared_openai_client(
+        OpenAI,
         base_url=metadata["base_url"],
         api_key=api_key,
-        timeout=float(args.timeout),
+        timeout_sec=float(args.timeout),
     )
 
     response = client.images.generate(
         **request_payload,
         extra_body=extra_body,
+        timeout=float(args.timeout),
     )
     data = getattr(response, "data", None)
     if not data:
@@ -29,31 +29,28 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import json
-import re
 import sys
 from pathlib import Path
 from typing import Any
 
+try:
+    from _encoding_engine import DOC_MOJIBAKE_TOKENS, EncodingScan, engine_stats, scan_file, token_rule_name
+except ImportError:
+    _SC_DIR = Path(__file__).resolve().parents[1] / "sc"
+    if str(_SC_DIR) not in sys.path:
+        sys.path.insert(0, str(_SC_DIR))
+    from _encoding_engine import DOC_MOJIBAKE_TOKENS, EncodingScan, engine_stats, scan_file, token_rule_name
+
+
+# Suspicious signals with low false-positive risk for this repo: (reason, _encoding_engine rule).
+SIGNAL_RULES = [
+    ("replacement_char_fffd", "fffd"),
+    ("cjk_broken_by_question_mark", "cjk_broken_by_question_mark"),
+    ("multi_question_marks", "multi_question_marks"),
+    ("cp1252_mojibake_punctuation", "cp1252_mojibake"),
+]
 
-# Suspicious signals with low false-positive risk for this repo.
-FFFD_RE = re.compile("\uFFFD")
-CN_BREAK_Q_RE = re.compile(r"[\u4e00-\u9fff]\?[\u4e00-\u9fff]")
-MULTI_Q_RE = re.compile(r"\?{3,}")
-CP1252_MOJIBAKE_RE = re.compile(r"â[€™œž“”–—]")
-
-MOJIBAKE_TOKENS = (
-    "锟斤拷",
-    "茂禄驴",
-    "闂侀柣閻熼崡閳",
-    "芒鈧",
-    "Ã",
-    "Â",
-    "Ð",
-    "Ñ",
-)
-
-# Potentially-garbled CJK glyph cluster used only by ratio gate (high threshold).
-MIXED_MOJIBAKE_GLYPHS = "鈥銆鍙鍔鎴浠绗鏂寮缁瀛闂閿璇锛鍚璁鍙"
+MOJIBAKE_TOKENS = DOC_MOJIBAKE_TOKENS
 
 DEFAULT_ROOTS = ["docs", ".github", ".taskmaster"]
 DEFAULT_ROOT_FILES = ["AGENTS.md", "README.md", "project.godot", ".gitignore", ".gitattributes"]
@@ -115,36 +112,17 @@ def _to_posix(path: Path) -> str:
     return str(path).replace("\\", "/")
 
 
-def _safe_sample(text: str, *, max_chars: int = 180) -> str:
-    line = text.replace("\n", " ").strip()
-    if len(line) <= max_chars:
-        return line
-    return line[: max_chars - 3] + "..."
-
-
-def _count_cjk(text: str) -> int:
-    return sum(1 for ch in text if "\u4e00" <= ch <= "\u9fff")
+def _semantic_garbled_reasons(scan: EncodingScan) -> list[str]:
+    reasons = [reason for reason, rule in SIGNAL_RULES if scan.count(rule)]
 
-
-def _semantic_garbled_reasons(text: str) -> list[str]:
-    reasons: list[str] = []
-
-    if FFFD_RE.search(text):
-        reasons.append("replacement_char_fffd")
-    if CN_BREAK_Q_RE.search(text):
-        reasons.append("cjk_broken_by_question_mark")
-    if MULTI_Q_RE.search(text):
-        reasons.append("multi_question_marks")
-    if CP1252_MOJIBAKE_RE.search(text):
-        reasons.append("cp1252_mojibake_punctuation")
-
-    token_hits = [token for token in MOJIBAKE_TOKENS if token in text]
+    token_hits = [token for token in MOJIBAKE_TOKENS if scan.count(token_rule_name(token))]
     if token_hits:
         reasons.append("mojibake_tokens:" + ",".join(token_hits[:4]))
 
-    cjk_total = _count_cjk(text)
+    # Ratio gate over the engine's MOJIBAKE_GLYPHS cluster (high threshold).
+    cjk_total = scan.cjk_chars
     if cjk_total > 0:
-        mixed_count = sum(text.count(ch) for ch in set(MIXED_MOJIBAKE_GLYPHS))
+        mixed_count = scan.glyph_chars
         mixed_ratio = mixed_count / cjk_total
         if mixed_count >= 24 and mixed_ratio >= 0.18:
             reasons.append(f"mojibake_glyph_ratio:{mixed_count}/{cjk_total}")
@@ -153,31 +131,25 @@ def _semantic_garbled_reasons(text: str) -> list[str]:
 
 
 def _scan_file(path: Path) -> dict[str, Any]:
+    scan = scan_file(path)
     result: dict[str, Any] = {
         "path": _to_posix(path),
-        "utf8_ok": False,
-        "has_bom": False,
+        "utf8_ok": scan.utf8_ok,
+        "has_bom": scan.has_bom,
         "semantic_garbled": False,
         "reasons": [],
         "error": None,
         "sample": "",
     }
-
-    try:
-        raw = path.read_bytes()
-        result["has_bom"] = raw.startswith(b"\xef\xbb\xbf")
-        text = raw.decode("utf-8", errors="strict")
-        result["utf8_ok"] = True
-        reasons = _semantic_garbled_reasons(text)
-        result["reasons"] = reasons
-        result["semantic_garbled"] = len(reasons) > 0
-        if reasons:
-            result["sample"] = _safe_sample(text)
-    except UnicodeDecodeError as exc:
-        result["error"] = f"UnicodeDecodeError: {exc}"
-    except Exception as exc:  # noqa: BLE001
-        result["error"] = str(exc)
-
+    if scan.error is not None:
+        result["error"] = scan.error_detail if scan.decode_failed else scan.error
+        return result
+
+    reasons = _semantic_garbled_reasons(scan)
+    result["reasons"] = reasons
+    result["semantic_garbled"] = len(reasons) > 0
+    if reasons:
+        result["sample"] = scan.preview
     return result
 
 
@@ -277,6 +249,7 @@ def main() -> int:
         "scanned": len(scanned),
         "failed": len(failures),
         "failed_paths": [x["path"] for x in failures],
+        "engine": engine_stats(),
         "results": scanned,
     }
 
@@ -11,6 +11,9 @@ It scans `Game.Core/Contracts/**/*.cs` and validates event contract conventions:
 - If the file contains an XML doc line like `Domain event: <type>`, it should match `EventType` (warning by default).
 - EventType values should be unique across Contracts.
 
+Contract files are read through the shared parsed model in _contract_model.py (cached by content
+hash under logs/ci/.contract-cache/, shared with validate_contracts.py and the catalog).
+
 Outputs:
   - JSON report (default): logs/ci/<YYYY-MM-DD>/domain-contracts-check/summary.json
 
@@ -26,25 +29,20 @@ import argparse
 import json
 import os
 import re
+import sys
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 from typing import Any
 
+PYTHON_DIR = Path(__file__).resolve().parent
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from _contract_model import iter_source_files, load_contract_model, save_contract_cache  # noqa: E402
+
 
-EVENT_TYPE_LITERAL_RE = re.compile(
-    r"\bpublic\s+const\s+string\s+EventType\s*=\s*\"([^\"]+)\"\s*;",
-    re.MULTILINE,
-)
-EVENT_TYPE_SYMBOL_RE = re.compile(
-    r"\bpublic\s+const\s+string\s+EventType\s*=\s*EventTypes\.([A-Za-z_][A-Za-z0-9_]*)\s*;",
-    re.MULTILINE,
-)
-EVENT_TYPES_MEMBER_RE = re.compile(
-    r"\bpublic\s+const\s+string\s+([A-Za-z_][A-Za-z0-9_]*)\s*=\s*\"([^\"]+)\"\s*;",
-    re.MULTILINE,
-)
-DOC_DOMAIN_EVENT_RE = re.compile(r"\bDomain\s+event:\s*([a-z0-9._]+)\b", re.IGNORECASE)
+EVENT_TYPE_SYMBOL_RE = re.compile(r"EventTypes\.([A-Za-z_][A-Za-z0-9_]*)")
 
 
 @dataclass(frozen=True)
@@ -69,26 +67,19 @@ def _default_out_path(root: Path) -> Path:
     return root / "logs" / "ci" / day / "domain-contracts-check" / "summary.json"
 
 
-def _iter_contract_files(contracts_dir: Path) -> list[Path]:
-    files: list[Path] = []
-    for p in contracts_dir.rglob("*.cs"):
-        if not p.is_file():
-            continue
-        if any(seg in {"bin", "obj"} for seg in p.parts):
-            continue
-        files.append(p)
-    return sorted(files)
+def _iter_contract_files(contracts_dir: Path, root: Path) -> list[tuple[Path, str]]:
+    return iter_source_files(contracts_dir, root, skip_dirs=frozenset({"bin", "obj"}))
 
 
-def _load_event_types_map(contracts_dir: Path) -> dict[str, str]:
+def _load_event_types_map(contracts_dir: Path, root: Path) -> dict[str, str]:
     mapping: dict[str, str] = {}
     event_types_path = contracts_dir / "EventTypes.cs"
     if not event_types_path.exists():
         return mapping
 
-    text = event_types_path.read_text(encoding="utf-8", errors="ignore")
-    for symbol, value in EVENT_TYPES_MEMBER_RE.findall(text):
-        mapping[symbol] = value
+    for const in load_contract_model(event_types_path, root=root).consts:
+        if const.literal is not None:
+            mapping[const.name] = const.literal
     return mapping
 
 
@@ -114,12 +105,12 @@ def _validate_event_type(value: str, *, domain_prefix: str) -> list[str]:
     return issues
 
 
-def _doc_value_for_position(doc_matches: list[re.Match[str]], position: int) -> str | None:
+def _doc_value_for_position(doc_markers: tuple[tuple[int, str], ...], position: int) -> str | None:
     nearest: str | None = None
-    for match in doc_matches:
-        if match.start() > position:
+    for start, value in doc_markers:
+        if start > position:
             break
-        nearest = match.group(1).strip()
+        nearest = value
     return nearest
 
 
@@ -152,23 +143,23 @@ def main() -> int:
 
     findings: list[Finding] = []
     all_event_types: dict[str, list[str]] = {}
-    event_type_map = _load_event_types_map(contracts_dir)
+    event_type_map = _load_event_types_map(contracts_dir, root)
+    contract_files = _iter_contract_files(contracts_dir, root)
 
-    for cs in _iter_contract_files(contracts_dir):
-        text = cs.read_text(encoding="utf-8", errors="ignore")
-        doc_matches = list(DOC_DOMAIN_EVENT_RE.finditer(text))
-        resolved_values: list[tuple[int, str]] = []
+    for cs, rel in contract_files:
+        model = load_contract_model(cs, root=root)
+        event_type_consts = model.consts_named("EventType")
+        resolved_values: list[tuple[int, str]] = [(const.start, const.literal) for const in event_type_consts if const.literal is not None]
 
-        for match in EVENT_TYPE_LITERAL_RE.finditer(text):
-            resolved_values.append((match.start(), match.group(1)))
-
-        for match in EVENT_TYPE_SYMBOL_RE.finditer(text):
+        for const in event_type_consts:
+            match = EVENT_TYPE_SYMBOL_RE.fullmatch(const.rhs.strip())
+            if not match:
+                continue
             symbol = match.group(1)
             event_type = event_type_map.get(symbol)
             if event_type:
-                resolved_values.append((match.start(), event_type))
+                resolved_values.append((const.start, event_type))
                 continue
-            rel = _to_posix(cs.relative_to(root))
             findings.append(
                 Finding(
                     file=rel,
@@ -182,11 +173,10 @@ def main() -> int:
         for source_pos, event_type in resolved_values:
             issues = _validate_event_type(event_type, domain_prefix=args.domain_prefix)
             warnings: list[str] = []
-            doc_value = _doc_value_for_position(doc_matches, source_pos)
+            doc_value = _doc_value_for_position(model.domain_event_docs, source_pos)
             if doc_value and doc_value.lower() != event_type.strip().lower():
                 warnings.append(f"doc 'Domain event' mismatch: doc={doc_value!r} const={event_type!r}")
 
-            rel = _to_posix(cs.relative_to(root))
             ok = not issues
             findings.append(Finding(file=rel, event_type=event_type, ok=ok, issues=issues, warnings=warnings))
             all_event_types.setdefault(event_type, []).append(rel)
@@ -206,7 +196,7 @@ def main() -> int:
         "domain_prefix": args.domain_prefix,
         "contracts_dir": _to_posix(contracts_dir.relative_to(root)),
         "counts": {
-            "files_scanned": len(_iter_contract_files(contracts_dir)),
+            "files_scanned": len(contract_files),
             "event_type_constants": len(findings),
             "issues": issues_count + (1 if dup_issues else 0),
             "warnings": warnings_count,
@@ -215,6 +205,7 @@ def main() -> int:
         "findings": [f.__dict__ for f in findings],
     }
     out_path.write_text(json.dumps(report, ensure_ascii=True, indent=2) + "\n", encoding="utf-8")
+    save_contract_cache()
 
     print(
         f"DOMAIN_CONTRACTS_CHECK status={status} events={len(findings)} "
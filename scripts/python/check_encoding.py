@@ -20,11 +20,20 @@ import datetime as dt
 import io
 import json
 import os
-import re
-import subprocess
 import sys
+from pathlib import Path
 from typing import Iterable, List
 
+try:
+    from _encoding_engine import engine_stats, scan_file
+    from _git_snapshot import git_snapshot
+except ImportError:
+    _SC_DIR = Path(__file__).resolve().parents[1] / "sc"
+    if str(_SC_DIR) not in sys.path:
+        sys.path.insert(0, str(_SC_DIR))
+    from _encoding_engine import engine_stats, scan_file
+    from _git_snapshot import git_snapshot
+
 
 TEXT_EXT = {
     ".md",
@@ -91,27 +100,17 @@ EXCLUDE_SUBSTRINGS = [
     "gitlog/export-logs.zip",
 ]
 
-# Mojibake/garble indicators (heuristic, not a proof).
-MOJIBAKE_REGEXES = [
-    ("FFFD_REPLACEMENT", re.compile("\uFFFD")),
-    ("CJK_MOJIBAKE", re.compile(r"[闁閻鐟鍗鈧缂濞閸鎮绱锛绗閿鍊鎯缁婵锟斤拷]")),
-    ("CP1252_PUNCT", re.compile(r"(?:â€™|â€œ|â€�|â€”|â€˜|â€¢|â€¦|â„¢)")),
-    ("BOM_AS_TEXT", re.compile(r"ï»¿")),
+# Mojibake/garble indicators (heuristic, not a proof): report label -> _encoding_engine rule.
+MOJIBAKE_RULES = [
+    ("FFFD_REPLACEMENT", "fffd"),
+    ("CJK_MOJIBAKE", "cjk_mojibake_char"),
+    ("CP1252_PUNCT", "cp1252_punct"),
+    ("BOM_AS_TEXT", "bom_as_text"),
 ]
 
-CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F]")
-
-
-def run_cmd(args: List[str]) -> str:
-    p = subprocess.Popen(
-        args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, encoding="utf-8", errors="ignore"
-    )
-    out, _ = p.communicate()
-    return out
-
 
 def git_changed_since(since: str) -> List[str]:
-    out = run_cmd(["git", "log", f"--since={since}", "--name-only", "--pretty=format:"])
+    _rc, out = git_snapshot().git(["git", "log", f"--since={since}", "--name-only", "--pretty=format:"], timeout_sec=300)
     files = [ln.strip() for ln in out.splitlines() if ln.strip() and not ln.startswith(" ")]
     return sorted(set(files))
 
@@ -150,48 +149,33 @@ def iter_files_under(root_dir: str) -> List[str]:
     return sorted(set(out))
 
 
-def _summarize_hits(matches: Iterable[str], limit: int = 5) -> str:
-    uniq: List[str] = []
-    for m in matches:
-        if m not in uniq:
-            uniq.append(m)
-        if len(uniq) >= limit:
-            break
-    return ",".join(uniq)
-
-
 def check_utf8(path: str) -> dict:
+    scan = scan_file(path)
     result = {
         "path": path,
-        "utf8_ok": False,
-        "has_bom": False,
+        "utf8_ok": scan.utf8_ok,
+        "has_bom": scan.has_bom,
         "mojibake_hits": [],
         "error": None,
     }
-    try:
-        raw = io.open(path, "rb").read()
-        result["has_bom"] = raw.startswith(b"\xef\xbb\xbf")
-        text = raw.decode("utf-8", errors="strict")
-        result["utf8_ok"] = True
-
-        hits_summary: List[str] = []
-        for name, rx in MOJIBAKE_REGEXES:
-            matches = rx.findall(text)
-            if not matches:
-                continue
-            samples = _summarize_hits(matches)
-            hits_summary.append(f"{name}:{len(matches)}:{samples}" if samples else f"{name}:{len(matches)}")
-
-        ctrl = CONTROL_CHARS_RE.findall(text)
-        if ctrl:
-            hits_summary.append(f"CONTROL_CHARS:{len(ctrl)}")
-
-        if hits_summary:
-            result["mojibake_hits"] = hits_summary
-    except UnicodeDecodeError as e:
-        result["error"] = f"UnicodeDecodeError: {e}"
-    except Exception as e:
-        result["error"] = str(e)
+    if scan.error is not None:
+        result["error"] = scan.error_detail if scan.decode_failed else scan.error
+        return result
+
+    hits_summary: List[str] = []
+    for name, rule in MOJIBAKE_RULES:
+        hits = scan.rule_hits(rule)
+        if not hits:
+            continue
+        samples = ",".join(hits.samples)
+        hits_summary.append(f"{name}:{hits.count}:{samples}" if samples else f"{name}:{hits.count}")
+
+    ctrl = scan.count("control_chars")
+    if ctrl:
+        hits_summary.append(f"CONTROL_CHARS:{ctrl}")
+
+    if hits_summary:
+        result["mojibake_hits"] = hits_summary
     return result
 
 
@@ -237,6 +221,7 @@ def main() -> int:
         "bad": len(bad),
         "bad_paths": [b["path"] for b in bad],
         "mojibake_paths": [r["path"] for r in results if r.get("mojibake_hits")],
+        "engine": engine_stats(),
         "generated": dt.datetime.now().isoformat(),
     }
 
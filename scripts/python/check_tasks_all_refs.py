@@ -26,9 +26,16 @@ from __future__ import annotations
 import argparse
 import json
 import re
+import sys
 from pathlib import Path
 from typing import Any
 
+PYTHON_DIR = Path(__file__).resolve().parent
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from _reference_graph import load_reference_graph  # noqa: E402
+
 
 # ADR -> chapter mapping for consistency warnings.
 # Values are used as expected chapter refs. Missing/extra chapters are warnings.
@@ -83,33 +90,12 @@ def load_json_list(path: Path) -> list[dict[str, Any]]:
 
 
 def collect_adr_ids(root: Path) -> set[str]:
-    adr_dir = root / "docs" / "adr"
-    ids: set[str] = set()
-    if not adr_dir.exists():
-        return ids
-    for file_path in adr_dir.glob("ADR-*.md"):
-        match = re.match(r"ADR-(\d{4})", file_path.stem)
-        if match:
-            ids.add(f"ADR-{match.group(1)}")
-    return ids
+    return load_reference_graph(root).adr_ids()
 
 
 def collect_overlay_paths(root: Path) -> set[str]:
-    overlay_paths: set[str] = set()
-    overlays_root = root / "docs" / "architecture" / "overlays"
-    if not overlays_root.exists():
-        return overlay_paths
-
-    for prd_dir in overlays_root.iterdir():
-        if not prd_dir.is_dir():
-            continue
-        chapter_dir = prd_dir / "08"
-        if not chapter_dir.exists():
-            continue
-        for item in chapter_dir.glob("*"):
-            if item.is_file():
-                overlay_paths.add(_norm(str(item.relative_to(root))))
-    return overlay_paths
+    """Files under docs/architecture/overlays/<PRD-ID>/08 as repo-relative posix paths."""
+    return load_reference_graph(root).overlay_paths()
 
 
 def _validate_task(
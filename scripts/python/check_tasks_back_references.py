@@ -1,8 +1,8 @@
 import json
-import re
 from pathlib import Path
 
 import check_tasks_all_refs
+from _reference_graph import load_reference_graph
 
 
 # Keep ADR->CH mapping consistent with the main checker.
@@ -15,35 +15,12 @@ def load_tasks_back(root: Path) -> list[dict]:
 
 
 def collect_adr_ids(root: Path) -> set[str]:
-    adr_dir = root / "docs" / "adr"
-    ids: set[str] = set()
-    if not adr_dir.exists():
-        return ids
-    for f in adr_dir.glob("ADR-*.md"):
-        m = re.match(r"ADR-(\d{4})", f.stem)
-        if m:
-            ids.add(f"ADR-{m.group(1)}")
-    return ids
+    return load_reference_graph(root).adr_ids()
 
 
 def collect_overlay_paths(root: Path) -> set[str]:
-    overlay_paths: set[str] = set()
-
-    overlays_root = root / "docs" / "architecture" / "overlays"
-    if not overlays_root.exists():
-        return overlay_paths
-
-    for prd_dir in overlays_root.iterdir():
-        if not prd_dir.is_dir():
-            continue
-        chapter_dir = prd_dir / "08"
-        if not chapter_dir.exists():
-            continue
-        for p in chapter_dir.glob("*"):
-            rel = p.relative_to(root)
-            overlay_paths.add(str(rel).replace("\\", "/"))
-
-    return overlay_paths
+    # Unlike check_tasks_all_refs, sub-directories of 08/ count as overlay entries here.
+    return load_reference_graph(root).overlay_paths(include_dirs=True)
 
 
 def run_check(root: Path) -> bool:
@@ -27,6 +27,14 @@ import sys
 from pathlib import Path
 from typing import List, Tuple
 
+try:
+    from _parallel_scan import contains_any, scan_items
+except ImportError:
+    _SC_DIR = Path(__file__).resolve().parents[1] / "sc"
+    if str(_SC_DIR) not in sys.path:
+        sys.path.insert(0, str(_SC_DIR))
+    from _parallel_scan import contains_any, scan_items
+
 
 def is_pascal_case(name: str) -> bool:
     """
@@ -105,7 +113,11 @@ def extract_test_methods(file_path: Path) -> List[Tuple[int, str]]:
 
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+            text = f.read()
+        # Literal prefilter: a file without any attribute has no test methods to check.
+        if not contains_any(text, ('[Fact]', '[Theory]')):
+            return test_methods
+        lines = text.split('\n')
 
         # Look for [Fact] or [Theory] attributes followed by method definition
         for i, line in enumerate(lines, start=1):
@@ -145,11 +157,10 @@ def scan_test_files(test_dir: Path, *, style: str) -> dict:
     """
     violations = {}
 
-    # Find all *Tests.cs files
-    test_files = list(test_dir.rglob('*Tests.cs'))
+    # Find all *Tests.cs files; large suites are parsed across worker processes (scripts/sc/_parallel_scan.py).
+    test_files = sorted(test_dir.rglob('*Tests.cs'))
 
-    for test_file in test_files:
-        test_methods = extract_test_methods(test_file)
+    for test_file, test_methods in zip(test_files, scan_items(extract_test_methods, test_files)):
         file_violations = []
 
         for line_num, method_name in test_methods:
@@ -18,29 +18,32 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import json
-import re
+import sys
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Iterable
 
+try:
+    from _encoding_engine import EncodingScan, engine_stats, scan_file
+except ImportError:
+    _SC_DIR = Path(__file__).resolve().parents[1] / "sc"
+    if str(_SC_DIR) not in sys.path:
+        sys.path.insert(0, str(_SC_DIR))
+    from _encoding_engine import EncodingScan, engine_stats, scan_file
+
 
-UTF8_BOM = b"\xef\xbb\xbf"
 DEFAULT_TARGETS = ("docs", ".github", ".taskmaster", "AGENTS.md")
 OPTIONAL_MISSING_TARGETS = {".taskmaster"}
 ALLOWLIST_REL_PATHS = {
     "docs/architecture/base/ZZZ-encoding-fixture-bad.md",
 }
 
-CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F]")
-
-MOJIBAKE_RULES: list[tuple[str, re.Pattern[str]]] = [
-    ("replacement_char", re.compile("\uFFFD")),
-    ("latin1_utf8_mix", re.compile(r"(?:Ã.|Â.|â€™|â€œ|â€|ï»¿)")),
-    ("gbk_token", re.compile(r"锟斤拷")),
-    (
-        "cjk_mojibake_cluster",
-        re.compile(r"[闂侀柣閻熼崡閳х紓婵為柛閹槐閿涚粭闁块崐閹紒濠礭]{2,}"),
-    ),
+# Violation kind suffix -> _encoding_engine rule.
+MOJIBAKE_RULES: list[tuple[str, str]] = [
+    ("replacement_char", "fffd"),
+    ("latin1_utf8_mix", "latin1_utf8_mix"),
+    ("gbk_token", "gbk_token"),
+    ("cjk_mojibake_cluster", "cjk_mojibake_cluster"),
 ]
 
 
@@ -56,26 +59,14 @@ def to_posix(path: Path) -> str:
     return str(path).replace("\\", "/")
 
 
-def read_text_strict(path: Path) -> tuple[str | None, str | None, bool]:
-    raw = path.read_bytes()
-    has_bom = raw.startswith(UTF8_BOM)
-    try:
-        text = raw.decode("utf-8", errors="strict")
-    except UnicodeDecodeError as exc:
-        return None, f"UnicodeDecodeError: {exc}", has_bom
-    return text, None, has_bom
-
-
-def summarize_line_hits(text: str, rx: re.Pattern[str], *, max_lines: int = 3) -> str | None:
+def summarize_line_hits(scan: EncodingScan, rule: str, *, max_lines: int = 3) -> str | None:
+    hits = scan.rule_hits(rule)
     samples: list[str] = []
-    for idx, line in enumerate(text.splitlines(), start=1):
-        if rx.search(line):
-            preview = line.strip()
-            if len(preview) > 160:
-                preview = preview[:160] + "..."
-            samples.append(f"L{idx}:{preview}")
-            if len(samples) >= max_lines:
-                break
+    for idx, line in (hits.lines if hits else ())[:max_lines]:
+        preview = line.strip()
+        if len(preview) > 160:
+            preview = preview[:160] + "..."
+        samples.append(f"L{idx}:{preview}")
     return " | ".join(samples) if samples else None
 
 
@@ -124,14 +115,13 @@ def validate_file(repo_root: Path, path: Path) -> list[Violation]:
     rel = to_posix(path.relative_to(repo_root))
     violations: list[Violation] = []
 
-    text, decode_error, has_bom = read_text_strict(path)
-    if decode_error is not None:
-        violations.append(Violation(path=rel, kind="not_utf8", message=decode_error))
+    scan = scan_file(path)
+    if scan.error is not None:
+        kind = "not_utf8" if scan.decode_failed else "read_error"
+        violations.append(Violation(path=rel, kind=kind, message=scan.error_detail))
         return violations
 
-    assert text is not None
-
-    if has_bom:
+    if scan.has_bom:
         violations.append(
             Violation(
                 path=rel,
@@ -140,26 +130,25 @@ def validate_file(repo_root: Path, path: Path) -> list[Violation]:
             )
         )
 
-    ctrl_matches = CONTROL_CHARS_RE.findall(text)
-    if ctrl_matches:
+    ctrl_count = scan.count("control_chars")
+    if ctrl_count:
         violations.append(
             Violation(
                 path=rel,
                 kind="control_chars",
-                message=f"Found {len(ctrl_matches)} control chars",
+                message=f"Found {ctrl_count} control chars",
             )
         )
 
-    for kind, rx in MOJIBAKE_RULES:
-        if not rx.search(text):
+    for kind, rule in MOJIBAKE_RULES:
+        if not scan.count(rule):
             continue
-        sample = summarize_line_hits(text, rx)
         violations.append(
             Violation(
                 path=rel,
                 kind=f"mojibake_{kind}",
                 message=f"Matched mojibake rule: {kind}",
-                sample=sample,
+                sample=summarize_line_hits(scan, rule),
             )
         )
 
@@ -184,6 +173,7 @@ def write_reports(out_dir: Path, *, scanned: int, targets: list[str], violations
         "allowlist_paths": sorted(ALLOWLIST_REL_PATHS),
         "violations": len(violations),
         "status": "fail" if violations else "ok",
+        "engine": engine_stats(),
     }
     details = [asdict(v) for v in violations]
 
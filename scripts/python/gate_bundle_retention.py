@@ -11,6 +11,11 @@ import shutil
 from pathlib import Path
 from typing import Any
 
+try:
+    from _artifact_store import gc_artifact_store
+except ImportError:
+    from scripts.python._artifact_store import gc_artifact_store
+
 
 def collect_runs_by_date(ci_root: Path) -> dict[dt.date, list[Path]]:
     grouped: dict[dt.date, list[Path]] = {}
@@ -71,6 +76,9 @@ def prune_gate_bundle_runs(
             except Exception as exc:  # noqa: BLE001
                 failed.append({"path": str(run_dir).replace("\\", "/"), "error": str(exc)})
 
+    # 3) Release artifact-store blobs that only the pruned runs referenced
+    artifact_store_gc = gc_artifact_store(ci_root.parent.parent)
+
     return {
         "retention_days": retention_days,
         "max_runs_per_day": max_runs_per_day,
@@ -79,4 +87,5 @@ def prune_gate_bundle_runs(
         "deleted": sorted(set(deleted)),
         "failed_count": len(failed),
         "failed": failed,
+        "artifact_store_gc": artifact_store_gc,
     }
@@ -6,6 +6,9 @@ Generate a contracts catalog (template-friendly).
 This tool is intentionally generic: it does NOT assume any specific project/module name.
 It can be used by any project created by copying this template.
 
+Contracts, ports, services and repositories are read through the shared parsed model in
+_contract_model.py (cached by content hash under logs/ci/.contract-cache/).
+
 Outputs (default):
   logs/ci/<YYYY-MM-DD>/contracts-catalog/contracts-catalog[--<PRD-ID>].md
   logs/ci/<YYYY-MM-DD>/contracts-catalog/summary.json
@@ -16,25 +19,23 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import re
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any
+
+PYTHON_DIR = Path(__file__).resolve().parent
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from _contract_model import ContractModel, TypeDecl, iter_source_files, load_contract_model, save_contract_cache  # noqa: E402
 
 
-EVENT_TYPE_CONST_RE = re.compile(
-    r"\bpublic\s+const\s+string\s+EventType\s*=\s*\"([^\"]+)\"\s*;",
-    re.MULTILINE,
-)
-TYPE_DEF_RE = re.compile(
-    r"\bpublic\s+(?:sealed\s+)?(?:partial\s+)?(?:record|class)\s+([A-Za-z_][A-Za-z0-9_]*)\b",
-    re.MULTILINE,
-)
-PUBLIC_INTERFACE_RE = re.compile(
-    r"\bpublic\s+interface\s+([A-Za-z_][A-Za-z0-9_]*)\b",
-    re.MULTILINE,
-)
+# Type declarations an EventType constant is attributed to: public [sealed] [partial] record/class.
+SYMBOL_TYPE_KINDS = frozenset({"record", "class"})
+SYMBOL_TYPE_MODIFIERS = {(), ("sealed",), ("partial",), ("sealed", "partial")}
+SYMBOL_LOOKBACK_CHARS = 2000
 
 
 @dataclass(frozen=True)
@@ -63,44 +64,44 @@ def _today_ci_dir(root: Path) -> Path:
     return root / "logs" / "ci" / day
 
 
-def _read_text_utf8(path: Path) -> str:
-    return path.read_text(encoding="utf-8", errors="ignore")
-
-
-def _iter_files(base: Path, pattern: str) -> Iterable[Path]:
+def _iter_files(root: Path, base: Path) -> list[tuple[Path, str]]:
     if not base.exists():
         return []
-    files: list[Path] = []
-    for p in base.rglob(pattern):
-        if not p.is_file():
-            continue
-        if any(seg in {"bin", "obj"} for seg in p.parts):
-            continue
-        files.append(p)
-    return sorted(files)
+    return iter_source_files(base, root, skip_dirs=frozenset({"bin", "obj"}))
+
+
+def _is_symbol_type(decl: TypeDecl) -> bool:
+    return decl.kind in SYMBOL_TYPE_KINDS and decl.modifiers in SYMBOL_TYPE_MODIFIERS
 
 
-def _guess_symbol_near(text: str, const_start: int) -> str | None:
+def _guess_symbol_near(model: ContractModel, const_start: int) -> str | None:
     # Heuristic: find the closest type definition above the constant (within 2k chars).
-    window = text[max(0, const_start - 2000) : const_start]
-    matches = list(TYPE_DEF_RE.finditer(window))
-    return matches[-1].group(1) if matches else None
+    window_start = max(0, const_start - SYMBOL_LOOKBACK_CHARS)
+    symbol: str | None = None
+    for decl in model.types:
+        if decl.end > const_start:
+            break
+        if decl.start >= window_start and _is_symbol_type(decl):
+            symbol = decl.name
+    return symbol
 
 
 def _collect_events(root: Path, *, contracts_dir: Path, domain_prefix: str) -> list[EventEntry]:
     entries: list[EventEntry] = []
-    for cs in _iter_files(contracts_dir, "*.cs"):
-        text = _read_text_utf8(cs)
-        for m in EVENT_TYPE_CONST_RE.finditer(text):
-            event_type = m.group(1).strip()
+    for cs, rel in _iter_files(root, contracts_dir):
+        model = load_contract_model(cs, root=root)
+        for const in model.consts_named("EventType"):
+            if const.literal is None:
+                continue
+            event_type = const.literal.strip()
             if not event_type.startswith(domain_prefix + "."):
                 continue
-            symbol = _guess_symbol_near(text, m.start())
+            symbol = _guess_symbol_near(model, const.start)
             entries.append(
                 EventEntry(
                     event_type=event_type,
                     symbol=symbol,
-                    file=_to_posix(cs.relative_to(root)),
+                    file=rel,
                 )
             )
     entries.sort(key=lambda e: (e.file, e.event_type))
@@ -109,13 +110,14 @@ def _collect_events(root: Path, *, contracts_dir: Path, domain_prefix: str) -> l
 
 def _collect_interfaces(root: Path, base_dir: Path) -> list[InterfaceEntry]:
     entries: list[InterfaceEntry] = []
-    for cs in _iter_files(base_dir, "*.cs"):
-        text = _read_text_utf8(cs)
-        for m in PUBLIC_INTERFACE_RE.finditer(text):
+    for cs, rel in _iter_files(root, base_dir):
+        for decl in load_contract_model(cs, root=root).types:
+            if decl.kind != "interface" or decl.modifiers:
+                continue
             entries.append(
                 InterfaceEntry(
-                    symbol=m.group(1),
-                    file=_to_posix(cs.relative_to(root)),
+                    symbol=decl.name,
+                    file=rel,
                 )
             )
     entries.sort(key=lambda e: (e.symbol, e.file))
@@ -295,6 +297,7 @@ def main() -> int:
         },
     }
     out_json.write_text(json.dumps(report, ensure_ascii=True, indent=2) + "\n", encoding="utf-8")
+    save_contract_cache()
 
     print(f"CONTRACTS_CATALOG status=ok out_md={_to_posix(out_md)} out_json={_to_posix(out_json)}")
     return 0
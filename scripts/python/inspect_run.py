@@ -13,6 +13,7 @@ SC_DIR = REPO_ROOT / "scripts" / "sc"
 if str(SC_DIR) not in sys.path:
     sys.path.insert(0, str(SC_DIR))
 
+import _profile  # noqa: E402,F401 - SC_PROFILE hooks; keep before the other local imports
 from _artifact_schema import (  # noqa: E402
     ArtifactSchemaError,
     validate_local_hard_checks_execution_context_payload,
@@ -33,6 +34,7 @@ from _chapter6_recovery_common import (  # noqa: E402
     recommended_command as build_recommended_command,
 )
 from _repair_approval import resolve_approval_state  # noqa: E402
+from _log_lifecycle import restore_archived_path  # noqa: E402
 from _summary_schema import (  # noqa: E402
     SummarySchemaError,
     validate_local_hard_checks_summary,
@@ -273,7 +275,9 @@ def _resolve_latest_path(root: Path, *, latest: str, kind: str, task_id: str, ru
         path = Path(explicit)
         if not path.is_absolute():
             path = root / path
-        return path.resolve()
+        path = path.resolve()
+        restore_archived_path(root, path)
+        return path
     candidates = _latest_candidates(root, kind=kind, task_id=task_id, run_id=run_id)
     if not candidates:
         raise FileNotFoundError("No latest run index found. Pass --latest or provide enough filters.")
@@ -379,6 +383,10 @@ def _resolve_artifact_root(root: Path, latest_path: Path, latest_payload: dict[s
         out_dir = _resolve_path(candidate_root, latest_payload.get(out_dir_key))
         if out_dir is not None and out_dir.exists():
             return candidate_root, out_dir
+    for candidate_root in candidate_roots:
+        out_dir = _resolve_path(candidate_root, latest_payload.get(out_dir_key))
+        if out_dir is not None and restore_archived_path(candidate_root, out_dir):
+            return candidate_root, out_dir
     return candidate_roots[0], _resolve_path(candidate_roots[0], latest_payload.get(out_dir_key))
 
 
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Apply the log lifecycle policy: archive cold dated log entries into per-day zips,
+delete expired ones, and release unreferenced artifact-store blobs.
+
+Policy:
+- scripts/python/config/log-lifecycle-policy.json (override with --policy)
+
+Output:
+- logs/ci/<YYYY-MM-DD>/log-lifecycle/summary.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import sys
+from pathlib import Path
+
+from _log_lifecycle import DEFAULT_POLICY_FILE, apply_log_lifecycle, load_policy
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Archive and prune dated log trees according to the lifecycle policy.")
+    parser.add_argument("--repo-root", default=".")
+    parser.add_argument("--policy", default=DEFAULT_POLICY_FILE, help="Policy JSON (repo-relative or absolute).")
+    parser.add_argument("--hot-days", type=int, default=None, help="Override the policy hot window in days.")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be archived or deleted without touching files.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    root = Path(args.repo_root).resolve()
+    try:
+        policy = load_policy(root, args.policy)
+    except (OSError, ValueError) as exc:
+        print(f"LOG_LIFECYCLE status=fail reason=invalid-policy error={exc}")
+        return 2
+    if args.hot_days is not None:
+        if args.hot_days < 0:
+            print("LOG_LIFECYCLE status=fail reason=invalid-hot-days")
+            return 2
+        policy["hot_days"] = args.hot_days
+
+    summary = apply_log_lifecycle(root, policy, dry_run=bool(args.dry_run))
+    status = "ok" if summary["failed_count"] == 0 else "fail"
+    out_path = root / "logs" / "ci" / dt.date.today().strftime("%Y-%m-%d") / "log-lifecycle" / "summary.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps({"status": status, **summary}, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(
+        f"LOG_LIFECYCLE status={status} archived={summary['archived_count']} deleted={summary['deleted_count']} "
+        f"protected={summary['protected_count']} failed={summary['failed_count']} dry_run={str(bool(args.dry_run)).lower()} "
+        f"out={str(out_path).replace(chr(92), '/')}"
+    )
+    return 0 if status == "ok" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -40,13 +40,21 @@ Usage (Windows, PowerShell):
 from __future__ import annotations
 
 import argparse
+import contextlib
 import datetime as dt
 import json
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+SC_DIR = Path(__file__).resolve().parents[1] / "sc"
+if str(SC_DIR) not in sys.path:
+    sys.path.insert(0, str(SC_DIR))
+
+from _task_view_writer import view_lock  # noqa: E402
+
 
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
@@ -234,11 +242,20 @@ def main() -> int:
     args = ap.parse_args()
 
     root = repo_root()
-    out_dir = ci_out_dir("migrate-task-optional-hints")
-
     master_p = root / ".taskmaster" / "tasks" / "tasks.json"
     back_p = root / ".taskmaster" / "tasks" / "tasks_back.json"
     gameplay_p = root / ".taskmaster" / "tasks" / "tasks_gameplay.json"
+    with contextlib.ExitStack() as locks:
+        if args.write:
+            # Hold the view locks across read-modify-write: parallel light-lane workers commit to the same views.
+            for view_path in (back_p, gameplay_p):
+                locks.enter_context(view_lock(view_path, root=root))
+        return _migrate(args, master_p=master_p, back_p=back_p, gameplay_p=gameplay_p)
+
+
+def _migrate(args: argparse.Namespace, *, master_p: Path, back_p: Path, gameplay_p: Path) -> int:
+    root = repo_root()
+    out_dir = ci_out_dir("migrate-task-optional-hints")
 
     master = read_json(master_p)
     back = read_json(back_p)
@@ -20,9 +20,14 @@ import sys
 from pathlib import Path
 from typing import Any
 
+PYTHON_DIR = Path(__file__).resolve().parent
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from _reference_graph import load_reference_graph  # noqa: E402
+
 
 DEFAULT_OVERLAY_INDEX: Path | None = None
-OVERLAYS_ROOT = Path("docs/architecture/overlays")
 TASK_FILES = [
     Path(".taskmaster/tasks/tasks.json"),
     Path(".taskmaster/tasks/tasks_back.json"),
@@ -77,10 +82,7 @@ def _build_baseline(repo_root: Path) -> dict[str, Any]:
 
 
 def _existing_overlay_indexes(repo_root: Path) -> list[Path]:
-    overlays_root = repo_root / OVERLAYS_ROOT
-    if not overlays_root.exists():
-        return []
-    return sorted(p.relative_to(repo_root) for p in overlays_root.glob('*/08/_index.md') if p.is_file())
+    return [Path(rel) for rel in load_reference_graph(repo_root).overlay_indexes()]
 
 
 def _candidate_index_from_doc_path(path_str: str) -> Path | None:
@@ -98,40 +100,18 @@ def _candidate_index_from_doc_path(path_str: str) -> Path | None:
 def _task_derived_overlay_indexes(repo_root: Path) -> list[Path]:
     candidates: list[Path] = []
     seen: set[str] = set()
-    for rel in TASK_FILES:
-        full_path = repo_root / rel
-        if not full_path.exists():
+    # Task -> overlay edges come in task-file, task and field order (overlay before overlay_refs);
+    # most tasks repeat the same few docs, so each distinct ref is mapped once.
+    refs = dict.fromkeys(edge.key for edge in load_reference_graph(repo_root).task_refs(('overlay', 'overlay_refs')))
+    for ref in refs:
+        overlay = _candidate_index_from_doc_path(ref)
+        if overlay is None:
             continue
-        try:
-            payload = json.loads(full_path.read_text(encoding='utf-8'))
-        except Exception:
+        key = overlay.as_posix()
+        if key in seen:
             continue
-
-        items: list[dict[str, Any]] = []
-        if isinstance(payload, dict):
-            items = [x for x in ((payload.get('master') or {}).get('tasks') or []) if isinstance(x, dict)]
-        elif isinstance(payload, list):
-            items = [x for x in payload if isinstance(x, dict)]
-
-        for item in items:
-            overlay = _candidate_index_from_doc_path(str(item.get('overlay') or ''))
-            if overlay is not None:
-                key = overlay.as_posix()
-                if key not in seen:
-                    seen.add(key)
-                    candidates.append(overlay)
-            refs = item.get('overlay_refs')
-            if not isinstance(refs, list):
-                continue
-            for ref in refs:
-                overlay_ref = _candidate_index_from_doc_path(str(ref or ''))
-                if overlay_ref is None:
-                    continue
-                key = overlay_ref.as_posix()
-                if key in seen:
-                    continue
-                seen.add(key)
-                candidates.append(overlay_ref)
+        seen.add(key)
+        candidates.append(overlay)
     return candidates
 
 
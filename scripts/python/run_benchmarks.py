@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Run the sc/python toolchain benchmarks against deterministic synthetic repos.
+
+Examples:
+- py -3 scripts/python/run_benchmarks.py --suite micro
+- py -3 scripts/python/run_benchmarks.py --suite all --scaling 1,4,16 --repeat 3
+- py -3 scripts/python/run_benchmarks.py --baseline logs/ci/benchmarks/baseline.json --max-regression-pct 15
+
+Output:
+- logs/ci/<YYYY-MM-DD>/sc-benchmarks/results.json (override with --out)
+- --save-baseline also writes the results to the baseline path (default logs/ci/benchmarks/baseline.json)
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from _benchmark_repo import SyntheticRepoSpec
+from _benchmark_suite import (
+    DEFAULT_MAX_REGRESSION_PCT,
+    DEFAULT_MIN_DELTA_MS,
+    RESULTS_SCHEMA_VERSION,
+    SUITES,
+    compare_results,
+    run_suite,
+    scaled_spec,
+)
+
+
+DEFAULT_BASELINE = "logs/ci/benchmarks/baseline.json"
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+def _git_head(root: Path) -> str:
+    try:
+        proc = subprocess.run(["git", "rev-parse", "HEAD"], cwd=str(root), capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return proc.stdout.strip() if proc.returncode == 0 else ""
+
+
+def _parse_scaling(value: str) -> list[int]:
+    factors: list[int] = []
+    for item in str(value or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        factor = int(item)
+        if factor < 1:
+            raise ValueError(f"scaling factor must be >= 1: {item}")
+        factors.append(factor)
+    if not factors:
+        raise ValueError("--scaling needs at least one factor")
+    return factors
+
+
+def _resolve(root: Path, value: str) -> Path:
+    path = Path(value)
+    return path if path.is_absolute() else root / path
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark hot functions and entry points of scripts/sc and scripts/python on synthetic repos.")
+    parser.add_argument("--suite", choices=[*SUITES, "all"], default="micro")
+    parser.add_argument("--filter", default="", help="Comma-separated case names or globs, e.g. 'resolve_triplet,build_report_catalog.*'.")
+    parser.add_argument("--tasks", type=int, default=50, help="Tasks per triplet view at scale 1.")
+    parser.add_argument("--code-files", type=int, default=200, help=".cs/.gd files at scale 1.")
+    parser.add_argument("--docs", type=int, default=20, help="ADR and overlay docs at scale 1.")
+    parser.add_argument("--log-days", type=int, default=7, help="Days of logs/ci pipeline runs.")
+    parser.add_argument("--runs-per-day", type=int, default=10, help="Pipeline runs per day at scale 1.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scaling", default="1", help="Comma-separated scale factors for tasks/code files/docs/runs, e.g. 1,4,16.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed samples per case.")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per case before sampling.")
+    parser.add_argument("--work-dir", default="", help="Where synthetic repos are generated (default: a temp dir removed afterwards).")
+    parser.add_argument("--out", default="", help="Results JSON (default logs/ci/<date>/sc-benchmarks/results.json).")
+    parser.add_argument("--baseline", default="", help="Baseline results JSON to compare against.")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, default="", help=f"Also store the results as baseline (default path {DEFAULT_BASELINE}).")
+    parser.add_argument("--max-regression-pct", type=float, default=DEFAULT_MAX_REGRESSION_PCT)
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS, help="Ignore median changes smaller than this.")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    root = _repo_root()
+    try:
+        factors = _parse_scaling(args.scaling)
+    except ValueError as exc:
+        print(f"SC_BENCHMARKS status=fail reason=invalid-scaling error={exc}")
+        return 2
+    if min(args.tasks, args.code_files, args.docs, args.log_days, args.runs_per_day) < 1 or args.repeat < 1 or args.warmup < 0:
+        print("SC_BENCHMARKS status=fail reason=invalid-scale")
+        return 2
+
+    baseline_payload: dict[str, Any] = {}
+    if args.baseline:
+        try:
+            baseline_payload = json.loads(_resolve(root, args.baseline).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"SC_BENCHMARKS status=fail reason=invalid-baseline error={exc}")
+            return 2
+
+    suites = SUITES if args.suite == "all" else (args.suite,)
+    base = SyntheticRepoSpec(
+        tasks=args.tasks,
+        code_files=args.code_files,
+        log_days=args.log_days,
+        runs_per_day=args.runs_per_day,
+        docs=args.docs,
+        seed=args.seed,
+    )
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="sc-bench-") as td:
+        work_dir = _resolve(root, args.work_dir) if args.work_dir else Path(td)
+        for factor in factors:
+            spec = scaled_spec(base, factor)
+            for item in run_suite(work_dir, spec, suites=suites, repeat=args.repeat, warmup=args.warmup, name_filter=args.filter, source_root=root):
+                item["scale_factor"] = factor
+                results.append(item)
+
+    errors = [item for item in results if item.get("status") != "ok"]
+    payload: dict[str, Any] = {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "cmd": "sc-benchmarks",
+        "generated_at": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+        "git_head": _git_head(root),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "suites": list(suites),
+        "scaling": factors,
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "results": results,
+    }
+    regressions: list[dict[str, Any]] = []
+    if baseline_payload:
+        comparison = compare_results(
+            results,
+            list(baseline_payload.get("results") or []),
+            max_regression_pct=args.max_regression_pct,
+            min_delta_ms=args.min_delta_ms,
+        )
+        comparison["baseline"] = args.baseline.replace("\\", "/")
+        comparison["baseline_git_head"] = str(baseline_payload.get("git_head") or "")
+        payload["comparison"] = comparison
+        regressions = comparison["regressions"]
+    status = "fail" if errors or regressions else "ok"
+    payload["status"] = status
+
+    out_path = _resolve(root, args.out) if args.out else root / "logs" / "ci" / dt.date.today().strftime("%Y-%m-%d") / "sc-benchmarks" / "results.json"
+    text = json.dumps(payload, ensure_ascii=False, indent=2) + "\n"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(text, encoding="utf-8")
+    if args.save_baseline and not errors:
+        baseline_path = _resolve(root, args.save_baseline)
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(text, encoding="utf-8")
+
+    for item in results:
+        if item.get("status") == "ok":
+            print(f"  {item['scale']:<24} {item['name']:<30} median={item['median_sec'] * 1000:9.2f}ms p90={item['p90_sec'] * 1000:9.2f}ms")
+        else:
+            print(f"  {item['scale']:<24} {item['name']:<30} ERROR {item.get('error')}")
+    for row in regressions:
+        print(f"  REGRESSION {row['scale']} {row['name']} {row['baseline_median_sec'] * 1000:.2f}ms -> {row['median_sec'] * 1000:.2f}ms ({row['delta_pct']:+.1f}%)")
+    print(
+        f"SC_BENCHMARKS status={status} cases={len(results)} errors={len(errors)} regressions={len(regressions)} "
+        f"out={str(out_path).replace(chr(92), '/')}"
+    )
+    return 0 if status == "ok" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,21 +5,36 @@
 Key behavior:
 - Runs all configured steps for each task by default (does not stop on step failure).
 - Supports resume from summary.json.
+- With --jobs N, runs N tasks at once (steps inside one task stay ordered) under a global
+  --llm-concurrency cap; view writes are serialized by scripts/sc/_task_view_writer.py.
 - Writes per-step logs and rolling summary under logs/ci/<YYYY-MM-DD>/.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
 import datetime as dt
 import json
 import os
 import re
-import shutil
 import subprocess
+import sys
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from _artifact_store import snapshot_files
+from _light_lane_coalesce import RequestCoalescer, option_value, replace_option, write_semantic_gate_task_dir
+
+SC_DIR = Path(__file__).resolve().parents[1] / "sc"
+if str(SC_DIR) not in sys.path:
+    sys.path.insert(0, str(SC_DIR))
+
+from _latency_model import latency_key, load_policy, plan_timeout_retry, recommend_timeout, record_latency  # noqa: E402
 
 _FILL_REFS_TIMEOUT_SEC = 300
 _TIMEOUT_BUFFER_SEC = 120
@@ -28,6 +43,9 @@ _RETRYABLE_TIMEOUT_STEPS = {"extract", "align"}
 _FILL_REF_STEP_NAMES = {"fill_refs_dry", "fill_refs_write", "fill_refs_verify"}
 _EARLY_GUARD_STEP_NAMES = {"preflight_extract_guard"}
 _SKIP_SOFT_STEP_NAMES = {"coverage", "semantic_gate", *_FILL_REF_STEP_NAMES}
+_LLM_FREE_STEP_NAMES = {"preflight_extract_guard"}
+# Steps whose inner scripts write to one shared logs/ci/<date>/<name> dir unless given a round id.
+_SHARED_OUT_DIR_STEP_NAMES = {"align", "semantic_gate", *_FILL_REF_STEP_NAMES}
 _EXTRACT_FAIL_FAMILY_AUTO_SKIP_ALL = {
     "timeout",
     "stdout:sc_llm_obligations_status_fail",
@@ -217,6 +235,14 @@ def _retry_inner_timeout_sec(
     return max(base_inner + _RETRY_TIMEOUT_BOOST_SEC, int(base_inner * 2))
 
 
+def _record_step_latency(root: Path, key: str, *, rc: int, duration_sec: float) -> None:
+    outcome = "ok" if int(rc) == 0 else ("timeout" if int(rc) == 124 else "error")
+    try:
+        record_latency(key, duration_sec, outcome=outcome, root=root)
+    except (OSError, TimeoutError):
+        pass  # the latency model is advisory; never fail a step on it
+
+
 def _run_step_with_retry(
     *,
     root: Path,
@@ -225,7 +251,19 @@ def _run_step_with_retry(
     delivery_profile: str,
     explicit_timeout_sec: int | None,
     llm_timeout_sec: int | None,
+    batch_size: int = 1,
 ) -> tuple[int, str, str, dict[str, Any]]:
+    # A coalesced batch of N tasks takes longer than one task: learn it under its own key.
+    step_latency_key = latency_key(f"light-lane:{step_name}", agent=f"batch-{batch_size}" if batch_size > 1 else "")
+    timeout_model: dict[str, Any] = {}
+    static_inner_timeout = 0
+    if explicit_timeout_sec is None and llm_timeout_sec is None and _step_supports_inner_timeout(step_name):
+        # Only self-resolved timeouts are adaptive; explicit CLI values always win.
+        static_inner_timeout = _profile_step_llm_timeout_sec(root, step_name=step_name, delivery_profile=delivery_profile)
+        adaptive_inner_timeout, timeout_model = recommend_timeout(step_latency_key, default_sec=static_inner_timeout, root=root)
+        if timeout_model.get("source") == "model":
+            cmd = _replace_or_append_timeout_arg(cmd, timeout_sec=adaptive_inner_timeout)
+            llm_timeout_sec = adaptive_inner_timeout
     timeout_sec = _resolve_step_timeout_sec(
         step_name,
         delivery_profile=delivery_profile,
@@ -233,7 +271,9 @@ def _run_step_with_retry(
         llm_timeout_sec=llm_timeout_sec,
         root=root,
     )
+    started = time.monotonic()
     rc, stdout, stderr = _run_step(root, cmd, timeout_sec=timeout_sec)
+    _record_step_latency(root, step_latency_key, rc=rc, duration_sec=time.monotonic() - started)
     attempts: list[dict[str, Any]] = [
         {
             "attempt": 1,
@@ -248,35 +288,53 @@ def _run_step_with_retry(
     if int(rc) == 124 and step_name in _RETRYABLE_TIMEOUT_STEPS:
         retry_cmd = list(cmd)
         retry_inner_timeout = llm_timeout_sec
-        if _step_supports_inner_timeout(step_name):
-            retry_inner_timeout = _retry_inner_timeout_sec(
-                step_name,
-                delivery_profile=delivery_profile,
-                llm_timeout_sec=llm_timeout_sec,
+        retry_wrapper_timeout: int | None = None
+        if timeout_model.get("source") == "model":
+            budget_sec = static_inner_timeout * load_policy(root).deadline_budget_ratio - (time.monotonic() - started)
+            retry_plan = plan_timeout_retry(
+                step_latency_key,
+                attempt_timeout_sec=int(llm_timeout_sec or static_inner_timeout),
+                budget_remaining_sec=budget_sec,
                 root=root,
             )
-            retry_cmd = _replace_or_append_timeout_arg(retry_cmd, timeout_sec=retry_inner_timeout)
-        retry_wrapper_timeout = max(
-            int(timeout_sec),
-            _resolve_step_timeout_sec(
-                step_name,
-                delivery_profile=delivery_profile,
-                explicit_timeout_sec=None,
-                llm_timeout_sec=retry_inner_timeout,
-                root=root,
-            ),
-        )
-        rc, stdout, stderr = _run_step(root, retry_cmd, timeout_sec=retry_wrapper_timeout)
-        attempts.append(
-            {
-                "attempt": 2,
-                "rc": int(rc),
-                "timeout_sec": int(retry_wrapper_timeout),
-                "cmd": list(retry_cmd),
-                "stdout": stdout,
-                "stderr": stderr,
-            }
-        )
+            timeout_model["retry_plan"] = retry_plan
+            if retry_plan["action"] == "retry":
+                retry_inner_timeout = int(retry_plan["timeout_sec"])
+                retry_cmd = _replace_or_append_timeout_arg(retry_cmd, timeout_sec=retry_inner_timeout)
+                retry_wrapper_timeout = retry_inner_timeout + _TIMEOUT_BUFFER_SEC
+        else:
+            if _step_supports_inner_timeout(step_name):
+                retry_inner_timeout = _retry_inner_timeout_sec(
+                    step_name,
+                    delivery_profile=delivery_profile,
+                    llm_timeout_sec=llm_timeout_sec,
+                    root=root,
+                )
+                retry_cmd = _replace_or_append_timeout_arg(retry_cmd, timeout_sec=retry_inner_timeout)
+            retry_wrapper_timeout = max(
+                int(timeout_sec),
+                _resolve_step_timeout_sec(
+                    step_name,
+                    delivery_profile=delivery_profile,
+                    explicit_timeout_sec=None,
+                    llm_timeout_sec=retry_inner_timeout,
+                    root=root,
+                ),
+            )
+        if retry_wrapper_timeout is not None:
+            started = time.monotonic()
+            rc, stdout, stderr = _run_step(root, retry_cmd, timeout_sec=retry_wrapper_timeout)
+            _record_step_latency(root, step_latency_key, rc=rc, duration_sec=time.monotonic() - started)
+            attempts.append(
+                {
+                    "attempt": 2,
+                    "rc": int(rc),
+                    "timeout_sec": int(retry_wrapper_timeout),
+                    "cmd": list(retry_cmd),
+                    "stdout": stdout,
+                    "stderr": stderr,
+                }
+            )
 
     metadata = {
         "retry_count": max(0, len(attempts) - 1),
@@ -284,6 +342,8 @@ def _run_step_with_retry(
         "attempt_count": len(attempts),
         "attempts": attempts,
     }
+    if timeout_model:
+        metadata["timeout_model"] = timeout_model
     return int(rc), stdout, stderr, metadata
 
 
@@ -428,6 +488,35 @@ def _apply_fill_refs_mode(
     return list(steps)
 
 
+def _isolate_shared_out_dirs(steps: list[tuple[str, list[str]]]) -> list[tuple[str, list[str]]]:
+    return [
+        (name, command + ["--round-id", "lane-t{id}"] if name in _SHARED_OUT_DIR_STEP_NAMES else command)
+        for name, command in steps
+    ]
+
+
+def _for_each_task(
+    task_ids: list[int],
+    *,
+    jobs: int,
+    run_task: Callable[[int, int], dict[str, Any] | None],
+    finish_task: Callable[[int, dict[str, Any] | None], None],
+) -> None:
+    """Run ``run_task(idx, task_id)`` on up to ``jobs`` workers; ``finish_task`` stays on this thread.
+
+    Rows are handed to ``finish_task`` in completion order so summary.json is only ever written by
+    the calling thread. jobs <= 1 keeps the original strictly sequential loop.
+    """
+    if int(jobs) <= 1 or len(task_ids) <= 1:
+        for idx, task_id in enumerate(task_ids, start=1):
+            finish_task(task_id, run_task(idx, task_id))
+        return
+    with ThreadPoolExecutor(max_workers=int(jobs), thread_name_prefix="light-lane-task") as pool:
+        futures = {pool.submit(run_task, idx, task_id): task_id for idx, task_id in enumerate(task_ids, start=1)}
+        for future in as_completed(futures):
+            finish_task(futures[future], future.result())
+
+
 def _resolve_downstream_on_extract_fail(policy: str, *, selected_count: int) -> str:
     if str(policy) == "auto":
         return "skip-soft" if int(selected_count) > 1 else "continue"
@@ -1048,17 +1137,23 @@ def _extract_inner_out_dir(stdout: str, stderr: str) -> Path | None:
     return None
 
 
-def _copy_file_set(source_dir: Path, artifact_dir: Path) -> list[str]:
-    copied: list[str] = []
+def _copy_file_set(source_dir: Path, artifact_dir: Path, *, root: Path | None = None) -> list[str]:
+    pairs: list[tuple[Path, str]] = []
     for pattern in _SNAPSHOT_PATTERNS:
         for path in sorted(source_dir.glob(pattern)):
             if not path.is_file():
                 continue
-            target = artifact_dir / path.name
-            target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(path, target)
-            copied.append(str(target.name))
-    return copied
+            pairs.append((path, path.name))
+    snapshot_files(target_dir=artifact_dir, files=pairs, root=root)
+    return [name for _, name in pairs]
+
+
+def _task_dir_files(source_task_dir: Path, name: str) -> list[tuple[Path, str]]:
+    return [
+        (path, f"{name}/{path.relative_to(source_task_dir).as_posix()}")
+        for path in sorted(source_task_dir.rglob("*"))
+        if path.is_file()
+    ]
 
 
 def _summarize_inner_summary(step_name: str, payload: dict[str, Any]) -> dict[str, Any]:
@@ -1123,7 +1218,7 @@ def _snapshot_inner_artifacts(
 
     artifact_dir = wrapper_out_dir / f"t{task_id:04d}--{step_name}.artifacts"
     artifact_dir.mkdir(parents=True, exist_ok=True)
-    copied = _copy_file_set(source_dir, artifact_dir)
+    copied = _copy_file_set(source_dir, artifact_dir, root=root)
 
     task_subdir_names = [f"task-{task_id}", f"task-{task_id:04d}"]
     copied_task_dirs: list[str] = []
@@ -1131,8 +1226,8 @@ def _snapshot_inner_artifacts(
         source_task_dir = source_dir / name
         if not source_task_dir.is_dir():
             continue
-        target_task_dir = artifact_dir / name
-        shutil.copytree(source_task_dir, target_task_dir, dirs_exist_ok=True)
+        (artifact_dir / name).mkdir(parents=True, exist_ok=True)
+        snapshot_files(target_dir=artifact_dir, files=_task_dir_files(source_task_dir, name), root=root)
         copied_task_dirs.append(name)
 
     metadata: dict[str, Any] = {
@@ -1458,6 +1553,75 @@ def _collect_failed_steps(step_map: dict[str, dict[str, Any]], *, ordered_step_n
     return failed
 
 
+def _run_coalesced_semantic_gate(
+    items: list[tuple[int, list[str]]],
+    *,
+    root: Path,
+    delivery_profile: str,
+    explicit_timeout_sec: int | None,
+    llm_timeout_sec: int | None,
+    llm_slots: threading.Semaphore | None = None,
+) -> dict[int, tuple[int, str, str, dict[str, Any]]]:
+    """Run several per-task semantic_gate commands as one prompt and split it back into per-task results.
+
+    Each task gets the summary.json/TSV layout its own --round-id run would have produced, so the
+    step records, artifact snapshots and resume logic downstream do not know the call was shared.
+    """
+    task_ids = [task_id for task_id, _ in items]
+    batch_round_id = f"lane-batch-{uuid.uuid4().hex[:8]}"
+    batch_cmd = replace_option(items[0][1], "--task-ids", ",".join(str(task_id) for task_id in task_ids))
+    batch_cmd = replace_option(batch_cmd, "--batch-size", str(len(task_ids)))
+    batch_cmd = replace_option(batch_cmd, "--round-id", batch_round_id)
+    with llm_slots if llm_slots is not None else contextlib.nullcontext():
+        rc, stdout, stderr, retry_meta = _run_step_with_retry(
+            root=root,
+            cmd=batch_cmd,
+            step_name="semantic_gate",
+            delivery_profile=delivery_profile,
+            explicit_timeout_sec=explicit_timeout_sec,
+            llm_timeout_sec=llm_timeout_sec,
+            batch_size=len(task_ids),
+        )
+    batch_out_dir = _extract_inner_out_dir(stdout, stderr)
+    batch_dir = None if batch_out_dir is None else (batch_out_dir if batch_out_dir.is_absolute() else root / batch_out_dir)
+    batch_summary = _load_summary(batch_dir / "summary.json") if batch_dir is not None else None
+    coalesced = {
+        "batch_out_dir": _relative_to_root(root, batch_dir) if batch_dir is not None else "",
+        "task_ids": task_ids,
+        "batch_rc": int(rc),
+    }
+
+    results: dict[int, tuple[int, str, str, dict[str, Any]]] = {}
+    for task_id, cmd in items:
+        task_meta = {**retry_meta, "coalesced": coalesced}
+        if batch_dir is None or batch_summary is None or batch_summary.get("summary_errors"):
+            # No usable batch result (crash/timeout/schema error): every member inherits the batch outcome.
+            results[task_id] = (int(rc), stdout, stderr, task_meta)
+            continue
+        round_id = option_value(cmd, "--round-id")
+        task_dir = batch_dir.parent / ("sc-semantic-gate-all" + (f"-round-{round_id}" if round_id else ""))
+        summary = write_semantic_gate_task_dir(
+            batch_dir=batch_dir,
+            task_dir=task_dir,
+            batch_summary=batch_summary,
+            task_id=task_id,
+            coalesced=coalesced,
+        )
+        status_line = (
+            "SC_SEMANTIC_GATE_ALL "
+            f"status={summary['status']} needs_fix={len(summary['needs_fix'])} unknown={len(summary['unknown'])} "
+            f"limit_needs_fix={int(summary.get('max_needs_fix') or 0)} limit_unknown={int(summary.get('max_unknown') or 0)} "
+            f"out={task_dir}"
+        )
+        task_stdout = f"{stdout.rstrip()}\n{status_line}\n"
+        attempts = [dict(attempt) for attempt in list(retry_meta.get("attempts") or []) if isinstance(attempt, dict)]
+        if attempts:
+            attempts[-1]["stdout"] = task_stdout
+        task_meta["attempts"] = attempts
+        results[task_id] = (0 if summary["status"] == "ok" else 1, task_stdout, stderr, task_meta)
+    return results
+
+
 def _run_named_steps_for_task(
     *,
     root: Path,
@@ -1472,6 +1636,8 @@ def _run_named_steps_for_task(
     downstream_on_extract_fail: str,
     downstream_on_extract_family_fail: str,
     stop_on_step_failure: bool,
+    llm_slots: threading.Semaphore | None = None,
+    coalescers: dict[str, RequestCoalescer] | None = None,
 ) -> list[str]:
     failed_steps: list[str] = []
     for step_name, template in step_items:
@@ -1513,16 +1679,25 @@ def _run_named_steps_for_task(
                 continue
 
         cmd = [part.format(id=task_id) for part in template]
-        step_started = dt.datetime.now()
-        step_started_monotonic = time.monotonic()
-        rc, stdout, stderr, retry_meta = _run_step_with_retry(
-            root=root,
-            cmd=cmd,
-            step_name=step_name,
-            delivery_profile=delivery_profile,
-            explicit_timeout_sec=explicit_timeout_sec,
-            llm_timeout_sec=llm_timeout_sec,
-        )
+        coalescer = coalescers.get(step_name) if coalescers else None
+        if coalescer is not None:
+            # The batch leader takes the LLM slot for the whole batch; waiting here must not hold one.
+            step_started = dt.datetime.now()
+            step_started_monotonic = time.monotonic()
+            rc, stdout, stderr, retry_meta = coalescer.submit(task_id, cmd)
+        else:
+            slot = llm_slots if llm_slots is not None and step_name not in _LLM_FREE_STEP_NAMES else contextlib.nullcontext()
+            with slot:
+                step_started = dt.datetime.now()
+                step_started_monotonic = time.monotonic()
+                rc, stdout, stderr, retry_meta = _run_step_with_retry(
+                    root=root,
+                    cmd=cmd,
+                    step_name=step_name,
+                    delivery_profile=delivery_profile,
+                    explicit_timeout_sec=explicit_timeout_sec,
+                    llm_timeout_sec=llm_timeout_sec,
+                )
         duration_sec = round(max(0.0, time.monotonic() - step_started_monotonic), 3)
         log_path = out_dir / f"t{task_id:04d}--{step_name}.log"
         attempts = retry_meta.get("attempts") or []
@@ -1573,6 +1748,10 @@ def _run_named_steps_for_task(
             "retry_rcs": [int(item) for item in list(retry_meta.get("retry_rcs") or [])],
             "attempt_count": int(retry_meta.get("attempt_count") or 1),
         }
+        if isinstance(retry_meta.get("coalesced"), dict):
+            step_map[step_name]["coalesced"] = retry_meta["coalesced"]
+        if isinstance(retry_meta.get("timeout_model"), dict):
+            step_map[step_name]["timeout_model"] = retry_meta["timeout_model"]
         step_map[step_name].update(
             _snapshot_inner_artifacts(
                 root=root,
@@ -1650,6 +1829,25 @@ def build_parser() -> argparse.ArgumentParser:
         choices=["playable-ea", "fast-ship", "standard"],
         help="Delivery profile for light-lane LLM steps.",
     )
+    parser.add_argument("--jobs", type=int, default=1, help="Task workers; steps inside one task always run in order (default: 1).")
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=0,
+        help="Max LLM-backed steps running at once across all task workers (0 means --jobs).",
+    )
+    parser.add_argument(
+        "--coalesce-batch-size",
+        type=int,
+        default=8,
+        help="With --jobs > 1, send up to this many pending per-task semantic_gate requests as one prompt (0/1 disables).",
+    )
+    parser.add_argument(
+        "--coalesce-wait-sec",
+        type=float,
+        default=30.0,
+        help="Longest a pending coalesced request waits for more tasks before its batch is sent anyway.",
+    )
     parser.add_argument("--self-check", action="store_true", help="Print resolved task range and step names, then exit.")
     return parser
 
@@ -1684,6 +1882,26 @@ def main() -> int:
     downstream_on_extract_family_fail_resolved = str(args.downstream_on_extract_family_fail)
     if batch_lane_resolved == "extract-first" and downstream_on_extract_fail_resolved == "continue":
         downstream_on_extract_fail_resolved = "skip-soft"
+    jobs = max(1, int(args.jobs or 1))
+    llm_concurrency = max(1, int(args.llm_concurrency or 0) or jobs)
+    if jobs > 1:
+        steps = _isolate_shared_out_dirs(steps)
+    llm_slots = threading.BoundedSemaphore(llm_concurrency) if jobs > 1 else None
+    coalesce_batch_size = max(0, int(args.coalesce_batch_size or 0))
+    coalescers: dict[str, RequestCoalescer] = {}
+    if jobs > 1 and coalesce_batch_size > 1:
+        coalescers["semantic_gate"] = RequestCoalescer(
+            lambda items: _run_coalesced_semantic_gate(
+                items,
+                root=root,
+                delivery_profile=str(args.delivery_profile),
+                explicit_timeout_sec=args.timeout_sec,
+                llm_timeout_sec=args.llm_timeout_sec,
+                llm_slots=llm_slots,
+            ),
+            max_batch=coalesce_batch_size,
+            max_wait_sec=float(args.coalesce_wait_sec),
+        )
     step_lookup = {name: cmd for name, cmd in steps}
     phase1_step_names = [name for name in ["preflight_extract_guard", "extract", "align"] if name in step_lookup]
     phase2_step_names = [name for name, _cmd in steps if name not in phase1_step_names]
@@ -1723,6 +1941,9 @@ def main() -> int:
             "batch_lane_resolved": batch_lane_resolved,
             "phase1_step_names": phase1_step_names,
             "phase2_step_names": phase2_step_names,
+            "jobs": jobs,
+            "llm_concurrency": llm_concurrency,
+            "coalesce_steps": sorted(coalescers),
         }
         _refresh_route_contract(
             payload,
@@ -1780,6 +2001,10 @@ def main() -> int:
     summary["batch_lane_resolved"] = batch_lane_resolved
     summary["phase1_step_names"] = phase1_step_names
     summary["phase2_step_names"] = phase2_step_names
+    summary["jobs"] = jobs
+    summary["llm_concurrency"] = llm_concurrency
+    summary["coalesce_batch_size"] = coalesce_batch_size if coalescers else 0
+    summary["coalesce_wait_sec"] = float(args.coalesce_wait_sec)
     summary["llm_timeout_sec"] = int(args.llm_timeout_sec) if args.llm_timeout_sec is not None else None
     summary["wrapper_timeout_sec"] = int(args.timeout_sec) if args.timeout_sec is not None else None
     summary["resume_reused"] = bool(isinstance(old_summary, dict) and _summary_scope_matches(old_summary, resume_scope))
@@ -1811,31 +2036,25 @@ def main() -> int:
         )
         _write_json(summary_path, summary)
 
-    if batch_lane_resolved == "extract-first" and len(selected) > 1:
-        summary["phase"] = "phase1"
-        phase1_items = [(name, step_lookup[name]) for name in phase1_step_names]
-        for idx, task_id in enumerate(selected, start=1):
-            existing_row = updated.get(task_id)
-            if _row_is_complete(existing_row, step_names=step_names):
-                skipped_completed += 1
-                _flush_summary(last_task_id=task_id)
-                continue
-            print(f"[phase1 {idx}/{len(selected)}] run task {task_id}")
-            row = dict(existing_row) if isinstance(existing_row, dict) else {"task_id": task_id, "steps": []}
-            step_map, phase_start_index, reused_successful_steps, resumed_from_step = _prepare_phase_resume(
-                existing_row,
-                target_step_names=phase1_step_names,
-            )
-            if resumed_from_step:
-                row["phase1_resumed_from_step"] = resumed_from_step
-            if reused_successful_steps:
-                row["phase1_reused_successful_steps"] = list(reused_successful_steps)
+    def _finalize_row(row: dict[str, Any], step_map: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        ordered = [step_map[name] for name in step_names if name in step_map]
+        failed_steps = _collect_failed_steps(step_map, ordered_step_names=step_names)
+        row["steps"] = ordered
+        row["failed_steps"] = failed_steps
+        row["first_failed_step"] = failed_steps[0] if failed_steps else ""
+        row["ok"] = (len(failed_steps) == 0 and len(ordered) == len(steps))
+        return row
+
+    def _run_steps(task_id: int, step_map: dict[str, dict[str, Any]], step_items: list[tuple[str, list[str]]]) -> None:
+        with contextlib.ExitStack() as stack:
+            for coalescer in coalescers.values():
+                stack.enter_context(coalescer.track_task())
             _run_named_steps_for_task(
                 root=root,
                 out_dir=out_dir,
                 task_id=task_id,
                 step_map=step_map,
-                step_items=phase1_items[phase_start_index:],
+                step_items=step_items,
                 delivery_profile=str(args.delivery_profile),
                 explicit_timeout_sec=args.timeout_sec,
                 llm_timeout_sec=args.llm_timeout_sec,
@@ -1843,15 +2062,63 @@ def main() -> int:
                 downstream_on_extract_fail=downstream_on_extract_fail_resolved,
                 downstream_on_extract_family_fail=downstream_on_extract_family_fail_resolved,
                 stop_on_step_failure=bool(args.stop_on_step_failure),
+                llm_slots=llm_slots,
+                coalescers=coalescers,
             )
-            ordered = [step_map[name] for name in step_names if name in step_map]
-            failed_steps = _collect_failed_steps(step_map, ordered_step_names=step_names)
-            row["steps"] = ordered
-            row["failed_steps"] = failed_steps
-            row["first_failed_step"] = failed_steps[0] if failed_steps else ""
-            row["ok"] = (len(failed_steps) == 0 and len(ordered) == len(steps))
+
+    def _finish_task(task_id: int, row: dict[str, Any] | None) -> None:
+        nonlocal skipped_completed
+        if row is None:
+            skipped_completed += 1
+        else:
             updated[task_id] = row
-            _flush_summary(last_task_id=task_id)
+        _flush_summary(last_task_id=task_id)
+
+    def _run_phase_task(phase: str, phase_step_names: list[str], total: int, idx: int, task_id: int) -> dict[str, Any] | None:
+        existing_row = updated.get(task_id)
+        if phase == "phase1" and _row_is_complete(existing_row, step_names=step_names):
+            return None
+        print(f"[{phase} {idx}/{total}] run task {task_id}")
+        row = dict(existing_row) if isinstance(existing_row, dict) else {"task_id": task_id, "steps": []}
+        step_map, phase_start_index, reused_successful_steps, resumed_from_step = _prepare_phase_resume(
+            existing_row,
+            target_step_names=phase_step_names,
+        )
+        if resumed_from_step:
+            row[f"{phase}_resumed_from_step"] = resumed_from_step
+        if reused_successful_steps:
+            row[f"{phase}_reused_successful_steps"] = list(reused_successful_steps)
+        phase_items = [(name, step_lookup[name]) for name in phase_step_names]
+        _run_steps(task_id, step_map, phase_items[phase_start_index:])
+        return _finalize_row(row, step_map)
+
+    def _run_standard_task(idx: int, task_id: int) -> dict[str, Any] | None:
+        existing_row = updated.get(task_id)
+        if _row_is_complete(existing_row, step_names=step_names):
+            return None
+        print(f"[{idx}/{len(selected)}] run task {task_id}")
+        row: dict[str, Any] = {"task_id": task_id, "steps": []}
+        step_map, resume_start_index, resumed_from_step, reused_successful_steps = _prepare_failed_row_resume(
+            existing_row,
+            step_names=step_names,
+            resume_failed_task_from=str(args.resume_failed_task_from),
+        )
+        if resumed_from_step:
+            row["resumed_from_step"] = resumed_from_step
+            row["reused_successful_steps"] = list(reused_successful_steps)
+        else:
+            resume_start_index = 0
+        _run_steps(task_id, step_map, steps[resume_start_index:])
+        return _finalize_row(row, step_map)
+
+    if batch_lane_resolved == "extract-first" and len(selected) > 1:
+        summary["phase"] = "phase1"
+        _for_each_task(
+            selected,
+            jobs=jobs,
+            run_task=lambda idx, task_id: _run_phase_task("phase1", phase1_step_names, len(selected), idx, task_id),
+            finish_task=_finish_task,
+        )
 
         phase2_candidates: list[int] = []
         for task_id in selected:
@@ -1863,92 +2130,23 @@ def main() -> int:
                 phase2_candidates.append(task_id)
         summary["phase"] = "phase2"
         summary["phase2_candidate_task_ids"] = [int(task_id) for task_id in phase2_candidates]
-        phase2_items = [(name, step_lookup[name]) for name in phase2_step_names]
-        for idx, task_id in enumerate(phase2_candidates, start=1):
-            existing_row = updated.get(task_id)
-            print(f"[phase2 {idx}/{len(phase2_candidates)}] run task {task_id}")
-            row = dict(existing_row) if isinstance(existing_row, dict) else {"task_id": task_id, "steps": []}
-            step_map, phase_start_index, reused_successful_steps, resumed_from_step = _prepare_phase_resume(
-                existing_row,
-                target_step_names=phase2_step_names,
-            )
-            if resumed_from_step:
-                row["phase2_resumed_from_step"] = resumed_from_step
-            if reused_successful_steps:
-                row["phase2_reused_successful_steps"] = list(reused_successful_steps)
-            _run_named_steps_for_task(
-                root=root,
-                out_dir=out_dir,
-                task_id=task_id,
-                step_map=step_map,
-                step_items=phase2_items[phase_start_index:],
-                delivery_profile=str(args.delivery_profile),
-                explicit_timeout_sec=args.timeout_sec,
-                llm_timeout_sec=args.llm_timeout_sec,
-                fill_refs_after_extract_fail=str(args.fill_refs_after_extract_fail),
-                downstream_on_extract_fail=downstream_on_extract_fail_resolved,
-                downstream_on_extract_family_fail=downstream_on_extract_family_fail_resolved,
-                stop_on_step_failure=bool(args.stop_on_step_failure),
-            )
-            ordered = [step_map[name] for name in step_names if name in step_map]
-            failed_steps = _collect_failed_steps(step_map, ordered_step_names=step_names)
-            row["steps"] = ordered
-            row["failed_steps"] = failed_steps
-            row["first_failed_step"] = failed_steps[0] if failed_steps else ""
-            row["ok"] = (len(failed_steps) == 0 and len(ordered) == len(steps))
-            updated[task_id] = row
-            _flush_summary(last_task_id=task_id)
+        _for_each_task(
+            phase2_candidates,
+            jobs=jobs,
+            run_task=lambda idx, task_id: _run_phase_task("phase2", phase2_step_names, len(phase2_candidates), idx, task_id),
+            finish_task=_finish_task,
+        )
         summary.pop("phase", None)
     else:
-        for idx, task_id in enumerate(selected, start=1):
-            existing_row = updated.get(task_id)
-            if _row_is_complete(existing_row, step_names=step_names):
-                skipped_completed += 1
-                _flush_summary(last_task_id=task_id)
-                continue
-
-            print(f"[{idx}/{len(selected)}] run task {task_id}")
-            row = {"task_id": task_id, "steps": []}
-            step_map, resume_start_index, resumed_from_step, reused_successful_steps = _prepare_failed_row_resume(
-                existing_row,
-                step_names=step_names,
-                resume_failed_task_from=str(args.resume_failed_task_from),
-            )
-            if resumed_from_step:
-                row["resumed_from_step"] = resumed_from_step
-                row["reused_successful_steps"] = list(reused_successful_steps)
-            else:
-                resume_start_index = 0
-
-            _run_named_steps_for_task(
-                root=root,
-                out_dir=out_dir,
-                task_id=task_id,
-                step_map=step_map,
-                step_items=steps[resume_start_index:],
-                delivery_profile=str(args.delivery_profile),
-                explicit_timeout_sec=args.timeout_sec,
-                llm_timeout_sec=args.llm_timeout_sec,
-                fill_refs_after_extract_fail=str(args.fill_refs_after_extract_fail),
-                downstream_on_extract_fail=downstream_on_extract_fail_resolved,
-                downstream_on_extract_family_fail=downstream_on_extract_family_fail_resolved,
-                stop_on_step_failure=bool(args.stop_on_step_failure),
-            )
-
-            ordered = [step_map[name] for name in step_names if name in step_map]
-            failed_steps = _collect_failed_steps(step_map, ordered_step_names=step_names)
-            row["steps"] = ordered
-            row["failed_steps"] = failed_steps
-            row["first_failed_step"] = failed_steps[0] if failed_steps else ""
-            row["ok"] = (len(failed_steps) == 0 and len(ordered) == len(steps))
-            updated[task_id] = row
-            _flush_summary(last_task_id=task_id)
+        _for_each_task(selected, jobs=jobs, run_task=_run_standard_task, finish_task=_finish_task)
 
     _rebuild_counts(summary)
     summary["remaining_tasks"] = max(0, len(selected) - int(summary.get("processed_tasks", 0)))
     summary["status"] = "ok" if int(summary.get("failed_tasks", 0)) == 0 else "fail"
     summary["finished_at"] = dt.datetime.now().isoformat(timespec="seconds")
     summary["skipped_completed_tasks"] = skipped_completed
+    if coalescers:
+        summary["coalesce_stats"] = {name: coalescer.stats() for name, coalescer in sorted(coalescers.items())}
     _refresh_route_contract(
         summary,
         root=root,
@@ -12,6 +12,7 @@ import math
 import subprocess
 import sys
 from argparse import Namespace
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 
@@ -202,6 +203,8 @@ def _build_batch_command(
         cmd.append("--stop-on-step-failure")
     if bool(args.no_align_apply):
         cmd.append("--no-align-apply")
+    if int(getattr(args, "parallel_shards", 1) or 1) > 1:
+        cmd.extend(["--parallel-shards", str(int(args.parallel_shards))])
     cmd.extend(
         [
             "--rolling-extract-policy",
@@ -906,7 +909,16 @@ def _apply_timeout_backoff(
     shard_entry: dict[str, Any],
     args: argparse.Namespace,
     shard_index: int,
+    launched_generation: int | None = None,
 ) -> dict[str, Any]:
+    """Shared timeout/shard-size controller.
+
+    ``launched_generation`` is the backoff_adjustment_count the shard was launched under. With
+    parallel shards, evidence from a shard started before the latest adjustment is stale and must
+    not stack another increment on top of it.
+    """
+    if launched_generation is not None and int(launched_generation) != int(state.get("backoff_adjustment_count") or 0):
+        return state
     observed = int(shard_entry.get("extract_observed_tasks") or 0)
     timeout_rate = float(shard_entry.get("extract_timeout_rate") or 0.0)
     if observed < max(1, int(args.rolling_timeout_backoff_min_observed_tasks)):
@@ -1012,7 +1024,8 @@ def _summarize_shard_results(shards: list[dict[str, Any]]) -> dict[str, int]:
 
 def _merge_outputs(root: Path, out_dir: Path, shard_entries: list[dict[str, Any]]) -> dict[str, Any] | None:
     summary_paths: list[Path] = []
-    for shard in shard_entries:
+    # Shard index order, never finish order: parallel shards must merge to the same payload.
+    for shard in sorted(shard_entries, key=lambda item: int(item.get("index") or 0)):
         if not bool(shard.get("summary_exists")):
             continue
         summary_paths.append(root / str(shard.get("summary_path")))
@@ -1094,6 +1107,12 @@ def build_parser() -> argparse.ArgumentParser:
         choices=["playable-ea", "fast-ship", "standard"],
         help="Delivery profile for light-lane LLM steps.",
     )
+    parser.add_argument(
+        "--parallel-shards",
+        type=int,
+        default=1,
+        help="Run up to N shards concurrently; rolling state is updated as each shard completes (default: 1).",
+    )
     parser.add_argument("--self-check", action="store_true", help="Print resolved shard plan, write summary.json, then exit.")
     parser.add_argument(
         "--rolling-extract-policy",
@@ -1194,6 +1213,7 @@ def main() -> int:
         "downstream_on_extract_fail": str(args.downstream_on_extract_fail),
         "downstream_on_extract_family_fail": str(args.downstream_on_extract_family_fail),
         "resume_failed_task_from": str(args.resume_failed_task_from),
+        "parallel_shards": max(1, int(getattr(args, "parallel_shards", 1) or 1)),
         "rolling_extract": _new_rolling_extract_state(args),
         "rolling_family": _new_rolling_family_state(args),
         "shard_count": len(initial_shard_task_groups),
@@ -1233,89 +1253,116 @@ def main() -> int:
     pending_task_ids = list(selected)
     planned_shards: list[dict[str, Any]] = []
     shard_index = 0
-    while pending_task_ids:
-        shard_index += 1
-        current_shard_size = _compute_next_shard_size(rolling_extract_state, int(args.max_tasks_per_shard))
-        shard_task_ids = list(pending_task_ids[:current_shard_size])
-        pending_task_ids = list(pending_task_ids[current_shard_size:])
-        planned_shards.append(
-            {
-                "index": shard_index,
-                "name": _build_shard_name(shard_index, shard_task_ids),
-                "task_ids": [int(task_id) for task_id in shard_task_ids],
-                "task_id_start": int(shard_task_ids[0]),
-                "task_id_end": int(shard_task_ids[-1]),
-                "task_count": len(shard_task_ids),
-                "out_dir": _relative_to_root(root, shards_root / _build_shard_name(shard_index, shard_task_ids)),
-            }
-        )
-        effective_args = _rolling_extract_effective_args(args, rolling_extract_state)
-        entry = _run_shard(
-            root=root,
-            args=effective_args,
-            shard_task_ids=shard_task_ids,
-            shard_index=shard_index,
-            shard_count=max(shard_index, shard_index + (1 if pending_task_ids else 0)),
-            shards_root=shards_root,
-        )
-        entry["rolling_extract_mode"] = "degraded" if bool(rolling_extract_state.get("degraded_mode_active")) else "normal"
-        shard_entries.append(entry)
-        shard_summary = _load_json(root / str(entry.get("summary_path")))
-        rolling_extract_state = _apply_timeout_backoff(
-            state=rolling_extract_state,
-            shard_entry=entry,
-            args=args,
-            shard_index=shard_index,
-        )
-        rolling_extract_state = _update_rolling_extract_state(
-            state=rolling_extract_state,
-            shard_entry=entry,
-            shard_index=shard_index,
-        )
-        rolling_family_state = _update_rolling_family_state(
-            state=rolling_family_state,
-            shard_entry=entry,
-            shard_summary=shard_summary,
-            shard_index=shard_index,
-        )
-        summary["shards"] = shard_entries
-        summary["planned_shards"] = planned_shards
-        summary["last_shard_index"] = shard_index
-        summary["last_task_id"] = int(shard_task_ids[-1])
-        summary["last_updated_at"] = dt.datetime.now().isoformat(timespec="seconds")
-        summary["shard_status_counts"] = _summarize_shard_results(shard_entries)
-        summary["rolling_extract"] = rolling_extract_state
-        summary["rolling_family"] = rolling_family_state
-        summary["family_hotspots"] = list(rolling_family_state.get("hotspots") or [])
-        summary["quarantine_ranges"] = list(rolling_family_state.get("quarantine_ranges") or [])
-        summary["shard_count"] = len(planned_shards) + (1 if pending_task_ids else 0)
-        _write_json(summary_path, summary)
-        stop_reason = ""
-        if str(rolling_family_state.get("action") or "") == "stop" and bool(rolling_family_state.get("triggered")):
-            stop_reason = str(rolling_family_state.get("trigger_reason") or "rolling_family_stop")
-        elif str(rolling_extract_state.get("action") or "") == "stop" and bool(rolling_extract_state.get("triggered")):
-            stop_reason = str(rolling_extract_state.get("trigger_reason") or "rolling_extract_stop")
-        if stop_reason:
-            remaining = list(pending_task_ids)
-            pending_index = shard_index + 1
-            while remaining:
-                next_size = _compute_next_shard_size(rolling_extract_state, int(args.max_tasks_per_shard))
-                next_ids = list(remaining[:next_size])
-                remaining = list(remaining[next_size:])
-                skipped_planned_shards.append(
+    parallel_shards = max(1, int(getattr(args, "parallel_shards", 1) or 1))
+    in_flight: dict[Future[dict[str, Any]], tuple[int, list[int], str, int]] = {}
+    # The family streak counts consecutive task ids, so shards feed it strictly in index order.
+    family_backlog: dict[int, tuple[dict[str, Any], dict[str, Any] | None]] = {}
+    next_family_index = 1
+    stop_reason = ""
+    with ThreadPoolExecutor(max_workers=parallel_shards, thread_name_prefix="light-lane-shard") as pool:
+        while True:
+            while pending_task_ids and not stop_reason and len(in_flight) < parallel_shards:
+                shard_index += 1
+                current_shard_size = _compute_next_shard_size(rolling_extract_state, int(args.max_tasks_per_shard))
+                shard_task_ids = list(pending_task_ids[:current_shard_size])
+                pending_task_ids = list(pending_task_ids[current_shard_size:])
+                planned_shards.append(
                     {
-                        "index": pending_index,
-                        "name": _build_shard_name(pending_index, next_ids),
-                        "task_ids": [int(task_id) for task_id in next_ids],
-                        "task_id_start": int(next_ids[0]),
-                        "task_id_end": int(next_ids[-1]),
-                        "task_count": len(next_ids),
-                        "status": "skipped",
-                        "skip_reason": stop_reason,
+                        "index": shard_index,
+                        "name": _build_shard_name(shard_index, shard_task_ids),
+                        "task_ids": [int(task_id) for task_id in shard_task_ids],
+                        "task_id_start": int(shard_task_ids[0]),
+                        "task_id_end": int(shard_task_ids[-1]),
+                        "task_count": len(shard_task_ids),
+                        "out_dir": _relative_to_root(root, shards_root / _build_shard_name(shard_index, shard_task_ids)),
                     }
                 )
-                pending_index += 1
-            break
+                future = pool.submit(
+                    _run_shard,
+                    root=root,
+                    args=_rolling_extract_effective_args(args, rolling_extract_state),
+                    shard_task_ids=shard_task_ids,
+                    shard_index=shard_index,
+                    shard_count=max(shard_index, shard_index + (1 if pending_task_ids else 0)),
+                    shards_root=shards_root,
+                )
+                in_flight[future] = (
+                    shard_index,
+                    shard_task_ids,
+                    "degraded" if bool(rolling_extract_state.get("degraded_mode_active")) else "normal",
+                    int(rolling_extract_state.get("backoff_adjustment_count") or 0),
+                )
+            if not in_flight:
+                break
+            done, _pending = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda item: in_flight[item][0]):
+                done_index, done_task_ids, extract_mode, launched_generation = in_flight.pop(future)
+                entry = future.result()
+                entry["rolling_extract_mode"] = extract_mode
+                shard_entries.append(entry)
+                shard_entries.sort(key=lambda item: int(item.get("index") or 0))
+                shard_summary = _load_json(root / str(entry.get("summary_path")))
+                rolling_extract_state = _apply_timeout_backoff(
+                    state=rolling_extract_state,
+                    shard_entry=entry,
+                    args=args,
+                    shard_index=done_index,
+                    launched_generation=launched_generation,
+                )
+                rolling_extract_state = _update_rolling_extract_state(
+                    state=rolling_extract_state,
+                    shard_entry=entry,
+                    shard_index=done_index,
+                )
+                family_backlog[done_index] = (entry, shard_summary)
+                while next_family_index in family_backlog:
+                    family_entry, family_summary = family_backlog.pop(next_family_index)
+                    rolling_family_state = _update_rolling_family_state(
+                        state=rolling_family_state,
+                        shard_entry=family_entry,
+                        shard_summary=family_summary,
+                        shard_index=next_family_index,
+                    )
+                    next_family_index += 1
+                summary["shards"] = shard_entries
+                summary["planned_shards"] = planned_shards
+                summary["last_shard_index"] = done_index
+                summary["last_task_id"] = int(done_task_ids[-1])
+                summary["last_updated_at"] = dt.datetime.now().isoformat(timespec="seconds")
+                summary["shard_status_counts"] = _summarize_shard_results(shard_entries)
+                summary["rolling_extract"] = rolling_extract_state
+                summary["rolling_family"] = rolling_family_state
+                summary["family_hotspots"] = list(rolling_family_state.get("hotspots") or [])
+                summary["quarantine_ranges"] = list(rolling_family_state.get("quarantine_ranges") or [])
+                summary["shard_count"] = len(planned_shards) + (1 if pending_task_ids else 0)
+                _write_json(summary_path, summary)
+                if stop_reason:
+                    continue
+                if str(rolling_family_state.get("action") or "") == "stop" and bool(rolling_family_state.get("triggered")):
+                    stop_reason = str(rolling_family_state.get("trigger_reason") or "rolling_family_stop")
+                elif str(rolling_extract_state.get("action") or "") == "stop" and bool(rolling_extract_state.get("triggered")):
+                    stop_reason = str(rolling_extract_state.get("trigger_reason") or "rolling_extract_stop")
+
+    if stop_reason:
+        remaining = list(pending_task_ids)
+        pending_index = shard_index + 1
+        while remaining:
+            next_size = _compute_next_shard_size(rolling_extract_state, int(args.max_tasks_per_shard))
+            next_ids = list(remaining[:next_size])
+            remaining = list(remaining[next_size:])
+            skipped_planned_shards.append(
+                {
+                    "index": pending_index,
+                    "name": _build_shard_name(pending_index, next_ids),
+                    "task_ids": [int(task_id) for task_id in next_ids],
+                    "task_id_start": int(next_ids[0]),
+                    "task_id_end": int(next_ids[-1]),
+                    "task_count": len(next_ids),
+                    "status": "skipped",
+                    "skip_reason": stop_reason,
+                }
+            )
+            pending_index += 1
 
     if skipped_planned_shards:
         summary["skipped_planned_shards"] = skipped_planned_shards
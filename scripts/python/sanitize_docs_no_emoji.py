@@ -21,27 +21,24 @@ import argparse
 import datetime as dt
 import io
 import json
-import os
+import sys
 from collections import Counter
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, List, Tuple
 
+try:
+    from _encoding_engine import EMOJI_RANGES, EMOJI_VS16, scan_file
+except ImportError:
+    _SC_DIR = Path(__file__).resolve().parents[1] / "sc"
+    if str(_SC_DIR) not in sys.path:
+        sys.path.insert(0, str(_SC_DIR))
+    from _encoding_engine import EMOJI_RANGES, EMOJI_VS16, scan_file
 
-# Basic emoji/symbol ranges (not exhaustive; intended for policy enforcement).
-RANGES: List[Tuple[int, int]] = [
-    (0x1F300, 0x1F5FF),
-    (0x1F600, 0x1F64F),
-    (0x1F680, 0x1F6FF),
-    (0x1F700, 0x1F77F),
-    (0x1F780, 0x1F7FF),
-    (0x1F800, 0x1F8FF),
-    (0x1F900, 0x1F9FF),
-    (0x1FA00, 0x1FAFF),
-    (0x2600, 0x26FF),
-    (0x2700, 0x27BF),
-]
 
-VS16 = 0xFE0F  # Variation Selector-16
+# Basic emoji/symbol ranges, shared with the "emoji" rule of _encoding_engine.
+RANGES: List[Tuple[int, int]] = EMOJI_RANGES
+
+VS16 = EMOJI_VS16  # Variation Selector-16
 
 
 def is_emoji(cp: int) -> bool:
@@ -144,6 +141,10 @@ def main() -> int:
     unknown_total = Counter()
 
     for fp in files:
+        # The engine scan is cached by content hash; only files with emoji hits are decoded again.
+        scan = scan_file(fp)
+        if not scan.utf8_ok or not scan.count("emoji"):
+            continue
         try:
             raw = fp.read_text(encoding="utf-8")
         except Exception:
@@ -23,6 +23,12 @@ import re
 import sys
 from typing import Dict, List, Tuple
 
+try:
+    from _encoding_engine import read_and_scan
+except ImportError:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sc"))
+    from _encoding_engine import read_and_scan
+
 
 DEFAULT_ROOT = "docs"
 ALLOWED_EXTS = {".md", ".txt", ".yml", ".yaml", ".json", ".xml", ".ini", ".cfg", ".index", ".adoc"}
@@ -54,18 +60,9 @@ def iter_docs_files(root: str) -> List[str]:
 
 
 def read_text_utf8(path: str) -> Tuple[str, str | None]:
-    try:
-        with io.open(path, "rb") as f:
-            raw = f.read()
-        return raw.decode("utf-8", errors="strict"), None
-    except Exception as e:
-        # Keep scanning even if a single file is not UTF-8; record error and decode with replacement.
-        try:
-            with io.open(path, "rb") as f:
-                raw = f.read()
-            return raw.decode("utf-8", errors="replace"), f"{type(e).__name__}: {e}"
-        except Exception as e2:
-            return "", f"{type(e2).__name__}: {e2}"
+    # Keep scanning even if a single file is not UTF-8; record error and decode with replacement.
+    text, scan = read_and_scan(path, errors="replace")
+    return text or "", (scan.error_detail or None)
 
 
 def main() -> int:
@@ -1,39 +1,38 @@
 import argparse
 import json
 import os
-import re
+import sys
 from datetime import datetime
 
+try:
+    from _encoding_engine import scan_file as engine_scan_file
+except ImportError:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sc'))
+    from _encoding_engine import scan_file as engine_scan_file
 
-MOJIBAKE_RE = re.compile(r"[闁閻鐟鍗鈧缂濞閸鎮绱锛绗閿鍊鎯缁婵]")
+
+# Mojibake char class lives in _encoding_engine as rule "garbled_char".
 ALLOWED_EXTS = {'.md', '.txt', '.yml', '.yaml', '.json', '.xml', '.ini', '.cfg', '.index', '.adoc'}
 
 
 def scan_file(path: str):
-    try:
-        with open(path, 'rb') as f:
-            raw = f.read()
-        # strict UTF-8 decode to surface decode errors
-        text = raw.decode('utf-8', errors='strict')
-    except Exception as e:
+    scan = engine_scan_file(path)
+    if scan.error is not None:
+        # strict UTF-8 decode surfaces decode errors
         return {
             'file': path,
-            'error': f'decode_error: {type(e).__name__}: {e}',
+            'error': f'decode_error: {scan.error_detail}',
             'suspected': True,
             'has_fffd': False,
             'mojibake_hits': 0,
             'lines': []
         }
 
-    has_fffd = '\uFFFD' in text
-    hits = 0
-    lines = []
-    for i, line in enumerate(text.splitlines(), start=1):
-        if MOJIBAKE_RE.search(line):
-            hits += 1
-            if len(lines) < 8:
-                # keep a short preview line
-                lines.append({'line': i, 'text': line[:400]})
+    has_fffd = scan.count('fffd') > 0
+    garbled = scan.rule_hits('garbled_char')
+    hits = garbled.line_count if garbled else 0
+    # keep short preview lines
+    lines = [{'line': no, 'text': text} for no, text in (garbled.lines if garbled else ())]
 
     suspected = has_fffd or hits > 0
     return {
@@ -10,19 +10,28 @@ from _project_health_cli_status import (
     render_project_health_server_ci_fail_line,
     render_project_health_server_status_line,
 )
-from _project_health_server import ensure_project_health_server
+from _project_health_live import DEFAULT_POLL_SEC, run_live_server
+from _project_health_server import HOST, ensure_project_health_server
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Serve the local project-health dashboard.")
     parser.add_argument("--repo-root", default=".")
     parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--poll-sec", type=float, default=DEFAULT_POLL_SEC)
+    parser.add_argument("--foreground", action="store_true", help="Run the live server in this process (used by the detached spawn).")
     args = parser.parse_args(argv)
 
     if os.environ.get("CI"):
         print(render_project_health_server_ci_fail_line())
         return 2
 
+    if args.foreground:
+        if args.port <= 0:
+            parser.error("--foreground requires --port")
+        run_live_server(root=args.repo_root, host=HOST, port=args.port, poll_sec=args.poll_sec)
+        return 0
+
     payload = ensure_project_health_server(root=args.repo_root, preferred_port=args.port)
     print(
         render_project_health_server_status_line(
@@ -14,10 +14,17 @@ import argparse
 import datetime as dt
 import json
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+PYTHON_DIR = Path(__file__).resolve().parent
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from _reference_graph import load_reference_graph  # noqa: E402
+
 
 OVERLAY_PRD_RE = re.compile(r"^docs/architecture/overlays/([^/]+)/08(?:/|$)")
 VALID_PRD_ID_RE = re.compile(r"^[A-Za-z0-9._-]+$")
@@ -194,14 +201,11 @@ def _auto_detect_prd_id(root: Path, tasks_dir: Path) -> str:
         ordered = sorted(task_candidates)
         raise ValueError(f"Auto-detect found multiple PRD IDs in task files: {ordered}. Use --prd-id.")
 
-    overlays_root = root / "docs" / "architecture" / "overlays"
-    fs_candidates: list[str] = []
-    if overlays_root.exists():
-        for folder in overlays_root.iterdir():
-            if not folder.is_dir() or folder.name.startswith("_"):
-                continue
-            if (folder / "08").exists():
-                fs_candidates.append(folder.name)
+    fs_candidates = [
+        folder.prd_id
+        for folder in load_reference_graph(root).overlay_folders()
+        if folder.has_08 and not folder.prd_id.startswith("_")
+    ]
 
     if len(fs_candidates) == 1:
         return fs_candidates[0]
@@ -237,12 +241,11 @@ def _pick_first_matching(files: list[str], prefixes: tuple[str, ...], fallback:
 def _load_overlay_paths_from_folder(root: Path, prd_id: str) -> OverlayPaths:
     safe_prd_id = _validate_prd_id(prd_id)
     base = f"docs/architecture/overlays/{safe_prd_id}/08"
-    folder = root / base
-    if not folder.exists():
+    folder = load_reference_graph(root).overlay_folder(safe_prd_id)
+    if folder is None or not folder.has_08:
         raise ValueError(f"Missing overlay directory: {base}")
 
-    all_files = [p.name for p in folder.iterdir() if p.is_file()]
-    all_files.sort()
+    all_files = [name for name, is_file in folder.entries if is_file]
 
     index = "_index.md"
     acceptance = "ACCEPTANCE_CHECKLIST.md"
@@ -12,6 +12,10 @@ Hard checks:
   - Files with EventType constant must also have <remarks>.
 - BCL-only boundary: contracts must not depend on Godot APIs/namespaces.
 - Namespace must start with Game.Core.Contracts.
+
+Contract files are parsed through the shared model in _contract_model.py and each file's issues
+are cached by content hash, the EventTypes entries it references and this script's own source,
+so an unchanged tree is re-validated from the cache (SC_CONTRACT_CACHE=off disables it).
 """
 
 from __future__ import annotations
@@ -24,6 +28,20 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
+PYTHON_DIR = Path(__file__).resolve().parent
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from _contract_model import (  # noqa: E402
+    ContractModel,
+    cached_result,
+    content_digest,
+    fingerprint,
+    iter_source_files,
+    load_contract_model,
+    save_contract_cache,
+)
+
 
 CONTRACTS_PREFIX = "Game.Core/Contracts/"
 CONTRACTS_ROOT = Path("Game.Core") / "Contracts"
@@ -36,13 +54,12 @@ EVENT_TYPE_PATTERN = re.compile(
     r"|screen\.[a-z0-9_]+(?:\.[a-z0-9_]+)+"
     r")$"
 )
-NAMESPACE_PATTERN = re.compile(r"^\s*namespace\s+([A-Za-z_][A-Za-z0-9_\.]*)\s*(?:;|\{)", re.MULTILINE)
-USING_PATTERN = re.compile(r"^\s*using\s+([A-Za-z_][A-Za-z0-9_\.]*)\s*;", re.MULTILINE)
-PUBLIC_TYPE_LINE_PATTERN = re.compile(
-    r"^\s*public\s+(?:sealed\s+|abstract\s+|static\s+|partial\s+)?(?:record|class|interface|enum|struct)\s+[A-Za-z_][A-Za-z0-9_]*"
-)
-EVENTTYPE_CONST_PATTERN = re.compile(r"public\s+const\s+string\s+EventType\s*=\s*([^;]+);")
-EVENT_TYPES_CONST_PATTERN = re.compile(r"public\s+const\s+string\s+([A-Za-z_][A-Za-z0-9_]*)\s*=\s*\"([^\"]+)\";")
+# XML-doc rule scope: a type declared at the start of its line with at most one of these modifiers.
+XML_DOC_TYPE_MODIFIERS = frozenset({"sealed", "abstract", "static", "partial"})
+EVENT_TYPES_REF_PATTERN = re.compile(r"EventTypes\.([A-Za-z_][A-Za-z0-9_]*)")
+CONTRACT_PATH_PATTERN = re.compile(r"`(" + re.escape(CONTRACTS_PREFIX) + r"[^`]+?\.cs)`")
+# Cached per-file issues are only reused while the rules in this file are unchanged.
+RULES_VERSION = content_digest(Path(__file__).read_bytes())[:16]
 
 
 def _to_posix(p: Path) -> str:
@@ -68,12 +85,10 @@ def find_overlay_docs(root: Path) -> List[Path]:
     return docs
 
 
-def extract_contract_paths(md_path: Path) -> List[str]:
-    text = _read_text(md_path)
-    pattern = re.compile(r"`(" + re.escape(CONTRACTS_PREFIX) + r"[^`]+?\.cs)`")
+def _contract_paths_in(text: str) -> List[str]:
     seen: set[str] = set()
     out: List[str] = []
-    for match in pattern.findall(text):
+    for match in CONTRACT_PATH_PATTERN.findall(text):
         norm = str(match).replace("\\", "/")
         if norm in seen:
             continue
@@ -82,11 +97,23 @@ def extract_contract_paths(md_path: Path) -> List[str]:
     return out
 
 
+def extract_contract_paths(md_path: Path, *, root: Path | None = None) -> List[str]:
+    """Contract paths referenced by an overlay doc; cached by content hash when ``root`` is given."""
+    if root is None:
+        return _contract_paths_in(_read_text(md_path))
+    raw = md_path.read_bytes()
+    return cached_result(
+        root,
+        f"overlay-refs:{RULES_VERSION}:{content_digest(raw)}",
+        lambda: _contract_paths_in(raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")),
+    )
+
+
 def find_all_contract_files(root: Path) -> List[str]:
     contracts_root = root / CONTRACTS_ROOT
     if not contracts_root.exists():
         return []
-    files = [_to_posix(p.relative_to(root)) for p in contracts_root.rglob("*.cs") if p.is_file()]
+    files = [rel for _path, rel in iter_source_files(contracts_root, root)]
     files.sort()
     return files
 
@@ -96,13 +123,6 @@ def _is_required_overlay_contract_doc(rel_doc: str) -> bool:
     return name.startswith("08-Contracts-") or name.startswith("08-Feature-Slice-")
 
 
-def _line_number_of(text: str, needle: str) -> int:
-    idx = text.find(needle)
-    if idx < 0:
-        return 1
-    return text[:idx].count("\n") + 1
-
-
 def _extract_event_types_map(root: Path) -> tuple[Dict[str, str], List[Dict[str, Any]]]:
     issues: List[Dict[str, Any]] = []
     mapping: Dict[str, str] = {}
@@ -118,16 +138,18 @@ def _extract_event_types_map(root: Path) -> tuple[Dict[str, str], List[Dict[str,
         )
         return mapping, issues
 
-    text = _read_text(event_types_path)
-    for m in EVENT_TYPES_CONST_PATTERN.finditer(text):
-        name = m.group(1)
-        value = m.group(2)
+    model = load_contract_model(event_types_path, root=root, strict=True)
+    for const in model.consts:
+        if const.literal is None:
+            continue
+        name = const.name
+        value = const.literal
         mapping[name] = value
         if not EVENT_TYPE_PATTERN.match(value):
             issues.append(
                 {
                     "file": _to_posix(event_types_path.relative_to(root)),
-                    "line": _line_number_of(text, m.group(0)),
+                    "line": const.line,
                     "code": "event_type_value_invalid",
                     "message": f"EventTypes.{name} value '{value}' does not match ADR-0004 naming pattern.",
                 }
@@ -144,10 +166,10 @@ def _extract_event_types_map(root: Path) -> tuple[Dict[str, str], List[Dict[str,
     return mapping, issues
 
 
-def _validate_namespace(rel_path: str, text: str) -> List[Dict[str, Any]]:
+def _validate_namespace(rel_path: str, model: ContractModel) -> List[Dict[str, Any]]:
     issues: List[Dict[str, Any]] = []
-    m = NAMESPACE_PATTERN.search(text)
-    if not m:
+    ns = model.namespace
+    if ns is None:
         issues.append(
             {
                 "file": rel_path,
@@ -158,12 +180,11 @@ def _validate_namespace(rel_path: str, text: str) -> List[Dict[str, Any]]:
         )
         return issues
 
-    ns = m.group(1)
     if not ns.startswith("Game.Core.Contracts"):
         issues.append(
             {
                 "file": rel_path,
-                "line": _line_number_of(text, m.group(0)),
+                "line": model.namespace_line,
                 "code": "namespace_invalid",
                 "message": f"Namespace '{ns}' must start with 'Game.Core.Contracts'.",
             }
@@ -171,9 +192,9 @@ def _validate_namespace(rel_path: str, text: str) -> List[Dict[str, Any]]:
     return issues
 
 
-def _validate_bcl_only(rel_path: str, text: str) -> List[Dict[str, Any]]:
+def _validate_bcl_only(rel_path: str, model: ContractModel) -> List[Dict[str, Any]]:
     issues: List[Dict[str, Any]] = []
-    if re.search(r"^\s*using\s+Godot(?:\.|;)", text, flags=re.MULTILINE) or re.search(r"\bGodot\.", text):
+    if model.godot_dependency:
         issues.append(
             {
                 "file": rel_path,
@@ -183,14 +204,13 @@ def _validate_bcl_only(rel_path: str, text: str) -> List[Dict[str, Any]]:
             }
         )
 
-    for m in USING_PATTERN.finditer(text):
-        ns = m.group(1)
+    for ns, line_no in model.usings:
         if ns.startswith("System") or ns.startswith("Game.Core.Contracts"):
             continue
         issues.append(
             {
                 "file": rel_path,
-                "line": _line_number_of(text, m.group(0)),
+                "line": line_no,
                 "code": "using_non_bcl_forbidden",
                 "message": f"Using '{ns}' is outside BCL/contracts boundary.",
             }
@@ -198,28 +218,25 @@ def _validate_bcl_only(rel_path: str, text: str) -> List[Dict[str, Any]]:
     return issues
 
 
-def _validate_xml_comments(rel_path: str, text: str, require_remarks: bool) -> List[Dict[str, Any]]:
+def _validate_xml_comments(rel_path: str, model: ContractModel, require_remarks: bool) -> List[Dict[str, Any]]:
     issues: List[Dict[str, Any]] = []
-    lines = text.splitlines()
-    for idx, line in enumerate(lines):
-        if not PUBLIC_TYPE_LINE_PATTERN.match(line.strip()):
+    for decl in model.types:
+        if not decl.line_start or len(decl.modifiers) > 1 or not XML_DOC_TYPE_MODIFIERS.issuperset(decl.modifiers):
             continue
-        start = max(0, idx - 12)
-        header = "\n".join(lines[start:idx])
-        if "<summary>" not in header:
+        if not decl.has_summary:
             issues.append(
                 {
                     "file": rel_path,
-                    "line": idx + 1,
+                    "line": decl.line,
                     "code": "xml_summary_missing",
                     "message": "Public contract type is missing XML <summary>.",
                 }
             )
-        if require_remarks and "<remarks>" not in header:
+        if require_remarks and not decl.has_remarks:
             issues.append(
                 {
                     "file": rel_path,
-                    "line": idx + 1,
+                    "line": decl.line,
                     "code": "xml_remarks_missing",
                     "message": "Event contract type is missing XML <remarks>.",
                 }
@@ -228,9 +245,9 @@ def _validate_xml_comments(rel_path: str, text: str, require_remarks: bool) -> L
     return issues
 
 
-def _validate_eventtype_constants(rel_path: str, text: str, event_types_map: Dict[str, str]) -> List[Dict[str, Any]]:
+def _validate_eventtype_constants(rel_path: str, model: ContractModel, event_types_map: Dict[str, str]) -> List[Dict[str, Any]]:
     issues: List[Dict[str, Any]] = []
-    matches = list(EVENTTYPE_CONST_PATTERN.finditer(text))
+    matches = model.consts_named("EventType")
     if rel_path.startswith("Game.Core/Contracts/Events/") and not matches:
         issues.append(
             {
@@ -242,9 +259,9 @@ def _validate_eventtype_constants(rel_path: str, text: str, event_types_map: Dic
         )
         return issues
 
-    for m in matches:
-        rhs = str(m.group(1)).strip()
-        line_no = _line_number_of(text, m.group(0))
+    for const in matches:
+        rhs = const.rhs.strip()
+        line_no = const.line
         literal = re.fullmatch(r"\"([^\"]+)\"", rhs)
         if literal:
             value = literal.group(1)
@@ -259,7 +276,7 @@ def _validate_eventtype_constants(rel_path: str, text: str, event_types_map: Dic
                 )
             continue
 
-        ref = re.fullmatch(r"EventTypes\.([A-Za-z_][A-Za-z0-9_]*)", rhs)
+        ref = EVENT_TYPES_REF_PATTERN.fullmatch(rhs)
         if ref:
             key = ref.group(1)
             if key not in event_types_map:
@@ -295,29 +312,42 @@ def _validate_eventtype_constants(rel_path: str, text: str, event_types_map: Dic
     return issues
 
 
-def _validate_contract_file(rel_path: str, text: str, event_types_map: Dict[str, str]) -> Dict[str, List[Dict[str, Any]]]:
-    has_eventtype_const = "public const string EventType" in text
+def _validate_contract_file(rel_path: str, model: ContractModel, event_types_map: Dict[str, str]) -> Dict[str, List[Dict[str, Any]]]:
+    has_eventtype_const = bool(model.consts_named("EventType"))
     return {
-        "namespace_issues": _validate_namespace(rel_path, text),
-        "bcl_only_issues": _validate_bcl_only(rel_path, text),
-        "xml_comment_issues": _validate_xml_comments(rel_path, text, require_remarks=has_eventtype_const),
-        "eventtype_issues": _validate_eventtype_constants(rel_path, text, event_types_map),
+        "namespace_issues": _validate_namespace(rel_path, model),
+        "bcl_only_issues": _validate_bcl_only(rel_path, model),
+        "xml_comment_issues": _validate_xml_comments(rel_path, model, require_remarks=has_eventtype_const),
+        "eventtype_issues": _validate_eventtype_constants(rel_path, model, event_types_map),
     }
 
 
+def _validate_contract_file_cached(root: Path, rel_path: str, event_types_map: Dict[str, str]) -> Dict[str, List[Dict[str, Any]]]:
+    model = load_contract_model(root / rel_path, root=root, strict=True)
+    # A file only depends on the EventTypes entries it references, so editing EventTypes.cs
+    # re-validates just those files.
+    refs: set[str] = set()
+    for const in model.consts_named("EventType"):
+        ref = EVENT_TYPES_REF_PATTERN.fullmatch(const.rhs.strip())
+        if ref:
+            refs.add(ref.group(1))
+    deps = fingerprint({key: event_types_map.get(key) for key in sorted(refs)}) if refs else "-"
+    return cached_result(
+        root,
+        f"validate:{RULES_VERSION}:{rel_path}:{model.digest}:{deps}",
+        lambda: _validate_contract_file(rel_path, model, event_types_map),
+    )
+
+
 def build_report(root: Path) -> Dict[str, object]:
     overlay_docs = find_overlay_docs(root)
 
     doc_contracts: Dict[str, List[str]] = {}
     for md in overlay_docs:
         rel_doc = _to_posix(md.relative_to(root))
-        doc_contracts[rel_doc] = extract_contract_paths(md)
+        doc_contracts[rel_doc] = extract_contract_paths(md, root=root)
 
-    referenced_contracts: List[str] = []
-    for contracts in doc_contracts.values():
-        for c in contracts:
-            if c not in referenced_contracts:
-                referenced_contracts.append(c)
+    referenced_contracts: List[str] = list(dict.fromkeys(c for contracts in doc_contracts.values() for c in contracts))
 
     all_contracts = find_all_contract_files(root)
     missing_contract_files: List[Dict[str, str]] = []
@@ -329,7 +359,8 @@ def build_report(root: Path) -> Dict[str, object]:
 
     docs_without_contracts = [doc for doc, contracts in doc_contracts.items() if not contracts]
     required_docs_without_contracts = [doc for doc in docs_without_contracts if _is_required_overlay_contract_doc(doc)]
-    contracts_without_docs = [c for c in all_contracts if c not in referenced_contracts]
+    referenced_set = set(referenced_contracts)
+    contracts_without_docs = [c for c in all_contracts if c not in referenced_set]
 
     event_types_map, event_types_file_issues = _extract_event_types_map(root)
 
@@ -339,8 +370,7 @@ def build_report(root: Path) -> Dict[str, object]:
     eventtype_issues: List[Dict[str, Any]] = list(event_types_file_issues)
 
     for rel in all_contracts:
-        text = _read_text(root / rel)
-        result = _validate_contract_file(rel, text, event_types_map)
+        result = _validate_contract_file_cached(root, rel, event_types_map)
         namespace_issues.extend(result["namespace_issues"])
         bcl_only_issues.extend(result["bcl_only_issues"])
         xml_comment_issues.extend(result["xml_comment_issues"])
@@ -393,6 +423,7 @@ def main(argv: list[str] | None = None) -> int:
     root = Path(args.root).resolve()
 
     report = build_report(root)
+    save_contract_cache()
     out_path = write_report(root, report)
 
     print(f"Contracts validation report written to: {out_path}")
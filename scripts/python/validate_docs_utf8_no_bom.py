@@ -19,9 +19,18 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import json
+import sys
 from pathlib import Path
 from typing import Any
 
+try:
+    from _encoding_engine import scan_file
+except ImportError:
+    _SC_DIR = Path(__file__).resolve().parents[1] / "sc"
+    if str(_SC_DIR) not in sys.path:
+        sys.path.insert(0, str(_SC_DIR))
+    from _encoding_engine import scan_file
+
 
 TEXT_EXTENSIONS = {
     ".md",
@@ -112,20 +121,13 @@ def iter_target_files(root: Path, roots: list[str]) -> list[Path]:
 
 
 def check_file(path: Path, root: Path) -> dict[str, Any]:
-    raw = path.read_bytes()
-    rel = normalize_rel(path, root)
-    result = {
-        "path": rel,
-        "utf8_ok": True,
-        "has_bom": raw.startswith(b"\xef\xbb\xbf"),
-        "error": None,
+    scan = scan_file(path)
+    return {
+        "path": normalize_rel(path, root),
+        "utf8_ok": scan.utf8_ok,
+        "has_bom": scan.has_bom,
+        "error": scan.error_detail or None,
     }
-    try:
-        raw.decode("utf-8", errors="strict")
-    except UnicodeDecodeError as exc:
-        result["utf8_ok"] = False
-        result["error"] = f"UnicodeDecodeError: {exc}"
-    return result
 
 
 def validate(root: Path, roots: list[str]) -> dict[str, Any]:
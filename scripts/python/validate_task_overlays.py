@@ -20,80 +20,28 @@ from __future__ import annotations
 import argparse
 import json
 import re
+import sys
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any
 
+PYTHON_DIR = Path(__file__).resolve().parent
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
 
-FRONT_MATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
-OVERLAY_DIR_RE = re.compile(r"^(docs/architecture/overlays/[^/]+/08)/", re.IGNORECASE)
-
-
-def extract_front_matter(content: str) -> Optional[dict[str, Any]]:
-    """Extract a minimal YAML front matter block from a Markdown file."""
-
-    match = FRONT_MATTER_RE.match(content)
-    if not match:
-        return None
-
-    fm_text = match.group(1)
-    result: dict[str, Any] = {
-        "PRD-ID": None,
-        "Title": None,
-        "Status": None,
-        "ADR-Refs": [],
-        "Test-Refs": [],
-    }
-
-    current_key: Optional[str] = None
-    for raw_line in fm_text.split("\n"):
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
+from _front_matter import parse_front_matter, read_head  # noqa: E402
+from _reference_graph import load_reference_graph  # noqa: E402
 
-        if ":" in line and not line.startswith("-"):
-            key, value = line.split(":", 1)
-            key = key.strip()
-            value = value.strip()
-
-            if key in result:
-                current_key = key
-                if value:
-                    if key in {"ADR-Refs", "Test-Refs"}:
-                        result[key] = [value]
-                    else:
-                        result[key] = value
-                else:
-                    result[key] = []
-            else:
-                # Unknown front-matter keys are ignored. Reset the list context so
-                # list items under unknown keys (e.g. Arch-Refs) do not get
-                # mistakenly appended to the previous recognized key.
-                current_key = None
-            continue
-
-        if line.startswith("-") and current_key:
-            value = line[1:].strip()
-            if "#" in value:
-                value = value.split("#", 1)[0].strip()
-            if value:
-                result[current_key].append(value)
 
-    return result
+OVERLAY_DIR_RE = re.compile(r"^(docs/architecture/overlays/[^/]+/08)/", re.IGNORECASE)
+# From this many distinct overlay refs on, they are checked in a thread pool (the work is mostly file I/O).
+OVERLAY_POOL_MIN = 16
+OVERLAY_POOL_WORKERS = 8
 
 
 def collect_adr_ids(root: Path) -> set[str]:
     """Collect existing ADR ids under docs/adr."""
 
-    adr_dir = root / "docs" / "adr"
-    ids: set[str] = set()
-    if not adr_dir.exists():
-        return ids
-
-    for file_path in adr_dir.glob("ADR-*.md"):
-        match = re.match(r"ADR-(\d{4})", file_path.stem)
-        if match:
-            ids.add(f"ADR-{match.group(1)}")
-    return ids
+    return load_reference_graph(root).adr_ids()
 
 
 def validate_acceptance_checklist(checklist_path: Path, adr_ids: set[str]) -> list[str]:
@@ -105,11 +53,14 @@ def validate_acceptance_checklist(checklist_path: Path, adr_ids: set[str]) -> li
         return [f"File not found: {checklist_path}"]
 
     try:
-        content = checklist_path.read_text(encoding="utf-8")
+        with checklist_path.open(encoding="utf-8") as handle:
+            # Only the head is needed to reject a checklist without front matter.
+            head = read_head(handle)
+            fm = parse_front_matter(head)
+            content = head + handle.read() if fm else head
     except Exception as exc:  # noqa: BLE001
         return [f"Failed to read file: {exc}"]
 
-    fm = extract_front_matter(content)
     if not fm:
         return ["Missing YAML front matter block (--- ... ---)."]
 
@@ -179,9 +130,52 @@ def _task_matches_id(task: dict[str, Any], task_file: Path, task_id: str) -> boo
     return False
 
 
-def validate_task_file(root: Path, task_file: Path, label: str, adr_ids: set[str], task_id: str | None = None) -> tuple[int, int]:
+def _task_overlays(task: dict[str, Any]) -> list[Any]:
+    overlay_refs = task.get("overlay_refs")
+    if overlay_refs:
+        return overlay_refs if isinstance(overlay_refs, list) else [overlay_refs]
+    overlay = task.get("overlay")
+    return [overlay] if overlay else []
+
+
+def _validate_overlay(full_path: Path, adr_ids: set[str]) -> list[str] | None:
+    """None when the overlay file is missing, else its validation errors (only checklists have any)."""
+
+    if not full_path.exists():
+        return None
+    if full_path.name == "ACCEPTANCE_CHECKLIST.md":
+        return validate_acceptance_checklist(full_path, adr_ids)
+    return []
+
+
+def validate_overlays(root: Path, refs: list[str], adr_ids: set[str], results: dict[str, list[str] | None]) -> None:
+    """Fill ``results`` (keyed by overlay ref as written) for the refs not validated yet, each once."""
+
+    pending = [ref for ref in dict.fromkeys(refs) if ref not in results]
+    if len(pending) < OVERLAY_POOL_MIN:
+        for ref in pending:
+            results[ref] = _validate_overlay(root / ref, adr_ids)
+        return
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(OVERLAY_POOL_WORKERS, len(pending))) as pool:
+        for ref, result in zip(pending, pool.map(lambda item: _validate_overlay(root / item, adr_ids), pending)):
+            results[ref] = result
+
+
+def validate_task_file(
+    root: Path,
+    task_file: Path,
+    label: str,
+    adr_ids: set[str],
+    task_id: str | None = None,
+    overlay_results: dict[str, list[str] | None] | None = None,
+) -> tuple[int, int]:
     """Validate overlay references for a single task file.
 
+    Each distinct overlay ref is validated once, however many tasks use it; pass the same
+    ``overlay_results`` dict for several task files of one root to share the results.
+
     Returns: (tasks_with_overlays, tasks_passed)
     """
 
@@ -199,16 +193,15 @@ def validate_task_file(root: Path, task_file: Path, label: str, adr_ids: set[str
     tasks_with_overlays = 0
     passed = 0
     forced_errors: list[str] = []
+    results = {} if overlay_results is None else overlay_results
+    tasks = sorted(tasks, key=lambda x: str(x.get("id", "")))
+    validate_overlays(root, [str(path) for task in tasks for path in _task_overlays(task)], adr_ids, results)
 
-    for task in sorted(tasks, key=lambda x: str(x.get("id", ""))):
+    for task in tasks:
         tid = task.get("id")
 
         overlay_refs = task.get("overlay_refs")
-        if overlay_refs:
-            overlays = overlay_refs if isinstance(overlay_refs, list) else [overlay_refs]
-        else:
-            overlay = task.get("overlay")
-            overlays = [overlay] if overlay else []
+        overlays = _task_overlays(task)
 
         # Backlog view policy (tasks_back.json):
         # tasks_back is the "governance/acceptance/contracts" view. Every task must be anchored to
@@ -262,21 +255,16 @@ def validate_task_file(root: Path, task_file: Path, label: str, adr_ids: set[str
 
         task_ok = True
         for overlay_path in overlays:
-            full_path = root / str(overlay_path)
-            if not full_path.exists():
+            errors = results[str(overlay_path)]
+            if errors is None:
                 print(f"  ERROR: overlay file does not exist: {overlay_path}")
                 task_ok = False
-                continue
-
-            if full_path.name == "ACCEPTANCE_CHECKLIST.md":
-                errors = validate_acceptance_checklist(full_path, adr_ids)
-                if errors:
-                    print("  ERROR: ACCEPTANCE_CHECKLIST.md validation failed:")
-                    for err in errors:
-                        print(f"    - {err}")
-                    task_ok = False
-                else:
-                    print(f"  overlay OK: {overlay_path}")
+            elif errors:
+                # Only ACCEPTANCE_CHECKLIST.md files carry validation errors.
+                print("  ERROR: ACCEPTANCE_CHECKLIST.md validation failed:")
+                for err in errors:
+                    print(f"    - {err}")
+                task_ok = False
             else:
                 print(f"  overlay OK: {overlay_path}")
 
@@ -337,8 +325,11 @@ def main() -> int:
 
     total_checked = 0
     total_passed = 0
+    overlay_results: dict[str, list[str] | None] = {}
     for task_file in task_files:
-        checked, passed = validate_task_file(root, task_file, task_file.name, adr_ids, task_id=args.task_id)
+        checked, passed = validate_task_file(
+            root, task_file, task_file.name, adr_ids, task_id=args.task_id, overlay_results=overlay_results
+        )
         total_checked += checked
         total_passed += passed
 
@@ -5,7 +5,7 @@ import json
 import re
 from typing import Any
 
-from _util import repo_root, run_cmd
+from _git_snapshot import git_snapshot
 
 
 _STATUS_PREFIX_RE = re.compile(r"^[ MARCUD?!]{1,2}\s+")
@@ -158,7 +158,7 @@ def _git_diff_paths(previous_head: str, current_head: str) -> tuple[list[str], s
     cur = str(current_head or "").strip()
     if not prev or not cur or prev == cur:
         return [], None
-    rc, out = run_cmd(["git", "diff", "--name-only", f"{prev}..{cur}"], cwd=repo_root(), timeout_sec=60)
+    rc, out = git_snapshot().git(["git", "diff", "--name-only", f"{prev}..{cur}"], timeout_sec=60)
     if rc != 0:
         return [], f"git_diff_failed:{prev}..{cur}"
     return [_normalize_path(line) for line in out.splitlines() if _normalize_path(line)], None
@@ -0,0 +1,273 @@
+"""Relevance-ranked packing of diff hunks into an llm_review prompt budget.
+
+A full diff that does not fit used to be cut at a fixed size or replaced by a names-only summary,
+which drops exactly the hunks a reviewer needs. pack_diff_sections() parses the raw diffs into
+hunks, scores each hunk for one reviewer (task refs it touches, the reviewer's interest in the
+file category from _marathon_policy, change size), greedily keeps the best hunks that fit the
+budget and replaces every other hunk with a one-line stub, so the reviewer still sees what was
+left out. Kept hunks are rendered in their original diff order.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from _marathon_policy import _category_for_path
+
+
+_HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+_DIFF_GIT_RE = re.compile(r"^diff --git a/(.+?) b/(.+)$")
+
+# How much each reviewer cares about a file category (see _marathon_policy._category_for_path).
+AGENT_CATEGORY_WEIGHTS: dict[str, dict[str, float]] = {
+    "architect-reviewer": {"core-contracts": 3.0, "core": 2.0, "solution": 2.0, "godot-runtime": 1.5, "docs": 1.0, "scripts": 1.0},
+    "code-reviewer": {"core": 2.5, "godot-runtime": 2.5, "scripts": 2.0, "core-contracts": 2.0, "core-tests": 1.0, "godot-tests": 1.0},
+    "security-auditor": {"ci": 3.0, "core": 2.5, "godot-runtime": 2.5, "scripts": 2.0, "solution": 1.5, "core-contracts": 1.0},
+    "test-automator": {"core-tests": 3.0, "godot-tests": 3.0, "core": 1.5, "godot-runtime": 1.5, "core-contracts": 1.0},
+    "semantic-equivalence-auditor": {"core": 2.5, "core-contracts": 2.5, "godot-runtime": 2.5, "core-tests": 1.5, "godot-tests": 1.5, "tasking": 1.0},
+}
+DEFAULT_CATEGORY_WEIGHTS: dict[str, float] = {"core": 2.0, "core-contracts": 2.0, "godot-runtime": 2.0, "scripts": 1.5, "core-tests": 1.0, "godot-tests": 1.0}
+REF_EXACT_SCORE = 6.0
+REF_RELATED_SCORE = 3.0
+MAX_SIZE_SCORE = 3.0
+MAX_STUB_LINES = 200
+
+
+@dataclass(frozen=True)
+class DiffHunk:
+    section: str
+    index: int
+    path: str
+    file_header: str
+    header: str
+    text: str
+    added: int
+    deleted: int
+
+    def stub(self) -> str:
+        header = self.header or "(file header only)"
+        return f"- {self.path} {header} (+{self.added}/-{self.deleted})"
+
+
+def parse_unified_diff(text: str, *, section: str = "") -> list[DiffHunk]:
+    """Split `git diff` / `git show` output into hunks; a file without hunks (binary, mode-only) is one hunk."""
+    hunks: list[DiffHunk] = []
+    path = ""
+    file_header: list[str] = []
+    file_has_hunks = False
+    current: list[str] | None = None
+
+    def _flush_hunk() -> None:
+        nonlocal current
+        if current is None:
+            return
+        body = current[1:]
+        match = _HUNK_HEADER_RE.match(current[0])
+        hunks.append(
+            DiffHunk(
+                section=section,
+                index=len(hunks),
+                path=path,
+                file_header="\n".join(file_header),
+                header=match.group(0) if match else current[0],
+                text="\n".join(current),
+                added=sum(1 for line in body if line.startswith("+")),
+                deleted=sum(1 for line in body if line.startswith("-")),
+            )
+        )
+        current = None
+
+    def _flush_file() -> None:
+        if path and not file_has_hunks:
+            hunks.append(DiffHunk(section=section, index=len(hunks), path=path, file_header="\n".join(file_header), header="", text="", added=0, deleted=0))
+
+    for line in text.splitlines():
+        match = _DIFF_GIT_RE.match(line)
+        if match:
+            _flush_hunk()
+            _flush_file()
+            path, file_header, file_has_hunks = match.group(2), [line], False
+            continue
+        if line.startswith("@@ ") and path:
+            _flush_hunk()
+            current = [line]
+            file_has_hunks = True
+            continue
+        if current is not None:
+            current.append(line)
+        elif path:
+            file_header.append(line)
+        # Anything before the first "diff --git" (the commit message of `git show`) is not a hunk.
+    _flush_hunk()
+    _flush_file()
+    return hunks
+
+
+def _normalize_ref(ref: str) -> str:
+    text = str(ref or "").replace("\\", "/").strip().strip("`").strip()
+    return text[2:] if text.startswith("./") else text
+
+
+def collect_review_ref_paths(triplet: Any) -> list[str]:
+    """Task refs a reviewer should see first: acceptance/test refs, contract refs and overlay refs."""
+    if triplet is None:
+        return []
+    from _acceptance_task_requirements import collect_task_refs
+
+    refs: list[str] = list(collect_task_refs(triplet))
+    for entry in (getattr(triplet, "master", None), getattr(triplet, "back", None), getattr(triplet, "gameplay", None)):
+        if not isinstance(entry, dict):
+            continue
+        for key in ("contractRefs", "contract_refs", "overlay_refs", "archRefs"):
+            value = entry.get(key)
+            if isinstance(value, list):
+                refs.extend(str(item) for item in value)
+        if str(entry.get("overlay") or "").strip():
+            refs.append(str(entry.get("overlay")))
+    seen: set[str] = set()
+    out: list[str] = []
+    for ref in refs:
+        normalized = _normalize_ref(ref)
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            out.append(normalized)
+    return out
+
+
+def _ref_score(path: str, ref_paths: list[str]) -> float:
+    lower = path.lower()
+    stem = lower.rsplit("/", 1)[-1].rsplit(".", 1)[0]
+    best = 0.0
+    for ref in ref_paths:
+        ref_lower = ref.lower()
+        if ref_lower == lower or lower.endswith("/" + ref_lower) or ref_lower.endswith("/" + lower):
+            return REF_EXACT_SCORE
+        ref_stem = ref_lower.rsplit("/", 1)[-1].rsplit(".", 1)[0]
+        ref_dir = ref_lower.rsplit("/", 1)[0] if "/" in ref_lower else ""
+        # Tests named after the code they cover (FooTests.cs <-> Foo.cs), or a file next to a ref.
+        if stem and ref_stem and len(stem) >= 4 and (stem in ref_stem or ref_stem in stem):
+            best = max(best, REF_RELATED_SCORE)
+        elif ref_dir and lower.startswith(ref_dir + "/"):
+            best = max(best, REF_RELATED_SCORE / 2)
+    return best
+
+
+def score_hunk(hunk: DiffHunk, *, agent: str, ref_paths: list[str]) -> float:
+    weights = AGENT_CATEGORY_WEIGHTS.get(agent, DEFAULT_CATEGORY_WEIGHTS)
+    changed = hunk.added + hunk.deleted
+    size_score = min(MAX_SIZE_SCORE, math.log2(1 + changed) / 2) if changed else 0.0
+    return round(_ref_score(hunk.path, ref_paths) + weights.get(_category_for_path(hunk.path), 0.0) + size_score, 3)
+
+
+def _render_packed(
+    hunks: list[DiffHunk],
+    included: set[tuple[str, int]],
+    section_order: list[str],
+    text_blocks: list[str],
+    *,
+    agent: str,
+) -> str:
+    blocks: list[str] = []
+    stubs: list[str] = []
+    for title in section_order:
+        lines: list[str] = []
+        last_header: str | None = None
+        for hunk in hunks:
+            if hunk.section != title:
+                continue
+            if (hunk.section, hunk.index) not in included:
+                stubs.append(hunk.stub())
+                continue
+            if hunk.file_header != last_header:
+                lines.append(hunk.file_header)
+                last_header = hunk.file_header
+            if hunk.text:
+                lines.append(hunk.text)
+        if lines:
+            blocks.append(f"{title}\n```diff\n" + "\n".join(lines) + "\n```")
+    blocks.extend(text_blocks)
+    if stubs:
+        shown = stubs[:MAX_STUB_LINES]
+        if len(stubs) > len(shown):
+            shown.append(f"- ... {len(stubs) - len(shown)} more hunks omitted")
+        blocks.append(f"## Omitted hunks ({len(stubs)}, ranked lower for {agent})\n" + "\n".join(shown))
+    return "\n\n".join(blocks) if blocks else "## Diff\n(no changes detected)\n"
+
+
+def pack_diff_sections(
+    sections: list[tuple[str, str, str]],
+    *,
+    budget_chars: int,
+    agent: str,
+    ref_paths: list[str],
+) -> tuple[str, dict[str, Any]]:
+    """Pack ``(title, kind, text)`` sections (kind "diff" or "text") into at most ``budget_chars``.
+
+    "text" sections (untracked file lists) are kept verbatim; "diff" sections are packed hunk by hunk.
+    """
+    hunks: list[DiffHunk] = []
+    text_blocks: list[str] = []
+    section_order: list[str] = []
+    for title, kind, text in sections:
+        if kind == "diff":
+            section_order.append(title)
+            hunks.extend(parse_unified_diff(text, section=title))
+        elif str(text or "").strip():
+            text_blocks.append(f"{title}\n```\n{text.strip()}\n```")
+    scores = {(hunk.section, hunk.index): score_hunk(hunk, agent=agent, ref_paths=ref_paths) for hunk in hunks}
+
+    fixed_chars = sum(len(block) + 2 for block in text_blocks)
+    fixed_chars += sum(len(title) + 16 for title in section_order) + len(agent) + 80
+    stub_chars = {(hunk.section, hunk.index): len(hunk.stub()) + 1 for hunk in hunks}
+    if len(hunks) <= MAX_STUB_LINES:
+        # Every stub is listed, so a kept hunk gives its stub line back.
+        stub_reserve, credit_stubs = sum(stub_chars.values()), True
+    else:
+        # Only the first MAX_STUB_LINES stubs are listed; which ones depends on what is kept, so
+        # reserve the longest possible listing and never give it back.
+        stub_reserve = sum(sorted(stub_chars.values(), reverse=True)[:MAX_STUB_LINES]) + 48
+        credit_stubs = False
+    used = fixed_chars + stub_reserve
+    included: set[tuple[str, int]] = set()
+    headers_paid: set[tuple[str, str]] = set()
+    for hunk in sorted(hunks, key=lambda item: (-scores[(item.section, item.index)], item.section, item.index)):
+        key = (hunk.section, hunk.index)
+        header_key = (hunk.section, hunk.path + "\0" + hunk.file_header)
+        cost = len(hunk.text) + 1 - (stub_chars[key] if credit_stubs else 0)
+        if header_key not in headers_paid:
+            cost += len(hunk.file_header) + 1
+        if used + cost > budget_chars:
+            continue
+        used += cost
+        included.add(key)
+        headers_paid.add(header_key)
+
+    packed = _render_packed(hunks, included, section_order, text_blocks, agent=agent)
+    # The estimate above is an upper bound; this only guards against it drifting from the renderer.
+    for hunk in sorted(hunks, key=lambda item: (scores[(item.section, item.index)], item.section, -item.index)):
+        if len(packed) <= budget_chars:
+            break
+        if (hunk.section, hunk.index) in included:
+            included.discard((hunk.section, hunk.index))
+            packed = _render_packed(hunks, included, section_order, text_blocks, agent=agent)
+
+    meta: dict[str, Any] = {
+        "agent": agent,
+        "budget_chars": int(budget_chars),
+        "packed_chars": len(packed),
+        "hunks_total": len(hunks),
+        "hunks_included": len(included),
+        "hunks_stubbed": len(hunks) - len(included),
+        "files_total": len({hunk.path for hunk in hunks}),
+        "ref_paths": len(ref_paths),
+        "ref_hunks_included": sum(1 for hunk in hunks if (hunk.section, hunk.index) in included and _ref_score(hunk.path, ref_paths) > 0),
+        "top_included": [
+            {"path": hunk.path, "header": hunk.header, "score": scores[(hunk.section, hunk.index)]}
+            for hunk in sorted(hunks, key=lambda item: -scores[(item.section, item.index)])
+            if (hunk.section, hunk.index) in included
+        ][:20],
+    }
+    return packed, meta
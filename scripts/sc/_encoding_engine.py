@@ -0,0 +1,485 @@
+"""Single-pass encoding and garbled-text engine shared by the encoding scanners.
+
+The encoding gates (check_encoding, check_docs_utf8_integrity, validate_docs_utf8_no_bom,
+encoding_hard_gate, scan_garbled, the task-text garbled gate, ...) used to walk, read and decode
+every file on their own and each ran its own regex list over the text. scan_file() reads a file
+once and answers every heuristic they use:
+
+- byte-level fast path: BOM sniff and ``bytes.isascii()``. Pure-ASCII files skip the strict
+  UTF-8 decode and every rule that needs a non-ASCII character; CJK characters are counted on
+  the raw bytes;
+- every rule in RULES is compiled into one trigger search plus one lookahead pass, which yields
+  the same counts, samples and hit lines as running each rule's own ``findall``;
+- results are cached by content hash, in process and in logs/ci/.encoding-cache/scan-cache.json,
+  so an unchanged file costs one read and one hash on the next run, whichever scanner asks.
+
+The scripts stay report formatters: each picks the rule names it has always reported and keeps
+its own output layout. SC_ENCODING_CACHE=off disables the cache; any other non-empty value is
+used as the cache file path.
+"""
+
+from __future__ import annotations
+
+import atexit
+import bisect
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+
+from _util import repo_root
+
+
+UTF8_BOM = b"\xef\xbb\xbf"
+CACHE_ENV = "SC_ENCODING_CACHE"
+CACHE_MAX_ENTRIES = 50000
+MAX_SAMPLES = 5
+MAX_LINES = 8
+LINE_WIDTH = 400
+PREVIEW_CHARS = 180
+
+EMOJI_VS16 = 0xFE0F
+# Basic emoji/symbol ranges (not exhaustive; intended for policy enforcement).
+EMOJI_RANGES: list[tuple[int, int]] = [
+    (0x1F300, 0x1F5FF),
+    (0x1F600, 0x1F64F),
+    (0x1F680, 0x1F6FF),
+    (0x1F700, 0x1F77F),
+    (0x1F780, 0x1F7FF),
+    (0x1F800, 0x1F8FF),
+    (0x1F900, 0x1F9FF),
+    (0x1FA00, 0x1FAFF),
+    (0x2600, 0x26FF),
+    (0x2700, 0x27BF),
+]
+
+# Potentially-garbled CJK glyphs; only the ratio check of check_docs_utf8_integrity uses them.
+MOJIBAKE_GLYPHS = "鈥銆鍙鍔鎴浠绗鏂寮缁瀛闂閿璇锛鍚璁鍙"
+DOC_MOJIBAKE_TOKENS: tuple[str, ...] = ("锟斤拷", "茂禄驴", "闂侀柣閻熼崡閳", "芒鈧", "Ã", "Â", "Ð", "Ñ")
+TASK_TEXT_TOKENS: tuple[str, ...] = ("\uFFFD", "Ã", "Â", "Ð", "Ñ", "æ", "å", "ç", "â€™", "â€œ", "â€", "ðŸ")
+
+_MOJIBAKE_CHARS = "闁閻鐟鍗鈧缂濞閸鎮绱锛绗閿鍊鎯缁婵"
+_CLUSTER_CHARS = "闂侀柣閻熼崡閳х紓婵為柛閹\ue1be槐閿涚粭闁块崐閹\ue21c紒濠礭"
+_REPAIR_CHARS = "闁鐟閻濡缂婵鐜鍑"
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    pattern: str
+    triggers: str  # character-class body: every match contains at least one of these characters
+    ascii_ok: bool = False  # the rule can match pure-ASCII text
+
+
+def _emoji_class() -> str:
+    return "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in EMOJI_RANGES) + chr(EMOJI_VS16)
+
+
+def token_rule_name(token: str) -> str:
+    return f"token:{token}"
+
+
+def _token_rules(tokens: Iterable[str]) -> list[Rule]:
+    rules: list[Rule] = []
+    for token in dict.fromkeys(tokens):
+        rules.append(Rule(token_rule_name(token), re.escape(token), re.escape(token[0])))
+    return rules
+
+
+RULES: tuple[Rule, ...] = (
+    Rule("fffd", "\uFFFD", "\uFFFD"),
+    Rule("control_chars", r"[\x00-\x08\x0B\x0C\x0E-\x1F]", r"\x00-\x08\x0B\x0C\x0E-\x1F", ascii_ok=True),
+    Rule("multi_question_marks", r"\?{3,}", "?", ascii_ok=True),
+    Rule("cjk_broken_by_question_mark", r"[\u4e00-\u9fff]\?[\u4e00-\u9fff]", "?"),
+    Rule("cjk_mojibake_char", f"[{_MOJIBAKE_CHARS}锟斤拷]", f"{_MOJIBAKE_CHARS}锟斤拷"),
+    Rule("garbled_char", f"[{_MOJIBAKE_CHARS}]", _MOJIBAKE_CHARS),
+    Rule("cjk_mojibake_cluster", f"[{_CLUSTER_CHARS}]{{2,}}", _CLUSTER_CHARS),
+    Rule("repair_garbled_run", f"[{_REPAIR_CHARS}]+", _REPAIR_CHARS),
+    Rule("cp1252_punct", "(?:â€™|â€œ|â€�|â€”|â€˜|â€¢|â€¦|â„¢)", "â"),
+    Rule("cp1252_mojibake", "â[€™œž“”–—]", "â"),
+    Rule("latin1_utf8_mix", "(?:Ã.|Â.|â€™|â€œ|â€|ï»¿)", "ÃÂâï"),
+    Rule("bom_as_text", "ï»¿", "ï"),
+    Rule("gbk_token", "锟斤拷", "锟"),
+    Rule("emoji", f"[{_emoji_class()}]", _emoji_class()),
+    *_token_rules(DOC_MOJIBAKE_TOKENS + TASK_TEXT_TOKENS),
+)
+RULES_BY_NAME: dict[str, Rule] = {rule.name: rule for rule in RULES}
+# Largest distance between a match start and its first trigger (cjk_broken_by_question_mark).
+_TRIGGER_LEAD = 1
+
+ENGINE_VERSION = hashlib.blake2b(
+    "\n".join(
+        [f"{rule.name}={rule.pattern}" for rule in RULES]
+        + [MOJIBAKE_GLYPHS, f"{MAX_SAMPLES}/{MAX_LINES}/{LINE_WIDTH}/{PREVIEW_CHARS}"]
+    ).encode("utf-8"),
+    digest_size=6,
+).hexdigest()
+
+_CJK_LEAD_BYTES = bytes(range(0xE5, 0xEA))  # U+5000..U+9FFF
+_CJK_E4_RE = re.compile(rb"\xe4[\xb8-\xbf]")  # U+4E00..U+4FFF
+_GLYPH_SET = frozenset(MOJIBAKE_GLYPHS)
+
+
+@dataclass(frozen=True)
+class RuleHits:
+    count: int
+    samples: tuple[str, ...] = ()
+    line_count: int = 0
+    lines: tuple[tuple[int, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class EncodingScan:
+    path: str
+    digest: str = ""
+    size: int = 0
+    has_bom: bool = False
+    ascii_only: bool = False
+    utf8_ok: bool = False
+    error: str | None = None
+    error_type: str = ""
+    hits: dict[str, RuleHits] = field(default_factory=dict)
+    cjk_chars: int = 0
+    glyph_chars: int = 0
+    preview: str = ""
+    cached: bool = False
+
+    @property
+    def error_detail(self) -> str:
+        return f"{self.error_type}: {self.error}" if self.error is not None else ""
+
+    @property
+    def decode_failed(self) -> bool:
+        return self.error_type == "UnicodeDecodeError"
+
+    def rule_hits(self, rule: str) -> RuleHits | None:
+        if rule not in RULES_BY_NAME:
+            raise KeyError(f"unknown encoding rule: {rule}")
+        return self.hits.get(rule)
+
+    def count(self, rule: str) -> int:
+        hits = self.rule_hits(rule)
+        return hits.count if hits else 0
+
+
+class _RuleSet:
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        self.rules = tuple(rules)
+        self.trigger = re.compile("[" + "".join(rule.triggers for rule in self.rules) + "]")
+        gate = "|".join(f"(?:{rule.pattern})" for rule in self.rules)
+        captures = "".join(f"(?:(?=(?P<r{idx}>{rule.pattern}))|)" for idx, rule in enumerate(self.rules))
+        # Zero-width matches only where at least one rule matches; each rule's lookahead records its own span.
+        self.combined = re.compile(f"(?=(?:{gate})){captures}")
+
+    def match(self, text: str) -> dict[str, RuleHits]:
+        first = self.trigger.search(text)
+        if first is None:
+            return {}
+        spans: dict[int, list[tuple[int, int]]] = {}
+        next_ok = [0] * len(self.rules)
+        for match in self.combined.finditer(text, max(0, first.start() - _TRIGGER_LEAD)):
+            for idx in range(len(self.rules)):
+                start, end = match.span(idx + 1)
+                # Keep findall semantics: a rule's next match starts at or after the end of its previous one.
+                if start < 0 or start < next_ok[idx]:
+                    continue
+                next_ok[idx] = end
+                spans.setdefault(idx, []).append((start, end))
+        if not spans:
+            return {}
+
+        kept = text.splitlines(keepends=True)
+        lines = text.splitlines()
+        starts = [0]
+        for chunk in kept:
+            starts.append(starts[-1] + len(chunk))
+        out: dict[str, RuleHits] = {}
+        for idx, rule_spans in sorted(spans.items()):
+            samples: list[str] = []
+            line_numbers: list[int] = []
+            for start, end in rule_spans:
+                value = text[start:end]
+                if len(samples) < MAX_SAMPLES and value not in samples:
+                    samples.append(value)
+                line_no = bisect.bisect_right(starts, start)
+                if not line_numbers or line_numbers[-1] != line_no:
+                    line_numbers.append(line_no)
+            out[self.rules[idx].name] = RuleHits(
+                count=len(rule_spans),
+                samples=tuple(samples),
+                line_count=len(line_numbers),
+                lines=tuple((no, lines[no - 1][:LINE_WIDTH]) for no in line_numbers[:MAX_LINES]),
+            )
+        return out
+
+
+_ALL_RULES = _RuleSet(RULES)
+_ASCII_RULES = _RuleSet(rule for rule in RULES if rule.ascii_ok)
+
+
+@lru_cache(maxsize=32)
+def _rule_subset(names: tuple[str, ...]) -> _RuleSet:
+    missing = [name for name in names if name not in RULES_BY_NAME]
+    if missing:
+        raise KeyError(f"unknown encoding rule: {', '.join(missing)}")
+    return _RuleSet(RULES_BY_NAME[name] for name in names)
+
+
+def text_hits(text: str, rules: Iterable[str] | None = None) -> dict[str, RuleHits]:
+    """Run the rules (default: all) over an in-memory string, e.g. a task field."""
+    if rules is not None:
+        return _rule_subset(tuple(rules)).match(str(text or ""))
+    value = str(text or "")
+    return (_ASCII_RULES if value.isascii() else _ALL_RULES).match(value)
+
+
+def _preview(text: str) -> str:
+    line = text[: PREVIEW_CHARS * 16].replace("\n", " ").strip()
+    if len(line) <= PREVIEW_CHARS:
+        return line
+    return line[: PREVIEW_CHARS - 3] + "..."
+
+
+def _count_cjk(raw: bytes) -> int:
+    # Valid UTF-8 only: lead bytes E5..E9 never occur as continuation bytes.
+    return len(raw) - len(raw.translate(None, _CJK_LEAD_BYTES)) + len(_CJK_E4_RE.findall(raw))
+
+
+# ---------------------------------------------------------------------------
+# Content-hash cache
+# ---------------------------------------------------------------------------
+
+_LOCK = threading.Lock()
+_MEMO: dict[str, dict[str, Any]] = {}
+_NEW: dict[str, dict[str, Any]] = {}
+_LOADED_FROM: Path | None = None
+_ATEXIT_REGISTERED = False
+_STATS: dict[str, int] = {}
+
+
+def _reset_stats() -> None:
+    _STATS.clear()
+    _STATS.update({"files": 0, "bytes_read": 0, "cache_hits": 0, "ascii_fast_path": 0, "strict_decodes": 0, "flagged": 0, "read_errors": 0})
+
+
+_reset_stats()
+
+
+def cache_path(root: Path | None = None) -> Path | None:
+    value = str(os.environ.get(CACHE_ENV) or "").strip()
+    if value.lower() == "off":
+        return None
+    if value:
+        return Path(value)
+    return (root or repo_root()) / "logs" / "ci" / ".encoding-cache" / "scan-cache.json"
+
+
+def _read_cache_file(path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != ENGINE_VERSION:
+        return {}
+    entries = payload.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _cache_get(digest: str) -> dict[str, Any] | None:
+    global _LOADED_FROM
+    path = cache_path()
+    if path is None:
+        return None
+    with _LOCK:
+        if _LOADED_FROM != path:
+            _MEMO.clear()
+            _MEMO.update(_read_cache_file(path))
+            _NEW.clear()
+            _LOADED_FROM = path
+        return _MEMO.get(digest)
+
+
+def _cache_put(digest: str, payload: dict[str, Any]) -> None:
+    global _ATEXIT_REGISTERED
+    if cache_path() is None:
+        return
+    with _LOCK:
+        _MEMO[digest] = payload
+        _NEW[digest] = payload
+        if not _ATEXIT_REGISTERED:
+            atexit.register(save_scan_cache)
+            _ATEXIT_REGISTERED = True
+
+
+def save_scan_cache() -> Path | None:
+    """Merge this process's new results into the cache file (called at exit; safe to call early)."""
+    path = cache_path()
+    with _LOCK:
+        if path is None or path != _LOADED_FROM or not _NEW:
+            return None
+        merged = _read_cache_file(path)
+        merged.update(_NEW)
+        if len(merged) > CACHE_MAX_ENTRIES:
+            merged = dict(list(merged.items())[-CACHE_MAX_ENTRIES:])
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": ENGINE_VERSION, "entries": merged}, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            return None
+        _NEW.clear()
+        return path
+
+
+def reset_encoding_engine() -> None:
+    """Forget the in-process cache and counters (tests, long-lived processes)."""
+    global _LOADED_FROM
+    with _LOCK:
+        _MEMO.clear()
+        _NEW.clear()
+        _LOADED_FROM = None
+        _reset_stats()
+
+
+def engine_stats() -> dict[str, Any]:
+    with _LOCK:
+        stats: dict[str, Any] = dict(_STATS)
+    path = cache_path()
+    stats["cache"] = str(path).replace("\\", "/") if path else "off"
+    stats["version"] = ENGINE_VERSION
+    return stats
+
+
+def _count_stat(key: str, amount: int = 1) -> None:
+    with _LOCK:
+        _STATS[key] = _STATS.get(key, 0) + amount
+
+
+def _to_payload(scan: EncodingScan) -> dict[str, Any]:
+    return {
+        "size": scan.size,
+        "has_bom": scan.has_bom,
+        "ascii_only": scan.ascii_only,
+        "utf8_ok": scan.utf8_ok,
+        "error": scan.error,
+        "error_type": scan.error_type,
+        "hits": {name: [h.count, list(h.samples), h.line_count, [list(x) for x in h.lines]] for name, h in scan.hits.items()},
+        "cjk_chars": scan.cjk_chars,
+        "glyph_chars": scan.glyph_chars,
+        "preview": scan.preview,
+    }
+
+
+def _from_payload(path: str, digest: str, payload: dict[str, Any]) -> EncodingScan:
+    hits: dict[str, RuleHits] = {}
+    for name, (count, samples, line_count, lines) in (payload.get("hits") or {}).items():
+        hits[name] = RuleHits(int(count), tuple(samples), int(line_count), tuple((int(no), str(text)) for no, text in lines))
+    return EncodingScan(
+        path=path,
+        digest=digest,
+        size=int(payload.get("size") or 0),
+        has_bom=bool(payload.get("has_bom")),
+        ascii_only=bool(payload.get("ascii_only")),
+        utf8_ok=bool(payload.get("utf8_ok")),
+        error=payload.get("error"),
+        error_type=str(payload.get("error_type") or ""),
+        hits=hits,
+        cjk_chars=int(payload.get("cjk_chars") or 0),
+        glyph_chars=int(payload.get("glyph_chars") or 0),
+        preview=str(payload.get("preview") or ""),
+        cached=True,
+    )
+
+
+# ---------------------------------------------------------------------------
+# File scanning
+# ---------------------------------------------------------------------------
+
+
+def _decode(raw: bytes) -> tuple[str | None, bool, UnicodeDecodeError | None]:
+    body = raw[len(UTF8_BOM):] if raw.startswith(UTF8_BOM) else raw
+    if body.isascii():
+        prefix = "\ufeff" if len(body) != len(raw) else ""
+        return prefix + body.decode("ascii"), True, None
+    try:
+        return raw.decode("utf-8", errors="strict"), False, None
+    except UnicodeDecodeError as exc:
+        return None, False, exc
+
+
+def _scan_raw(path: str, raw: bytes, *, want_text: bool) -> tuple[EncodingScan, str | None]:
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    cached = _cache_get(digest)
+    if cached is not None:
+        _count_stat("cache_hits")
+        scan = _from_payload(path, digest, cached)
+        text = _decode(raw)[0] if want_text and scan.utf8_ok else None
+        return scan, text
+
+    text, ascii_only, exc = _decode(raw)
+    has_bom = raw.startswith(UTF8_BOM)
+    _count_stat("ascii_fast_path" if ascii_only else "strict_decodes")
+    if text is None:
+        scan = EncodingScan(path=path, digest=digest, size=len(raw), has_bom=has_bom, error=str(exc), error_type="UnicodeDecodeError")
+    else:
+        hits = (_ASCII_RULES if ascii_only else _ALL_RULES).match(text)
+        if hits:
+            _count_stat("flagged")
+        cjk_chars = 0 if ascii_only else _count_cjk(raw)
+        glyph_chars = sum(text.count(ch) for ch in _GLYPH_SET) if cjk_chars else 0
+        scan = EncodingScan(
+            path=path,
+            digest=digest,
+            size=len(raw),
+            has_bom=has_bom,
+            ascii_only=ascii_only,
+            utf8_ok=True,
+            hits=hits,
+            cjk_chars=cjk_chars,
+            glyph_chars=glyph_chars,
+            preview=_preview(text) if hits or glyph_chars else "",
+        )
+    _cache_put(digest, _to_payload(scan))
+    return scan, text
+
+
+def _read(path: str | Path) -> tuple[bytes | None, EncodingScan | None]:
+    _count_stat("files")
+    try:
+        raw = Path(path).read_bytes()
+    except OSError as exc:
+        _count_stat("read_errors")
+        return None, EncodingScan(path=str(path), error=str(exc), error_type=type(exc).__name__)
+    _count_stat("bytes_read", len(raw))
+    return raw, None
+
+
+def scan_file(path: str | Path) -> EncodingScan:
+    """One read, one hash; decode and rule pass only on a cache miss."""
+    raw, failed = _read(path)
+    if raw is None:
+        assert failed is not None
+        return failed
+    return _scan_raw(str(path), raw, want_text=False)[0]
+
+
+def read_and_scan(path: str | Path, *, errors: str = "strict") -> tuple[str | None, EncodingScan]:
+    """Like scan_file() but also return the decoded text from the same read.
+
+    The text is None when the file cannot be read, or cannot be decoded and ``errors`` is "strict";
+    with ``errors="replace"`` an undecodable file comes back decoded with U+FFFD replacements.
+    """
+    raw, failed = _read(path)
+    if raw is None:
+        assert failed is not None
+        return None, failed
+    scan, text = _scan_raw(str(path), raw, want_text=True)
+    if text is None and scan.decode_failed and errors != "strict":
+        text = raw.decode("utf-8", errors=errors)
+    return text, scan
@@ -3,30 +3,19 @@
 
 from __future__ import annotations
 
-import re
+import json
 from pathlib import Path
 from typing import Any
 
-from _taskmaster import default_paths, load_json
-
-
-_MOJIBAKE_TOKENS: tuple[str, ...] = (
-    "�",
-    "Ã",
-    "Â",
-    "Ð",
-    "Ñ",
-    "æ",
-    "å",
-    "ç",
-    "â€™",
-    "â€œ",
-    "â€",
-    "ðŸ",
-)
+from _encoding_engine import TASK_TEXT_TOKENS, read_and_scan, text_hits, token_rule_name
+from _taskmaster import default_paths
+
 
-_CN_BREAK_Q_RE = re.compile(r"[\u4e00-\u9fff]\?[\u4e00-\u9fff]")
-_MULTI_Q_RE = re.compile(r"\?{3,}")
+_SUSPICIOUS_RULES: tuple[str, ...] = (
+    *(token_rule_name(token) for token in TASK_TEXT_TOKENS),
+    "cjk_broken_by_question_mark",
+    "multi_question_marks",
+)
 
 
 def parse_task_ids_csv(value: str | None) -> set[int]:
@@ -48,13 +37,7 @@ def _is_suspicious_text(text: str) -> bool:
     s = str(text or "")
     if not s:
         return False
-    if any(token in s for token in _MOJIBAKE_TOKENS):
-        return True
-    if _CN_BREAK_Q_RE.search(s):
-        return True
-    if _MULTI_Q_RE.search(s):
-        return True
-    return False
+    return bool(text_hits(s, _SUSPICIOUS_RULES))
 
 
 def _safe_sample(text: str, *, max_chars: int) -> str:
@@ -104,15 +87,14 @@ def _scan_scope(
         "hits": [],
     }
 
-    try:
-        text = path.read_text(encoding="utf-8")
-    except Exception as exc:  # noqa: BLE001
+    text, scan = read_and_scan(path)
+    if text is None:
         report["utf8_decode"] = "fail"
-        report["error"] = str(exc)
+        report["error"] = str(scan.error)
         return report
 
     try:
-        payload = load_json(path)
+        payload = json.loads(text)
     except Exception as exc:  # noqa: BLE001
         report["json_parse"] = "fail"
         report["error"] = str(exc)
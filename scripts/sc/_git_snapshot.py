@@ -0,0 +1,332 @@
+"""Per-run git working-tree snapshot shared by every git consumer of one pipeline turn.
+
+Fingerprints, diff stats, change-scope classification and review diff context all used to shell
+out to git on their own, so one turn ran dozens of git processes. git_snapshot() captures HEAD and
+`status --porcelain=v2 -z` once and memoizes every further read-only query (numstat, raw diffs,
+untracked files, name-only ranges) on the snapshot. A snapshot stays valid while HEAD and the
+index mtime are unchanged; both are read from .git without spawning git.
+
+publish_git_snapshot(out_dir) writes the snapshot to the run out-dir and exports its path as
+SC_GIT_SNAPSHOT, so child processes start from the parent's snapshot and add their own queries to
+the same file. Worktree edits that do not touch the index are not noticed within a run: the
+snapshot describes the tree at the start of the turn. SC_GIT_SNAPSHOT=off disables all reuse.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Sequence
+
+from _util import repo_root, run_cmd
+
+
+SNAPSHOT_ENV = "SC_GIT_SNAPSHOT"
+SNAPSHOT_FILE_NAME = "git-snapshot.json"
+SCHEMA_VERSION = 1
+
+_LOCK = threading.Lock()
+_SNAPSHOTS: dict[str, "GitSnapshot"] = {}
+_STATS = {"captures": 0, "reuses": 0, "git_calls": 0, "memo_hits": 0}
+
+
+def snapshot_disabled() -> bool:
+    return str(os.environ.get(SNAPSHOT_ENV) or "").strip().lower() in {"off", "0", "false", "no"}
+
+
+def _git_dirs(root: Path) -> tuple[Path, Path] | None:
+    """(git_dir, common_dir) for a checkout or linked worktree, read without spawning git."""
+    dot_git = root / ".git"
+    if dot_git.is_dir():
+        return dot_git, dot_git
+    if not dot_git.is_file():
+        return None
+    text = dot_git.read_text(encoding="utf-8", errors="ignore").strip()
+    if not text.startswith("gitdir:"):
+        return None
+    git_dir = Path(text.split(":", 1)[1].strip())
+    git_dir = git_dir if git_dir.is_absolute() else (root / git_dir).resolve()
+    common = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.is_file():
+        raw = commondir_file.read_text(encoding="utf-8", errors="ignore").strip()
+        common = Path(raw) if Path(raw).is_absolute() else (git_dir / raw).resolve()
+    return git_dir, common
+
+
+def _resolve_ref(git_dir: Path, common_dir: Path, ref: str) -> str:
+    for base in (git_dir, common_dir):
+        path = base / ref
+        if path.is_file():
+            return path.read_text(encoding="utf-8", errors="ignore").strip()
+    packed = common_dir / "packed-refs"
+    if packed.is_file():
+        for line in packed.read_text(encoding="utf-8", errors="ignore").splitlines():
+            parts = line.strip().split(" ", 1)
+            if len(parts) == 2 and parts[1] == ref:
+                return parts[0]
+    return ""
+
+
+def snapshot_key(root: Path) -> dict[str, Any] | None:
+    """HEAD sha + index mtime, or None when .git cannot be read directly (then nothing is reused)."""
+    try:
+        dirs = _git_dirs(root)
+        if dirs is None:
+            return None
+        git_dir, common_dir = dirs
+        head = (git_dir / "HEAD").read_text(encoding="utf-8", errors="ignore").strip()
+        if head.startswith("ref:"):
+            head = _resolve_ref(git_dir, common_dir, head.split(":", 1)[1].strip())
+        index = git_dir / "index"
+        index_mtime_ns = index.stat().st_mtime_ns if index.is_file() else 0
+    except OSError:
+        return None
+    return {"head": head, "index_mtime_ns": int(index_mtime_ns)}
+
+
+def _quote_status_path(path: str) -> str:
+    """Quote a path the way `git status --short` does (core.quotePath defaults)."""
+    escapes = {'"': '\\"', "\\": "\\\\", "\t": "\\t", "\n": "\\n"}
+    if not any(ch in escapes or ch == " " or ord(ch) < 0x20 or ord(ch) > 0x7E for ch in path):
+        return path
+    out: list[str] = []
+    for ch in path:
+        if ch in escapes:
+            out.append(escapes[ch])
+        elif ord(ch) < 0x20 or ord(ch) > 0x7E:
+            out.extend(f"\\{byte:03o}" for byte in ch.encode("utf-8"))
+        else:
+            out.append(ch)
+    return '"' + "".join(out) + '"'
+
+
+def parse_porcelain_v2(raw: str) -> tuple[str, list[dict[str, str]]]:
+    """Parse `git status --porcelain=v2 -z --branch` into (head, entries)."""
+    head = ""
+    entries: list[dict[str, str]] = []
+    records = raw.split("\0")
+    index = 0
+    while index < len(records):
+        record = records[index]
+        index += 1
+        if not record:
+            continue
+        kind = record[0]
+        if record.startswith("# branch.oid "):
+            oid = record[len("# branch.oid ") :].strip()
+            head = "" if oid == "(initial)" else oid
+        elif kind == "1":
+            parts = record.split(" ", 8)
+            if len(parts) == 9:
+                entries.append({"kind": "changed", "xy": parts[1], "path": parts[8]})
+        elif kind == "2":
+            parts = record.split(" ", 9)
+            original = records[index] if index < len(records) else ""
+            index += 1
+            if len(parts) == 10:
+                entries.append({"kind": "renamed", "xy": parts[1], "path": parts[9], "orig_path": original})
+        elif kind == "u":
+            parts = record.split(" ", 10)
+            if len(parts) == 11:
+                entries.append({"kind": "unmerged", "xy": parts[1], "path": parts[10]})
+        elif kind == "?":
+            entries.append({"kind": "untracked", "xy": "??", "path": record[2:]})
+    return head, entries
+
+
+def status_short_lines(entries: list[dict[str, str]]) -> list[str]:
+    """Rebuild `git status --short` lines (as used by fingerprints) from porcelain v2 entries."""
+    lines: list[str] = []
+    for entry in entries:
+        xy = str(entry.get("xy") or "").replace(".", " ")
+        path = _quote_status_path(str(entry.get("path") or ""))
+        if entry.get("kind") == "renamed":
+            path = f"{_quote_status_path(str(entry.get('orig_path') or ''))} -> {path}"
+        lines.append(f"{xy} {path}")
+    return sorted(lines)
+
+
+class GitSnapshot:
+    """Status of one checkout at one (HEAD, index mtime) plus memoized read-only git queries."""
+
+    def __init__(self, *, root: Path, key: dict[str, Any] | None, head: str, status_ok: bool, entries: list[dict[str, str]]) -> None:
+        self.root = root
+        self.key = key
+        self.head = head
+        self.status_ok = status_ok
+        self.entries = entries
+        self.outputs: dict[str, tuple[int, str]] = {}
+        self.path: Path | None = None
+        self._lock = threading.Lock()
+
+    def fingerprint(self) -> dict[str, Any]:
+        return {"head": self.head, "status_short": status_short_lines(self.entries) if self.status_ok else []}
+
+    def git(self, args: Sequence[str], *, timeout_sec: int = 60) -> tuple[int, str]:
+        """Run a read-only git command once per snapshot; failures and timeouts are not memoized."""
+        memo_key = "\0".join(str(arg) for arg in args)
+        with self._lock:
+            cached = self.outputs.get(memo_key)
+        if cached is not None:
+            _count(memo_hits=1)
+            return cached
+        _count(git_calls=1)
+        rc, out = run_cmd(list(args), cwd=self.root, timeout_sec=timeout_sec)
+        if rc == 0 and self.key is not None and not snapshot_disabled():
+            with self._lock:
+                self.outputs[memo_key] = (rc, out)
+            if self.path is not None:
+                self._merge_into_file({memo_key: (rc, out)})
+        return rc, out
+
+    def to_payload(self) -> dict[str, Any]:
+        with self._lock:
+            outputs = {key: [rc, out] for key, (rc, out) in self.outputs.items()}
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "root": str(self.root),
+            "key": self.key,
+            "head": self.head,
+            "status_ok": self.status_ok,
+            "entries": self.entries,
+            "fingerprint": self.fingerprint(),
+            "outputs": outputs,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "GitSnapshot":
+        snapshot = cls(
+            root=Path(str(payload.get("root") or "")),
+            key=payload.get("key") if isinstance(payload.get("key"), dict) else None,
+            head=str(payload.get("head") or ""),
+            status_ok=bool(payload.get("status_ok")),
+            entries=[dict(item) for item in list(payload.get("entries") or []) if isinstance(item, dict)],
+        )
+        for key, value in dict(payload.get("outputs") or {}).items():
+            if isinstance(value, list) and len(value) == 2:
+                snapshot.outputs[str(key)] = (int(value[0]), str(value[1]))
+        return snapshot
+
+    def write(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_text(json.dumps(self.to_payload(), ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+        self.path = path
+        return path
+
+    def _merge_into_file(self, new_outputs: dict[str, tuple[int, str]]) -> None:
+        # Sibling processes may have added their own queries meanwhile; keep theirs too. A lost race
+        # only costs one repeated git call later.
+        path = self.path
+        if path is None:
+            return
+        on_disk = _read_payload(path)
+        if on_disk is not None and on_disk.get("key") == self.key:
+            for key, value in dict(on_disk.get("outputs") or {}).items():
+                if isinstance(value, list) and len(value) == 2 and str(key) not in new_outputs:
+                    with self._lock:
+                        self.outputs.setdefault(str(key), (int(value[0]), str(value[1])))
+        try:
+            self.write(path)
+        except OSError:
+            pass
+
+
+def _count(**deltas: int) -> None:
+    with _LOCK:
+        for name, delta in deltas.items():
+            _STATS[name] = _STATS.get(name, 0) + int(delta)
+
+
+def snapshot_stats() -> dict[str, int]:
+    with _LOCK:
+        return dict(_STATS)
+
+
+def _read_payload(path: Path) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict) or int(payload.get("schema_version") or 0) != SCHEMA_VERSION:
+        return None
+    return payload
+
+
+def _capture(root: Path) -> GitSnapshot:
+    _count(captures=1, git_calls=1)
+    rc, out = run_cmd(["git", "status", "--porcelain=v2", "-z", "--branch"], cwd=root, timeout_sec=30)
+    head, entries = parse_porcelain_v2(out) if rc == 0 else ("", [])
+    if rc == 0 and not head:
+        rc_head, out_head = run_cmd(["git", "rev-parse", "HEAD"], cwd=root, timeout_sec=30)
+        head = out_head.strip() if rc_head == 0 else ""
+    # status refreshes the index, so the key is taken afterwards.
+    key = snapshot_key(root) if rc == 0 else None
+    if key is not None and key.get("head") != head:
+        key = None
+    return GitSnapshot(root=root, key=key, head=head, status_ok=rc == 0, entries=entries)
+
+
+def _published_snapshot(root: Path, key: dict[str, Any]) -> GitSnapshot | None:
+    raw = str(os.environ.get(SNAPSHOT_ENV) or "").strip()
+    if not raw or snapshot_disabled():
+        return None
+    path = Path(raw)
+    payload = _read_payload(path)
+    if payload is None or payload.get("key") != key:
+        return None
+    if Path(str(payload.get("root") or "")).resolve() != root.resolve():
+        return None
+    snapshot = GitSnapshot.from_payload(payload)
+    snapshot.root = root
+    snapshot.path = path
+    return snapshot
+
+
+def git_snapshot(root: Path | None = None) -> GitSnapshot:
+    """Snapshot for ``root`` (default: repo root), reused while HEAD and the index are unchanged."""
+    base = (root or repo_root()).resolve()
+    if snapshot_disabled():
+        return _capture(base)
+    key = snapshot_key(base)
+    with _LOCK:
+        cached = _SNAPSHOTS.get(str(base))
+    if cached is not None and key is not None and cached.key == key:
+        _count(reuses=1)
+        return cached
+    snapshot = _published_snapshot(base, key) if key is not None else None
+    if snapshot is not None:
+        _count(reuses=1)
+    else:
+        snapshot = _capture(base)
+    if snapshot.key is not None:
+        with _LOCK:
+            _SNAPSHOTS[str(base)] = snapshot
+    return snapshot
+
+
+def publish_git_snapshot(out_dir: Path, *, root: Path | None = None) -> Path | None:
+    """Write the current snapshot into ``out_dir`` and export it to child processes."""
+    if snapshot_disabled():
+        return None
+    snapshot = git_snapshot(root)
+    if snapshot.key is None:
+        return None
+    try:
+        path = snapshot.write(out_dir / SNAPSHOT_FILE_NAME)
+    except OSError:
+        return None
+    os.environ[SNAPSHOT_ENV] = str(path)
+    return path
+
+
+def reset_git_snapshots() -> None:
+    with _LOCK:
+        _SNAPSHOTS.clear()
+        for name in _STATS:
+            _STATS[name] = 0
@@ -0,0 +1,331 @@
+"""Shared latency model for LLM-backed steps: streaming quantiles, adaptive timeouts and retry budgets.
+
+Every finished LLM call (light-lane step, llm_review agent, ...) is recorded under a key made of
+step, agent, backend and prompt-size bucket. Each key keeps P-square quantile estimators (Jain &
+Chlamtac), so the state stays a few numbers per quantile no matter how many runs fed it. Callers
+ask for a timeout at the configured quantile plus margin and fall back to their static profile
+value until the key has enough samples. Timed-out calls are censored (their true latency is
+unknown), so they do not feed the estimators; they raise the recommendation instead when they
+happen more often than the quantile allows.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from _task_view_writer import view_lock
+from _util import repo_root
+
+
+TRACKED_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+OUTCOMES = ("ok", "timeout", "error")
+
+
+@dataclass(frozen=True)
+class LatencyPolicy:
+    enabled: bool = True
+    quantile: float = 0.95
+    margin_ratio: float = 0.25
+    margin_sec: int = 30
+    min_samples: int = 8
+    floor_sec: int = 60
+    ceiling_ratio: float = 2.0
+    timeout_escalation_ratio: float = 1.5
+    deadline_budget_ratio: float = 3.0
+
+
+def policy_path(root: Path | None = None) -> Path:
+    return (root or repo_root()) / "scripts" / "sc" / "config" / "adaptive-timeouts.json"
+
+
+def model_path(root: Path | None = None) -> Path:
+    return (root or repo_root()) / "logs" / "ci" / ".latency-model" / "latency-model.json"
+
+
+def load_policy(root: Path | None = None) -> LatencyPolicy:
+    """Policy from scripts/sc/config/adaptive-timeouts.json; SC_ADAPTIVE_TIMEOUTS=off disables it."""
+    payload: dict[str, Any] = {}
+    path = policy_path(root)
+    if path.is_file():
+        try:
+            loaded = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            loaded = {}
+        if isinstance(loaded, dict):
+            payload = loaded
+    defaults = LatencyPolicy()
+    enabled = bool(payload.get("enabled", defaults.enabled))
+    env_switch = str(os.environ.get("SC_ADAPTIVE_TIMEOUTS") or "").strip().lower()
+    if env_switch in {"0", "off", "false", "no"}:
+        enabled = False
+    elif env_switch in {"1", "on", "true", "yes"}:
+        enabled = True
+    return LatencyPolicy(
+        enabled=enabled,
+        quantile=min(0.99, max(0.5, float(payload.get("quantile", defaults.quantile)))),
+        margin_ratio=max(0.0, float(payload.get("margin_ratio", defaults.margin_ratio))),
+        margin_sec=max(0, int(payload.get("margin_sec", defaults.margin_sec))),
+        min_samples=max(5, int(payload.get("min_samples", defaults.min_samples))),
+        floor_sec=max(1, int(payload.get("floor_sec", defaults.floor_sec))),
+        ceiling_ratio=max(1.0, float(payload.get("ceiling_ratio", defaults.ceiling_ratio))),
+        timeout_escalation_ratio=max(1.0, float(payload.get("timeout_escalation_ratio", defaults.timeout_escalation_ratio))),
+        deadline_budget_ratio=max(1.0, float(payload.get("deadline_budget_ratio", defaults.deadline_budget_ratio))),
+    )
+
+
+ALL_PROMPT_SIZES = "all"
+
+
+def prompt_bucket(prompt_chars: int | None) -> str:
+    """Power-of-two prompt size bucket starting at 4k chars ("le4k", "le8k", ...); "all" when unknown."""
+    if prompt_chars is None or int(prompt_chars) <= 0:
+        return ALL_PROMPT_SIZES
+    limit = 4096
+    while int(prompt_chars) > limit:
+        limit *= 2
+    return f"le{limit // 1024}k"
+
+
+def latency_key(step: str, *, agent: str = "", backend: str = "", prompt_chars: int | None = None) -> str:
+    backend_value = str(backend or os.environ.get("SC_LLM_BACKEND") or "codex-cli").strip().lower()
+    return "|".join([str(step).strip(), str(agent or "-").strip(), backend_value, prompt_bucket(prompt_chars)])
+
+
+class P2Quantile:
+    """P-square streaming estimator for one quantile (five markers, O(1) update)."""
+
+    def __init__(self, q: float) -> None:
+        self.q = float(q)
+        self.heights: list[float] = []
+        self.positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self.desired = [1.0, 1.0 + 2.0 * self.q, 1.0 + 4.0 * self.q, 3.0 + 2.0 * self.q, 5.0]
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        x = float(value)
+        self.count += 1
+        if len(self.heights) < 5:
+            self.heights.append(x)
+            self.heights.sort()
+            return
+        q, n = self.heights, self.positions
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(4) if q[i] <= x < q[i + 1])
+        for i in range(k + 1, 5):
+            n[i] += 1.0
+        increments = (0.0, self.q / 2.0, self.q, (1.0 + self.q) / 2.0, 1.0)
+        for i in range(5):
+            self.desired[i] += increments[i]
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if (d >= 1.0 and n[i + 1] - n[i] > 1.0) or (d <= -1.0 and n[i - 1] - n[i] < -1.0):
+                step = 1.0 if d > 0 else -1.0
+                candidate = q[i] + step / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < candidate < q[i + 1]:
+                    j = i + int(step)
+                    candidate = q[i] + step * (q[j] - q[i]) / (n[j] - n[i])
+                q[i] = candidate
+                n[i] += step
+
+    def value(self) -> float | None:
+        if not self.heights:
+            return None
+        if len(self.heights) < 5 or self.count <= 5:
+            ordered = sorted(self.heights)
+            return ordered[min(len(ordered) - 1, int(math.ceil(self.q * len(ordered))) - 1)]
+        return self.heights[2]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"q": self.q, "count": self.count, "heights": self.heights, "positions": self.positions, "desired": self.desired}
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "P2Quantile":
+        estimator = cls(float(payload.get("q") or 0.5))
+        estimator.count = int(payload.get("count") or 0)
+        estimator.heights = [float(item) for item in list(payload.get("heights") or [])][:5]
+        if len(list(payload.get("positions") or [])) == 5:
+            estimator.positions = [float(item) for item in payload["positions"]]
+        if len(list(payload.get("desired") or [])) == 5:
+            estimator.desired = [float(item) for item in payload["desired"]]
+        return estimator
+
+
+class LatencyStats:
+    def __init__(self) -> None:
+        self.outcomes = {name: 0 for name in OUTCOMES}
+        self.max_timeout_sec = 0.0
+        self.last_seen = ""
+        self.estimators = {q: P2Quantile(q) for q in TRACKED_QUANTILES}
+
+    def observe(self, seconds: float, *, outcome: str) -> None:
+        outcome = outcome if outcome in OUTCOMES else "error"
+        self.outcomes[outcome] += 1
+        self.last_seen = time.strftime("%Y-%m-%dT%H:%M:%S")
+        if outcome == "timeout":
+            self.max_timeout_sec = max(self.max_timeout_sec, float(seconds))
+        elif outcome == "ok":
+            for estimator in self.estimators.values():
+                estimator.add(max(0.0, float(seconds)))
+
+    @property
+    def samples(self) -> int:
+        return int(self.outcomes["ok"])
+
+    def quantile(self, q: float) -> float | None:
+        nearest = min(TRACKED_QUANTILES, key=lambda item: (abs(item - q), -item))
+        return self.estimators[nearest].value()
+
+    def timeout_rate(self) -> float:
+        attempts = self.outcomes["ok"] + self.outcomes["timeout"]
+        return float(self.outcomes["timeout"]) / attempts if attempts else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "outcomes": dict(self.outcomes),
+            "max_timeout_sec": self.max_timeout_sec,
+            "last_seen": self.last_seen,
+            "quantiles": {str(q): estimator.to_dict() for q, estimator in self.estimators.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "LatencyStats":
+        stats = cls()
+        for name in OUTCOMES:
+            stats.outcomes[name] = int(dict(payload.get("outcomes") or {}).get(name) or 0)
+        stats.max_timeout_sec = float(payload.get("max_timeout_sec") or 0.0)
+        stats.last_seen = str(payload.get("last_seen") or "")
+        for raw_q, estimator in dict(payload.get("quantiles") or {}).items():
+            try:
+                q = float(raw_q)
+            except ValueError:
+                continue
+            if q in stats.estimators and isinstance(estimator, dict):
+                stats.estimators[q] = P2Quantile.from_dict(estimator)
+        return stats
+
+
+def load_model(root: Path | None = None) -> dict[str, LatencyStats]:
+    path = model_path(root)
+    if not path.is_file():
+        return {}
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    keys = payload.get("keys") if isinstance(payload, dict) else None
+    if not isinstance(keys, dict):
+        return {}
+    return {str(key): LatencyStats.from_dict(value) for key, value in keys.items() if isinstance(value, dict)}
+
+
+def record_latency(key: str, seconds: float, *, outcome: str, root: Path | None = None) -> None:
+    """Fold one observation into the on-disk model (read-modify-write under a cross-process lock).
+
+    Sized keys are also folded into their "all" sibling, which callers use when the prompt size is
+    not known before the call.
+    """
+    if not load_policy(root).enabled:
+        return
+    path = model_path(root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with view_lock(path, root=root, timeout_sec=30):
+        model = load_model(root)
+        keys = {key, key.rsplit("|", 1)[0] + "|" + ALL_PROMPT_SIZES}
+        for name in keys:
+            model.setdefault(name, LatencyStats()).observe(seconds, outcome=outcome)
+        staging = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        payload = {"schema_version": 1, "keys": {name: stats.to_dict() for name, stats in sorted(model.items())}}
+        try:
+            staging.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            os.replace(staging, path)
+        finally:
+            if staging.exists():
+                staging.unlink()
+
+
+def recommend_timeout(
+    key: str,
+    *,
+    default_sec: int,
+    root: Path | None = None,
+    policy: LatencyPolicy | None = None,
+    model: dict[str, LatencyStats] | None = None,
+) -> tuple[int, dict[str, Any]]:
+    """Timeout at the policy quantile plus margin, clamped to [floor, default * ceiling_ratio].
+
+    Returns ``(default_sec, {"source": "static", ...})`` until the key has min_samples successes.
+    """
+    policy = policy or load_policy(root)
+    stats = (model if model is not None else load_model(root)).get(key) if policy.enabled else None
+    meta: dict[str, Any] = {"key": key, "source": "static", "default_sec": int(default_sec)}
+    if stats is None or stats.samples < policy.min_samples:
+        meta["samples"] = stats.samples if stats is not None else 0
+        return int(default_sec), meta
+    estimate = float(stats.quantile(policy.quantile) or 0.0)
+    timeout = estimate * (1.0 + policy.margin_ratio) + policy.margin_sec
+    if stats.timeout_rate() > 1.0 - policy.quantile:
+        # The censored tail is heavier than the estimators can see: outgrow the longest kill.
+        timeout = max(timeout, stats.max_timeout_sec * policy.timeout_escalation_ratio)
+    ceiling = max(policy.floor_sec, int(default_sec * policy.ceiling_ratio))
+    timeout_sec = int(min(ceiling, max(policy.floor_sec, math.ceil(timeout))))
+    meta.update(
+        {
+            "source": "model",
+            "samples": stats.samples,
+            "quantile": policy.quantile,
+            "estimate_sec": round(estimate, 3),
+            "timeout_rate": round(stats.timeout_rate(), 4),
+            "timeout_sec": timeout_sec,
+        }
+    )
+    return timeout_sec, meta
+
+
+def plan_timeout_retry(
+    key: str,
+    *,
+    attempt_timeout_sec: int,
+    budget_remaining_sec: float,
+    root: Path | None = None,
+    policy: LatencyPolicy | None = None,
+    model: dict[str, LatencyStats] | None = None,
+) -> dict[str, Any]:
+    """Decide whether a timed-out call is worth re-issuing within the remaining deadline budget.
+
+    A retry is only planned when the budget still covers a median call plus margin; its timeout is
+    the larger of twice the failed attempt and the p99 estimate, capped by the remaining budget.
+    ``hedge_after_sec`` is the policy-quantile latency, the point where a duplicate request pays off.
+    """
+    policy = policy or load_policy(root)
+    stats = (model if model is not None else load_model(root)).get(key)
+    remaining = max(0.0, float(budget_remaining_sec))
+    median = float(stats.quantile(0.5) or 0.0) if stats is not None and stats.samples else 0.0
+    tail = float(stats.quantile(0.99) or 0.0) if stats is not None and stats.samples else 0.0
+    needed = median * (1.0 + policy.margin_ratio) + policy.margin_sec if median else float(policy.floor_sec)
+    plan: dict[str, Any] = {
+        "key": key,
+        "budget_remaining_sec": int(remaining),
+        "hedge_after_sec": int(math.ceil(float(stats.quantile(policy.quantile) or 0.0))) if stats is not None and stats.samples else 0,
+    }
+    if remaining < needed:
+        plan.update({"action": "stop", "reason": "deadline_budget_exhausted", "timeout_sec": 0})
+        return plan
+    wanted = max(int(attempt_timeout_sec) * 2, int(math.ceil(tail * (1.0 + policy.margin_ratio) + policy.margin_sec)))
+    plan.update({"action": "retry", "reason": "within_deadline_budget", "timeout_sec": int(min(remaining, wanted))})
+    return plan
@@ -0,0 +1,64 @@
+"""Registry of deferred module imports for sc helpers.
+
+lazy_import("http.client") returns a stand-in module that imports the real one on first attribute
+access, so a helper can keep ``module.attr`` call sites for rarely used dependencies without paying
+their import cost on every CLI start. The first access is serialized with a lock, which the stdlib
+LazyLoader only does from Python 3.12.3 on. lazy_import_report() lists every registered module and
+whether something has touched it yet; SC_PROFILE=import reports it next to the import-time table.
+
+Only defer modules that are used through attribute access: ``from x import y`` and module-level
+uses of ``x.attr`` load the module immediately and gain nothing.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+import types
+from typing import Any
+
+
+_LOCK = threading.Lock()
+_REGISTRY: dict[str, "_DeferredModule"] = {}
+
+
+class _DeferredModule(types.ModuleType):
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self._sc_module: types.ModuleType | None = None
+
+    def _sc_load(self) -> types.ModuleType:
+        module = self._sc_module
+        if module is None:
+            with _LOCK:
+                module = self._sc_module
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self._sc_module = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only reached for names the stand-in does not define itself (test patches set them here).
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError(attr)
+        return getattr(self._sc_load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._sc_module is not None else "deferred"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Return a stand-in for ``name`` that imports it on first attribute access."""
+    with _LOCK:
+        module = _REGISTRY.get(name)
+        if module is None:
+            module = _REGISTRY[name] = _DeferredModule(name)
+    return module
+
+
+def lazy_import_report() -> list[dict[str, Any]]:
+    return [
+        {"name": name, "loaded": module._sc_module is not None}
+        for name, module in sorted(_REGISTRY.items())
+    ]
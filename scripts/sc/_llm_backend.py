@@ -1,6 +1,16 @@
 #!/usr/bin/env python3
 """
 Internal LLM backend seam for sc scripts.
+
+Opt-in hedging (SC_LLM_HEDGE=on): when a call runs past its expected latency (the policy quantile
+recorded for its key in the shared latency model, or SC_LLM_HEDGE_AFTER_SEC), a duplicate request
+is fired; the first valid response wins and the others are killed (CLI processes) or abandoned
+(API calls). The local-stub backend runs SC_LLM_STUB_CMD with the prompt on stdin and treats its
+stdout as the model reply, so the whole path can be exercised without a real model.
+
+The openai-api backend reuses one pooled client per process (see _llm_client_pool). With
+SC_OPENAI_TRANSPORT=http it talks to OPENAI_BASE_URL/responses over the stdlib keep-alive pool
+instead of the SDK.
 """
 
 from __future__ import annotations
@@ -8,12 +18,23 @@ from __future__ import annotations
 import importlib.util
 import json
 import os
+import shlex
 import shutil
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
+from typing import Callable
 
-KNOWN_LLM_BACKENDS = ("codex-cli", "openai-api")
+from _latency_model import latency_key, load_model, load_policy, record_latency
+from _llm_client_pool import shared_http_pool, shared_openai_client
+from _trace import span
+
+KNOWN_LLM_BACKENDS = ("codex-cli", "openai-api", "local-stub")
+HEDGE_MAX_REQUESTS = 3
+KNOWN_OPENAI_TRANSPORTS = ("sdk", "http")
+DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
 
 
 def resolve_llm_backend(raw: str | None) -> str:
@@ -46,13 +67,23 @@ def inspect_llm_backend(backend: str | None) -> dict[str, object]:
         payload["python_module_found"] = bool(module_spec)
         payload["api_key_env"] = "OPENAI_API_KEY"
         payload["api_key_present"] = bool(api_key)
-        if module_spec is None:
+        payload["transport"] = _resolve_openai_transport()
+        if payload["transport"] == "sdk" and module_spec is None:
             blocking_errors.append("python package 'openai' is not installed")
         if not api_key:
             blocking_errors.append("OPENAI_API_KEY is not set")
         payload["blocking_errors"] = blocking_errors
         payload["available"] = len(blocking_errors) == 0
         return payload
+    if backend_name == "local-stub":
+        stub_cmd = str(os.environ.get("SC_LLM_STUB_CMD") or "").strip()
+        payload["command_env"] = "SC_LLM_STUB_CMD"
+        payload["command"] = stub_cmd
+        if not stub_cmd:
+            payload["blocking_errors"] = ["SC_LLM_STUB_CMD is not set"]
+            return payload
+        payload["available"] = True
+        return payload
     payload["blocking_errors"] = [f"unsupported llm backend: {backend_name}"]
     return payload
 
@@ -73,6 +104,15 @@ def _resolve_openai_model() -> str:
     return str(os.environ.get("SC_OPENAI_MODEL") or os.environ.get("OPENAI_MODEL") or "gpt-5").strip() or "gpt-5"
 
 
+def _resolve_openai_transport() -> str:
+    value = str(os.environ.get("SC_OPENAI_TRANSPORT") or "sdk").strip().lower()
+    return value if value in KNOWN_OPENAI_TRANSPORTS else "sdk"
+
+
+def _resolve_openai_base_url() -> str:
+    return str(os.environ.get("OPENAI_BASE_URL") or DEFAULT_OPENAI_BASE_URL).strip().rstrip("/") or DEFAULT_OPENAI_BASE_URL
+
+
 def _extract_response_output_text(response: object) -> str:
     direct = str(getattr(response, "output_text", "") or "").strip()
     if direct:
@@ -94,32 +134,181 @@ def _extract_response_output_text(response: object) -> str:
         direct = str(response.get("output_text") or "").strip()
         if direct:
             return direct
+        chunks = [
+            str(part.get("text") or "").strip()
+            for item in list(response.get("output") or [])
+            if isinstance(item, dict)
+            for part in list(item.get("content") or [])
+            if isinstance(part, dict) and str(part.get("text") or "").strip()
+        ]
+        if chunks:
+            return "\n".join(chunks).strip()
     return ""
 
 
-def run_llm_exec(
+class _Request:
+    """One in-flight backend request running on a daemon thread; ``cancel`` kills or abandons it."""
+
+    def __init__(self, index: int, run: Callable[["_Request"], tuple[int, str, list[str]]], changed: threading.Event) -> None:
+        self.index = index
+        self.started = time.perf_counter()
+        self.finished = 0.0
+        self.result: tuple[int, str, list[str]] = (1, "request did not finish\n", [])
+        self.done = threading.Event()
+        self.cancelled = False
+        self._cancel_hooks: list[Callable[[], object]] = []
+        self._run = run
+        self._changed = changed
+        threading.Thread(target=self._target, daemon=True).start()
+
+    def _target(self) -> None:
+        try:
+            self.result = self._run(self)
+        except Exception as exc:  # noqa: BLE001
+            self.result = (1, f"request failed: {exc}\n", [])
+        finally:
+            self.finished = time.perf_counter()
+            self.done.set()
+            self._changed.set()
+
+    def on_cancel(self, hook: Callable[[], object]) -> None:
+        self._cancel_hooks.append(hook)
+        if self.cancelled:
+            hook()
+
+    def cancel(self) -> None:
+        self.cancelled = True
+        for hook in list(self._cancel_hooks):
+            try:
+                hook()
+            except Exception:  # noqa: BLE001
+                pass
+
+
+_HEDGE_LOCK = threading.Lock()
+_HEDGE_STATS = {
+    "calls": 0,
+    "hedged_calls": 0,
+    "hedge_requests": 0,
+    "hedge_wins": 0,
+    "cancelled_requests": 0,
+    "wasted_token_estimate": 0,
+}
+
+
+def hedge_stats() -> dict[str, int]:
+    """Process-wide hedging counters, for step summaries."""
+    with _HEDGE_LOCK:
+        return dict(_HEDGE_STATS)
+
+
+def _count_hedge(**deltas: int) -> None:
+    with _HEDGE_LOCK:
+        for name, value in deltas.items():
+            _HEDGE_STATS[name] = int(_HEDGE_STATS.get(name, 0)) + int(value)
+
+
+def hedging_enabled() -> bool:
+    return str(os.environ.get("SC_LLM_HEDGE") or "").strip().lower() in {"1", "on", "true", "yes"}
+
+
+def _estimate_tokens(chars: int) -> int:
+    return max(0, int(chars)) // 4
+
+
+def _hedge_delay_sec(root: Path, key: str, timeout_sec: int) -> float | None:
+    raw = str(os.environ.get("SC_LLM_HEDGE_AFTER_SEC") or "").strip()
+    if raw:
+        try:
+            delay = float(raw)
+        except ValueError:
+            delay = 0.0
+    else:
+        policy = load_policy(root)
+        stats = load_model(root).get(key) if policy.enabled else None
+        if stats is None or stats.samples < policy.min_samples:
+            return None
+        delay = float(stats.quantile(policy.quantile) or 0.0)
+    return delay if 0.0 < delay < float(timeout_sec) else None
+
+
+def _write_last_message(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text.rstrip() + "\n", encoding="utf-8")
+
+
+def _run_cli_process(
+    cmd: list[str],
+    *,
+    prompt: str,
+    root: Path,
+    timeout_sec: float,
+    request: _Request | None,
+) -> tuple[int | None, str]:
+    """Run one CLI backend process; ``None`` as rc means it timed out."""
+    if request is None:
+        try:
+            proc = subprocess.run(
+                cmd,
+                input=prompt,
+                text=True,
+                encoding="utf-8",
+                errors="ignore",
+                cwd=str(root),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                timeout=timeout_sec,
+            )
+        except subprocess.TimeoutExpired:
+            return None, ""
+        return proc.returncode or 0, proc.stdout or ""
+    popen = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="ignore",
+        cwd=str(root),
+    )
+    request.on_cancel(popen.kill)
+    try:
+        stdout, _ = popen.communicate(input=prompt, timeout=timeout_sec)
+    except subprocess.TimeoutExpired:
+        popen.kill()
+        popen.communicate()
+        return None, ""
+    return popen.returncode or 0, stdout or ""
+
+
+def _launcher(
+    backend_name: str,
     *,
-    backend: str,
     root: Path,
     prompt: str,
-    output_last_message: Path,
-    timeout_sec: int,
-    codex_configs: list[str] | None = None,
-) -> tuple[int, str, list[str]]:
-    backend_name = resolve_llm_backend(backend)
+    codex_configs: list[str] | None,
+) -> Callable[[Path, float, _Request | None], tuple[int, str, list[str]]] | tuple[int, str, list[str]]:
+    """Per-backend request function ``(output_path, timeout_sec, request) -> (rc, trace, cmd)``.
+
+    Returns the final result tuple instead when the backend cannot run at all.
+    """
     if backend_name == "openai-api":
         info = inspect_llm_backend(backend_name)
         blocking_errors = [str(item).strip() for item in list(info.get("blocking_errors") or []) if str(item).strip()]
         if blocking_errors:
             details = "; ".join(blocking_errors)
             return 2, f"openai-api backend is not runnable: {details}\n", [backend_name]
-        try:
-            openai_module = sys.modules.get("openai")
-            if openai_module is None:
-                import openai as openai_module  # type: ignore
-            OpenAI = getattr(openai_module, "OpenAI")
-        except Exception as exc:  # noqa: BLE001
-            return 1, f"openai-api backend failed to import SDK: {exc}\n", [backend_name]
+        transport = str(info.get("transport") or "sdk")
+        OpenAI = None
+        if transport == "sdk":
+            try:
+                openai_module = sys.modules.get("openai")
+                if openai_module is None:
+                    import openai as openai_module  # type: ignore
+                OpenAI = getattr(openai_module, "OpenAI")
+            except Exception as exc:  # noqa: BLE001
+                return 1, f"openai-api backend failed to import SDK: {exc}\n", [backend_name]
 
         model = _resolve_openai_model()
         reasoning_effort = _extract_reasoning_effort(codex_configs)
@@ -129,24 +318,63 @@ def run_llm_exec(
         }
         if reasoning_effort:
             kwargs["reasoning"] = {"effort": reasoning_effort}
-        try:
-            client = OpenAI(timeout=float(timeout_sec))
-            response = client.responses.create(**kwargs)
-        except Exception as exc:  # noqa: BLE001
-            return 1, f"openai-api request failed: {exc}\n", [backend_name]
 
-        output_text = _extract_response_output_text(response)
-        if output_text:
-            output_last_message.parent.mkdir(parents=True, exist_ok=True)
-            output_last_message.write_text(output_text.rstrip() + "\n", encoding="utf-8")
-        trace = {
-            "backend": backend_name,
-            "model": model,
-            "reasoning_effort": reasoning_effort or None,
-            "response_id": str(getattr(response, "id", "") or ""),
-            "output_chars": len(output_text),
-        }
-        return (0 if output_text else 1), json.dumps(trace, ensure_ascii=False, indent=2) + "\n", [backend_name, model]
+        def _send(timeout_sec: float) -> object:
+            # Shared clients stay open for the next call, so a cancelled hedge is abandoned, not closed.
+            if OpenAI is not None:
+                client = shared_openai_client(OpenAI, timeout_sec=float(timeout_sec))
+                return client.responses.create(**kwargs, timeout=float(timeout_sec))
+            api_key = str(os.environ.get("OPENAI_API_KEY") or "").strip()
+            status, body = shared_http_pool().post_json(
+                f"{_resolve_openai_base_url()}/responses",
+                kwargs,
+                headers={"Authorization": f"Bearer {api_key}"},
+                timeout=float(timeout_sec),
+            )
+            if status >= 400:
+                raise RuntimeError(f"HTTP {status}: {str(body)[:500]}")
+            return body
+
+        def _openai(output_path: Path, timeout_sec: float, request: _Request | None) -> tuple[int, str, list[str]]:
+            try:
+                response = _send(timeout_sec)
+            except Exception as exc:  # noqa: BLE001
+                return 1, f"openai-api request failed: {exc}\n", [backend_name]
+
+            output_text = _extract_response_output_text(response)
+            if output_text and not (request is not None and request.cancelled):
+                _write_last_message(output_path, output_text)
+            response_id = response.get("id") if isinstance(response, dict) else getattr(response, "id", "")
+            trace = {
+                "backend": backend_name,
+                "transport": transport,
+                "model": model,
+                "reasoning_effort": reasoning_effort or None,
+                "response_id": str(response_id or ""),
+                "output_chars": len(output_text),
+            }
+            return (0 if output_text else 1), json.dumps(trace, ensure_ascii=False, indent=2) + "\n", [backend_name, model]
+
+        return _openai
+
+    if backend_name == "local-stub":
+        stub_cmd = shlex.split(str(os.environ.get("SC_LLM_STUB_CMD") or "").strip())
+        if not stub_cmd:
+            return 2, "local-stub backend is not runnable: SC_LLM_STUB_CMD is not set\n", [backend_name]
+
+        def _stub(output_path: Path, timeout_sec: float, request: _Request | None) -> tuple[int, str, list[str]]:
+            try:
+                rc, stdout = _run_cli_process(stub_cmd, prompt=prompt, root=root, timeout_sec=timeout_sec, request=request)
+            except Exception as exc:  # noqa: BLE001
+                return 1, f"local-stub failed to start: {exc}\n", stub_cmd
+            if rc is None:
+                return 124, "local-stub timeout\n", stub_cmd
+            if rc == 0 and stdout.strip():
+                _write_last_message(output_path, stdout)
+            return rc, stdout, stub_cmd
+
+        return _stub
+
     if backend_name != "codex-cli":
         return 2, f"unsupported llm backend: {backend_name}\n", [backend_name]
 
@@ -159,32 +387,152 @@ def run_llm_exec(
     for item in extra_config:
         extra_config_args.extend(["-c", str(item)])
 
-    cmd = [
-        exe,
-        "exec",
-        *extra_config_args,
-        "-s",
-        "read-only",
-        "-C",
-        str(root),
-        "--output-last-message",
-        str(output_last_message),
-        "-",
-    ]
-    try:
-        proc = subprocess.run(
-            cmd,
-            input=prompt,
-            text=True,
-            encoding="utf-8",
-            errors="ignore",
-            cwd=str(root),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            timeout=timeout_sec,
-        )
-    except subprocess.TimeoutExpired:
-        return 124, "codex exec timeout\n", cmd
-    except Exception as exc:  # noqa: BLE001
-        return 1, f"codex exec failed to start: {exc}\n", cmd
-    return proc.returncode or 0, proc.stdout or "", cmd
+    def _codex(output_path: Path, timeout_sec: float, request: _Request | None) -> tuple[int, str, list[str]]:
+        cmd = [
+            exe,
+            "exec",
+            *extra_config_args,
+            "-s",
+            "read-only",
+            "-C",
+            str(root),
+            "--output-last-message",
+            str(output_path),
+            "-",
+        ]
+        try:
+            rc, stdout = _run_cli_process(cmd, prompt=prompt, root=root, timeout_sec=timeout_sec, request=request)
+        except Exception as exc:  # noqa: BLE001
+            return 1, f"codex exec failed to start: {exc}\n", cmd
+        if rc is None:
+            return 124, "codex exec timeout\n", cmd
+        return rc, stdout, cmd
+
+    return _codex
+
+
+def _response_is_valid(result: tuple[int, str, list[str]], output_path: Path) -> bool:
+    return int(result[0]) == 0 and output_path.is_file() and bool(output_path.read_text(encoding="utf-8", errors="ignore").strip())
+
+
+def _run_hedged(
+    launch: Callable[[Path, float, _Request | None], tuple[int, str, list[str]]],
+    *,
+    root: Path,
+    prompt: str,
+    output_last_message: Path,
+    timeout_sec: int,
+    key: str,
+    record: bool,
+) -> tuple[int, str, list[str]]:
+    delay = _hedge_delay_sec(root, key, timeout_sec)
+    max_requests = max(1, min(HEDGE_MAX_REQUESTS, 1 + int(os.environ.get("SC_LLM_HEDGE_MAX") or 1)))
+    started = time.perf_counter()
+    deadline = started + float(timeout_sec)
+    changed = threading.Event()
+    requests: list[tuple[_Request, Path]] = []
+
+    def _start() -> None:
+        index = len(requests)
+        path = output_last_message.with_name(f".{output_last_message.name}.req-{index}")
+        remaining = max(1.0, deadline - time.perf_counter())
+        requests.append((_Request(index, lambda request: launch(path, remaining, request), changed), path))
+
+    _start()
+    winner: tuple[_Request, Path] | None = None
+    next_hedge_at = started + delay if delay is not None else None
+    while winner is None:
+        changed.clear()
+        winner = next(((req, path) for req, path in requests if req.done.is_set() and _response_is_valid(req.result, path)), None)
+        if winner is not None or all(req.done.is_set() for req, _ in requests):
+            break  # a fast failure is not a latency problem: it is returned, not hedged
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+        if next_hedge_at is not None and now >= next_hedge_at and len(requests) < max_requests:
+            _start()
+            next_hedge_at = now + float(delay or 0.0) if len(requests) < max_requests else None
+            continue
+        wake_at = min(deadline, next_hedge_at) if next_hedge_at is not None and len(requests) < max_requests else deadline
+        changed.wait(timeout=max(0.01, wake_at - now))
+
+    prompt_tokens = _estimate_tokens(len(prompt))
+    wasted_tokens = 0
+    cancelled = 0
+    for req, path in requests:
+        if winner is not None and req is winner[0]:
+            continue
+        if not req.done.is_set():
+            req.cancel()
+            cancelled += 1
+        wasted_tokens += prompt_tokens
+        if req.done.is_set() and path.is_file():
+            wasted_tokens += _estimate_tokens(len(path.read_text(encoding="utf-8", errors="ignore")))
+    chosen = winner or next(((req, path) for req, path in requests if req.done.is_set()), None)
+    if winner is None and chosen is None:
+        rc, trace, cmd = 124, "hedged llm requests timed out\n", []
+    else:
+        req, path = chosen
+        rc, trace, cmd = req.result
+        if path.is_file():
+            output_last_message.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, output_last_message)
+    for _req, path in requests:
+        path.unlink(missing_ok=True)
+
+    hedges = len(requests) - 1
+    _count_hedge(
+        calls=1,
+        hedged_calls=1 if hedges else 0,
+        hedge_requests=hedges,
+        hedge_wins=1 if winner is not None and winner[0].index > 0 else 0,
+        cancelled_requests=cancelled,
+        wasted_token_estimate=wasted_tokens if hedges else 0,
+    )
+    if record:
+        outcome = "ok" if rc == 0 else ("timeout" if rc == 124 else "error")
+        try:
+            record_latency(key, time.perf_counter() - started, outcome=outcome, root=root)
+        except (OSError, TimeoutError):
+            pass
+    if hedges:
+        winner_index = winner[0].index if winner is not None else -1
+        trace = f"{trace.rstrip()}\n[llm-hedge] requests={len(requests)} winner={winner_index} after_sec={round(float(delay or 0.0), 3)} cancelled={cancelled}\n"
+    return int(rc), trace, cmd
+
+
+def run_llm_exec(
+    *,
+    backend: str,
+    root: Path,
+    prompt: str,
+    output_last_message: Path,
+    timeout_sec: int,
+    codex_configs: list[str] | None = None,
+    hedge_key: str | None = None,
+) -> tuple[int, str, list[str]]:
+    """Run one prompt on ``backend``; ``hedge_key`` names the latency-model key that drives hedging.
+
+    Without a key the call is hedged (and recorded) under a generic per-backend, per-prompt-size key.
+    """
+    backend_name = resolve_llm_backend(backend)
+    with span(f"llm_exec {backend_name}", cat="llm", prompt_chars=len(prompt)) as attrs:
+        launch = _launcher(backend_name, root=root, prompt=prompt, codex_configs=codex_configs)
+        if isinstance(launch, tuple):
+            result = launch
+        elif not hedging_enabled():
+            result = launch(output_last_message, float(timeout_sec), None)
+        else:
+            key = hedge_key or latency_key("llm-exec", backend=backend_name, prompt_chars=len(prompt))
+            result = _run_hedged(
+                launch,
+                root=root,
+                prompt=prompt,
+                output_last_message=output_last_message,
+                timeout_sec=timeout_sec,
+                key=key,
+                record=hedge_key is None,
+            )
+        if attrs is not None:
+            attrs["rc"] = result[0]
+        return result
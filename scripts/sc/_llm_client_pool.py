@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Process-wide pooled HTTP clients for the sc LLM backends.
+
+Building a client per call means every request pays DNS, TCP and TLS setup again. The helpers here
+keep one client per endpoint for the life of the process, so batch drivers that issue many calls
+reuse warm keep-alive connections:
+
+- shared_openai_client(): one SDK client per (SDK class, base_url, api key), backed by an httpx
+  pool when httpx is importable. Per-call timeouts are passed per request, not per client.
+- HttpConnectionPool / shared_http_pool(): a small stdlib keep-alive pool for OpenAI-compatible
+  JSON endpoints (SC_OPENAI_TRANSPORT=http); needs no SDK and can be pointed at a local stub server.
+
+SC_LLM_HTTP_POOL_SIZE caps connections per endpoint (default 8).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any
+from urllib.parse import urlsplit
+
+from _lazy_import import lazy_import
+
+DEFAULT_POOL_SIZE = 8
+KEEPALIVE_EXPIRY_SEC = 60.0
+
+# http.client (with ssl and email) only loads once a request is actually sent.
+_http_client = lazy_import("http.client")
+
+
+def _stale_connection_errors() -> tuple[type[BaseException], ...]:
+    return (_http_client.RemoteDisconnected, _http_client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+
+
+def pool_size() -> int:
+    raw = str(os.environ.get("SC_LLM_HTTP_POOL_SIZE") or "").strip()
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_POOL_SIZE
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+class HttpConnectionPool:
+    """Thread-safe keep-alive connections, at most ``max_size`` per (scheme, host, port)."""
+
+    def __init__(self, *, max_size: int = DEFAULT_POOL_SIZE) -> None:
+        self.max_size = max(1, int(max_size))
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str, int], list[_http_client.HTTPConnection]] = {}
+        self._slots: dict[tuple[str, str, int], threading.BoundedSemaphore] = {}
+        self._stats = {"connections_opened": 0, "requests": 0, "reused_requests": 0}
+
+    def _slot(self, key: tuple[str, str, int]) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = threading.BoundedSemaphore(self.max_size)
+            return slot
+
+    def _connect(self, key: tuple[str, str, int], timeout: float) -> _http_client.HTTPConnection:
+        scheme, host, port = key
+        connection_cls = _http_client.HTTPSConnection if scheme == "https" else _http_client.HTTPConnection
+        with self._lock:
+            self._stats["connections_opened"] += 1
+        return connection_cls(host, port, timeout=timeout)
+
+    def _checkout(self, key: tuple[str, str, int], timeout: float) -> tuple[_http_client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key) or []
+            conn = idle.pop() if idle else None
+        if conn is None:
+            return self._connect(key, timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _checkin(self, key: tuple[str, str, int], conn: _http_client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float,
+    ) -> tuple[int, bytes]:
+        parts = urlsplit(url)
+        scheme = (parts.scheme or "http").lower()
+        key = (scheme, str(parts.hostname or ""), int(parts.port or (443 if scheme == "https" else 80)))
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        request_headers = {"Connection": "keep-alive", **dict(headers or {})}
+        slot = self._slot(key)
+        if not slot.acquire(timeout=max(0.0, float(timeout))):
+            raise TimeoutError(f"no free connection to {key[1]}:{key[2]} within {timeout}s")
+        try:
+            conn, reused = self._checkout(key, float(timeout))
+            while True:
+                try:
+                    conn.request(method, path, body=body, headers=request_headers)
+                    response = conn.getresponse()
+                    payload = response.read()
+                except _stale_connection_errors():
+                    conn.close()
+                    if not reused:
+                        raise
+                    conn, reused = self._connect(key, float(timeout)), False  # server dropped an idle connection
+                    continue
+                except BaseException:
+                    conn.close()
+                    raise
+                break
+            with self._lock:
+                self._stats["requests"] += 1
+                self._stats["reused_requests"] += 1 if reused else 0
+            if response.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            return int(response.status), payload
+        finally:
+            slot.release()
+
+    def post_json(
+        self,
+        url: str,
+        payload: Any,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float,
+    ) -> tuple[int, Any]:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        request_headers = {"Content-Type": "application/json", "Accept": "application/json", **dict(headers or {})}
+        status, raw = self.request("POST", url, body=body, headers=request_headers, timeout=timeout)
+        text = raw.decode("utf-8", errors="replace")
+        try:
+            return status, json.loads(text) if text.strip() else {}
+        except json.JSONDecodeError:
+            return status, text
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        with self._lock:
+            idle = [conn for conns in self._idle.values() for conn in conns]
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
+
+_LOCK = threading.Lock()
+_HTTP_POOL: HttpConnectionPool | None = None
+_SDK_CLIENTS: dict[tuple[int, str, str], object] = {}
+_SDK_STATS = {"sdk_clients": 0, "sdk_client_reuses": 0}
+
+
+def shared_http_pool() -> HttpConnectionPool:
+    global _HTTP_POOL
+    with _LOCK:
+        if _HTTP_POOL is None:
+            _HTTP_POOL = HttpConnectionPool(max_size=pool_size())
+        return _HTTP_POOL
+
+
+def _pooled_httpx_client(timeout_sec: float) -> object | None:
+    try:
+        import httpx  # type: ignore
+    except ImportError:
+        return None
+
+    size = pool_size()
+    limits = httpx.Limits(max_connections=size, max_keepalive_connections=size, keepalive_expiry=KEEPALIVE_EXPIRY_SEC)
+    return httpx.Client(limits=limits, timeout=float(timeout_sec), follow_redirects=True)
+
+
+def shared_openai_client(
+    openai_cls: Any,
+    *,
+    timeout_sec: float,
+    base_url: str = "",
+    api_key: str = "",
+) -> object:
+    """Return the process-wide client for this endpoint, creating it (and its pool) on first use."""
+    fingerprint = hashlib.sha256(str(api_key).encode("utf-8")).hexdigest()[:16] if api_key else ""
+    key = (id(openai_cls), str(base_url), fingerprint)
+    with _LOCK:
+        client = _SDK_CLIENTS.get(key)
+        if client is not None:
+            _SDK_STATS["sdk_client_reuses"] += 1
+            return client
+        kwargs: dict[str, object] = {"timeout": float(timeout_sec)}
+        if base_url:
+            kwargs["base_url"] = base_url
+        if api_key:
+            kwargs["api_key"] = api_key
+        http_client = _pooled_httpx_client(float(timeout_sec))
+        if http_client is not None:
+            kwargs["http_client"] = http_client
+        client = _SDK_CLIENTS[key] = openai_cls(**kwargs)
+        _SDK_STATS["sdk_clients"] += 1
+        return client
+
+
+def client_pool_stats() -> dict[str, int]:
+    with _LOCK:
+        stats = dict(_SDK_STATS)
+        http_pool = _HTTP_POOL
+    if http_pool is not None:
+        stats.update(http_pool.stats())
+    return stats
+
+
+def reset_client_pools() -> None:
+    """Drop every shared client (tests, or after a fork)."""
+    global _HTTP_POOL
+    with _LOCK:
+        clients = list(_SDK_CLIENTS.values())
+        _SDK_CLIENTS.clear()
+        http_pool, _HTTP_POOL = _HTTP_POOL, None
+        _SDK_STATS.update({"sdk_clients": 0, "sdk_client_reuses": 0})
+    for client in clients:
+        close = getattr(client, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:  # noqa: BLE001
+                pass
+    if http_pool is not None:
+        http_pool.close()
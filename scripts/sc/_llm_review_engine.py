@@ -7,10 +7,14 @@ from __future__ import annotations
 
 import argparse
 import time
-from typing import Any
+from typing import Any, Callable
 
 from _acceptance_artifacts import build_acceptance_evidence
 from _deterministic_review import DETERMINISTIC_AGENTS, build_deterministic_review
+from _diff_packer import collect_review_ref_paths, pack_diff_sections
+from _latency_model import latency_key, record_latency
+from _llm_backend import hedge_stats, hedging_enabled, resolve_llm_backend
+from _llm_client_pool import client_pool_stats
 from _llm_review_acceptance import build_acceptance_semantic_context, read_text, strip_emoji, truncate
 from _llm_review_cli import (
     apply_delivery_profile_defaults,
@@ -21,7 +25,7 @@ from _llm_review_cli import (
     summary_base,
     validate_args,
 )
-from _llm_review_exec import auto_resolve_commit_for_task, build_diff_context, run_codex_exec
+from _llm_review_exec import auto_resolve_commit_for_task, build_diff_context, collect_diff_sections, run_codex_exec
 from _llm_review_models import ReviewResult
 from _llm_review_prompting import (
     agent_prompt,
@@ -90,6 +94,7 @@ def _fit_prompt_context(
     diff_position: str,
     max_chars: int,
     allow_drop_acceptance_semantic: bool,
+    diff_packer: Callable[[int], tuple[str, dict[str, Any]]] | None = None,
 ) -> tuple[str, dict[str, Any]]:
     prompt = _compose_prompt(
         blocks=blocks,
@@ -106,6 +111,23 @@ def _fit_prompt_context(
     if len(prompt) <= max_chars:
         return prompt, meta
 
+    if diff_packer is not None:
+        room = max_chars - (len(prompt) - len(diff_ctx))
+        if room > 0:
+            packed_ctx, packing = diff_packer(room)
+            packed_prompt = _compose_prompt(
+                blocks=blocks,
+                diff_ctx=packed_ctx,
+                acceptance_semantic_ctx=acceptance_semantic_ctx,
+                diff_position=diff_position,
+            )
+            if len(packed_prompt) <= max_chars:
+                meta["diff_mode_used"] = "packed"
+                meta["fallbacks_applied"].append("packed_diff")
+                meta["diff_packing"] = packing
+                meta["pre_budget_chars"] = len(packed_prompt)
+                return packed_prompt, meta
+
     if diff_ctx_summary and diff_ctx_summary != diff_ctx:
         summary_prompt = _compose_prompt(
             blocks=blocks,
@@ -317,6 +339,21 @@ def main() -> int:
     acceptance_semantic_cache: dict[str, tuple[str, dict[str, Any] | None]] = {}
     diff_ctx = build_diff_context(args)
     diff_ctx_summary: str | None = None
+    diff_packing_inputs: dict[str, Any] = {}
+
+    def _pack_diff_for(agent_name: str, budget_chars: int) -> tuple[str, dict[str, Any]]:
+        # Collected on first use only: most prompts fit without packing.
+        if not diff_packing_inputs:
+            diff_packing_inputs["sections"] = collect_diff_sections(args)
+            diff_packing_inputs["ref_paths"] = collect_review_ref_paths(triplet)
+        if not diff_packing_inputs["sections"]:
+            return diff_ctx, {"agent": agent_name, "hunks_total": 0, "note": "no raw diff available"}
+        return pack_diff_sections(
+            diff_packing_inputs["sections"],
+            budget_chars=budget_chars,
+            agent=agent_name,
+            ref_paths=diff_packing_inputs["ref_paths"],
+        )
 
     results: list[ReviewResult] = []
     hard_fail = False
@@ -424,6 +461,11 @@ def main() -> int:
             diff_position=prompt_shape["diff_position"],
             max_chars=int(args.prompt_max_chars),
             allow_drop_acceptance_semantic=(agent != "semantic-equivalence-auditor"),
+            diff_packer=(
+                (lambda budget, _agent=agent: _pack_diff_for(_agent, budget))
+                if str(args.diff_mode or "").strip().lower() == "full"
+                else None
+            ),
         )
         prompt_used, budget_meta = apply_prompt_budget(prompt, max_chars=int(args.prompt_max_chars))
         if bool(budget_meta.get("truncated")):
@@ -454,13 +496,25 @@ def main() -> int:
         agent_cap = per_agent_overrides.get(agent, per_agent_timeout_sec)
         remaining_before_sec = max(0, int(remaining))
         effective_timeout = max(1, int(agent_cap))
+        agent_latency_key = latency_key("sc-llm-review", agent=agent, backend=str(args.llm_backend), prompt_chars=len(prompt_used))
+        agent_started = time.perf_counter()
         rc, trace_out, cmd = run_codex_exec(
             backend=str(args.llm_backend),
             prompt=prompt_used,
             output_last_message=output_path,
             timeout_sec=effective_timeout,
             codex_configs=codex_configs,
+            **({"hedge_key": agent_latency_key} if hedging_enabled() else {}),
         )
+        try:
+            record_latency(
+                agent_latency_key,
+                time.perf_counter() - agent_started,
+                outcome="ok" if rc == 0 else ("timeout" if rc == 124 else "error"),
+                root=repo_root(),
+            )
+        except (OSError, TimeoutError):
+            pass
         write_text(trace_path, trace_out)
 
         last_msg = ""
@@ -536,6 +590,10 @@ def main() -> int:
             },
         }
     )
+    if hedging_enabled():
+        summary["llm_hedge"] = hedge_stats()
+    if resolve_llm_backend(str(args.llm_backend)) == "openai-api":
+        summary["llm_client_pool"] = client_pool_stats()
     write_json(out_dir / "summary.json", summary)
     print(f"SC_LLM_REVIEW status={summary['status']} out={repo_rel(out_dir)}")
     return 0 if summary["status"] in ("ok", "warn") else 1
@@ -8,13 +8,14 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from _git_snapshot import git_snapshot
 from _llm_backend import run_llm_exec
 from _llm_review_acceptance import truncate
-from _util import repo_root, run_cmd
+from _util import repo_root
 
 
 def git_capture(args: list[str], *, timeout_sec: int) -> tuple[int, str]:
-    return run_cmd(args, cwd=repo_root(), timeout_sec=timeout_sec)
+    return git_snapshot().git(args, timeout_sec=timeout_sec)
 
 
 def auto_resolve_commit_for_task(task_id: str) -> str | None:
@@ -90,6 +91,31 @@ def build_diff_context(args: argparse.Namespace) -> str:
     return f"## Diff vs {base}\n```diff\n" + truncate(out.strip(), max_chars=60_000) + "\n```"
 
 
+def collect_diff_sections(args: argparse.Namespace) -> list[tuple[str, str, str]]:
+    """Untruncated full-mode diff as ``(title, kind, text)`` sections for the diff packer.
+
+    Returns [] outside full mode or when git fails; the git calls are the ones build_diff_context
+    already made, so the snapshot serves them from memory.
+    """
+    mode = str(getattr(args, "diff_mode", "full") or "full").strip().lower()
+    if mode in {"summary", "none"}:
+        return []
+    if args.uncommitted:
+        rc1, unstaged = git_capture(["git", "diff", "--no-color"], timeout_sec=60)
+        rc2, staged = git_capture(["git", "diff", "--no-color", "--staged"], timeout_sec=60)
+        rc3, untracked = git_capture(["git", "ls-files", "--others", "--exclude-standard"], timeout_sec=30)
+        if rc1 != 0 or rc2 != 0 or rc3 != 0:
+            return []
+        sections = [("## Staged diff", "diff", staged), ("## Unstaged diff", "diff", unstaged), ("## Untracked files", "text", untracked)]
+        return [section for section in sections if section[2].strip()]
+    if args.commit:
+        rc, out = git_capture(["git", "show", "--no-color", args.commit], timeout_sec=60)
+        return [("## Commit diff", "diff", out)] if rc == 0 and out.strip() else []
+    base = args.base
+    rc, out = git_capture(["git", "diff", "--no-color", f"{base}...HEAD"], timeout_sec=60)
+    return [(f"## Diff vs {base}", "diff", out)] if rc == 0 and out.strip() else []
+
+
 def run_codex_exec(
     *,
     backend: str = "codex-cli",
@@ -97,6 +123,7 @@ def run_codex_exec(
     output_last_message: Path,
     timeout_sec: int,
     codex_configs: list[str] | None = None,
+    hedge_key: str | None = None,
 ) -> tuple[int, str, list[str]]:
     return run_llm_exec(
         backend=backend,
@@ -105,4 +132,5 @@ def run_codex_exec(
         output_last_message=output_last_message,
         timeout_sec=timeout_sec,
         codex_configs=codex_configs,
+        hedge_key=hedge_key,
     )
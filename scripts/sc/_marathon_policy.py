@@ -4,7 +4,8 @@ import datetime as dt
 from pathlib import Path
 from typing import Any
 
-from _util import repo_root, run_cmd
+from _git_snapshot import git_snapshot
+from _util import repo_root
 
 
 def _parse_iso(value: str) -> dt.datetime | None:
@@ -93,9 +94,9 @@ def _enrich_diff_stats(payload: dict[str, Any], *, tracked_paths: list[str], unt
 
 
 def capture_diff_stats(*, cwd: Path | None = None, timeout_sec: int = 30) -> dict[str, int]:
-    root = cwd or repo_root()
-    rc_diff, out_diff = run_cmd(["git", "diff", "--numstat", "HEAD"], cwd=root, timeout_sec=timeout_sec)
-    rc_untracked, out_untracked = run_cmd(["git", "ls-files", "--others", "--exclude-standard"], cwd=root, timeout_sec=timeout_sec)
+    snapshot = git_snapshot(cwd or repo_root())
+    rc_diff, out_diff = snapshot.git(["git", "diff", "--numstat", "HEAD"], timeout_sec=timeout_sec)
+    rc_untracked, out_untracked = snapshot.git(["git", "ls-files", "--others", "--exclude-standard"], timeout_sec=timeout_sec)
     if rc_diff != 0 and rc_untracked != 0:
         return _coerce_diff_stats(None)
     files_changed = 0
@@ -5,6 +5,7 @@ import json
 from pathlib import Path
 from typing import Any
 
+from _trace import span
 from _util import ensure_dir, repo_root
 
 
@@ -21,10 +22,11 @@ def marathon_state_path(out_dir: Path) -> Path:
 def _load_json(path: Path) -> dict[str, Any] | None:
     if not path.exists():
         return None
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
-        return None
+    with span("read_json", cat="io", file=path.name):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
     return data if isinstance(data, dict) else None
 
 def _step_template() -> dict[str, Any]:
@@ -0,0 +1,115 @@
+"""Shared executor for the regex-heavy deterministic file scans.
+
+scan_items() runs a per-file scan function over many files and yields the results in input order.
+Large inputs are split into chunks that run in a process pool (the regex work holds the GIL, so
+threads would not help); below the threshold, or when a pool cannot be started, it runs serially
+in this process. Results are the same either way, so callers sort their candidates once and get
+deterministic output.
+
+The scan function must be a module-level function (extra arguments via functools.partial) and
+return something picklable. Knobs:
+- SC_SCAN_WORKERS: worker processes (default: CPU count; 1 forces the serial path).
+- SC_SCAN_PARALLEL_MIN_FILES: smallest input that is worth a pool (default 256); spawning
+  interpreters costs more than scanning a few hundred small files.
+
+contains_any() / contains_any_ci() are the literal-substring prefilters the scanners run before a
+regex: a file without any of a rule's literals cannot match it.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Callable, Iterable, Iterator, Sequence, TypeVar
+
+from _lazy_import import lazy_import
+
+
+WORKERS_ENV = "SC_SCAN_WORKERS"
+MIN_FILES_ENV = "SC_SCAN_PARALLEL_MIN_FILES"
+DEFAULT_MIN_FILES = 256
+CHUNKS_PER_WORKER = 4
+MIN_CHUNK = 16
+# ProcessPoolExecutor rejects max_workers above 61 on Windows (WaitForMultipleObjects limit).
+WINDOWS_MAX_WORKERS = 61
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_futures = lazy_import("concurrent.futures")
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = str(os.environ.get(name) or "").strip()
+    try:
+        return int(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def scan_workers(item_count: int) -> int:
+    """Worker processes for ``item_count`` items; 1 means serial."""
+    if item_count < max(1, _env_int(MIN_FILES_ENV, DEFAULT_MIN_FILES)):
+        return 1
+    workers = _env_int(WORKERS_ENV, 0) or (os.cpu_count() or 1)
+    return max(1, min(workers, item_count // MIN_CHUNK or 1))
+
+
+def _chunks(items: Sequence[T], size: int) -> list[Sequence[T]]:
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _run_chunk(func: Callable[[T], R], chunk: Sequence[T]) -> list[R]:
+    return [func(item) for item in chunk]
+
+
+def scan_items(func: Callable[[T], R], items: Iterable[T], *, workers: int | None = None) -> Iterator[R]:
+    """Yield ``func(item)`` for every item, in input order, chunked across a process pool when large."""
+    items = list(items)
+    workers = scan_workers(len(items)) if workers is None else max(1, int(workers))
+    if workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield func(item)
+        return
+    size = max(MIN_CHUNK, -(-len(items) // (workers * CHUNKS_PER_WORKER)))
+    chunks = _chunks(items, size)
+    try:
+        max_workers = min(workers, len(chunks))
+        if sys.platform == "win32":
+            max_workers = min(max_workers, WINDOWS_MAX_WORKERS)
+        pool = _futures.ProcessPoolExecutor(max_workers=max_workers)
+    except (OSError, NotImplementedError, ImportError, ValueError):
+        # No process support here (e.g. sandboxed semaphores): the serial path gives the same result.
+        for item in items:
+            yield func(item)
+        return
+    done = 0
+    try:
+        with pool:
+            for results in pool.map(_run_chunk, [func] * len(chunks), chunks):
+                done += 1
+                yield from results
+    except (_futures.process.BrokenProcessPool, OSError):
+        # A worker died before its chunk finished; rescan what was not yielded yet.
+        for chunk in chunks[done:]:
+            for item in chunk:
+                yield func(item)
+
+
+def contains_any(text: str, literals: Iterable[str]) -> bool:
+    return any(literal in text for literal in literals)
+
+
+def ci_haystack(text: str) -> str | None:
+    """Lowered ``text`` for contains_any_ci(); None when the prefilter cannot be trusted.
+
+    Under re.IGNORECASE a few non-ASCII letters match ASCII ones (e.g. 'ı' matches 'i', 'ſ' matches
+    's'), so only ASCII text is prefiltered; anything else always goes on to the regex.
+    """
+    return text.lower() if text.isascii() else None
+
+
+def contains_any_ci(haystack: str | None, literals: Iterable[str]) -> bool:
+    """Prefilter for re.IGNORECASE rules with lowercase ASCII ``literals``; see ci_haystack()."""
+    return haystack is None or any(literal in haystack for literal in literals)
+
@@ -11,12 +11,15 @@ from typing import Any, Callable
 from _approval_contract import approval_request_path, approval_response_path
 from _failure_taxonomy import derive_producer_failure_kind
 from _harness_capabilities import harness_capabilities_path
-from _llm_backend import KNOWN_LLM_BACKENDS
 from _pipeline_events import run_events_path
 from _util import repo_root, today_str, write_json, write_text
 
 
 def build_parser() -> argparse.ArgumentParser:
+    # Deferred: _llm_backend is only needed for the choices list, and readers such as inspect_run
+    # import this module without ever building the parser.
+    from _llm_backend import KNOWN_LLM_BACKENDS
+
     parser = argparse.ArgumentParser(description="Run task review pipeline with strict run_id binding.")
     parser.add_argument("--task-id", required=True, help="Task id (e.g. 1 or 1.3).")
     parser.add_argument("--run-id", default=None, help="New run id for normal/fork mode, or selector for resume/abort.")
@@ -4,14 +4,16 @@ import json
 from pathlib import Path
 from typing import Any
 
+from _trace import span
 from _util import repo_root
 
 
 def _read_json(path: Path) -> dict[str, Any]:
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
+    with span("read_json", cat="io", file=path.name):
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
     return payload if isinstance(payload, dict) else {}
 
 
@@ -8,6 +8,7 @@ from typing import Any, Callable
 
 from _failure_taxonomy import derive_producer_failure_kind
 from _pipeline_helpers import has_materialized_pipeline_steps
+from _trace import finish_trace
 
 
 def _sync_summary_recovery_recommendation(summary: dict[str, Any], active_task_payload: dict[str, Any]) -> None:
@@ -449,6 +450,9 @@ class PipelineSession:
         else:
             self._append_run_completed(agent_review_rc=0)
         self.summary["finished_at_utc"] = datetime.now(timezone.utc).isoformat()
+        trace_summary = finish_trace()
+        if trace_summary:
+            self.summary["trace"] = trace_summary
         if not self.persist():
             return 2
         return 0 if self.summary["status"] == "ok" else 1
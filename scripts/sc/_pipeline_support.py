@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import re
-import shutil
+import sys
 import time
 from pathlib import Path
 from typing import Any
@@ -13,8 +13,15 @@ from _delivery_profile import profile_agent_review_defaults
 from _harness_capabilities import harness_capabilities_path
 from _pipeline_events import run_events_path
 from _pipeline_helpers import derive_pipeline_run_type
+from _trace import span
 from _util import repo_root, run_cmd, today_str, write_json, write_text
 
+PYTHON_DIR = Path(__file__).resolve().parents[1] / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from _artifact_store import snapshot_files, snapshot_tree  # noqa: E402
+
 
 OUT_RE = re.compile(r"\bout=([^\r\n]+)")
 AGENT_REVIEW_MODES = {"skip", "warn", "require"}
@@ -56,17 +63,27 @@ def _snapshot_child_artifacts(*, pipeline_out_dir: Path, step_name: str, reporte
     except ValueError:
         pass
 
-    snapshot_dir = pipeline_out_dir / "child-artifacts" / step_name
-    if snapshot_dir.exists():
-        shutil.rmtree(snapshot_dir)
-    shutil.copytree(resolved, snapshot_dir)
-    summary_path = snapshot_dir / "summary.json"
-    return str(snapshot_dir), str(summary_path) if summary_path.exists() else ""
+    return snapshot_directory(source_dir=resolved, target_dir=pipeline_out_dir / "child-artifacts" / step_name)
+
+
+def snapshot_directory(*, source_dir: Path, target_dir: Path) -> tuple[str, str]:
+    """Replace target_dir with a snapshot of source_dir built from the shared artifact store."""
+    snapshot_tree(source_dir=source_dir, target_dir=target_dir, root=repo_root())
+    summary_path = target_dir / "summary.json"
+    return str(target_dir), str(summary_path) if summary_path.exists() else ""
+
+
+def snapshot_summary_file(*, source_summary: Path, target_dir: Path) -> tuple[str, str]:
+    snapshot_files(target_dir=target_dir, files=[(source_summary, "summary.json")], root=repo_root())
+    return str(target_dir), str(target_dir / "summary.json")
 
 
 def run_step(*, out_dir: Path, name: str, cmd: list[str], timeout_sec: int) -> dict[str, Any]:
     started = time.monotonic()
-    rc, out = run_cmd(cmd, cwd=repo_root(), timeout_sec=timeout_sec)
+    with span(f"step {name}", cat="step") as attrs:
+        rc, out = run_cmd(cmd, cwd=repo_root(), timeout_sec=timeout_sec)
+        if attrs is not None:
+            attrs["rc"] = rc
     duration_sec = round(max(0.0, time.monotonic() - started), 3)
     log_path = out_dir / f"{name}.log"
     write_text(log_path, out)
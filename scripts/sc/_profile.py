@@ -0,0 +1,332 @@
+"""SC_PROFILE hooks for sc entry points: per-module import times and a stdlib sampling profiler.
+
+SC_PROFILE is a comma list of modes, read when this module is first imported:
+- import: time every module imported from then on (find + load + exec, -X importtime style) and
+  write import-<script>-<pid>.txt / .json with self and cumulative microseconds per module.
+- cpu: sample the stacks of all threads every SC_PROFILE_INTERVAL_MS (default 5 ms, wall clock,
+  so blocking waits show up too) and write cpu-<script>-<pid>.collapsed (flamegraph.pl / speedscope
+  "collapsed stacks") and cpu-<script>-<pid>.speedscope.json.
+
+Reports are written at exit to SC_PROFILE_DIR, or logs/ci/<date>/sc-profile/ when unset. Entry
+points that own an out-dir call profile_out_dir(out_dir) so the reports land next to summary.json;
+that also exports SC_PROFILE_DIR, so child sc processes report into the same directory.
+
+Entry points import this module before their other local imports (and _util imports it first) so
+the import table covers their helper graph; modules loaded before it count as preloaded. The module
+itself only imports what the interpreter has already loaded at start-up, so importing it with
+SC_PROFILE unset costs nothing measurable.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from typing import Any
+
+
+PROFILE_ENV = "SC_PROFILE"
+DIR_ENV = "SC_PROFILE_DIR"
+INTERVAL_ENV = "SC_PROFILE_INTERVAL_MS"
+PROFILE_MODES = ("import", "cpu")
+DEFAULT_INTERVAL_MS = 5.0
+DEFAULT_TOP_N = 30
+
+_MODES: frozenset[str] = frozenset()
+_IMPORTS: "_ImportTimer | None" = None
+_SAMPLER: "_Sampler | None" = None
+
+
+def profile_modes(value: str | None = None) -> frozenset[str]:
+    raw = os.environ.get(PROFILE_ENV, "") if value is None else value
+    return frozenset(item.strip().lower() for item in str(raw or "").split(",") if item.strip().lower() in PROFILE_MODES)
+
+
+def _script_name() -> str:
+    name = os.path.basename(str(sys.argv[0] if sys.argv and sys.argv[0] else "python"))
+    return os.path.splitext(name)[0].replace(" ", "_") or "python"
+
+
+class _TimedLoader:
+    """Delegating loader that records how long a module takes to create and execute."""
+
+    def __init__(self, loader: Any, timer: "_ImportTimer", name: str, find_ns: int) -> None:
+        self._loader = loader
+        self._timer = timer
+        self._name = name
+        self._find_ns = find_ns
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec: Any) -> Any:
+        create = getattr(self._loader, "create_module", None)
+        if create is None:
+            return None
+        self._timer.enter(self._name, self._find_ns)
+        self._find_ns = 0
+        try:
+            return create(spec)
+        finally:
+            self._timer.leave_create(self._name)
+
+    def exec_module(self, module: Any) -> None:
+        self._timer.enter(self._name, self._find_ns)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.leave(self._name)
+
+
+class _ImportTimer:
+    """sys.meta_path hook; finding is delegated to the finders behind it."""
+
+    def __init__(self) -> None:
+        import threading
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.records: list[dict[str, Any]] = []
+        self.preloaded = len(sys.modules)
+        # name -> [start_ns, child_ns, depth] for modules whose body is running.
+        self._open: dict[str, list[int]] = {}
+
+    def _stack(self) -> list[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> Any:
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        started = time.perf_counter_ns()
+        try:
+            spec = None
+            for finder in list(sys.meta_path):
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._local.finding = False
+        if spec is None or spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _TimedLoader(spec.loader, self, fullname, time.perf_counter_ns() - started)
+        return spec
+
+    def enter(self, name: str, find_ns: int) -> None:
+        stack = self._stack()
+        entry = self._open.get(name)
+        if entry is None:
+            # Extension modules run create_module then exec_module; both count toward one record.
+            self._open[name] = [time.perf_counter_ns() - find_ns, 0, len(stack)]
+        stack.append(name)
+
+    def leave_create(self, name: str) -> None:
+        stack = self._stack()
+        if stack and stack[-1] == name:
+            stack.pop()
+
+    def leave(self, name: str) -> None:
+        stack = self._stack()
+        if stack and stack[-1] == name:
+            stack.pop()
+        entry = self._open.pop(name, None)
+        if entry is None:
+            return
+        started, child_ns, depth = entry
+        cumulative = time.perf_counter_ns() - started
+        if stack and stack[-1] in self._open:
+            self._open[stack[-1]][1] += cumulative
+        with self._lock:
+            self.records.append(
+                {"module": name, "self_us": max(0, cumulative - child_ns) // 1000, "cumulative_us": cumulative // 1000, "depth": depth}
+            )
+
+
+def import_report(timer: "_ImportTimer", *, top_n: int = DEFAULT_TOP_N) -> dict[str, Any]:
+    from _lazy_import import lazy_import_report
+
+    records = list(timer.records)
+    top_level = [item for item in records if item["depth"] == 0]
+    return {
+        "script": _script_name(),
+        "pid": os.getpid(),
+        "preloaded_modules": timer.preloaded,
+        "imported_modules": len(records),
+        "total_import_us": sum(item["cumulative_us"] for item in top_level),
+        "top_self": sorted(records, key=lambda item: (-item["self_us"], item["module"]))[: max(0, top_n)],
+        "lazy_imports": lazy_import_report(),
+        "records": records,
+    }
+
+
+def render_import_table(records: list[dict[str, Any]]) -> str:
+    lines = ["import time: self [us] | cumulative | imported package"]
+    for item in records:
+        lines.append(f"import time: {item['self_us']:>9} | {item['cumulative_us']:>10} | {'  ' * (item['depth'] + 1)}{item['module']}")
+    return "\n".join(lines) + "\n"
+
+
+def _frame_label(code: Any) -> tuple[str, str, int]:
+    return (str(getattr(code, "co_qualname", code.co_name)), os.path.basename(code.co_filename), int(code.co_firstlineno))
+
+
+class _Sampler:
+    def __init__(self, interval_sec: float) -> None:
+        import threading
+
+        self.interval_sec = interval_sec
+        self.counts: dict[tuple[str, tuple[tuple[str, str, int], ...]], int] = {}
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sc-profile-sampler", daemon=True)
+        self._enumerate = threading.enumerate
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+
+    def _run(self) -> None:
+        own = self._thread.ident
+        while not self._stop.wait(self.interval_sec):
+            names = {thread.ident: thread.name for thread in self._enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                stack: list[tuple[str, str, int]] = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                key = (names.get(thread_id, str(thread_id)), tuple(reversed(stack)))
+                self.counts[key] = self.counts.get(key, 0) + 1
+            self.samples += 1
+
+
+def collapsed_stacks(counts: dict[tuple[str, tuple[tuple[str, str, int], ...]], int]) -> str:
+    lines = []
+    for (thread, stack), count in sorted(counts.items(), key=lambda item: -item[1]):
+        frames = [thread, *(f"{name} ({file}:{line})" for name, file, line in stack)]
+        lines.append(";".join(frame.replace(";", ",") for frame in frames) + f" {count}")
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def speedscope_profile(counts: dict[tuple[str, tuple[tuple[str, str, int], ...]], int], *, interval_ms: float, name: str) -> dict[str, Any]:
+    """Sampled speedscope document, one profile per thread; identical stacks are merged into weights."""
+    frames: list[dict[str, Any]] = []
+    index: dict[tuple[str, str, int], int] = {}
+    profiles: dict[str, dict[str, Any]] = {}
+    for (thread, stack), count in sorted(counts.items(), key=lambda item: (item[0][0], -item[1])):
+        sample = []
+        for frame in stack:
+            if frame not in index:
+                index[frame] = len(frames)
+                frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+            sample.append(index[frame])
+        profile = profiles.setdefault(
+            thread,
+            {"type": "sampled", "name": thread, "unit": "milliseconds", "startValue": 0, "endValue": 0, "samples": [], "weights": []},
+        )
+        profile["samples"].append(sample)
+        profile["weights"].append(round(count * interval_ms, 3))
+        profile["endValue"] = round(profile["endValue"] + count * interval_ms, 3)
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": list(profiles.values()),
+        "name": name,
+        "activeProfileIndex": 0,
+        "exporter": "scripts/sc/_profile.py",
+    }
+
+
+def profile_dir() -> Any:
+    from pathlib import Path
+
+    configured = str(os.environ.get(DIR_ENV) or "").strip()
+    if configured:
+        return Path(configured)
+    from _util import ci_dir
+
+    return ci_dir("sc-profile")
+
+
+def profile_out_dir(out_dir: Any) -> None:
+    """Send this process's reports, and those of sc children it spawns, to ``out_dir``/profile."""
+    if _MODES:
+        os.environ[DIR_ENV] = str(os.path.join(os.path.abspath(str(out_dir)), "profile"))
+
+
+def _interval_ms() -> float:
+    try:
+        value = float(str(os.environ.get(INTERVAL_ENV) or "").strip() or DEFAULT_INTERVAL_MS)
+    except ValueError:
+        return DEFAULT_INTERVAL_MS
+    return value if value > 0 else DEFAULT_INTERVAL_MS
+
+
+def write_reports() -> list[str]:
+    """Stop profiling and write the reports of the enabled modes; returns the written paths."""
+    import json
+
+    global _IMPORTS, _SAMPLER
+    timer, sampler = _IMPORTS, _SAMPLER
+    if timer is not None and timer in sys.meta_path:
+        sys.meta_path.remove(timer)
+    if sampler is not None:
+        sampler.stop()
+    _IMPORTS = _SAMPLER = None
+    if timer is None and sampler is None:
+        return []
+    out_dir = profile_dir()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"{_script_name()}-{os.getpid()}"
+    written: list[str] = []
+    if timer is not None:
+        report = import_report(timer)
+        (out_dir / f"import-{stem}.txt").write_text(render_import_table(report["records"]), encoding="utf-8")
+        (out_dir / f"import-{stem}.json").write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        written += [str(out_dir / f"import-{stem}.txt"), str(out_dir / f"import-{stem}.json")]
+    if sampler is not None:
+        interval_ms = sampler.interval_sec * 1000.0
+        (out_dir / f"cpu-{stem}.collapsed").write_text(collapsed_stacks(sampler.counts), encoding="utf-8")
+        document = speedscope_profile(sampler.counts, interval_ms=interval_ms, name=f"{_script_name()} (pid {os.getpid()})")
+        (out_dir / f"cpu-{stem}.speedscope.json").write_text(json.dumps(document, ensure_ascii=False) + "\n", encoding="utf-8")
+        written += [str(out_dir / f"cpu-{stem}.collapsed"), str(out_dir / f"cpu-{stem}.speedscope.json")]
+    return written
+
+
+def _write_reports_at_exit() -> None:
+    try:
+        written = write_reports()
+    except Exception as exc:  # noqa: BLE001 - profiling must never change the exit status
+        print(f"SC_PROFILE status=fail error={exc}", file=sys.stderr)
+        return
+    if written:
+        print(f"SC_PROFILE modes={','.join(sorted(_MODES))} out={os.path.dirname(written[0])}", file=sys.stderr)
+
+
+def _install_from_env() -> None:
+    global _MODES, _IMPORTS, _SAMPLER
+    _MODES = profile_modes()
+    if not _MODES:
+        return
+    import atexit
+
+    if "import" in _MODES:
+        _IMPORTS = _ImportTimer()
+        sys.meta_path.insert(0, _IMPORTS)
+    if "cpu" in _MODES:
+        _SAMPLER = _Sampler(_interval_ms() / 1000.0)
+        _SAMPLER.start()
+    atexit.register(_write_reports_at_exit)
+
+
+_install_from_env()
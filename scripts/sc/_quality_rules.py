@@ -16,11 +16,14 @@ Scope (4 rules):
 
 from __future__ import annotations
 
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
 
+from _parallel_scan import contains_any, scan_items
+
 
 @dataclass(frozen=True)
 class Finding:
@@ -35,6 +38,10 @@ class Finding:
 _BLOCKING_WAIT_RE = re.compile(r"\.GetAwaiter\s*\(\s*\)\s*\.GetResult\s*\(\s*\)")
 _EVENTBUS_LOOKUP_RE = re.compile(r'GetNodeOrNull\s*<\s*EventBusAdapter\s*>\s*\(\s*"/root/EventBus"\s*\)')
 _DOMAIN_EVENT_CONNECT_RE = re.compile(r"Connect\s*\(\s*EventBusAdapter\.SignalName\.DomainEventEmitted\b")
+# Literals every match of a rule contains; a file without any of them skips the rule's regex.
+_BLOCKING_WAIT_LITERALS = ("GetAwaiter",)
+_UI_RULE_LITERALS = ("/root/EventBus", "DomainEventEmitted", "JsonDocument.Parse")
+_SKIP_DIRS = {".git", ".godot", "bin", "obj", "logs", "TestResults"}
 
 
 def _to_posix(path: Path) -> str:
@@ -42,21 +49,18 @@ def _to_posix(path: Path) -> str:
 
 
 def _iter_cs_files(root: Path) -> Iterable[Path]:
-    for p in root.rglob("*.cs"):
-        if not p.is_file():
-            continue
-        if any(seg in {".git", ".godot", "bin", "obj", "logs", "TestResults"} for seg in p.parts):
-            continue
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Prune instead of filtering rglob results, so .git/bin/obj/logs trees are never walked.
+        dirnames[:] = sorted(name for name in dirnames if name not in _SKIP_DIRS)
         # Tests.Godot/Game.Godot is a Junction to Game.Godot (SSoT). Scanning it would
         # duplicate findings and slow down gates. Always prefer the canonical path.
-        if "Tests.Godot" in p.parts and "Game.Godot" in p.parts:
-            try:
-                i = p.parts.index("Tests.Godot")
-                if i + 1 < len(p.parts) and p.parts[i + 1] == "Game.Godot":
-                    continue
-            except ValueError:
-                pass
-        yield p
+        if os.path.basename(dirpath) == "Tests.Godot" and "Game.Godot" in dirnames:
+            dirnames.remove("Game.Godot")
+        for name in sorted(filenames):
+            if os.path.normcase(name).endswith(".cs"):
+                p = Path(dirpath) / name
+                if p.is_file():
+                    yield p
 
 
 def _is_blocking_wait_hard_scope(rel: str) -> bool:
@@ -137,64 +141,83 @@ def _find_jsondocument_parse_single_arg(text: str) -> list[int]:
     return hits
 
 
-def scan_quality_rules(*, repo_root: Path) -> dict[str, Any]:
+def _applies_ui_rules(rel: str) -> bool:
+    # UI-specific rules: apply to runtime UI scripts (both main project and Tests.Godot runtime mirror).
+    return "/Scripts/" in rel and rel.endswith(".cs")
+
+
+def _scan_cs_file(item: tuple[str, str]) -> list[Finding]:
+    """Findings for one candidate file; runs in scan worker processes for large repos."""
+    path, rel = item
+    text = Path(path).read_text(encoding="utf-8", errors="ignore")
     findings: list[Finding] = []
 
-    for p in _iter_cs_files(repo_root):
-        rel = _to_posix(p.relative_to(repo_root))
-        text = p.read_text(encoding="utf-8", errors="ignore")
-
-        if _is_blocking_wait_hard_scope(rel) and _BLOCKING_WAIT_RE.search(text):
-            for m in _BLOCKING_WAIT_RE.finditer(text):
-                line = _line_number(text, m.start())
-                sample = text.splitlines()[line - 1].strip() if line - 1 < len(text.splitlines()) else None
-                findings.append(
-                    Finding(
-                        rule="cs.blocking_async_wait",
-                        severity="p0",
-                        file=rel,
-                        line=line,
-                        message="Blocking async wait via GetAwaiter().GetResult() in Game.Core services or Godot runtime scripts.",
-                        sample=sample,
-                    )
+    if _is_blocking_wait_hard_scope(rel) and contains_any(text, _BLOCKING_WAIT_LITERALS) and _BLOCKING_WAIT_RE.search(text):
+        lines = text.splitlines()
+        for m in _BLOCKING_WAIT_RE.finditer(text):
+            line = _line_number(text, m.start())
+            sample = lines[line - 1].strip() if line - 1 < len(lines) else None
+            findings.append(
+                Finding(
+                    rule="cs.blocking_async_wait",
+                    severity="p0",
+                    file=rel,
+                    line=line,
+                    message="Blocking async wait via GetAwaiter().GetResult() in Game.Core services or Godot runtime scripts.",
+                    sample=sample,
                 )
-
-        # UI-specific rules: apply to runtime UI scripts (both main project and Tests.Godot runtime mirror).
-        if "/Scripts/" in rel and rel.endswith(".cs"):
-            lookups = list(_EVENTBUS_LOOKUP_RE.finditer(text))
-            if len(lookups) > 1:
-                findings.append(
-                    Finding(
-                        rule="cs.eventbus_repeated_lookup",
-                        severity="p1",
-                        file=rel,
-                        line=_line_number(text, lookups[1].start()),
-                        message=f"Repeated GetNodeOrNull<EventBusAdapter>(\"/root/EventBus\") lookups in one file (count={len(lookups)}). Prefer caching/injection.",
-                        sample=lookups[1].group(0),
-                    )
+            )
+
+    if _applies_ui_rules(rel) and contains_any(text, _UI_RULE_LITERALS):
+        lookups = list(_EVENTBUS_LOOKUP_RE.finditer(text)) if "/root/EventBus" in text else []
+        if len(lookups) > 1:
+            findings.append(
+                Finding(
+                    rule="cs.eventbus_repeated_lookup",
+                    severity="p1",
+                    file=rel,
+                    line=_line_number(text, lookups[1].start()),
+                    message=f"Repeated GetNodeOrNull<EventBusAdapter>(\"/root/EventBus\") lookups in one file (count={len(lookups)}). Prefer caching/injection.",
+                    sample=lookups[1].group(0),
                 )
-
-            if _DOMAIN_EVENT_CONNECT_RE.search(text) and "override void _ExitTree" not in text:
-                findings.append(
-                    Finding(
-                        rule="cs.domain_event_connect_without_exit_cleanup",
-                        severity="p1",
-                        file=rel,
-                        line=None,
-                        message="Connect(DomainEventEmitted) detected but no _ExitTree override found; risk of leaked signal connection.",
-                    )
+            )
+
+        if "DomainEventEmitted" in text and _DOMAIN_EVENT_CONNECT_RE.search(text) and "override void _ExitTree" not in text:
+            findings.append(
+                Finding(
+                    rule="cs.domain_event_connect_without_exit_cleanup",
+                    severity="p1",
+                    file=rel,
+                    line=None,
+                    message="Connect(DomainEventEmitted) detected but no _ExitTree override found; risk of leaked signal connection.",
                 )
-
-            for pos in _find_jsondocument_parse_single_arg(text):
-                findings.append(
-                    Finding(
-                        rule="cs.jsondocument_parse_single_arg",
-                        severity="p1",
-                        file=rel,
-                        line=_line_number(text, pos),
-                        message="JsonDocument.Parse(...) called without JsonDocumentOptions (no MaxDepth bound). Prefer JsonDocument.Parse(json, options).",
-                    )
+            )
+
+        for pos in _find_jsondocument_parse_single_arg(text):
+            findings.append(
+                Finding(
+                    rule="cs.jsondocument_parse_single_arg",
+                    severity="p1",
+                    file=rel,
+                    line=_line_number(text, pos),
+                    message="JsonDocument.Parse(...) called without JsonDocumentOptions (no MaxDepth bound). Prefer JsonDocument.Parse(json, options).",
                 )
+            )
+    return findings
+
+
+def scan_quality_rules(*, repo_root: Path) -> dict[str, Any]:
+    findings: list[Finding] = []
+
+    # Files outside every rule's scope are never read; the rest are scanned in path order, in a
+    # process pool once there are enough of them (scripts/sc/_parallel_scan.py).
+    candidates: list[tuple[str, str]] = []
+    for p in _iter_cs_files(repo_root):
+        rel = _to_posix(p.relative_to(repo_root))
+        if _is_blocking_wait_hard_scope(rel) or _applies_ui_rules(rel):
+            candidates.append((str(p), rel))
+    for file_findings in scan_items(_scan_cs_file, candidates):
+        findings.extend(file_findings)
 
     by_sev: dict[str, list[dict[str, Any]]] = {"p0": [], "p1": [], "p2": []}
     for f in findings:
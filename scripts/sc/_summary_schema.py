@@ -10,6 +10,7 @@ from _summary_schema_fallback import (
     validate_sc_acceptance_without_jsonschema,
     validate_sc_test_without_jsonschema,
 )
+from _trace import span
 from _util import repo_root
 
 try:
@@ -86,11 +87,14 @@ def _validate_summary(
     label: str,
     fallback_validator: Callable[[dict[str, Any]], list[str]],
 ) -> None:
-    schema = _load_schema(schema_path, label)
-    if jsonschema is not None:
-        errors = _validate_with_jsonschema(payload, schema)
-    else:
-        errors = fallback_validator(payload)
+    with span(f"schema_validate {label}", cat="schema", jsonschema=jsonschema is not None) as attrs:
+        schema = _load_schema(schema_path, label)
+        if jsonschema is not None:
+            errors = _validate_with_jsonschema(payload, schema)
+        else:
+            errors = fallback_validator(payload)
+        if attrs is not None:
+            attrs["errors"] = len(errors)
     if errors:
         raise _build_error(label, errors)
 
@@ -91,6 +91,7 @@ def validate_pipeline_without_jsonschema(payload: dict[str, Any]) -> list[str]:
         "step_duration_totals",
         "step_duration_avg",
         "dominant_cost_phase",
+        "trace",
     }
     for key in required:
         if key not in payload:
@@ -175,6 +176,8 @@ def validate_pipeline_without_jsonschema(payload: dict[str, Any]) -> list[str]:
                         errors.append(f"$.{key}.{sub_key}: must be number >= 0")
     if "dominant_cost_phase" in payload and not _is_non_empty_string(payload.get("dominant_cost_phase")):
         errors.append("$.dominant_cost_phase: must be non-empty string when present")
+    if "trace" in payload and not isinstance(payload.get("trace"), dict):
+        errors.append("$.trace: must be object when present")
 
     steps = payload.get("steps")
     if not isinstance(steps, list):
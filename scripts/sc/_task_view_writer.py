@@ -0,0 +1,205 @@
+"""Serialized writes for the task view files (tasks_back.json / tasks_gameplay.json).
+
+Light-lane workers run align --apply and fill_refs --write for different tasks at the same time.
+Each of them loads the whole view before its LLM calls, so rewriting the file from that copy would
+drop entries another worker committed in the meantime. commit_view_entries takes an exclusive
+lock, re-reads the view, swaps in only the entries of the tasks the caller owns and logs the change
+to a write-ahead journal before the atomic replace; an interrupted commit is replayed by the next
+writer.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Iterator
+
+from _util import repo_root
+
+
+LOCK_POLL_SEC = 0.05
+DEFAULT_LOCK_TIMEOUT_SEC = 600.0
+
+
+def writer_state_dir(root: Path | None = None) -> Path:
+    return (root or repo_root()) / "logs" / "ci" / ".task-view-writer"
+
+
+def _state_stem(view_path: Path) -> str:
+    digest = hashlib.sha1(str(view_path.resolve()).encode("utf-8")).hexdigest()[:12]
+    return f"{view_path.name}-{digest}"
+
+
+def lock_path(view_path: Path, *, root: Path | None = None) -> Path:
+    return writer_state_dir(root) / f"{_state_stem(view_path)}.lock"
+
+
+def journal_path(view_path: Path, *, root: Path | None = None) -> Path:
+    return writer_state_dir(root) / f"{_state_stem(view_path)}.journal.jsonl"
+
+
+def _try_lock(handle: Any) -> bool:
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        import msvcrt
+
+        try:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(handle: Any) -> None:
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        import msvcrt
+
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        return
+    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def view_lock(
+    view_path: Path,
+    *,
+    root: Path | None = None,
+    timeout_sec: float = DEFAULT_LOCK_TIMEOUT_SEC,
+) -> Iterator[None]:
+    """Exclusive cross-process lock for one view file."""
+    path = lock_path(view_path, root=root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.perf_counter() + max(0.0, float(timeout_sec))
+    with path.open("a+b") as handle:
+        while not _try_lock(handle):
+            if time.perf_counter() >= deadline:
+                raise TimeoutError(f"view lock busy: {path}")
+            time.sleep(LOCK_POLL_SEC)
+        try:
+            yield
+        finally:
+            _unlock(handle)
+
+
+def _entry_task_id(item: Any) -> int | None:
+    if isinstance(item, dict) and isinstance(item.get("taskmaster_id"), int):
+        return int(item["taskmaster_id"])
+    return None
+
+
+def merge_view_entries(current: list[Any], updates: dict[int, dict[str, Any]]) -> list[Any]:
+    """Replace entries whose taskmaster_id is in ``updates``; unknown ids are appended in id order.
+
+    Only the first entry with a given id is replaced; later duplicates are kept unchanged, so a
+    view write never drops rows.
+    """
+    merged: list[Any] = []
+    placed: set[int] = set()
+    for item in current:
+        task_id = _entry_task_id(item)
+        if task_id is not None and task_id in updates and task_id not in placed:
+            merged.append(updates[task_id])
+            placed.add(task_id)
+        else:
+            merged.append(item)
+    merged.extend(updates[task_id] for task_id in sorted(updates) if task_id not in placed)
+    return merged
+
+
+def _write_view_atomic(view_path: Path, payload: list[Any]) -> None:
+    staging = view_path.with_name(f".{view_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        staging.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8", newline="\n")
+        os.replace(staging, view_path)
+    finally:
+        if staging.exists():
+            staging.unlink()
+
+
+def _load_view(view_path: Path) -> list[Any]:
+    payload = json.loads(view_path.read_text(encoding="utf-8"))
+    if not isinstance(payload, list):
+        raise ValueError(f"view is not a JSON array: {view_path}")
+    return payload
+
+
+def _pending_journal_updates(path: Path) -> dict[int, dict[str, Any]]:
+    pending: dict[int, dict[str, Any]] = {}
+    if not path.is_file():
+        return pending
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue  # torn tail from a crash before fsync: that commit never started
+        for key, entry in dict(record.get("entries") or {}).items():
+            if str(key).isdigit() and isinstance(entry, dict):
+                pending[int(key)] = entry
+    return pending
+
+
+def commit_view_entries(
+    view_path: Path,
+    updates: dict[int, dict[str, Any]],
+    *,
+    root: Path | None = None,
+    writer: str = "",
+) -> dict[str, Any]:
+    """Merge ``updates`` into the current on-disk view under the view lock."""
+    journal = journal_path(view_path, root=root)
+    with view_lock(view_path, root=root):
+        replayed = _pending_journal_updates(journal)
+        if not updates and not replayed:
+            return {"path": str(view_path).replace("\\", "/"), "task_ids": [], "replayed_task_ids": []}
+        # Load and merge before journaling: a view that cannot be read fails the commit without
+        # leaving a record the next writer would replay.
+        merged = merge_view_entries(_load_view(view_path), {**replayed, **updates})
+        record = {
+            "view": str(view_path).replace("\\", "/"),
+            "writer": writer,
+            "pid": os.getpid(),
+            "entries": {str(task_id): entry for task_id, entry in sorted(updates.items())},
+        }
+        with journal.open("a", encoding="utf-8") as handle:
+            journal_size = handle.tell()
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+            try:
+                _write_view_atomic(view_path, merged)
+            except BaseException:
+                # The caller sees this commit fail, so it must not be replayed; only a crash is.
+                handle.truncate(journal_size)
+                raise
+        journal.unlink(missing_ok=True)
+    return {
+        "path": str(view_path).replace("\\", "/"),
+        "task_ids": sorted(updates),
+        "replayed_task_ids": sorted(set(replayed) - set(updates)),
+    }
+
+
+def collect_view_entries(view: list[Any], task_ids: set[int] | list[int]) -> dict[int, dict[str, Any]]:
+    """Entries of ``view`` owned by ``task_ids``; the first row wins when an id repeats, as in merge_view_entries."""
+    wanted = set(task_ids)
+    collected: dict[int, dict[str, Any]] = {}
+    for item in view:
+        task_id = _entry_task_id(item)
+        if task_id is not None and task_id in wanted:
+            collected.setdefault(task_id, item)
+    return collected
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any
 
 from _taskmaster_paths import resolve_default_task_triplet_paths
+from _trace import span
 from _util import repo_root
 
 
@@ -34,7 +35,8 @@ class TaskmasterTriplet:
 
 
 def load_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    with span("read_json", cat="io", file=Path(path).name):
+        return json.loads(path.read_text(encoding="utf-8"))
 
 
 def default_paths() -> tuple[Path, Path, Path]:
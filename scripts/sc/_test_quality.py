@@ -16,6 +16,8 @@ import re
 from pathlib import Path
 from typing import Any
 
+from _parallel_scan import ci_haystack, contains_any_ci, scan_items
+
 
 EVENT_RE = re.compile(r"\b(?:core|ui)\.[a-z0-9_]+(?:\.[a-z0-9_]+){1,}\b", re.IGNORECASE)
 PUBLISH_RE = re.compile(r"\bPublishSimple\s*\(\s*\"(core|ui)\.", re.IGNORECASE)
@@ -27,6 +29,8 @@ FLAKY_RULES: list[tuple[str, re.Pattern[str]]] = [
     ("gd.await_until", re.compile(r"\b_await_until\s*\(", re.IGNORECASE)),
     ("gd.distance_tolerance", re.compile(r"\bdistance_to\s*\(.*\)\s*<=?\s*0\.\d+", re.IGNORECASE)),
 ]
+# Lowercase literals every match contains; files without them skip the regex (see _parallel_scan).
+FLAKY_RULE_LITERALS = {"gd.timer_wait": "create_timer", "gd.await_until": "_await_until", "gd.distance_tolerance": "distance_to"}
 
 
 def _to_posix(path: Path) -> str:
@@ -70,6 +74,33 @@ def _iter_gdunit_tests(tests_root: Path) -> list[Path]:
     return filtered
 
 
+def _scan_gdunit_file(item: tuple[str, str]) -> tuple[bool, list[str], list[dict[str, Any]]]:
+    """(behavior test?, referenced core./ui. events, flaky findings) for one GdUnit file."""
+    path, rel = item
+    text = _read_text(Path(path))
+    haystack = ci_haystack(text)
+    has_publish = contains_any_ci(haystack, ("publishsimple",)) and bool(PUBLISH_RE.search(text))
+    has_assert = contains_any_ci(haystack, ("assert_",)) and bool(ASSERT_RE.search(text))
+
+    # Track event strings referenced in tests (best-effort).
+    events: list[str] = []
+    if contains_any_ci(haystack, ("core.", "ui.")):
+        for m in EVENT_RE.finditer(text):
+            ev = m.group(0).lower()
+            if ev.startswith(("core.", "ui.")):
+                events.append(ev)
+
+    # Flaky heuristics (line level).
+    flaky: list[dict[str, Any]] = []
+    rules = [(rule_name, rx) for rule_name, rx in FLAKY_RULES if contains_any_ci(haystack, (FLAKY_RULE_LITERALS[rule_name],))]
+    if rules:
+        for i, line in enumerate(text.splitlines(), start=1):
+            for rule_name, rx in rules:
+                if rx.search(line):
+                    flaky.append({"file": rel, "line": i, "rule": rule_name, "text": line.strip()})
+    return has_publish and has_assert, events, flaky
+
+
 def assess_test_quality(
     *,
     repo_root: Path,
@@ -88,33 +119,13 @@ def assess_test_quality(
     flaky_findings: list[dict[str, Any]] = []
     referenced_events: dict[str, set[str]] = {"core": set(), "ui": set()}
 
-    for p in gd_tests:
-        text = _read_text(p)
-        has_publish = bool(PUBLISH_RE.search(text))
-        has_assert = bool(ASSERT_RE.search(text))
-        if has_publish and has_assert:
-            behavior_tests.append(_to_posix(p.relative_to(repo_root)))
-
-        # Track event strings referenced in tests (best-effort).
-        for m in EVENT_RE.finditer(text):
-            ev = m.group(0).lower()
-            if ev.startswith("core."):
-                referenced_events["core"].add(ev)
-            elif ev.startswith("ui."):
-                referenced_events["ui"].add(ev)
-
-        # Flaky heuristics (line level).
-        for i, line in enumerate(text.splitlines(), start=1):
-            for rule_name, rx in FLAKY_RULES:
-                if rx.search(line):
-                    flaky_findings.append(
-                        {
-                            "file": _to_posix(p.relative_to(repo_root)),
-                            "line": i,
-                            "rule": rule_name,
-                            "text": line.strip(),
-                        }
-                    )
+    items = [(str(p), _to_posix(p.relative_to(repo_root))) for p in gd_tests]
+    for (_, rel), (is_behavior, events, file_flaky) in zip(items, scan_items(_scan_gdunit_file, items)):
+        if is_behavior:
+            behavior_tests.append(rel)
+        for ev in events:
+            referenced_events["core" if ev.startswith("core.") else "ui"].add(ev)
+        flaky_findings.extend(file_flaky)
 
     # Coverage vs taskdoc events (helps avoid false confidence).
     missing_core_events = [e for e in taskdoc_events["core"] if e not in referenced_events["core"]]
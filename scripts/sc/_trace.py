@@ -0,0 +1,352 @@
+"""Cross-process span tracing for sc entry points, exported as a Chrome / Perfetto trace.
+
+run_review_pipeline starts one trace per run: finished spans are appended as JSON lines to
+<out_dir>/trace/spans-<pid>.jsonl. The trace context travels to child processes in SC_TRACE_CONTEXT
+("<trace_id>:<parent_span_id>:<trace_dir>"); any sc script that imports this module (every script
+that imports _util) joins the trace on import with a process span under that parent and closes it at
+exit. child_env() points the context at the current span, so a run_cmd child hangs under the span
+that spawned it rather than under the process.
+
+finish_trace() folds every span file of the trace into <out_dir>/trace.json (Chrome trace-event
+format, loadable in chrome://tracing or ui.perfetto.dev) and returns a top-N self-time table. The
+self time of a span is its duration minus the time covered by its direct children, in any process;
+for a run_cmd span that is mostly interpreter start-up and imports of the child.
+
+Without a started or joined trace span() is a no-op. SC_TRACE=off stops run_review_pipeline from
+starting one.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Iterator
+
+
+CONTEXT_ENV = "SC_TRACE_CONTEXT"
+SWITCH_ENV = "SC_TRACE"
+TRACE_DIRNAME = "trace"
+TRACE_FILE = "trace.json"
+DEFAULT_TOP_N = 15
+
+
+# Plain slotted classes rather than dataclasses: _util imports this module, and dataclasses pulls in
+# inspect, which would otherwise be most of the start-up cost of light CLIs such as sc-test --self-check.
+class _OpenSpan:
+    __slots__ = ("span_id", "parent_id", "name", "cat", "ts_us", "start_ns", "args")
+
+    def __init__(self, *, span_id: str, parent_id: str, name: str, cat: str, ts_us: int, start_ns: int, args: dict[str, Any]) -> None:
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.cat = cat
+        self.ts_us = ts_us
+        self.start_ns = start_ns
+        self.args = args
+
+
+class _TraceState:
+    __slots__ = ("trace_id", "trace_dir", "root", "owner", "previous_context", "lock")
+
+    def __init__(self, *, trace_id: str, trace_dir: Path, root: _OpenSpan, owner: bool, previous_context: str | None = None) -> None:
+        self.trace_id = trace_id
+        self.trace_dir = trace_dir
+        self.root = root
+        self.owner = owner
+        self.previous_context = previous_context
+        self.lock = threading.Lock()
+
+
+_STATE: _TraceState | None = None
+_LOCAL = threading.local()
+
+
+def _new_span_id() -> str:
+    return os.urandom(8).hex()
+
+
+def _open(name: str, cat: str, parent_id: str, args: dict[str, Any]) -> _OpenSpan:
+    return _OpenSpan(
+        span_id=_new_span_id(),
+        parent_id=parent_id,
+        name=name,
+        cat=cat,
+        ts_us=time.time_ns() // 1000,
+        start_ns=time.perf_counter_ns(),
+        args=args,
+    )
+
+
+def _emit(state: _TraceState, opened: _OpenSpan) -> None:
+    record = {
+        "trace_id": state.trace_id,
+        "span_id": opened.span_id,
+        "parent_id": opened.parent_id,
+        "name": opened.name,
+        "cat": opened.cat,
+        "pid": os.getpid(),
+        "tid": threading.get_native_id(),
+        "ts_us": opened.ts_us,
+        "dur_us": max(0, (time.perf_counter_ns() - opened.start_ns) // 1000),
+        "args": opened.args,
+    }
+    line = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+    with state.lock:
+        try:
+            # The owner creates the trace dir; a vanished dir (cleaned-up run) silently drops the span.
+            with (state.trace_dir / f"spans-{os.getpid()}.jsonl").open("a", encoding="utf-8") as handle:
+                handle.write(line)
+        except OSError:
+            pass
+
+
+def _stack() -> list[_OpenSpan]:
+    stack = getattr(_LOCAL, "stack", None)
+    if stack is None:
+        stack = []
+        _LOCAL.stack = stack
+    return stack
+
+
+def tracing_active() -> bool:
+    return _STATE is not None
+
+
+def current_span_id() -> str:
+    if _STATE is None:
+        return ""
+    stack = _stack()
+    return stack[-1].span_id if stack else _STATE.root.span_id
+
+
+def _context_value(state: _TraceState, parent_id: str) -> str:
+    return f"{state.trace_id}:{parent_id}:{state.trace_dir}"
+
+
+@contextlib.contextmanager
+def span(name: str, *, cat: str = "sc", **args: Any) -> Iterator[dict[str, Any] | None]:
+    """Time the block as one span; the yielded dict (None when not tracing) takes result attributes."""
+    state = _STATE
+    if state is None:
+        yield None
+        return
+    opened = _open(name, cat, current_span_id(), dict(args))
+    stack = _stack()
+    stack.append(opened)
+    try:
+        yield opened.args
+    except BaseException as exc:
+        opened.args["error"] = type(exc).__name__
+        raise
+    finally:
+        if stack and stack[-1] is opened:
+            stack.pop()
+        _emit(state, opened)
+
+
+def child_env(env: dict[str, str] | None = None) -> dict[str, str] | None:
+    """Environment for a child process that should join the trace under the current span.
+
+    Returns ``env`` unchanged (None keeps the inherited environment) when no trace is active.
+    """
+    state = _STATE
+    if state is None:
+        return env
+    merged = dict(os.environ if env is None else env)
+    merged[CONTEXT_ENV] = _context_value(state, current_span_id())
+    return merged
+
+
+def _process_name() -> str:
+    return Path(sys.argv[0] or "python").name or "python"
+
+
+def start_trace(out_dir: Path, *, name: str | None = None) -> str | None:
+    """Start a trace owned by this process under ``out_dir``; returns the trace id.
+
+    A process that already joined a parent's trace keeps that trace (and does not merge it).
+    """
+    global _STATE
+    if _STATE is not None:
+        return _STATE.trace_id
+    if str(os.environ.get(SWITCH_ENV) or "").strip().lower() in {"0", "off", "false", "no"}:
+        return None
+    root = _open(name or _process_name(), "process", "", {"argv": sys.argv[1:]})
+    state = _TraceState(
+        trace_id=uuid.uuid4().hex,
+        trace_dir=Path(out_dir).resolve() / TRACE_DIRNAME,
+        root=root,
+        owner=True,
+        previous_context=os.environ.get(CONTEXT_ENV),
+    )
+    try:
+        state.trace_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    _STATE = state
+    # Children that are not spawned through child_env() still inherit the trace under the root span.
+    os.environ[CONTEXT_ENV] = _context_value(state, root.span_id)
+    return state.trace_id
+
+
+def _release(state: _TraceState) -> None:
+    global _STATE
+    _emit(state, state.root)
+    _LOCAL.stack = []
+    _STATE = None
+    if state.owner:
+        if state.previous_context is None:
+            os.environ.pop(CONTEXT_ENV, None)
+        else:
+            os.environ[CONTEXT_ENV] = state.previous_context
+
+
+def end_trace() -> None:
+    """Close an owned trace without merging (early exits); joined traces close at process exit."""
+    if _STATE is not None and _STATE.owner:
+        _release(_STATE)
+
+
+def finish_trace(*, top_n: int = DEFAULT_TOP_N) -> dict[str, Any] | None:
+    """Close the owned root span, merge the trace into trace.json and return its summary block.
+
+    Returns None when no trace is active or the trace belongs to a parent process.
+    """
+    state = _STATE
+    if state is None or not state.owner:
+        return None
+    _release(state)
+    return merge_trace(state.trace_dir.parent, trace_id=state.trace_id, top_n=top_n)
+
+
+def _join_from_env() -> None:
+    global _STATE
+    raw = str(os.environ.get(CONTEXT_ENV) or "")
+    parts = raw.split(":", 2)
+    if len(parts) != 3 or not all(parts):
+        return
+    trace_id, parent_id, trace_dir = parts
+    root = _open(_process_name(), "process", parent_id, {"argv": sys.argv[1:]})
+    state = _TraceState(trace_id=trace_id, trace_dir=Path(trace_dir), root=root, owner=False)
+    _STATE = state
+    os.environ[CONTEXT_ENV] = _context_value(state, root.span_id)
+
+    def _close_at_exit() -> None:
+        if _STATE is state:
+            _release(state)
+
+    atexit.register(_close_at_exit)
+
+
+def load_spans(trace_dir: Path, *, trace_id: str) -> list[dict[str, Any]]:
+    spans: list[dict[str, Any]] = []
+    for path in sorted(trace_dir.glob("spans-*.jsonl")):
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            try:
+                item = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(item, dict) and item.get("trace_id") == trace_id:
+                spans.append(item)
+    return spans
+
+
+def _covered_us(start: int, end: int, children: list[dict[str, Any]]) -> int:
+    intervals = sorted(
+        (max(start, int(child["ts_us"])), min(end, int(child["ts_us"]) + int(child["dur_us"])))
+        for child in children
+    )
+    covered = 0
+    cursor = start
+    for low, high in intervals:
+        low = max(low, cursor)
+        if high > low:
+            covered += high - low
+            cursor = high
+    return covered
+
+
+def self_time_table(spans: list[dict[str, Any]], *, top_n: int = DEFAULT_TOP_N) -> list[dict[str, Any]]:
+    """Aggregate self time per (name, cat); children running in parallel are counted once."""
+    children: dict[str, list[dict[str, Any]]] = {}
+    for item in spans:
+        children.setdefault(str(item.get("parent_id") or ""), []).append(item)
+    roots = [item for item in spans if not item.get("parent_id")]
+    wall_us = max((int(item["dur_us"]) for item in roots), default=0)
+    rows: dict[tuple[str, str], dict[str, Any]] = {}
+    for item in spans:
+        start = int(item["ts_us"])
+        dur = int(item["dur_us"])
+        self_us = max(0, dur - _covered_us(start, start + dur, children.get(str(item["span_id"]), [])))
+        row = rows.setdefault((str(item["name"]), str(item["cat"])), {"name": item["name"], "cat": item["cat"], "count": 0, "self_us": 0, "total_us": 0})
+        row["count"] += 1
+        row["self_us"] += self_us
+        row["total_us"] += dur
+    table = sorted(rows.values(), key=lambda row: (-row["self_us"], row["name"]))[: max(0, top_n)]
+    return [
+        {
+            "name": row["name"],
+            "cat": row["cat"],
+            "count": row["count"],
+            "self_ms": round(row["self_us"] / 1000.0, 3),
+            "total_ms": round(row["total_us"] / 1000.0, 3),
+            "self_pct": round(row["self_us"] * 100.0 / wall_us, 2) if wall_us else 0.0,
+        }
+        for row in table
+    ]
+
+
+def merge_trace(out_dir: Path, *, trace_id: str, top_n: int = DEFAULT_TOP_N) -> dict[str, Any]:
+    """Write <out_dir>/trace.json for ``trace_id`` and return the summary block for summary.json."""
+    spans = load_spans(Path(out_dir) / TRACE_DIRNAME, trace_id=trace_id)
+    t0 = min((int(item["ts_us"]) for item in spans), default=0)
+    events: list[dict[str, Any]] = []
+    process_names: dict[int, str] = {}
+    for item in sorted(spans, key=lambda entry: (int(entry["ts_us"]), -int(entry["dur_us"]))):
+        pid = int(item["pid"])
+        if item.get("cat") == "process":
+            process_names.setdefault(pid, str(item["name"]))
+        events.append(
+            {
+                "name": item["name"],
+                "cat": item["cat"],
+                "ph": "X",
+                "ts": int(item["ts_us"]) - t0,
+                "dur": int(item["dur_us"]),
+                "pid": pid,
+                "tid": int(item["tid"]),
+                "args": {**(item.get("args") or {}), "span_id": item["span_id"], "parent_id": item["parent_id"]},
+            }
+        )
+    events.extend(
+        {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": name}}
+        for pid, name in sorted(process_names.items())
+    )
+    trace_path = Path(out_dir) / TRACE_FILE
+    trace_path.write_text(
+        json.dumps({"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"trace_id": trace_id, "t0_us": t0}}, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    roots = [item for item in spans if not item.get("parent_id")]
+    return {
+        "trace_id": trace_id,
+        "trace_json": str(trace_path),
+        "span_count": len(spans),
+        "process_count": len({int(item["pid"]) for item in spans}),
+        "wall_ms": round(max((int(item["dur_us"]) for item in roots), default=0) / 1000.0, 3),
+        "top_self_time": self_time_table(spans, top_n=top_n),
+    }
+
+
+_join_from_env()
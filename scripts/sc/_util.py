@@ -7,6 +7,9 @@ import subprocess
 from pathlib import Path
 from typing import Any, Iterable, Sequence
 
+import _profile  # noqa: F401 - installs the SC_PROFILE hooks before the rest of the helper graph loads
+from _trace import child_env, span
+
 
 def repo_root() -> Path:
     # scripts/sc/_util.py -> scripts/sc -> scripts -> repo root
@@ -43,8 +46,21 @@ def write_text(path: Path, content: str) -> None:
 
 
 def write_json(path: Path, payload: Any) -> None:
-    ensure_dir(path.parent)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    with span("write_json", cat="io", file=Path(path).name):
+        ensure_dir(path.parent)
+        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def _cmd_label(args: Sequence[str]) -> str:
+    """Short span name for a command: the script for python launchers, else the executable."""
+    parts = [str(item) for item in args]
+    if not parts:
+        return ""
+    exe = Path(parts[0]).name
+    if exe.lower().split(".")[0] in {"py", "python", "python3"}:
+        script = next((item for item in parts[1:] if not item.startswith("-")), "")
+        return Path(script).name if script else exe
+    return exe
 
 
 def run_cmd(
@@ -53,22 +69,28 @@ def run_cmd(
     cwd: Path | None = None,
     timeout_sec: int = 900,
 ) -> tuple[int, str]:
-    proc = subprocess.Popen(
-        list(args),
-        cwd=str(cwd or repo_root()),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        encoding="utf-8",
-        errors="ignore",
-    )
-    try:
-        out, _ = proc.communicate(timeout=timeout_sec)
-    except subprocess.TimeoutExpired:
-        proc.kill()
-        out, _ = proc.communicate()
-        return 124, out
-    return proc.returncode or 0, out
+    with span(f"run_cmd {_cmd_label(args)}", cat="subprocess", timeout_sec=timeout_sec) as attrs:
+        proc = subprocess.Popen(
+            list(args),
+            cwd=str(cwd or repo_root()),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="ignore",
+            env=child_env(),
+        )
+        try:
+            out, _ = proc.communicate(timeout=timeout_sec)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            out, _ = proc.communicate()
+            rc = 124
+        else:
+            rc = proc.returncode or 0
+        if attrs is not None:
+            attrs["rc"] = rc
+        return rc, out
 
 
 def first_existing(*candidates: str) -> str | None:
@@ -9,6 +9,8 @@ import os
 import uuid
 from pathlib import Path
 from typing import Any
+
+import _profile  # noqa: F401 - SC_PROFILE hooks; keep before the other local imports
 from _acceptance_orchestration import (
     build_step_plan,
     is_enabled,
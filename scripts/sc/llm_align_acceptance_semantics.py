@@ -24,6 +24,7 @@ from _delivery_profile import build_delivery_profile_context, profile_llm_semant
 from _llm_backend import KNOWN_LLM_BACKENDS, resolve_llm_backend
 
 from _taskmaster import default_paths, load_json  # type: ignore
+from _task_view_writer import collect_view_entries, commit_view_entries  # type: ignore
 from _util import ci_dir, repo_root, run_cmd, today_str, write_json, write_text  # type: ignore
 from _garbled_gate import render_top_hits, scan_task_text_integrity  # type: ignore
 
@@ -78,6 +79,7 @@ def main() -> int:
         help="Enable strict selection checks: fail on missing task ids and missing view entries.",
     )
     ap.add_argument("--apply", action="store_true", help="Write changes into tasks_back.json/tasks_gameplay.json.")
+    ap.add_argument("--round-id", default="", help="Optional run id suffix for output directory isolation.")
     ap.add_argument(
         "--preflight-migrate-optional-hints",
         action="store_true",
@@ -182,7 +184,10 @@ def main() -> int:
         print(f"SC_ALIGN_ACCEPTANCE_SELF_CHECK status=ok scope={args.scope} tasks={len(task_ids)} out={out_dir}")
         return 0
 
-    out_dir = ci_dir("sc-llm-align-acceptance-semantics")
+    out_dir_name = "sc-llm-align-acceptance-semantics"
+    if str(args.round_id or "").strip():
+        out_dir_name += f"-round-{str(args.round_id).strip()}"
+    out_dir = ci_dir(out_dir_name)
 
     garbled_gate_on = str(args.garbled_gate).strip().lower() != "off"
     gate_task_ids = set(task_ids) if task_ids else set()
@@ -273,10 +278,11 @@ def main() -> int:
     gameplay_file_changed = bool(run_result.get("gameplay_file_changed"))
 
     if args.apply:
+        # Commit only the aligned tasks' entries: parallel light-lane workers share these views.
         if back_file_changed:
-            write_json(tasks_back_path, back)
+            commit_view_entries(tasks_back_path, collect_view_entries(back, task_ids), writer="align")
         if gameplay_file_changed:
-            write_json(tasks_gameplay_path, gameplay)
+            commit_view_entries(tasks_gameplay_path, collect_view_entries(gameplay, task_ids), writer="align")
 
         if garbled_gate_on:
             post_report = scan_task_text_integrity(task_ids=gate_task_ids or None)
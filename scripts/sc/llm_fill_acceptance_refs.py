@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 from typing import Any
@@ -38,6 +37,7 @@ from _acceptance_refs_helpers import (  # noqa: E402
 from _acceptance_refs_prompt import build_prompt  # noqa: E402
 from _llm_backend import KNOWN_LLM_BACKENDS, resolve_llm_backend  # noqa: E402
 from _taskmaster import default_paths, iter_master_tasks, load_json  # noqa: E402
+from _task_view_writer import collect_view_entries, commit_view_entries  # noqa: E402
 from _util import ci_dir, repo_root, today_str, write_json, write_text  # noqa: E402
 
 
@@ -167,6 +167,7 @@ def main() -> int:
     ap.add_argument("--candidate-limit", type=int, default=30, help="Max existing candidate tests to provide to model.")
     ap.add_argument("--max-tasks", type=int, default=0, help="Optional cap; 0 means no limit.")
     ap.add_argument("--consensus-runs", type=int, default=1, help="Run per-task LLM proposal N times and take majority-success (default: 1).")
+    ap.add_argument("--round-id", default="", help="Optional run id suffix for output directory isolation.")
     ap.add_argument("--self-check", action="store_true", help="Run deterministic local self-check only.")
     args = ap.parse_args()
     args.llm_backend = resolve_llm_backend(getattr(args, "llm_backend", None))
@@ -188,7 +189,10 @@ def main() -> int:
         return 2
 
     root = repo_root()
-    out_dir = ci_dir("sc-llm-acceptance-refs")
+    out_dir_name = "sc-llm-acceptance-refs"
+    if str(args.round_id or "").strip():
+        out_dir_name += f"-round-{str(args.round_id).strip()}"
+    out_dir = ci_dir(out_dir_name)
     tasks_json_p, back_p, gameplay_p = default_paths()
     tasks_json = load_json(tasks_json_p)
     master_by_id = {str(t.get("id")): t for t in iter_master_tasks(tasks_json)}
@@ -307,8 +311,8 @@ def main() -> int:
         results.append(task_result)
 
     if args.write and any_updates > 0:
-        back_p.write_text(json.dumps(back, ensure_ascii=False, indent=2) + "\n", encoding="utf-8", newline="\n")
-        gameplay_p.write_text(json.dumps(gameplay, ensure_ascii=False, indent=2) + "\n", encoding="utf-8", newline="\n")
+        commit_view_entries(back_p, collect_view_entries(back, task_ids), writer="fill_refs")
+        commit_view_entries(gameplay_p, collect_view_entries(gameplay, task_ids), writer="fill_refs")
 
     missing_after = 0
     if args.write and any_updates > 0:
@@ -5,6 +5,7 @@ sc-llm-review entrypoint.
 
 from __future__ import annotations
 
+import _profile  # noqa: F401 - SC_PROFILE hooks; keep before the other local imports
 from _llm_review_engine import main
 
 
@@ -27,6 +27,7 @@ from _delivery_profile import (
 from _llm_review_cli import resolve_agents as resolve_llm_review_agents
 from _llm_backend import KNOWN_LLM_BACKENDS, resolve_llm_backend
 from _change_scope import classify_change_scope_between_snapshots
+from _git_snapshot import git_snapshot, publish_git_snapshot
 from _risk_profile_floor import derive_delivery_profile_floor, requires_security_auditor_for_change_scope
 from _util import ci_dir, repo_root, run_cmd, split_csv, write_json, write_text
 
@@ -189,12 +190,7 @@ def _changed_paths_hit_reviewer_anchors(changed_paths: list[str]) -> bool:
 
 
 def current_git_fingerprint() -> dict[str, Any]:
-    rc_head, out_head = run_cmd(["git", "rev-parse", "HEAD"], cwd=repo_root(), timeout_sec=30)
-    rc_status, out_status = run_cmd(["git", "status", "--short"], cwd=repo_root(), timeout_sec=30)
-    return {
-        "head": out_head.strip() if rc_head == 0 else "",
-        "status_short": sorted([line.rstrip() for line in out_status.splitlines() if line.strip()]) if rc_status == 0 else [],
-    }
+    return git_snapshot().fingerprint()
 
 
 def _step_status(summary: dict[str, Any], step_name: str) -> str:
@@ -1386,6 +1382,7 @@ def main() -> int:
     script_start = time.monotonic()
     out_dir = ci_dir(f"sc-needs-fix-fast-task-{args.task_id}")
     write_text(out_dir / "run_id.txt", uuid.uuid4().hex + "\n")
+    publish_git_snapshot(out_dir)
 
     timeline: list[dict[str, Any]] = []
     route_payload: dict[str, Any] = {}
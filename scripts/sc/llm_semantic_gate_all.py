@@ -10,7 +10,8 @@ from pathlib import Path
 
 from _delivery_profile import build_delivery_profile_context, profile_llm_semantic_gate_all_defaults, resolve_delivery_profile
 from _garbled_gate import parse_task_ids_csv, render_top_hits, scan_task_text_integrity
-from _llm_backend import KNOWN_LLM_BACKENDS, resolve_llm_backend, run_llm_exec
+from _llm_backend import KNOWN_LLM_BACKENDS, hedge_stats, hedging_enabled, resolve_llm_backend, run_llm_exec
+from _llm_client_pool import client_pool_stats
 from _semantic_gate_all_contract import (
     evaluate_semantic_gate_exit,
     run_semantic_gate_all_self_check,
@@ -129,6 +130,7 @@ def main() -> int:
     ap.add_argument("--max-needs-fix", type=int, default=None, help="Fail when Needs Fix count exceeds this limit (default: profile)")
     ap.add_argument("--max-unknown", type=int, default=None, help="Fail when Unknown count exceeds this limit (default: profile)")
     ap.add_argument("--garbled-gate", default=None, choices=["on", "off"], help="Hard precheck for garbled task/acceptance text (default: profile)")
+    ap.add_argument("--round-id", default="", help="Optional run id suffix for output directory isolation.")
     ap.add_argument("--self-check", action="store_true", help="Run deterministic local self-check only")
     args = apply_delivery_profile_defaults(ap.parse_args())
     os.environ["DELIVERY_PROFILE"] = str(args.delivery_profile)
@@ -152,7 +154,10 @@ def main() -> int:
         return 2
     max_prompt_chars = max(3000, int(args.max_prompt_chars))
 
-    out_dir = ci_dir("sc-semantic-gate-all")
+    out_dir_name = "sc-semantic-gate-all"
+    if str(args.round_id or "").strip():
+        out_dir_name += f"-round-{str(args.round_id).strip()}"
+    out_dir = ci_dir(out_dir_name)
     out_dir.mkdir(parents=True, exist_ok=True)
 
     task_filter = parse_task_ids_csv(str(args.task_ids).strip()) if str(args.task_ids).strip() else set()
@@ -279,6 +284,10 @@ def main() -> int:
         },
         "batch_meta": batch_meta,
     }
+    if hedging_enabled():
+        summary["llm_hedge"] = hedge_stats()
+    if str(args.llm_backend) == "openai-api":
+        summary["llm_client_pool"] = client_pool_stats()
     summary_ok, summary_errors, checked_summary = validate_semantic_gate_summary(summary)
     if not summary_ok:
         checked_summary["status"] = "fail"
@@ -11,7 +11,6 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import shutil
 import sys
 import time
 import uuid
@@ -19,6 +18,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from _profile import profile_out_dir  # SC_PROFILE hooks; keep before the other local imports
 from agent_to_agent_review import write_agent_review
 from _agent_review_policy import apply_agent_review_policy, apply_agent_review_signal
 from _delivery_profile import (
@@ -28,6 +28,7 @@ from _delivery_profile import (
     profile_llm_review_defaults,
     resolve_delivery_profile,
 )
+from _git_snapshot import git_snapshot, publish_git_snapshot
 from _harness_capabilities import write_harness_capabilities
 from _marathon_policy import (
     apply_context_refresh_policy,
@@ -68,9 +69,12 @@ from _pipeline_support import (
     load_existing_summary as _load_existing_summary,
     resolve_agent_review_mode as _resolve_agent_review_mode,
     run_step as _run_step,
+    snapshot_directory as _snapshot_directory,
+    snapshot_summary_file as _snapshot_summary_file,
     upsert_step as _upsert_step,
 )
 from _llm_review_cli import parse_agent_timeout_overrides, resolve_agents
+from _latency_model import latency_key, load_model, load_policy, recommend_timeout
 from _change_scope import classify_change_scope_between_snapshots
 from _pipeline_history import collect_recent_failure_summary
 
@@ -82,19 +86,13 @@ from _taskmaster import resolve_triplet
 from _technical_debt import write_low_priority_debt_artifacts
 from _llm_review_tier import resolve_llm_review_tier_plan
 from _summary_schema import SummarySchemaError, validate_pipeline_summary
+from _trace import end_trace, span, start_trace
 from _util import repo_root, write_json, write_text
 from _active_task_sidecar import write_active_task_sidecar as _write_active_task_sidecar_impl
 
 
 def current_git_fingerprint() -> dict[str, Any]:
-    from _util import repo_root, run_cmd
-
-    rc_head, out_head = run_cmd(["git", "rev-parse", "HEAD"], cwd=repo_root(), timeout_sec=30)
-    rc_status, out_status = run_cmd(["git", "status", "--short"], cwd=repo_root(), timeout_sec=30)
-    return {
-        "head": out_head.strip() if rc_head == 0 else "",
-        "status_short": sorted([line.rstrip() for line in out_status.splitlines() if line.strip()]) if rc_status == 0 else [],
-    }
+    return git_snapshot().fingerprint()
 
 
 def _normalize_cmd_for_reuse(cmd: list[str]) -> list[str]:
@@ -193,10 +191,11 @@ PROFILE_DRIFT_UNSAFE_PATHS_CEILING = 1
 
 
 def _read_json(path: Path) -> dict[str, Any]:
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
+    with span("read_json", cat="io", file=path.name):
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
     return payload if isinstance(payload, dict) else {}
 
 
@@ -402,14 +401,6 @@ def _derive_rerun_forbidden_payload(active_guard: dict[str, Any] | None) -> dict
     }
 
 
-def _snapshot_directory(*, source_dir: Path, target_dir: Path) -> tuple[str, str]:
-    if target_dir.exists():
-        shutil.rmtree(target_dir)
-    shutil.copytree(source_dir, target_dir)
-    summary_path = target_dir / "summary.json"
-    return str(target_dir), str(summary_path) if summary_path.exists() else ""
-
-
 def _snapshot_step_artifacts(*, step: dict[str, Any], out_dir: Path, step_name: str) -> tuple[str, str]:
     source_dir_raw = str(step.get("reported_out_dir") or "").strip()
     source_summary_raw = str(step.get("summary_file") or "").strip()
@@ -417,9 +408,7 @@ def _snapshot_step_artifacts(*, step: dict[str, Any], out_dir: Path, step_name:
     if source_dir_raw and Path(source_dir_raw).is_dir():
         return _snapshot_directory(source_dir=Path(source_dir_raw), target_dir=target_dir)
     if source_summary_raw and Path(source_summary_raw).is_file():
-        target_dir.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(Path(source_summary_raw), target_dir / "summary.json")
-        return str(target_dir), str(target_dir / "summary.json")
+        return _snapshot_summary_file(source_summary=Path(source_summary_raw), target_dir=target_dir)
     return "", ""
 
 
@@ -1047,10 +1036,10 @@ def _find_reusable_sc_test_step(
                 target_dir=out_dir / "child-artifacts" / "sc-test",
             )
         elif source_summary_raw and Path(source_summary_raw).is_file():
-            target_dir = out_dir / "child-artifacts" / "sc-test"
-            target_dir.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(Path(source_summary_raw), target_dir / "summary.json")
-            snapshot_dir, snapshot_summary = str(target_dir), str(target_dir / "summary.json")
+            snapshot_dir, snapshot_summary = _snapshot_summary_file(
+                source_summary=Path(source_summary_raw),
+                target_dir=out_dir / "child-artifacts" / "sc-test",
+            )
         else:
             continue
         log_path = out_dir / "sc-test.log"
@@ -1424,6 +1413,70 @@ def _derive_llm_agent_timeout_overrides(
     llm_semantic_gate: str,
     llm_timeout_sec: int,
     llm_agent_timeout_sec: int,
+    llm_backend: str | None = None,
+) -> dict[str, int]:
+    history_overrides = _derive_history_agent_timeout_overrides(
+        current_out_dir=current_out_dir,
+        task_id=task_id,
+        delivery_profile=delivery_profile,
+        security_profile=security_profile,
+        llm_agents=llm_agents,
+        llm_semantic_gate=llm_semantic_gate,
+        llm_timeout_sec=llm_timeout_sec,
+        llm_agent_timeout_sec=llm_agent_timeout_sec,
+    )
+    model_overrides = _derive_model_agent_timeout_overrides(
+        planned_agents=resolve_agents(llm_agents, llm_semantic_gate),
+        llm_timeout_sec=llm_timeout_sec,
+        llm_agent_timeout_sec=llm_agent_timeout_sec,
+        llm_backend=llm_backend,
+    )
+    merged = dict(model_overrides)
+    for agent, seconds in history_overrides.items():
+        merged[agent] = max(int(seconds), int(model_overrides.get(agent) or 0))
+    return merged
+
+
+def _derive_model_agent_timeout_overrides(
+    *,
+    planned_agents: list[str],
+    llm_timeout_sec: int,
+    llm_agent_timeout_sec: int,
+    llm_backend: str | None = None,
+) -> dict[str, int]:
+    """Per-agent timeouts from the shared latency model, once an agent has enough recorded runs.
+
+    ``llm_backend`` must be the backend llm_review will run with: its samples are keyed by backend.
+    """
+    root = repo_root()
+    policy = load_policy(root)
+    if not policy.enabled or not planned_agents:
+        return {}
+    model = load_model(root)
+    overrides: dict[str, int] = {}
+    for agent in planned_agents:
+        timeout_sec, meta = recommend_timeout(
+            latency_key("sc-llm-review", agent=agent, backend=str(llm_backend or "")),
+            default_sec=int(llm_agent_timeout_sec),
+            policy=policy,
+            model=model,
+        )
+        timeout_sec = min(int(llm_timeout_sec), int(timeout_sec))
+        if meta.get("source") == "model" and timeout_sec != int(llm_agent_timeout_sec):
+            overrides[agent] = timeout_sec
+    return overrides
+
+
+def _derive_history_agent_timeout_overrides(
+    *,
+    current_out_dir: Path,
+    task_id: str,
+    delivery_profile: str,
+    security_profile: str,
+    llm_agents: str,
+    llm_semantic_gate: str,
+    llm_timeout_sec: int,
+    llm_agent_timeout_sec: int,
 ) -> dict[str, int]:
     logs_root = repo_root() / "logs" / "ci"
     if not logs_root.exists():
@@ -1836,6 +1889,14 @@ def _run_acceptance_preflight(
 
 
 def main() -> int:
+    try:
+        return _run_pipeline()
+    finally:
+        # PipelineSession.finish() merges the trace; exits before that only close it.
+        end_trace()
+
+
+def _run_pipeline() -> int:
     script_start_monotonic = time.monotonic()
     args = build_parser().parse_args()
     task_id = _task_root_id(args.task_id)
@@ -1939,6 +2000,8 @@ def main() -> int:
     except FileNotFoundError:
         print("[sc-review-pipeline] ERROR: no existing pipeline run found for resume/abort/fork.")
         return 2
+    start_trace(out_dir, name="run_review_pipeline.py")
+    profile_out_dir(out_dir)
 
     try:
         delivery_profile, security_profile = _resolve_pipeline_profiles(
@@ -2016,6 +2079,7 @@ def main() -> int:
 
     _prepare_env(run_id, delivery_profile, security_profile)
     write_text(out_dir / "run_id.txt", run_id + "\n")
+    publish_git_snapshot(out_dir)
     marathon_state = marathon_state or load_marathon_state(out_dir) or build_initial_state(
         task_id=task_id,
         run_id=run_id,
@@ -2066,6 +2130,7 @@ def main() -> int:
         llm_semantic_gate=llm_semantic_gate,
         llm_timeout_sec=llm_timeout_sec,
         llm_agent_timeout_sec=llm_agent_timeout_sec,
+        llm_backend=getattr(args, "llm_backend", None),
     )
     llm_agent_timeout_overrides = {**derived_llm_agent_timeout_overrides, **requested_llm_agent_timeout_overrides}
     llm_agent_timeouts = _format_agent_timeout_overrides(llm_agent_timeout_overrides)
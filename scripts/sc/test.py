@@ -20,6 +20,7 @@ import uuid
 from pathlib import Path
 from typing import Any
 
+import _profile  # noqa: F401 - SC_PROFILE hooks; keep before the other local imports
 from _delivery_profile import default_security_profile_for_delivery, known_delivery_profiles, profile_test_defaults, resolve_delivery_profile
 from _sc_test_refs import (
     build_dotnet_filter_from_cs_refs as _build_dotnet_filter_from_cs_refs_impl,
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PYTHON_DIR = REPO_ROOT / "scripts" / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+
+def _load_module(name: str, relative_path: str):
+    path = REPO_ROOT / relative_path
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise AssertionError(f"failed to load module: {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+store = _load_module("artifact_store_test_module", "scripts/python/_artifact_store.py")
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+class ArtifactStoreTests(unittest.TestCase):
+    def _child_dir(self, root: Path) -> Path:
+        child = root / "logs" / "ci" / "2026-03-31" / "sc-acceptance-check-task-56"
+        _write(child / "summary.json", '{"status": "ok"}\n')
+        _write(child / "nested" / "trace.log", "trace\n")
+        (child / "empty").mkdir(parents=True)
+        return child
+
+    def test_snapshot_tree_should_mirror_source_and_share_blobs_across_runs(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            child = self._child_dir(root)
+            run_a = root / "logs" / "ci" / "2026-03-31" / "pipeline-run-a" / "child-artifacts" / "acceptance"
+            run_b = root / "logs" / "ci" / "2026-03-31" / "pipeline-run-b" / "child-artifacts" / "acceptance"
+
+            store.snapshot_tree(source_dir=child, target_dir=run_a)
+            result = store.snapshot_tree(source_dir=child, target_dir=run_b)
+
+            for target in (run_a, run_b):
+                self.assertEqual('{"status": "ok"}\n', (target / "summary.json").read_text(encoding="utf-8"))
+                self.assertEqual("trace\n", (target / "nested" / "trace.log").read_text(encoding="utf-8"))
+                self.assertTrue((target / "empty").is_dir())
+            self.assertEqual(2, result["files"])
+            blobs = sorted(path for path in (root / "logs" / "ci" / ".cas" / "blobs").rglob("*") if path.is_file())
+            self.assertEqual(2, len(blobs))
+            if result["methods"].get("hardlink"):
+                self.assertEqual(os.stat(run_a / "summary.json").st_ino, os.stat(run_b / "summary.json").st_ino)
+
+    def test_snapshot_should_fall_back_to_copy_when_links_fail(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            child = self._child_dir(root)
+            target = root / "logs" / "ci" / "2026-03-31" / "pipeline-run-a" / "child-artifacts" / "acceptance"
+            with mock.patch.object(store.os, "link", side_effect=OSError("cross-device")), mock.patch.object(
+                store, "_reflink", return_value=False
+            ):
+                result = store.snapshot_tree(source_dir=child, target_dir=target)
+            self.assertEqual({"copy": 2}, result["methods"])
+            self.assertEqual("trace\n", (target / "nested" / "trace.log").read_text(encoding="utf-8"))
+
+    def test_gc_should_release_blobs_only_after_all_referencing_snapshots_are_removed(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            child = self._child_dir(root)
+            day = root / "logs" / "ci" / "2026-03-31"
+            store.snapshot_tree(source_dir=child, target_dir=day / "run-a" / "child-artifacts" / "acceptance")
+            store.snapshot_tree(source_dir=child, target_dir=day / "run-b" / "child-artifacts" / "acceptance")
+
+            shutil.rmtree(day / "run-a")
+            partial = store.gc_artifact_store(root)
+            self.assertEqual(1, partial["removed_ref_count"])
+            self.assertEqual(0, partial["deleted_blob_count"])
+
+            shutil.rmtree(day / "run-b")
+            dry = store.gc_artifact_store(root, dry_run=True)
+            self.assertEqual(2, dry["deleted_blob_count"])
+            final = store.gc_artifact_store(root)
+            self.assertEqual(2, final["deleted_blob_count"])
+            self.assertEqual([], [path for path in (root / "logs" / "ci" / ".cas" / "blobs").rglob("*") if path.is_file()])
+
+    def test_snapshot_should_restore_a_blob_gc_removed_before_the_link(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            child = self._child_dir(root)
+            day = root / "logs" / "ci" / "2026-03-31"
+            store.snapshot_tree(source_dir=child, target_dir=day / "run-a" / "child-artifacts" / "acceptance")
+            shutil.rmtree(day / "run-a")
+            real_put_file = store.put_file
+            collected: list[int] = []
+
+            def _put_then_gc(store_dir: Path, source: Path) -> str:
+                digest = real_put_file(store_dir, source)
+                if not collected:
+                    # The blob already existed, so put_file skipped the copy; GC now sees it unreferenced.
+                    collected.append(store.gc_artifact_store(root)["deleted_blob_count"])
+                return digest
+
+            target = day / "run-b" / "child-artifacts" / "acceptance"
+            with mock.patch.object(store, "put_file", side_effect=_put_then_gc):
+                result = store.snapshot_tree(source_dir=child, target_dir=target)
+
+            self.assertEqual([2], collected)
+            self.assertEqual(2, result["files"])
+            self.assertEqual('{"status": "ok"}\n', (target / "summary.json").read_text(encoding="utf-8"))
+            self.assertEqual(0, store.gc_artifact_store(root)["deleted_blob_count"])
+
+    def test_store_can_be_disabled_by_env(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            child = self._child_dir(root)
+            target = root / "logs" / "ci" / "2026-03-31" / "run-a" / "child-artifacts" / "acceptance"
+            with mock.patch.dict(os.environ, {"SC_ARTIFACT_STORE": "off"}):
+                result = store.snapshot_tree(source_dir=child, target_dir=target)
+            self.assertEqual("", result["store"])
+            self.assertFalse((root / "logs" / "ci" / ".cas").exists())
+            self.assertTrue((target / "summary.json").is_file())
+
+
+if __name__ == "__main__":
+    unittest.main()
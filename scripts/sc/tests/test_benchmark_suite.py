@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PYTHON_DIR = REPO_ROOT / "scripts" / "python"
+SC_DIR = REPO_ROOT / "scripts" / "sc"
+for candidate in (PYTHON_DIR, SC_DIR):
+    if str(candidate) not in sys.path:
+        sys.path.insert(0, str(candidate))
+
+import _benchmark_repo as bench_repo  # noqa: E402
+import _benchmark_suite as bench_suite  # noqa: E402
+from _taskmaster import resolve_triplet  # noqa: E402
+
+
+SMALL = bench_repo.SyntheticRepoSpec(tasks=6, code_files=12, log_days=2, runs_per_day=3, docs=8, seed=7)
+
+
+def _tree(root: Path) -> dict[str, bytes]:
+    return {path.relative_to(root).as_posix(): path.read_bytes() for path in sorted(root.rglob("*")) if path.is_file()}
+
+
+def _result(name: str, median_sec: float, *, scale: str = "s1") -> dict[str, object]:
+    return {"name": name, "scale": scale, "status": "ok", "median_sec": median_sec}
+
+
+class SyntheticRepoTests(unittest.TestCase):
+    def test_same_seed_should_generate_identical_trees(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            first = bench_repo.generate_synthetic_repo(Path(td) / "a", SMALL)
+            bench_repo.generate_synthetic_repo(Path(td) / "b", SMALL)
+            other_seed = bench_repo.generate_synthetic_repo(Path(td) / "c", bench_repo.SyntheticRepoSpec(**{**SMALL.to_dict(), "seed": 8, "end_date": SMALL.end_date}))
+
+            self.assertEqual(_tree(Path(td) / "a"), _tree(Path(td) / "b"))
+            self.assertNotEqual(
+                (Path(td) / "a" / ".taskmaster" / "tasks" / "tasks.json").read_bytes(),
+                (Path(td) / "c" / ".taskmaster" / "tasks" / "tasks.json").read_bytes(),
+            )
+            self.assertEqual(6, first["pipeline_runs"])
+            self.assertEqual(first["spec"], other_seed["spec"] | {"seed": 7})
+
+    def test_generated_triplet_and_logs_should_be_readable_by_the_toolchain(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            manifest = bench_repo.generate_synthetic_repo(root, SMALL)
+            triplet = resolve_triplet(
+                task_id="6",
+                tasks_json_path=str(root / manifest["tasks_json_path"]),
+                tasks_back_path=str(root / manifest["tasks_back_path"]),
+                tasks_gameplay_path=str(root / manifest["tasks_gameplay_path"]),
+            )
+            summaries = sorted(root.glob("logs/ci/*/sc-review-pipeline-task-*-*/summary.json"))
+            events = (summaries[0].parent / "run-events.jsonl").read_text(encoding="utf-8").splitlines()
+
+            self.assertEqual("6", triplet.task_id)
+            self.assertEqual(6, triplet.back["taskmaster_id"])
+            self.assertTrue(triplet.gameplay["test_refs"][0].startswith("Tests.Godot/"))
+            self.assertTrue((root / str(triplet.overlay())).is_file())
+            self.assertEqual(6, len(summaries))
+            self.assertEqual("sc-review-pipeline", json.loads(summaries[0].read_text(encoding="utf-8"))["cmd"])
+            self.assertEqual("run_started", json.loads(events[0])["event"])
+            self.assertEqual("run_completed", json.loads(events[-1])["event"])
+
+
+class BenchmarkSuiteTests(unittest.TestCase):
+    def test_summarize_samples_should_report_order_statistics(self) -> None:
+        stats = bench_suite.summarize_samples([0.5, 0.1, 0.3, 0.2, 0.4])
+
+        self.assertEqual({"min_sec": 0.1, "median_sec": 0.3, "p90_sec": 0.46, "mean_sec": 0.3}, stats)
+
+    def test_compare_results_should_flag_regressions_above_threshold_and_noise_floor(self) -> None:
+        baseline = [_result("slower", 0.100), _result("faster", 0.100), _result("tiny", 0.0005), _result("gone", 0.1), _result("same", 0.1, scale="s4")]
+        current = [_result("slower", 0.130), _result("faster", 0.050), _result("tiny", 0.0010), _result("fresh", 0.1), _result("same", 0.105, scale="s4")]
+
+        comparison = bench_suite.compare_results(current, baseline, max_regression_pct=20.0, min_delta_ms=2.0)
+        verdicts = {(row["name"], row["scale"]): row["verdict"] for row in comparison["rows"]}
+
+        self.assertEqual(
+            {
+                ("slower", "s1"): "regression",
+                ("faster", "s1"): "improvement",
+                ("tiny", "s1"): "same",
+                ("fresh", "s1"): "new",
+                ("same", "s4"): "same",
+                ("gone", "s1"): "missing",
+            },
+            verdicts,
+        )
+        self.assertEqual(["slower"], [row["name"] for row in comparison["regressions"]])
+        self.assertEqual(30.0, comparison["regressions"][0]["delta_pct"])
+
+    def test_run_suite_should_time_filtered_micro_cases(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            results = bench_suite.run_suite(Path(td), SMALL, suites=("micro",), repeat=2, warmup=0, name_filter="resolve_triplet,build_report_catalog.*")
+
+        self.assertEqual(["resolve_triplet", "build_report_catalog.cold", "build_report_catalog.warm"], [item["name"] for item in results])
+        for item in results:
+            self.assertEqual("ok", item["status"], item.get("error"))
+            self.assertEqual(2, len(item["samples_sec"]))
+            self.assertLessEqual(item["min_sec"], item["median_sec"])
+            self.assertEqual(bench_suite.scale_label(SMALL), item["scale"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PYTHON_DIR = REPO_ROOT / "scripts" / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import _contract_model as contract_model  # noqa: E402
+import generate_contracts_catalog as catalog  # noqa: E402
+import validate_contracts  # noqa: E402
+
+
+EVENT_TYPES = (
+    "namespace Game.Core.Contracts;\n"
+    "/// <summary>Event types.</summary>\n"
+    "public static class EventTypes\n"
+    "{\n"
+    "    public const string GuildCreated = \"core.guild.created\";\n"
+    "    public const string GuildDisbanded = \"core.guild.disbanded\";\n"
+    "}\n"
+)
+
+
+def _event_contract(name: str, rhs: str) -> str:
+    return (
+        "using System;\n"
+        "namespace Game.Core.Contracts.Events;\n"
+        "\n"
+        f"/// <summary>{name}.</summary>\n"
+        f"/// <remarks>Domain event: {rhs.strip(chr(34))}</remarks>\n"
+        f"public sealed record {name}(string Id)\n"
+        "{\n"
+        f"    public const string EventType = {rhs};\n"
+        "}\n"
+    )
+
+
+def _write(root: Path, rel: str, text: str) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+class ContractModelParseTests(unittest.TestCase):
+    def test_parse_should_extract_declarations_docs_and_constants(self) -> None:
+        text = (
+            "using System;\n"
+            "using Godot;\n"
+            "namespace Game.Core.Contracts.Guild;\n"
+            "/// <summary>Created.</summary>\n"
+            "/// <remarks>Domain event: core.guild.created</remarks>\n"
+            "public sealed partial record GuildCreated\n"
+            "{\n"
+            "    public const string EventType = \"core.guild.created\";\n"
+            "    public const string Other = EventTypes.GuildDisbanded ;\n"
+            "}\n"
+            "public interface IGuildLookup { }\n"
+        )
+
+        model = contract_model.parse_contract_source(text)
+
+        self.assertEqual(("Game.Core.Contracts.Guild", 3), (model.namespace, model.namespace_line))
+        self.assertEqual((("System", 1), ("Godot", 2)), model.usings)
+        self.assertTrue(model.godot_dependency)
+        record, interface = model.types
+        self.assertEqual(("record", "GuildCreated", ("sealed", "partial"), 6), (record.kind, record.name, record.modifiers, record.line))
+        self.assertTrue(record.line_start and record.has_summary and record.has_remarks)
+        self.assertEqual(("interface", "IGuildLookup", 11, ()), (interface.kind, interface.name, interface.line, interface.modifiers))
+        self.assertEqual(
+            [("EventType", "core.guild.created", 8), ("Other", None, 9)],
+            [(const.name, const.literal, const.line) for const in model.consts],
+        )
+        self.assertEqual("EventTypes.GuildDisbanded", model.consts[1].rhs.strip())
+        self.assertEqual(["core.guild.created"], [value for _start, value in model.domain_event_docs])
+
+    def test_iter_source_files_should_skip_build_dirs_and_keep_path_order(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            for rel in ("Game.Core/Contracts/a.b/C.cs", "Game.Core/Contracts/a/B.cs", "Game.Core/Contracts/obj/Gen.cs", "Game.Core/Contracts/A.txt"):
+                _write(root, rel, "namespace Game.Core.Contracts;\n")
+
+            files = contract_model.iter_source_files(root / "Game.Core" / "Contracts", root, skip_dirs=frozenset({"obj"}))
+
+        self.assertEqual(["Game.Core/Contracts/a/B.cs", "Game.Core/Contracts/a.b/C.cs"], [rel for _path, rel in files])
+        self.assertEqual(sorted(path for path, _rel in files), [path for path, _rel in files])
+
+
+class ContractModelCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        contract_model.reset_contract_model()
+        self.addCleanup(contract_model.reset_contract_model)
+
+    def _repo(self, root: Path) -> None:
+        _write(root, "Game.Core/Contracts/EventTypes.cs", EVENT_TYPES)
+        _write(root, "Game.Core/Contracts/Events/GuildCreated.cs", _event_contract("GuildCreated", "EventTypes.GuildCreated"))
+        _write(root, "Game.Core/Contracts/Events/GuildDisbanded.cs", _event_contract("GuildDisbanded", "EventTypes.GuildDisbanded"))
+        _write(root, "Game.Core/Contracts/Events/GuildRenamed.cs", _event_contract("GuildRenamed", '"core.guild.renamed"'))
+        refs = "\n".join(f"- `Game.Core/Contracts/{rel}`" for rel in ("EventTypes.cs", "Events/GuildCreated.cs", "Events/GuildDisbanded.cs", "Events/GuildRenamed.cs"))
+        _write(root, "docs/architecture/overlays/PRD-X/08/08-Contracts-X.md", f"# X\n\n{refs}\n")
+
+    def test_validate_contracts_should_revalidate_only_files_affected_by_a_change(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self._repo(root)
+            cache_file = root / "cache" / "model-cache.json"
+            with mock.patch.dict(os.environ, {contract_model.CACHE_ENV: str(cache_file)}, clear=False):
+                first = validate_contracts.build_report(root)
+                contract_model.save_contract_cache()
+                self.assertTrue(cache_file.exists())
+
+                contract_model.reset_contract_model()
+                second = validate_contracts.build_report(root)
+                stats = contract_model.model_stats()
+                self.assertEqual(first, second)
+                self.assertEqual((0, 0), (stats["parsed"], stats["computed"]))
+
+                _write(root, "Game.Core/Contracts/EventTypes.cs", EVENT_TYPES.replace("core.guild.disbanded", "Guild.Disbanded"))
+                contract_model.reset_contract_model()
+                third = validate_contracts.build_report(root)
+                stats = contract_model.model_stats()
+
+            self.assertTrue(first["ok"], first)
+            self.assertEqual(1, stats["parsed"])
+            # EventTypes.cs itself plus the one contract that references the changed entry.
+            self.assertEqual(2, stats["computed"])
+            self.assertFalse(third["ok"])
+            self.assertEqual(
+                {("Game.Core/Contracts/EventTypes.cs", "event_type_value_invalid"), ("Game.Core/Contracts/Events/GuildDisbanded.cs", "eventtype_ref_value_invalid")},
+                {(item["file"], item["code"]) for item in third["eventtype_issues"]},
+            )
+
+    def test_cache_off_should_match_cached_results_and_write_nothing(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self._repo(root)
+            twice = _event_contract("Twice", '"Bad.Twice"') + 'public sealed record TwiceAgain\n{\n    public const string EventType = "Bad.Twice";\n}\n'
+            _write(root, "Game.Core/Contracts/Events/Twice.cs", twice)
+            with mock.patch.dict(os.environ, {contract_model.CACHE_ENV: "off"}, clear=False):
+                uncached = validate_contracts.build_report(root)
+                self.assertIsNone(contract_model.save_contract_cache())
+            self.assertFalse((root / "logs").exists())
+
+            with mock.patch.dict(os.environ, {contract_model.CACHE_ENV: str(root / "c.json")}, clear=False):
+                validate_contracts.build_report(root)
+                contract_model.reset_contract_model()
+                cached = validate_contracts.build_report(root)
+
+        self.assertEqual(uncached, cached)
+        # Identical declarations report their own lines, not the first occurrence's.
+        self.assertEqual([8, 12], [item["line"] for item in cached["eventtype_issues"] if item["file"].endswith("Twice.cs")])
+
+    def test_catalog_should_attribute_events_to_the_nearest_record(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self._repo(root)
+            with mock.patch.dict(os.environ, {contract_model.CACHE_ENV: "off"}, clear=False):
+                events = catalog._collect_events(root, contracts_dir=root / "Game.Core" / "Contracts", domain_prefix="core")
+
+        self.assertEqual([("Game.Core/Contracts/Events/GuildRenamed.cs", "core.guild.renamed", "GuildRenamed")], [(e.file, e.event_type, e.symbol) for e in events])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+
+SC_DIR = Path(__file__).resolve().parents[1]
+if str(SC_DIR) not in sys.path:
+    sys.path.insert(0, str(SC_DIR))
+
+import _diff_packer as diff_packer  # noqa: E402
+from _taskmaster import TaskmasterTriplet  # noqa: E402
+
+
+def _file_diff(path: str, hunks: list[tuple[int, int]]) -> str:
+    lines = [f"diff --git a/{path} b/{path}", "index 1111111..2222222 100644", f"--- a/{path}", f"+++ b/{path}"]
+    for start, added in hunks:
+        lines.append(f"@@ -{start},3 +{start},{3 + added} @@ class X")
+        lines.append(" context")
+        lines.extend(f"+{path} line {start}-{i}" for i in range(added))
+        lines.append(" context")
+    return "\n".join(lines)
+
+
+class DiffPackerTests(unittest.TestCase):
+    def test_parse_should_split_hunks_and_keep_header_only_files(self) -> None:
+        text = "\n".join(
+            [
+                "commit abc\n\n    message",
+                _file_diff("Game.Core/A.cs", [(1, 2), (40, 1)]),
+                "diff --git a/assets/icon.png b/assets/icon.png",
+                "Binary files a/assets/icon.png and b/assets/icon.png differ",
+            ]
+        )
+        hunks = diff_packer.parse_unified_diff(text, section="## Commit diff")
+
+        self.assertEqual(["Game.Core/A.cs", "Game.Core/A.cs", "assets/icon.png"], [hunk.path for hunk in hunks])
+        self.assertEqual([2, 1, 0], [hunk.added for hunk in hunks])
+        self.assertEqual("@@ -40,3 +40,4 @@", hunks[1].header)
+        self.assertEqual("", hunks[2].text)
+        self.assertIn("Binary files", hunks[2].file_header)
+
+    def test_ref_and_category_should_rank_hunks_per_agent(self) -> None:
+        refs = ["Game.Core.Tests/Tasks/InventoryTests.cs"]
+        test_hunk = diff_packer.parse_unified_diff(_file_diff("Game.Core.Tests/Tasks/InventoryTests.cs", [(1, 1)]))[0]
+        impl_hunk = diff_packer.parse_unified_diff(_file_diff("Game.Core/Inventory.cs", [(1, 1)]))[0]
+        doc_hunk = diff_packer.parse_unified_diff(_file_diff("docs/notes.md", [(1, 1)]))[0]
+
+        for agent in ("test-automator", "code-reviewer"):
+            test_score = diff_packer.score_hunk(test_hunk, agent=agent, ref_paths=refs)
+            impl_score = diff_packer.score_hunk(impl_hunk, agent=agent, ref_paths=refs)
+            doc_score = diff_packer.score_hunk(doc_hunk, agent=agent, ref_paths=refs)
+            self.assertGreater(test_score, doc_score)
+            self.assertGreater(impl_score, doc_score)
+        self.assertGreater(
+            diff_packer.score_hunk(test_hunk, agent="test-automator", ref_paths=[]),
+            diff_packer.score_hunk(test_hunk, agent="architect-reviewer", ref_paths=[]),
+        )
+
+    def test_pack_should_keep_best_hunks_within_budget_and_stub_the_rest(self) -> None:
+        big_doc = _file_diff("docs/big.md", [(i * 100, 40) for i in range(1, 6)])
+        contract = _file_diff("Game.Core/Contracts/Events.cs", [(10, 3)])
+        sections = [
+            ("## Staged diff", "diff", big_doc + "\n" + contract),
+            ("## Untracked files", "text", "notes/new.txt"),
+        ]
+
+        packed, meta = diff_packer.pack_diff_sections(sections, budget_chars=1500, agent="architect-reviewer", ref_paths=[])
+
+        self.assertLessEqual(len(packed), 1500)
+        self.assertIn("+Game.Core/Contracts/Events.cs line 10-0", packed)
+        self.assertIn("## Omitted hunks", packed)
+        self.assertIn("- docs/big.md @@ -100,3 +100,43 @@ (+40/-0)", packed)
+        self.assertIn("notes/new.txt", packed)
+        self.assertEqual(6, meta["hunks_total"])
+        self.assertEqual(meta["hunks_total"], meta["hunks_included"] + meta["hunks_stubbed"])
+        self.assertEqual("Game.Core/Contracts/Events.cs", meta["top_included"][0]["path"])
+
+    def test_pack_should_fit_the_budget_when_stubs_outnumber_the_listing(self) -> None:
+        text = "\n".join(_file_diff(f"Game.Core/Generated/Module{index:04d}.cs", [(1, 1), (50, 2)]) for index in range(1000))
+        sections = [("## Staged diff", "diff", text), ("## Untracked files", "text", "notes/new.txt")]
+
+        for budget in (30000, 60000, 100000):
+            packed, meta = diff_packer.pack_diff_sections(sections, budget_chars=budget, agent="code-reviewer", ref_paths=[])
+            self.assertGreater(meta["hunks_total"], diff_packer.MAX_STUB_LINES)
+            self.assertLessEqual(len(packed), budget)
+            self.assertEqual(len(packed), meta["packed_chars"])
+            self.assertGreater(meta["hunks_included"], 0)
+            self.assertGreater(len(packed), budget * 0.8)
+            self.assertIn("more hunks omitted", packed)
+
+    def test_collect_review_ref_paths_should_merge_task_refs(self) -> None:
+        triplet = TaskmasterTriplet(
+            task_id="7",
+            master={"id": "7", "overlay": "docs/architecture/overlays/PRD-X/08/_index.md", "contractRefs": ["Game.Core/Contracts/Events.cs"]},
+            back={"acceptance": ["Works. Refs: Game.Core.Tests/EventsTests.cs"], "test_refs": ["Game.Core.Tests/EventsTests.cs"]},
+            gameplay=None,
+            tasks_json_path="",
+            tasks_back_path="",
+            tasks_gameplay_path="",
+            taskdoc_path=None,
+        )
+
+        refs = diff_packer.collect_review_ref_paths(triplet)
+
+        self.assertEqual(
+            ["Game.Core.Tests/EventsTests.cs", "Game.Core/Contracts/Events.cs", "docs/architecture/overlays/PRD-X/08/_index.md"],
+            refs,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+SC_DIR = Path(__file__).resolve().parents[1]
+if str(SC_DIR) not in sys.path:
+    sys.path.insert(0, str(SC_DIR))
+
+import _encoding_engine as engine  # noqa: E402
+
+
+MIXED_TEXT = "\n".join(
+    [
+        "# Title",
+        "ok line with ??? and more?????",
+        "中?文 and 锟斤拷 and Ã© and â€™quoted â€œ",
+        "闂侀柣閻熼崡閳 cluster and 闁 single",
+        "ctrl\x01here \ufffd done ï»¿",
+        "emoji ✅️ end",
+    ]
+)
+
+
+class EncodingEngineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.addCleanup(self._td.cleanup)
+        self.root = Path(self._td.name)
+        patcher = mock.patch.dict(os.environ, {engine.CACHE_ENV: str(self.root / "cache.json")}, clear=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        engine.reset_encoding_engine()
+        self.addCleanup(engine.reset_encoding_engine)
+
+    def _write(self, name: str, data: bytes) -> Path:
+        path = self.root / name
+        path.write_bytes(data)
+        return path
+
+    def test_single_pass_should_match_each_rule_findall(self) -> None:
+        hits = engine.text_hits(MIXED_TEXT)
+
+        for rule in engine.RULES:
+            matches = re.findall(rule.pattern, MIXED_TEXT)
+            got = hits.get(rule.name)
+            self.assertEqual(len(matches), got.count if got else 0, rule.name)
+            if got:
+                self.assertEqual(tuple(dict.fromkeys(matches))[: engine.MAX_SAMPLES], got.samples, rule.name)
+        self.assertEqual(((2, "ok line with ??? and more?????"),), hits["multi_question_marks"].lines)
+        self.assertEqual(1, hits["multi_question_marks"].line_count)
+
+    def test_ascii_fast_path_should_skip_strict_decode(self) -> None:
+        plain = engine.scan_file(self._write("plain.md", b"hello\nwhat???\n"))
+        bom = engine.scan_file(self._write("bom.md", engine.UTF8_BOM + b"hello\n"))
+
+        self.assertTrue(plain.utf8_ok and plain.ascii_only)
+        self.assertEqual(1, plain.count("multi_question_marks"))
+        self.assertTrue(bom.has_bom and bom.ascii_only and bom.utf8_ok)
+        self.assertEqual(0, engine.engine_stats()["strict_decodes"])
+        self.assertEqual(2, engine.engine_stats()["ascii_fast_path"])
+
+    def test_non_ascii_scan_should_count_cjk_on_bytes_and_report_decode_errors(self) -> None:
+        text = "一丁中文\u9fff" + "鈥" * 3 + "\u4dff\ua000 é"
+        scan = engine.scan_file(self._write("cjk.md", text.encode("utf-8")))
+        broken = engine.scan_file(self._write("broken.md", b"ok \xff\xfe"))
+
+        self.assertEqual(sum(1 for ch in text if "\u4e00" <= ch <= "\u9fff"), scan.cjk_chars)
+        self.assertEqual(3, scan.glyph_chars)
+        self.assertFalse(broken.utf8_ok)
+        self.assertTrue(broken.decode_failed)
+        self.assertTrue(broken.error_detail.startswith("UnicodeDecodeError: "))
+        with self.assertRaises(KeyError):
+            scan.count("no-such-rule")
+
+    def test_results_should_be_cached_by_content_hash_across_processes(self) -> None:
+        first = engine.scan_file(self._write("a.md", MIXED_TEXT.encode("utf-8")))
+        same_content = engine.scan_file(self._write("b.md", MIXED_TEXT.encode("utf-8")))
+        self.assertFalse(first.cached)
+        self.assertTrue(same_content.cached)
+        self.assertEqual(first.hits, same_content.hits)
+        self.assertEqual(str(self.root / "b.md"), same_content.path)
+        self.assertEqual(self.root / "cache.json", engine.save_scan_cache())
+
+        engine.reset_encoding_engine()  # what a later process starts with
+        with mock.patch.object(engine._RuleSet, "match", side_effect=AssertionError("rules should not run")):
+            text, again = engine.read_and_scan(self.root / "a.md")
+        self.assertTrue(again.cached)
+        self.assertEqual(MIXED_TEXT, text)
+        self.assertEqual(first.hits, again.hits)
+        self.assertEqual(first.preview, again.preview)
+
+    def test_cache_off_and_replace_decoding(self) -> None:
+        path = self._write("broken.md", b"bad \xff text")
+        with mock.patch.dict(os.environ, {engine.CACHE_ENV: "off"}, clear=False):
+            engine.scan_file(path)
+            text, scan = engine.read_and_scan(path, errors="replace")
+            strict_text, _ = engine.read_and_scan(path)
+            self.assertIsNone(engine.save_scan_cache())
+
+        self.assertEqual("bad \ufffd text", text)
+        self.assertIsNone(strict_text)
+        self.assertFalse(scan.cached)
+        self.assertFalse((self.root / "cache.json").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
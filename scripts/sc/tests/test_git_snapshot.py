@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+SC_DIR = Path(__file__).resolve().parents[1]
+if str(SC_DIR) not in sys.path:
+    sys.path.insert(0, str(SC_DIR))
+
+import _git_snapshot as git_snapshot_module  # noqa: E402
+
+
+def _git(root: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=root, check=True, capture_output=True, text=True).stdout
+
+
+def _init_repo(root: Path) -> None:
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "dev@example.com")
+    _git(root, "config", "user.name", "dev")
+    (root / "a.txt").write_text("one\n", encoding="utf-8")
+    (root / "b.txt").write_text("two\n", encoding="utf-8")
+    _git(root, "add", "a.txt", "b.txt")
+    _git(root, "commit", "-q", "-m", "init")
+
+
+class GitSnapshotTests(unittest.TestCase):
+    def setUp(self) -> None:
+        git_snapshot_module.reset_git_snapshots()
+        patcher = mock.patch.dict(os.environ, {git_snapshot_module.SNAPSHOT_ENV: ""}, clear=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(git_snapshot_module.reset_git_snapshots)
+
+    def test_parse_porcelain_v2_should_rebuild_status_short_lines(self) -> None:
+        raw = "\0".join(
+            [
+                "# branch.oid 0123abcd",
+                "# branch.head main",
+                "1 .M N... 100644 100644 100644 aaa aaa docs/a b.md",
+                "2 R. N... 100644 100644 100644 bbb bbb R100 new.txt",
+                "old.txt",
+                "? tmp/",
+                "",
+            ]
+        )
+        head, entries = git_snapshot_module.parse_porcelain_v2(raw)
+
+        self.assertEqual("0123abcd", head)
+        self.assertEqual(
+            [' M "docs/a b.md"', "?? tmp/", "R  old.txt -> new.txt"],
+            git_snapshot_module.status_short_lines(entries),
+        )
+
+    def test_fingerprint_should_match_git_status_short(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _init_repo(root)
+            (root / "a.txt").write_text("changed\n", encoding="utf-8")
+            _git(root, "mv", "b.txt", "c.txt")
+            (root / "new dir").mkdir()
+            (root / "new dir" / "x.txt").write_text("x\n", encoding="utf-8")
+
+            fingerprint = git_snapshot_module.git_snapshot(root).fingerprint()
+
+            self.assertEqual(_git(root, "rev-parse", "HEAD").strip(), fingerprint["head"])
+            expected = sorted(line.rstrip() for line in _git(root, "status", "--short").splitlines() if line.strip())
+            self.assertEqual(expected, fingerprint["status_short"])
+
+    def test_queries_should_be_memoized_until_head_moves(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _init_repo(root)
+            (root / "a.txt").write_text("one\nmore\n", encoding="utf-8")
+            numstat = ["git", "diff", "--numstat", "HEAD"]
+
+            first = git_snapshot_module.git_snapshot(root)
+            self.assertEqual((0, "1\t0\ta.txt\n"), first.git(numstat))
+            with mock.patch.object(git_snapshot_module, "run_cmd", side_effect=AssertionError("git should not run")):
+                again = git_snapshot_module.git_snapshot(root)
+                self.assertIs(first, again)
+                self.assertEqual((0, "1\t0\ta.txt\n"), again.git(numstat))
+                again.fingerprint()
+
+            _git(root, "commit", "-q", "-am", "second")
+            moved = git_snapshot_module.git_snapshot(root)
+
+            self.assertIsNot(first, moved)
+            self.assertEqual((0, ""), moved.git(numstat))
+            self.assertEqual(2, git_snapshot_module.snapshot_stats()["captures"])
+
+    def test_published_snapshot_should_be_reused_by_a_fresh_process_state(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td) / "repo"
+            root.mkdir()
+            _init_repo(root)
+            out_dir = Path(td) / "run"
+            path = git_snapshot_module.publish_git_snapshot(out_dir, root=root)
+            self.assertEqual(out_dir / git_snapshot_module.SNAPSHOT_FILE_NAME, path)
+            self.assertEqual(str(path), os.environ[git_snapshot_module.SNAPSHOT_ENV])
+            git_snapshot_module.git_snapshot(root).git(["git", "ls-files", "--others", "--exclude-standard"])
+
+            git_snapshot_module.reset_git_snapshots()  # what a child process starts with
+            with mock.patch.object(git_snapshot_module, "run_cmd", side_effect=AssertionError("git should not run")):
+                child = git_snapshot_module.git_snapshot(root)
+                self.assertEqual((0, ""), child.git(["git", "ls-files", "--others", "--exclude-standard"]))
+            self.assertEqual(0, git_snapshot_module.snapshot_stats()["captures"])
+
+    def test_snapshot_off_should_always_capture(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _init_repo(root)
+            with mock.patch.dict(os.environ, {git_snapshot_module.SNAPSHOT_ENV: "off"}, clear=False):
+                git_snapshot_module.git_snapshot(root)
+                git_snapshot_module.git_snapshot(root)
+
+            self.assertEqual(2, git_snapshot_module.snapshot_stats()["captures"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SC_DIR = Path(__file__).resolve().parents[1]
+if str(SC_DIR) not in sys.path:
+    sys.path.insert(0, str(SC_DIR))
+
+import _latency_model as latency  # noqa: E402
+
+
+def _write_policy(root: Path, **overrides: object) -> None:
+    path = latency.policy_path(root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"enabled": True, **overrides}) + "\n", encoding="utf-8")
+
+
+class LatencyModelTests(unittest.TestCase):
+    def test_p2_quantile_should_track_uniform_distribution(self) -> None:
+        rng = random.Random(7)
+        estimator = latency.P2Quantile(0.9)
+        for _ in range(5000):
+            estimator.add(rng.uniform(0, 100))
+        restored = latency.P2Quantile.from_dict(json.loads(json.dumps(estimator.to_dict())))
+
+        self.assertAlmostEqual(90.0, float(restored.value() or 0.0), delta=3.0)
+
+    def test_prompt_bucket_should_use_power_of_two_steps(self) -> None:
+        self.assertEqual("all", latency.prompt_bucket(None))
+        self.assertEqual("le4k", latency.prompt_bucket(100))
+        self.assertEqual("le16k", latency.prompt_bucket(9000))
+        self.assertEqual("review|code-reviewer|openai-api|le8k", latency.latency_key("review", agent="code-reviewer", backend="openai-api", prompt_chars=5000))
+
+    def test_recommend_timeout_should_stay_static_until_enough_samples(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _write_policy(root, min_samples=8, margin_ratio=0.0, margin_sec=0, floor_sec=10)
+            key = latency.latency_key("light-lane:extract", backend="codex-cli")
+            for seconds in (40, 42, 44, 46, 48):
+                latency.record_latency(key, seconds, outcome="ok", root=root)
+
+            timeout, meta = latency.recommend_timeout(key, default_sec=240, root=root)
+            self.assertEqual((240, "static"), (timeout, meta["source"]))
+
+            for seconds in (50, 52, 54):
+                latency.record_latency(key, seconds, outcome="ok", root=root)
+            timeout, meta = latency.recommend_timeout(key, default_sec=240, root=root)
+
+            self.assertEqual("model", meta["source"])
+            self.assertEqual(8, meta["samples"])
+            self.assertGreaterEqual(timeout, 44)
+            self.assertLessEqual(timeout, 60)
+
+    def test_frequent_timeouts_should_push_timeout_past_longest_kill(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _write_policy(root, min_samples=5, margin_ratio=0.0, margin_sec=0, floor_sec=10, timeout_escalation_ratio=1.5)
+            key = latency.latency_key("light-lane:align", backend="codex-cli")
+            for seconds in (20, 21, 22, 23, 24, 25):
+                latency.record_latency(key, seconds, outcome="ok", root=root)
+            latency.record_latency(key, 100, outcome="timeout", root=root)
+
+            timeout, meta = latency.recommend_timeout(key, default_sec=480, root=root)
+
+            self.assertEqual(150, timeout)
+            self.assertGreater(meta["timeout_rate"], 0.05)
+
+    def test_sized_keys_should_also_feed_the_all_sizes_key(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            latency.record_latency(latency.latency_key("sc-llm-review", agent="code-reviewer", prompt_chars=5000), 30, outcome="ok", root=root)
+
+            model = latency.load_model(root)
+
+            self.assertEqual(1, model[latency.latency_key("sc-llm-review", agent="code-reviewer")].samples)
+
+    def test_plan_timeout_retry_should_respect_deadline_budget(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _write_policy(root, margin_ratio=0.0, margin_sec=0)
+            key = latency.latency_key("light-lane:extract", backend="codex-cli")
+            for seconds in range(50, 70):
+                latency.record_latency(key, seconds, outcome="ok", root=root)
+
+            retry = latency.plan_timeout_retry(key, attempt_timeout_sec=80, budget_remaining_sec=500, root=root)
+            stop = latency.plan_timeout_retry(key, attempt_timeout_sec=80, budget_remaining_sec=30, root=root)
+
+            self.assertEqual(("retry", 160), (retry["action"], retry["timeout_sec"]))
+            self.assertEqual("stop", stop["action"])
+            self.assertGreater(retry["hedge_after_sec"], 0)
+
+    def test_disabled_policy_should_not_record(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _write_policy(root, enabled=False)
+            latency.record_latency("k|-|codex-cli|all", 1.0, outcome="ok", root=root)
+
+            self.assertFalse(latency.model_path(root).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
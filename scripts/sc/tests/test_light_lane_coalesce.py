@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PYTHON_DIR = REPO_ROOT / "scripts" / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+from _light_lane_coalesce import RequestCoalescer, split_semantic_gate_summary  # noqa: E402
+
+
+class RequestCoalescerTests(unittest.TestCase):
+    def _run_workers(self, coalescer: RequestCoalescer, task_ids: list[int]) -> dict[int, object]:
+        results: dict[int, object] = {}
+        lock = threading.Lock()
+        tracked = threading.Barrier(len(task_ids))
+
+        def _worker(task_id: int) -> None:
+            with coalescer.track_task():
+                tracked.wait(5)
+                value = coalescer.submit(task_id, f"req-{task_id}")
+            with lock:
+                results[task_id] = value
+
+        threads = [threading.Thread(target=_worker, args=(task_id,)) for task_id in task_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        return results
+
+    def test_concurrent_submits_should_share_batches_up_to_max_batch(self) -> None:
+        batches: list[list[int]] = []
+
+        def _run_batch(items):
+            batches.append(sorted(task_id for task_id, _ in items))
+            return {task_id: f"{request}:batched" for task_id, request in items}
+
+        coalescer = RequestCoalescer(_run_batch, max_batch=3, max_wait_sec=5)
+        results = self._run_workers(coalescer, [1, 2, 3, 4, 5, 6])
+
+        self.assertEqual({task_id: f"req-{task_id}:batched" for task_id in range(1, 7)}, results)
+        self.assertEqual(2, len(batches))
+        self.assertTrue(all(len(batch) == 3 for batch in batches))
+        self.assertEqual({"requests": 6, "batches": 2}, coalescer.stats())
+
+    def test_batch_should_flush_without_waiting_once_no_tracked_worker_can_join(self) -> None:
+        coalescer = RequestCoalescer(lambda items: {task_id: "ok" for task_id, _ in items}, max_batch=8, max_wait_sec=60)
+        done = threading.Event()
+
+        def _worker() -> None:
+            coalescer.submit(1, "only")
+            done.set()
+
+        thread = threading.Thread(target=_worker)
+        thread.start()
+        self.assertTrue(done.wait(5))
+        thread.join(5)
+
+    def test_batch_error_should_reach_every_member(self) -> None:
+        def _run_batch(items):
+            raise RuntimeError("backend down")
+
+        coalescer = RequestCoalescer(_run_batch, max_batch=2, max_wait_sec=5)
+        errors: list[str] = []
+
+        def _worker(task_id: int) -> None:
+            try:
+                coalescer.submit(task_id, "x")
+            except RuntimeError as exc:
+                errors.append(str(exc))
+
+        threads = [threading.Thread(target=_worker, args=(task_id,)) for task_id in (1, 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        self.assertEqual(["backend down", "backend down"], errors)
+
+    def test_split_semantic_gate_summary_should_judge_task_by_batch_limits(self) -> None:
+        batch = {
+            "needs_fix": [2],
+            "unknown": [3],
+            "findings": [
+                {"task_id": 1, "verdict": "OK", "reason": ""},
+                {"task_id": 2, "verdict": "Needs Fix", "reason": "gap"},
+                {"task_id": 3, "verdict": "Unknown", "reason": "?"},
+            ],
+            "max_needs_fix": 0,
+            "max_unknown": 1,
+            "status": "fail",
+        }
+
+        self.assertEqual("ok", split_semantic_gate_summary(batch, 1)["status"])
+        self.assertEqual(["needs_fix>0"], split_semantic_gate_summary(batch, 2)["fail_reasons"])
+        self.assertEqual("ok", split_semantic_gate_summary(batch, 3)["status"])
+        self.assertEqual(["task_missing_from_batch"], split_semantic_gate_summary(batch, 9)["fail_reasons"])
+
+
+if __name__ == "__main__":
+    unittest.main()
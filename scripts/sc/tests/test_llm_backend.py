@@ -3,9 +3,11 @@ from __future__ import annotations
 
 import importlib.util
 import os
+import shlex
 import subprocess
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -30,6 +32,31 @@ def _load_module(name: str, relative_path: str):
 
 llm_backend = _load_module("sc_llm_backend_module", "scripts/sc/_llm_backend.py")
 
+_STUB_SCRIPT = """
+import os, sys, time
+state = sys.argv[1]
+prompt = sys.stdin.read()
+index = 0
+while True:
+    try:
+        os.close(os.open(os.path.join(state, f"call-{index}"), os.O_CREAT | os.O_EXCL))
+        break
+    except FileExistsError:
+        index += 1
+if index == 0:
+    time.sleep(float(sys.argv[2]))
+print(f"reply-{index} to {prompt.strip()}")
+"""
+
+
+def _stub_env(root: Path, *, first_delay_sec: float, **extra: str) -> dict[str, str]:
+    script = root / "stub_llm.py"
+    script.write_text(_STUB_SCRIPT, encoding="utf-8")
+    state = root / "stub-state"
+    state.mkdir(exist_ok=True)
+    command = " ".join(shlex.quote(part) for part in [sys.executable, str(script), str(state), str(first_delay_sec)])
+    return {"SC_LLM_STUB_CMD": command, **extra}
+
 
 class LlmBackendTests(unittest.TestCase):
     def test_run_llm_exec_should_fail_on_openai_backend_before_implementation(self) -> None:
@@ -91,7 +118,7 @@ class LlmBackendTests(unittest.TestCase):
         class _FakeClient:
             last_timeout = None
 
-            def __init__(self, *, timeout):
+            def __init__(self, *, timeout, **kwargs):  # noqa: ARG002
                 _FakeClient.last_timeout = timeout
                 self.responses = _FakeResponses()
 
@@ -123,7 +150,7 @@ class LlmBackendTests(unittest.TestCase):
                 raise RuntimeError("boom")
 
         class _FailingClient:
-            def __init__(self, *, timeout):  # noqa: ARG002
+            def __init__(self, *, timeout, **kwargs):  # noqa: ARG002
                 self.responses = _FailingResponses()
 
         fake_openai = type("FakeOpenAI", (), {"OpenAI": _FailingClient})
@@ -142,6 +169,69 @@ class LlmBackendTests(unittest.TestCase):
         self.assertIn("openai-api request failed", out)
         self.assertEqual(["openai-api"], cmd)
 
+    def test_local_stub_backend_should_run_without_hedging(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            out_path = root / "out" / "reply.md"
+            with mock.patch.dict(os.environ, {**_stub_env(root, first_delay_sec=0), "SC_LLM_HEDGE": ""}, clear=False):
+                rc, trace, cmd = llm_backend.run_llm_exec(
+                    backend="local-stub",
+                    root=root,
+                    prompt="hello",
+                    output_last_message=out_path,
+                    timeout_sec=30,
+                )
+
+            self.assertEqual(0, rc)
+            self.assertEqual("reply-0 to hello\n", out_path.read_text(encoding="utf-8"))
+            self.assertNotIn("[llm-hedge]", trace)
+            self.assertEqual(sys.executable, cmd[0])
+
+    def test_hedged_request_should_take_first_valid_reply_and_cancel_the_slow_one(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            out_path = root / "reply.md"
+            before = llm_backend.hedge_stats()
+            env = _stub_env(root, first_delay_sec=20, SC_LLM_HEDGE="on", SC_LLM_HEDGE_AFTER_SEC="0.3")
+            with mock.patch.dict(os.environ, env, clear=False):
+                started = time.perf_counter()
+                rc, trace, _cmd = llm_backend.run_llm_exec(
+                    backend="local-stub",
+                    root=root,
+                    prompt="hello",
+                    output_last_message=out_path,
+                    timeout_sec=30,
+                )
+                elapsed = time.perf_counter() - started
+            after = llm_backend.hedge_stats()
+
+            self.assertEqual(0, rc)
+            self.assertLess(elapsed, 10)
+            self.assertEqual("reply-1 to hello\n", out_path.read_text(encoding="utf-8"))
+            self.assertIn("[llm-hedge] requests=2 winner=1", trace)
+            self.assertEqual(1, after["hedge_wins"] - before["hedge_wins"])
+            self.assertEqual(1, after["cancelled_requests"] - before["cancelled_requests"])
+            self.assertGreater(after["wasted_token_estimate"], before["wasted_token_estimate"])
+            self.assertEqual([], sorted(path.name for path in root.glob(".reply.md.req-*")))
+
+    def test_hedged_request_should_not_duplicate_fast_calls(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            out_path = root / "reply.md"
+            env = _stub_env(root, first_delay_sec=0, SC_LLM_HEDGE="on", SC_LLM_HEDGE_AFTER_SEC="5")
+            with mock.patch.dict(os.environ, env, clear=False):
+                rc, trace, _cmd = llm_backend.run_llm_exec(
+                    backend="local-stub",
+                    root=root,
+                    prompt="hello",
+                    output_last_message=out_path,
+                    timeout_sec=30,
+                )
+
+            self.assertEqual(0, rc)
+            self.assertNotIn("[llm-hedge]", trace)
+            self.assertEqual(["call-0"], sorted(path.name for path in (root / "stub-state").iterdir()))
+
 
 if __name__ == "__main__":
     unittest.main()
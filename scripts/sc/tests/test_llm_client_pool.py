@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+
+SC_DIR = Path(__file__).resolve().parents[1]
+if str(SC_DIR) not in sys.path:
+    sys.path.insert(0, str(SC_DIR))
+
+import _llm_backend as llm_backend  # noqa: E402
+import _llm_client_pool as client_pool  # noqa: E402
+
+
+class _StubResponsesHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length).decode("utf-8"))
+        self.server.requests.append({"path": self.path, "client_port": self.client_address[1], "payload": payload})
+        text = f"echo: {payload.get('input')}"
+        body = json.dumps(
+            {"id": f"resp_{len(self.server.requests)}", "output": [{"type": "message", "content": [{"type": "output_text", "text": text}]}]}
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - keep test output quiet
+        return
+
+
+class LlmClientPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        client_pool.reset_client_pools()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubResponsesHandler)
+        self.server.requests = []
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+
+    def tearDown(self) -> None:
+        client_pool.reset_client_pools()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_sequential_posts_should_reuse_one_keepalive_connection(self) -> None:
+        pool = client_pool.HttpConnectionPool(max_size=4)
+        try:
+            for index in range(5):
+                status, body = pool.post_json(f"{self.base_url}/responses", {"input": f"p{index}"}, timeout=5)
+                self.assertEqual(200, status)
+                self.assertEqual("echo: p{}".format(index), body["output"][0]["content"][0]["text"])
+        finally:
+            pool.close()
+
+        self.assertEqual({"connections_opened": 1, "requests": 5, "reused_requests": 4}, pool.stats())
+        self.assertEqual(1, len({item["client_port"] for item in self.server.requests}))
+
+    def test_openai_http_transport_should_share_connections_across_calls(self) -> None:
+        env = {"OPENAI_API_KEY": "sk-test", "OPENAI_BASE_URL": self.base_url, "SC_OPENAI_TRANSPORT": "http", "SC_LLM_HEDGE": ""}
+        with tempfile.TemporaryDirectory() as td, mock.patch.dict(os.environ, env, clear=False), mock.patch.object(
+            llm_backend.importlib.util, "find_spec", return_value=None
+        ):
+            outputs = []
+            for index in range(3):
+                out_path = Path(td) / f"reply-{index}.md"
+                rc, trace, cmd = llm_backend.run_llm_exec(
+                    backend="openai-api",
+                    root=Path(td),
+                    prompt=f"hello {index}",
+                    output_last_message=out_path,
+                    timeout_sec=10,
+                    codex_configs=['model_reasoning_effort="low"'],
+                )
+                self.assertEqual(0, rc, trace)
+                outputs.append(out_path.read_text(encoding="utf-8"))
+
+        self.assertEqual([f"echo: hello {i}\n" for i in range(3)], outputs)
+        self.assertEqual("/v1/responses", self.server.requests[0]["path"])
+        self.assertEqual({"effort": "low"}, self.server.requests[0]["payload"]["reasoning"])
+        self.assertEqual(1, client_pool.client_pool_stats()["connections_opened"])
+        self.assertIn('"transport": "http"', trace)
+        self.assertEqual(["openai-api", cmd[1]], cmd)
+
+    def test_shared_openai_client_should_build_one_client_per_endpoint(self) -> None:
+        class _FakeClient:
+            created = 0
+
+            def __init__(self, **kwargs):
+                _FakeClient.created += 1
+                self.kwargs = kwargs
+
+        first = client_pool.shared_openai_client(_FakeClient, timeout_sec=10, base_url=self.base_url, api_key="k1")
+        again = client_pool.shared_openai_client(_FakeClient, timeout_sec=99, base_url=self.base_url, api_key="k1")
+        other = client_pool.shared_openai_client(_FakeClient, timeout_sec=10, base_url=self.base_url, api_key="k2")
+
+        self.assertIs(first, again)
+        self.assertIsNot(first, other)
+        self.assertEqual(2, _FakeClient.created)
+        self.assertEqual(10.0, first.kwargs["timeout"])
+        self.assertEqual(1, client_pool.client_pool_stats()["sdk_client_reuses"])
+
+
+if __name__ == "__main__":
+    unittest.main()
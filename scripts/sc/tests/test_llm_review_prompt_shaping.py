@@ -135,6 +135,31 @@ class LlmReviewPromptShapingTests(unittest.TestCase):
         self.assertTrue(meta["acceptance_semantic_included"])
         self.assertLess(len(prompt), 1000)
 
+    def test_fit_prompt_context_should_prefer_packed_diff_over_summary(self) -> None:
+        budgets: list[int] = []
+
+        def _packer(budget: int) -> tuple[str, dict[str, object]]:
+            budgets.append(budget)
+            return "## Staged diff\n" + ("p" * (budget - 40)), {"hunks_total": 3, "hunks_included": 1}
+
+        prompt, meta = _fit_prompt_context(
+            blocks=["Role: code-reviewer", "Task Context:\n- title: Task 56"],
+            diff_ctx="## Diff\n" + ("x" * 5000),
+            diff_ctx_summary="## Diff Summary\nshort",
+            acceptance_semantic_ctx="## Acceptance Semantics\n" + ("y" * 320),
+            diff_position="before_acceptance_semantic",
+            max_chars=1000,
+            allow_drop_acceptance_semantic=True,
+            diff_packer=_packer,
+        )
+
+        self.assertEqual("packed", meta["diff_mode_used"])
+        self.assertEqual(["packed_diff"], meta["fallbacks_applied"])
+        self.assertEqual({"hunks_total": 3, "hunks_included": 1}, meta["diff_packing"])
+        self.assertTrue(meta["acceptance_semantic_included"])
+        self.assertLessEqual(len(prompt), 1000)
+        self.assertEqual(1, len(budgets))
+
     def test_fit_prompt_context_should_drop_acceptance_semantic_as_last_resort(self) -> None:
         prompt, meta = _fit_prompt_context(
             blocks=["Role: code-reviewer", "Task Context:\n- title: Task 56"],
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import datetime as dt
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PYTHON_DIR = REPO_ROOT / "scripts" / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+
+def _load_module(name: str, relative_path: str):
+    path = REPO_ROOT / relative_path
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise AssertionError(f"failed to load module: {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+lifecycle = _load_module("log_lifecycle_test_module", "scripts/python/_log_lifecycle.py")
+
+TODAY = dt.date(2026, 4, 30)
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _policy(**overrides: object) -> dict[str, object]:
+    policy: dict[str, object] = {
+        "areas": ["logs/ci"],
+        "hot_days": 3,
+        "archive_compression": "deflate",
+        "reference_globs": ["logs/ci/*/*/latest.json"],
+        "families": [
+            {"name": "review-pipeline", "match": ["sc-review-pipeline-task-*"], "keep_days": 20, "keep_last": 1, "keep_if_referenced": True},
+            {"name": "default", "match": ["*"], "keep_days": 20, "keep_last": 0, "keep_if_referenced": True},
+        ],
+    }
+    policy.update(overrides)
+    return policy
+
+
+class LogLifecycleTests(unittest.TestCase):
+    def test_cold_entries_should_be_archived_and_restored_lazily(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            run_dir = root / "logs" / "ci" / "2026-04-20" / "sc-review-pipeline-task-7-run-a"
+            _write(run_dir / "summary.json", '{"status": "ok"}\n')
+            _write(run_dir / "child-artifacts" / "sc-test" / "summary.json", '{"status": "ok"}\n')
+            _write(root / "logs" / "ci" / "2026-04-29" / "sc-test" / "summary.json", "{}\n")
+
+            summary = lifecycle.apply_log_lifecycle(root, _policy(), today=TODAY)
+
+            self.assertEqual(["logs/ci/2026-04-20/sc-review-pipeline-task-7-run-a"], summary["archived"])
+            self.assertFalse(run_dir.exists())
+            self.assertFalse((root / "logs" / "ci" / "2026-04-20").exists())
+            self.assertTrue((root / "logs" / "ci" / "2026-04-29" / "sc-test" / "summary.json").exists())
+            manifest = json.loads((root / "logs" / "ci" / ".archive" / "manifest.json").read_text(encoding="utf-8"))
+            record = manifest["entries"]["2026-04-20/sc-review-pipeline-task-7-run-a"]
+            self.assertEqual("2026-04-20.zip", record["archive"])
+            self.assertEqual(2, record["files"])
+
+            target = run_dir / "child-artifacts" / "sc-test" / "summary.json"
+            self.assertTrue(lifecycle.restore_archived_path(root, target))
+            self.assertEqual('{"status": "ok"}\n', target.read_text(encoding="utf-8"))
+
+            again = lifecycle.apply_log_lifecycle(root, _policy(), today=TODAY)
+            self.assertEqual(["logs/ci/2026-04-20/sc-review-pipeline-task-7-run-a"], again["archived"])
+            self.assertFalse(run_dir.exists())
+
+    def test_expired_entries_should_respect_keep_last_and_references(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            ci = root / "logs" / "ci"
+            _write(ci / "2026-03-01" / "sc-review-pipeline-task-7-run-old" / "summary.json", "{}\n")
+            _write(ci / "2026-03-02" / "sc-review-pipeline-task-7-run-newest-old" / "summary.json", "{}\n")
+            _write(ci / "2026-03-01" / "sc-acceptance-check-task-7" / "summary.json", "{}\n")
+            _write(ci / "2026-03-01" / "misc" / "summary.json", "{}\n")
+            _write(
+                ci / "2026-04-29" / "sc-review-pipeline-task-7" / "latest.json",
+                json.dumps({"latest_out_dir": "logs\\ci\\2026-03-01\\sc-acceptance-check-task-7"}),
+            )
+
+            policy = _policy()
+            policy["families"][0]["keep_last"] = 2  # latest.json pointer dir + newest run
+            dry = lifecycle.apply_log_lifecycle(root, policy, today=TODAY, dry_run=True)
+            self.assertTrue((ci / "2026-03-01" / "misc").exists())
+            summary = lifecycle.apply_log_lifecycle(root, policy, today=TODAY)
+
+            self.assertEqual(dry["deleted"], summary["deleted"])
+            self.assertIn("logs/ci/2026-03-01/sc-review-pipeline-task-7-run-old", summary["deleted"])
+            self.assertIn("logs/ci/2026-03-01/misc", summary["deleted"])
+            self.assertIn("logs/ci/2026-03-01/sc-acceptance-check-task-7", summary["protected"])
+            self.assertTrue((ci / "2026-03-01" / "sc-acceptance-check-task-7").exists())
+            self.assertIn("logs/ci/2026-03-02/sc-review-pipeline-task-7-run-newest-old", summary["archived"])
+            self.assertTrue((ci / "2026-04-29" / "sc-review-pipeline-task-7" / "latest.json").exists())
+
+    def test_archived_entries_should_expire_with_their_archive(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _write(root / "logs" / "ci" / "2026-04-20" / "misc" / "summary.json", "{}\n")
+            lifecycle.apply_log_lifecycle(root, _policy(), today=TODAY)
+            self.assertTrue((root / "logs" / "ci" / ".archive" / "2026-04-20.zip").is_file())
+
+            summary = lifecycle.apply_log_lifecycle(root, _policy(), today=TODAY + dt.timedelta(days=30))
+            self.assertEqual(["logs/ci/2026-04-20/misc"], summary["deleted"])
+            self.assertFalse((root / "logs" / "ci" / ".archive" / "2026-04-20.zip").exists())
+
+
+    def test_expired_archived_entries_should_leave_a_shared_archive(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            ci = root / "logs" / "ci"
+            _write(ci / "2026-04-20" / "misc" / "summary.json", "{}\n")
+            _write(ci / "2026-04-20" / "misc" / "nested" / "log.txt", "x" * 4096)
+            _write(ci / "2026-04-20" / "sc-review-pipeline-task-7-run-a" / "summary.json", "{}\n")
+            lifecycle.apply_log_lifecycle(root, _policy(), today=TODAY)
+            archive = ci / ".archive" / "2026-04-20.zip"
+            self.assertIn("misc/nested/log.txt", zipfile.ZipFile(archive).namelist())
+
+            summary = lifecycle.apply_log_lifecycle(root, _policy(), today=TODAY + dt.timedelta(days=30))
+
+            self.assertEqual(["logs/ci/2026-04-20/misc"], summary["deleted"])
+            self.assertEqual([], summary["failed"])
+            with zipfile.ZipFile(archive) as handle:
+                self.assertEqual(["sc-review-pipeline-task-7-run-a/summary.json"], handle.namelist())
+            self.assertTrue(lifecycle.restore_archived_path(root, ci / "2026-04-20" / "sc-review-pipeline-task-7-run-a" / "summary.json"))
+
+    def test_referenced_archived_entries_should_outlive_keep_days(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            ci = root / "logs" / "ci"
+            _write(ci / "2026-04-20" / "misc" / "summary.json", "{}\n")
+            lifecycle.apply_log_lifecycle(root, _policy(), today=TODAY)
+            self.assertTrue((ci / ".archive" / "2026-04-20.zip").is_file())
+
+            _write(ci / "2026-05-29" / "sc-review-pipeline-task-7" / "latest.json", json.dumps({"latest_out_dir": "logs/ci/2026-04-20/misc"}))
+            summary = lifecycle.apply_log_lifecycle(root, _policy(), today=TODAY + dt.timedelta(days=30))
+
+            self.assertEqual([], summary["deleted"])
+            self.assertIn("logs/ci/2026-04-20/misc", summary["protected"])
+            self.assertTrue((ci / ".archive" / "2026-04-20.zip").is_file())
+            self.assertTrue(lifecycle.restore_archived_path(root, ci / "2026-04-20" / "misc" / "summary.json"))
+
+
+if __name__ == "__main__":
+    unittest.main()
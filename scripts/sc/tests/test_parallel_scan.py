@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SC_DIR = REPO_ROOT / "scripts" / "sc"
+PYTHON_DIR = REPO_ROOT / "scripts" / "python"
+for candidate in (SC_DIR, PYTHON_DIR):
+    if str(candidate) not in sys.path:
+        sys.path.insert(0, str(candidate))
+
+import _parallel_scan as parallel_scan  # noqa: E402
+import _quality_rules as quality_rules  # noqa: E402
+import _test_quality as test_quality  # noqa: E402
+import check_test_naming  # noqa: E402
+
+
+POOL_ENV = {parallel_scan.WORKERS_ENV: "2", parallel_scan.MIN_FILES_ENV: "1"}
+
+
+def _write(root: Path, rel: str, text: str) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+class ParallelScanTests(unittest.TestCase):
+    def test_scan_items_should_keep_input_order_with_and_without_pool(self) -> None:
+        items = ["x" * (index % 37) for index in range(200)]
+
+        serial = list(parallel_scan.scan_items(len, items, workers=1))
+        pooled = list(parallel_scan.scan_items(len, items, workers=3))
+
+        self.assertEqual([len(item) for item in items], serial)
+        self.assertEqual(serial, pooled)
+
+    def test_scan_items_should_cap_windows_pools_and_fall_back_when_rejected(self) -> None:
+        items = list(range(parallel_scan.MIN_CHUNK * 400))
+        with mock.patch(
+            "concurrent.futures.ProcessPoolExecutor", side_effect=ValueError("max_workers must be <= 61")
+        ) as pool, mock.patch.object(parallel_scan.sys, "platform", "win32"):
+            self.assertEqual(items, list(parallel_scan.scan_items(int, items, workers=100)))
+
+        self.assertEqual(parallel_scan.WINDOWS_MAX_WORKERS, pool.call_args.kwargs["max_workers"])
+
+    def test_scan_workers_should_stay_serial_below_threshold(self) -> None:
+        with mock.patch.dict(os.environ, {parallel_scan.WORKERS_ENV: "8"}, clear=False):
+            os.environ.pop(parallel_scan.MIN_FILES_ENV, None)
+            self.assertEqual(1, parallel_scan.scan_workers(parallel_scan.DEFAULT_MIN_FILES - 1))
+            self.assertEqual(8, parallel_scan.scan_workers(1000))
+        with mock.patch.dict(os.environ, POOL_ENV, clear=False):
+            self.assertEqual(1, parallel_scan.scan_workers(20))
+            self.assertEqual(2, parallel_scan.scan_workers(40))
+
+    def test_ci_prefilter_should_defer_non_ascii_text_to_the_regex(self) -> None:
+        self.assertFalse(parallel_scan.contains_any_ci(parallel_scan.ci_haystack("nothing here"), ("create_timer",)))
+        self.assertTrue(parallel_scan.contains_any_ci(parallel_scan.ci_haystack("CREATE_TIMER(1)"), ("create_timer",)))
+        # 'ı' matches 'i' under re.IGNORECASE, so a lowered-substring check would wrongly skip this text.
+        self.assertTrue(test_quality.FLAKY_RULES[0][1].search("create_tımer(1)"))
+        self.assertTrue(parallel_scan.contains_any_ci(parallel_scan.ci_haystack("create_tımer(1)"), ("create_timer",)))
+
+
+class ScannerTests(unittest.TestCase):
+    def _repo(self, root: Path) -> None:
+        blocking = "class S { void F() { Task.Delay(1).GetAwaiter().GetResult(); } }\n"
+        lookups = 'var a = GetNodeOrNull<EventBusAdapter>("/root/EventBus");\nvar b = GetNodeOrNull<EventBusAdapter>("/root/EventBus");\n'
+        _write(root, "Game.Core/Services/Saver.cs", blocking)
+        _write(root, "Game.Core/Domain/Model.cs", blocking)
+        _write(root, "Game.Godot/Scripts/UI/Hud.cs", lookups + "var d = JsonDocument.Parse(json);\nConnect(EventBusAdapter.SignalName.DomainEventEmitted, cb);\n")
+        _write(root, "Game.Godot/Scripts/UI/Clean.cs", "var d = JsonDocument.Parse(json, options);\n")
+        _write(root, "Tests.Godot/Game.Godot/Scripts/UI/Hud.cs", lookups)
+        _write(root, "Game.Godot/Scripts/bin/Generated.cs", lookups)
+        for index in range(40):
+            _write(root, f"Game.Godot/Scripts/Gen/File{index:02d}.cs", f"// file {index}\n" + ("var d = JsonDocument.Parse(x);\n" if index % 10 == 0 else ""))
+        _write(root, "Tests.Godot/tests/test_hud.gd", 'func test_a():\n\tbus.PUBLISHSIMPLE("core.hud.opened", "")\n\tassert_bool(true).is_true()\n')
+        _write(root, "Tests.Godot/tests/test_wait.gd", "func test_b():\n\tawait get_tree().create_timer(0.5).timeout\n\tvar e = \"ui.menu.closed\"\n")
+        _write(root, "Tests.Godot/tests/test_plain.gd", "func test_c():\n\tpass\n")
+
+    def test_quality_rules_should_scan_in_scope_files_in_path_order(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self._repo(root)
+
+            report = quality_rules.scan_quality_rules(repo_root=root)
+            with mock.patch.dict(os.environ, POOL_ENV, clear=False):
+                pooled = quality_rules.scan_quality_rules(repo_root=root)
+
+        self.assertEqual(report, pooled)
+        self.assertEqual([("Game.Core/Services/Saver.cs", 1)], [(item["file"], item["line"]) for item in report["findings"]["p0"]])
+        self.assertEqual(
+            [
+                ("cs.jsondocument_parse_single_arg", "Game.Godot/Scripts/Gen/File00.cs", 2),
+                ("cs.jsondocument_parse_single_arg", "Game.Godot/Scripts/Gen/File10.cs", 2),
+                ("cs.jsondocument_parse_single_arg", "Game.Godot/Scripts/Gen/File20.cs", 2),
+                ("cs.jsondocument_parse_single_arg", "Game.Godot/Scripts/Gen/File30.cs", 2),
+                ("cs.eventbus_repeated_lookup", "Game.Godot/Scripts/UI/Hud.cs", 2),
+                ("cs.domain_event_connect_without_exit_cleanup", "Game.Godot/Scripts/UI/Hud.cs", None),
+                ("cs.jsondocument_parse_single_arg", "Game.Godot/Scripts/UI/Hud.cs", 3),
+            ],
+            [(item["rule"], item["file"], item["line"]) for item in report["findings"]["p1"]],
+        )
+
+    def test_test_quality_and_naming_should_match_between_serial_and_pool(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            self._repo(root)
+            tests_dir = root / "Game.Core.Tests"
+            for index in range(30):
+                name = "Should_do_it" if index % 7 == 0 else "ShouldDoIt_WhenReady"
+                body = f"public class T{index}Tests {{\n    [Fact]\n    public void {name}() {{ }}\n}}\n" if index % 3 else "public class Helper {}\n"
+                _write(tests_dir, f"Area/T{index:02d}Tests.cs", body)
+            kwargs = {"repo_root": root, "task_id": "7", "title": "HUD panel", "details_blob": "", "taskdoc_path": None}
+
+            serial_quality = test_quality.assess_test_quality(**kwargs)
+            serial_naming = check_test_naming.scan_test_files(tests_dir, style="should_when")
+            with mock.patch.dict(os.environ, POOL_ENV, clear=False):
+                pooled_quality = test_quality.assess_test_quality(**kwargs)
+                pooled_naming = check_test_naming.scan_test_files(tests_dir, style="should_when")
+
+        self.assertEqual(serial_quality, pooled_quality)
+        self.assertEqual(["Tests.Godot/tests/test_hud.gd"], serial_quality["gdunit"]["behavior_tests_found"])
+        self.assertEqual({"core": ["core.hud.opened"], "ui": ["ui.menu.closed"]}, serial_quality["gdunit"]["referenced_events"])
+        self.assertEqual([("Tests.Godot/tests/test_wait.gd", 2, "gd.timer_wait")], [(item["file"], item["line"], item["rule"]) for item in serial_quality["findings"]["flaky_samples"]])
+        self.assertEqual(serial_naming, pooled_naming)
+        self.assertEqual(
+            ["T07Tests.cs", "T14Tests.cs", "T28Tests.cs"],
+            [path.name for path in serial_naming],
+        )
+        self.assertEqual([(3, "Should_do_it")], serial_naming[tests_dir / "Area" / "T07Tests.cs"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SC_DIR = Path(__file__).resolve().parents[1]
+if str(SC_DIR) not in sys.path:
+    sys.path.insert(0, str(SC_DIR))
+
+import _lazy_import as lazy  # noqa: E402
+import _profile as profile  # noqa: E402
+
+
+def _run_child(code: str, env_overrides: dict[str, str]) -> subprocess.CompletedProcess[str]:
+    env = {key: value for key, value in os.environ.items() if key not in {profile.PROFILE_ENV, profile.DIR_ENV}}
+    env.update(env_overrides)
+    return subprocess.run([sys.executable, "-c", code], cwd=str(SC_DIR), env=env, capture_output=True, text=True, timeout=60)
+
+
+class LazyImportTests(unittest.TestCase):
+    def test_lazy_import_should_defer_module_body_until_attribute_access(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            (Path(td) / "sc_lazy_probe.py").write_text("LOADED = True\nVALUE = 42\n", encoding="utf-8")
+            sys.path.insert(0, td)
+            try:
+                module = lazy.lazy_import("sc_lazy_probe")
+                self.assertNotIn("sc_lazy_probe", sys.modules)
+                self.assertIn({"name": "sc_lazy_probe", "loaded": False}, lazy.lazy_import_report())
+
+                self.assertEqual(42, module.VALUE)
+                self.assertIn("sc_lazy_probe", sys.modules)
+                self.assertIs(module, lazy.lazy_import("sc_lazy_probe"))
+                self.assertIn({"name": "sc_lazy_probe", "loaded": True}, lazy.lazy_import_report())
+            finally:
+                sys.path.remove(td)
+                sys.modules.pop("sc_lazy_probe", None)
+
+    def test_llm_client_pool_import_should_not_load_http_stack(self) -> None:
+        proc = _run_child(
+            "import sys, _llm_client_pool\nprint(sorted(name for name in ('http.client', 'ssl', 'concurrent.futures') if name in sys.modules))",
+            {},
+        )
+
+        self.assertEqual(0, proc.returncode, proc.stderr)
+        self.assertEqual("[]", proc.stdout.strip())
+
+
+class ProfileTests(unittest.TestCase):
+    def test_profile_modes_should_ignore_unknown_entries(self) -> None:
+        self.assertEqual(frozenset(), profile.profile_modes(""))
+        self.assertEqual(frozenset({"cpu"}), profile.profile_modes("CPU, bogus"))
+        self.assertEqual(frozenset({"cpu", "import"}), profile.profile_modes("import,cpu"))
+
+    def test_child_should_write_import_and_cpu_reports(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            proc = _run_child(
+                "import time\nimport _profile\nimport _delivery_profile\ntime.sleep(0.1)\n",
+                {profile.PROFILE_ENV: "import,cpu", profile.DIR_ENV: td, profile.INTERVAL_ENV: "2"},
+            )
+
+            self.assertEqual(0, proc.returncode, proc.stderr)
+            self.assertIn("SC_PROFILE modes=cpu,import", proc.stderr)
+            report = json.loads(next(Path(td).glob("import-*.json")).read_text(encoding="utf-8"))
+            modules = {item["module"]: item for item in report["records"]}
+            self.assertIn("_delivery_profile", modules)
+            self.assertEqual(0, modules["_delivery_profile"]["depth"])
+            self.assertGreaterEqual(modules["_delivery_profile"]["cumulative_us"], modules["_delivery_profile"]["self_us"])
+            self.assertTrue(next(Path(td).glob("import-*.txt")).read_text(encoding="utf-8").startswith("import time: self [us]"))
+            collapsed = next(Path(td).glob("cpu-*.collapsed")).read_text(encoding="utf-8")
+            self.assertIn("MainThread;<module> (<string>:1)", collapsed)
+            speedscope = json.loads(next(Path(td).glob("cpu-*.speedscope.json")).read_text(encoding="utf-8"))
+            self.assertEqual("sampled", speedscope["profiles"][0]["type"])
+
+    def test_child_without_profile_env_should_write_nothing(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            proc = _run_child("import _profile\nprint(sorted(_profile._MODES))", {profile.DIR_ENV: td})
+
+            self.assertEqual(0, proc.returncode, proc.stderr)
+            self.assertEqual("[]", proc.stdout.strip())
+            self.assertEqual([], list(Path(td).iterdir()))
+
+    def test_sample_exports_should_merge_identical_stacks(self) -> None:
+        main = ("main", "run.py", 1)
+        work = ("work", "run.py", 10)
+        counts = {("MainThread", (main, work)): 3, ("MainThread", (main,)): 1, ("worker", (work,)): 2}
+
+        collapsed = profile.collapsed_stacks(counts).splitlines()
+        document = profile.speedscope_profile(counts, interval_ms=5.0, name="run")
+
+        self.assertEqual("MainThread;main (run.py:1);work (run.py:10) 3", collapsed[0])
+        self.assertEqual(3, len(collapsed))
+        self.assertEqual([{"name": "main", "file": "run.py", "line": 1}, {"name": "work", "file": "run.py", "line": 10}], document["shared"]["frames"])
+        by_thread = {item["name"]: item for item in document["profiles"]}
+        self.assertEqual([[0, 1], [0]], by_thread["MainThread"]["samples"])
+        self.assertEqual([15.0, 5.0], by_thread["MainThread"]["weights"])
+        self.assertEqual(20.0, by_thread["MainThread"]["endValue"])
+        self.assertEqual([[1]], by_thread["worker"]["samples"])
+
+
+if __name__ == "__main__":
+    unittest.main()
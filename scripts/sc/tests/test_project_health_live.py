@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import json
+import sys
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PYTHON_DIR = REPO_ROOT / "scripts" / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+
+def _load_module(name: str, relative_path: str):
+    path = REPO_ROOT / relative_path
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise AssertionError(f"failed to load module: {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+live_module = _load_module("project_health_live_test_module", "scripts/python/_project_health_live.py")
+
+
+def _write_json(path: Path, payload: dict[str, object]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+class ProjectHealthLiveServerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        _write_json(
+            self.root / "logs" / "ci" / "project-health" / "doctor-project.latest.json",
+            {"kind": "doctor-project", "status": "warn", "summary": "doctor warn"},
+        )
+        for index in range(3):
+            _write_json(self.root / "logs" / "ci" / "reports" / f"r{index}.json", {"kind": f"r{index}", "status": "ok"})
+        self.server, self.stop = live_module.build_live_server(root=self.root, host="127.0.0.1", port=0, poll_sec=60)
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self) -> None:
+        self.stop.set()
+        self.server.shutdown()
+        self.server.server_close()
+        self._tmp.cleanup()
+
+    def _get(self, path: str, headers: dict[str, str] | None = None):
+        request = urllib.request.Request(f"http://127.0.0.1:{self.port}{path}", headers=headers or {})
+        try:
+            with urllib.request.urlopen(request, timeout=5) as resp:
+                return resp.status, dict(resp.headers), resp.read()
+        except urllib.error.HTTPError as exc:
+            return exc.code, dict(exc.headers), exc.read()
+
+    def test_api_should_serve_records_and_paginated_catalog_from_memory(self) -> None:
+        status, _, body = self._get("/api/records")
+        self.assertEqual(200, status)
+        payload = json.loads(body)
+        self.assertEqual("warn", payload["status"])
+        self.assertEqual(["doctor-project"], [item["kind"] for item in payload["records"]])
+
+        status, _, body = self._get("/api/catalog?page=2&page_size=2")
+        catalog = json.loads(body)
+        self.assertEqual(200, status)
+        self.assertEqual(4, catalog["total_json"])
+        self.assertEqual(2, catalog["page"])
+        self.assertEqual(2, catalog["total_pages"])
+        self.assertEqual(2, len(catalog["entries"]))
+
+        status, _, body = self._get("/api/active-tasks")
+        self.assertEqual(0, json.loads(body)["total"])
+
+        status, _, body = self._get("/api/catalog/entry?path=logs/ci/reports/r1.json")
+        self.assertEqual((200, "r1"), (status, json.loads(body)["kind"]))
+        status, _, _ = self._get("/api/catalog/entry?path=logs/ci/reports/missing.json")
+        self.assertEqual(404, status)
+
+    def test_etag_should_return_304_and_gzip_should_roundtrip(self) -> None:
+        status, headers, body = self._get("/latest.html", {"Accept-Encoding": "gzip"})
+        self.assertEqual(200, status)
+        self.assertEqual("gzip", headers.get("Content-Encoding"))
+        html_text = gzip.decompress(body).decode("utf-8")
+        self.assertIn("/api/events", html_text)
+        self.assertIn("Live updates are on", html_text)
+        self.assertNotIn("Auto-refresh is disabled", html_text)
+
+        status, _, body = self._get("/latest.html", {"If-None-Match": headers["ETag"]})
+        self.assertEqual(304, status)
+        self.assertEqual(b"", body)
+
+    def test_refresh_should_only_bump_version_when_inputs_change(self) -> None:
+        model = self.server.RequestHandlerClass.model
+        version = model.version
+        self.assertEqual([], model.refresh())
+        self.assertEqual(version, model.version)
+
+        _write_json(self.root / "logs" / "ci" / "reports" / "r9.json", {"kind": "r9", "status": "fail"})
+        self.assertEqual(["catalog", "html"], model.refresh())
+        self.assertEqual(version + 1, model.wait_for_change(version, timeout=0))
+        _, _, body = self._get("/api/catalog?page=1")
+        self.assertEqual(5, json.loads(body)["total_json"])
+
+    def test_refresh_should_notice_changes_to_files_referenced_by_active_task_sidecars(self) -> None:
+        model = self.server.RequestHandlerClass.model
+        out_dir = self.root / "logs" / "ci" / "2026-10-19" / "sc-review-pipeline-task-7"
+        _write_json(out_dir / "latest.json", {"latest_out_dir": str(out_dir)})
+        _write_json(out_dir / "summary.json", {"status": "ok", "steps": []})
+        _write_json(
+            self.root / "logs" / "ci" / "active-tasks" / "task-7.active.json",
+            {
+                "task_id": "7",
+                "status": "ok",
+                "paths": {"latest_json": str(out_dir / "latest.json"), "summary_json": str(out_dir / "summary.json")},
+            },
+        )
+        self.assertIn("active-tasks", model.refresh())
+        self.assertNotIn("active-tasks", model.refresh())
+
+        _write_json(out_dir / "summary.json", {"status": "fail", "steps": [{"name": "sc-test", "status": "fail"}]})
+        self.assertIn("active-tasks", model.refresh())
+        _write_json(out_dir / "latest.json", {"latest_out_dir": str(out_dir), "status": "fail"})
+        self.assertIn("active-tasks", model.refresh())
+        (out_dir / "summary.json").unlink()
+        self.assertIn("active-tasks", model.refresh())
+        self.assertNotIn("active-tasks", model.refresh())
+
+
+if __name__ == "__main__":
+    unittest.main()
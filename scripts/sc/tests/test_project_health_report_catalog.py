@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import datetime as dt
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PYTHON_DIR = REPO_ROOT / "scripts" / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+
+def _load_module(name: str, relative_path: str):
+    path = REPO_ROOT / relative_path
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise AssertionError(f"failed to load module: {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+project_health_common = _load_module("project_health_report_catalog_common_module", "scripts/python/_project_health_common.py")
+log_lifecycle = _load_module("project_health_report_catalog_lifecycle_module", "scripts/python/_log_lifecycle.py")
+project_health_schema = _load_module("project_health_report_catalog_schema_module", "scripts/python/_project_health_schema.py")
+
+
+def _write_json(path: Path, payload: object, *, mtime: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+class ProjectHealthReportCatalogTests(unittest.TestCase):
+    def test_index_should_only_reparse_new_or_changed_files_and_drop_deleted(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            logs = root / "logs" / "ci"
+            _write_json(logs / "a" / "one.json", {"kind": "one", "status": "ok"}, mtime=1_700_000_000)
+            _write_json(logs / "b" / "two.json", {"cmd": "two", "result": "fail"}, mtime=1_700_000_100)
+            (logs / "b" / "broken.json").write_text("{not json", encoding="utf-8")
+            os.utime(logs / "b" / "broken.json", (1_700_000_050, 1_700_000_050))
+
+            first = project_health_common.build_report_catalog(root)
+            self.assertEqual(3, first["total_json"])
+            self.assertEqual(1, first["invalid_json"])
+            self.assertTrue(project_health_common.report_catalog_index_path(root).is_file())
+
+            real_read_json = project_health_common.read_json
+            with mock.patch.object(project_health_common, "read_json", side_effect=real_read_json) as read_json:
+                unchanged = project_health_common.build_report_catalog(root)
+            self.assertEqual(first, unchanged)
+            read_paths = [Path(call.args[0]).name for call in read_json.call_args_list]
+            self.assertEqual(["report-catalog.index.json"], read_paths)
+
+            _write_json(logs / "a" / "one.json", {"kind": "one", "status": "warn", "pad": "x"}, mtime=1_700_000_200)
+            (logs / "b" / "two.json").unlink()
+            with mock.patch.object(project_health_common, "read_json", side_effect=real_read_json) as read_json:
+                updated = project_health_common.build_report_catalog(root)
+            read_paths = sorted(Path(call.args[0]).name for call in read_json.call_args_list)
+            self.assertEqual(["one.json", "report-catalog.index.json"], read_paths)
+            self.assertEqual(2, updated["total_json"])
+            self.assertEqual(["logs/ci/a/one.json", "logs/ci/b/broken.json"], [item["path"] for item in updated["entries"]])
+            self.assertEqual("warn", updated["entries"][0]["status"])
+            project_health_schema.validate_project_health_report_catalog_payload(updated)
+
+    def test_large_reports_should_use_bounded_head_parse(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            payload = {"kind": "big-report", "status": "ok", "summary": "head only", "rows": ["x" * 64] * 200}
+            _write_json(root / "logs" / "ci" / "big.json", payload, mtime=1_700_000_000)
+            with mock.patch.dict(os.environ, {"PROJECT_HEALTH_REPORT_CATALOG_FULL_PARSE_MAX_BYTES": "1024"}):
+                catalog = project_health_common.build_report_catalog(root)
+
+            entry = catalog["entries"][0]
+            self.assertEqual("big-report", entry["kind"])
+            self.assertEqual("ok", entry["status"])
+            self.assertEqual("head only", entry["summary"])
+            self.assertEqual("", entry["parse_error"])
+            self.assertEqual({}, entry["highlights"])
+
+    def test_catalog_pages_should_keep_newest_first_and_write_on_demand(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for index in range(5):
+                _write_json(root / "logs" / "ci" / f"r{index}.json", {"kind": f"r{index}"}, mtime=1_700_000_000 + index)
+
+            first_page = project_health_common.build_report_catalog(root, page=1, page_size=2)
+            self.assertEqual(5, first_page["total_json"])
+            self.assertEqual(3, first_page["total_pages"])
+            self.assertEqual(["r4", "r3"], [item["kind"] for item in first_page["entries"]])
+            project_health_schema.validate_project_health_report_catalog_payload(first_page)
+
+            page_path = project_health_common.write_report_catalog_page(root, page=3, page_size=2)
+            self.assertEqual("report-catalog.page-0003.json", page_path.name)
+            last_page = json.loads(page_path.read_text(encoding="utf-8"))
+            self.assertEqual(["r0"], [item["kind"] for item in last_page["entries"]])
+
+            again = project_health_common.build_report_catalog(root)
+            self.assertEqual(5, again["total_json"])
+
+
+    def test_archived_runs_should_stay_listed_and_restore_on_access(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            logs = root / "logs" / "ci"
+            run_dir = logs / "2026-04-20" / "sc-test-run-a"
+            _write_json(run_dir / "summary.json", {"kind": "sc-test", "status": "fail"}, mtime=1_776_000_000)
+            _write_json(logs / "hot.json", {"kind": "hot", "status": "ok"}, mtime=1_776_100_000)
+            policy = {"areas": ["logs/ci"], "hot_days": 3, "families": [{"name": "default", "match": ["*"], "keep_days": 30}]}
+            log_lifecycle.apply_log_lifecycle(root, policy, today=dt.date(2026, 4, 30))
+            self.assertFalse(run_dir.exists())
+
+            catalog = project_health_common.build_report_catalog(root)
+            archived = {item["path"]: item for item in catalog["entries"]}["logs/ci/2026-04-20/sc-test-run-a/summary.json"]
+            self.assertEqual(2, catalog["total_json"])
+            self.assertEqual(("summary", "archived"), (archived["kind"], archived["status"]))
+            project_health_schema.validate_project_health_report_catalog_payload(catalog)
+
+            with mock.patch.object(project_health_common.zipfile, "ZipFile", side_effect=AssertionError("zip reopened")):
+                self.assertEqual(catalog, project_health_common.build_report_catalog(root))
+            self.assertFalse(run_dir.exists())
+
+            self.assertIsNone(project_health_common.resolve_report_catalog_entry(root, "logs/ci/../../outside.json"))
+            entry = project_health_common.resolve_report_catalog_entry(root, archived["path"])
+            self.assertEqual(("sc-test", "fail"), (entry["kind"], entry["status"]))
+            self.assertTrue((run_dir / "summary.json").is_file())
+
+            restored = project_health_common.build_report_catalog(root)
+            self.assertEqual(2, restored["total_json"])
+            self.assertIn({"path": archived["path"], "status": "fail"}, [{"path": item["path"], "status": item["status"]} for item in restored["entries"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PYTHON_DIR = REPO_ROOT / "scripts" / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import _reference_graph as reference_graph  # noqa: E402
+import check_tasks_all_refs  # noqa: E402
+import check_tasks_back_references  # noqa: E402
+import remind_overlay_task_drift  # noqa: E402
+
+
+OVERLAY = "docs/architecture/overlays/PRD-X/08"
+CHECKLIST = (
+    "---\n"
+    "PRD-ID: PRD-X\n"
+    "ADR-Refs:\n"
+    "  - ADR-0001\n"
+    "  - ADR-0042\n"
+    "Test-Refs:\n"
+    "  - Game.Core.Tests/XTests.cs\n"
+    "---\n"
+    "See `Game.Core/Contracts/X/XCreated.cs` and `Game.Core/Contracts/X/Gone.cs`.\n"
+)
+
+
+def _write(root: Path, rel: str, text: str) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _repo(root: Path) -> None:
+    _write(root, "docs/adr/ADR-0001-first.md", "# ADR-0001\n")
+    _write(root, "docs/adr/ADR-0002-second.md", "# ADR-0002\n")
+    _write(root, "docs/adr/README.md", "# ADRs\n")
+    _write(root, f"{OVERLAY}/_index.md", "# X\n")
+    _write(root, f"{OVERLAY}/ACCEPTANCE_CHECKLIST.md", CHECKLIST)
+    _write(root, f"{OVERLAY}/08-Unused.md", "# unused\n")
+    (root / OVERLAY / "assets").mkdir()
+    _write(root, "Game.Core/Contracts/X/XCreated.cs", "namespace Game.Core.Contracts.X;\n")
+    _write(root, "Game.Core/Contracts/X/XRemoved.cs", "namespace Game.Core.Contracts.X;\n")
+    _write(root, "Game.Core.Tests/XTests.cs", "public class XTests {}\n")
+    back = [
+        {
+            "id": "X-1",
+            "adr_refs": ["ADR-0001"],
+            "overlay_refs": [f"{OVERLAY}/_index.md", f"{OVERLAY}/ACCEPTANCE_CHECKLIST.md"],
+            "depends_on": [],
+        },
+        {
+            "id": "X-2",
+            "adr_refs": ["ADR-0009"],
+            "overlay": f"{OVERLAY}\\ACCEPTANCE_CHECKLIST.md",
+            "overlay_refs": [f"{OVERLAY}/missing.md"],
+            "depends_on": ["X-1", "X-7"],
+        },
+    ]
+    _write(root, ".taskmaster/tasks/tasks_back.json", json.dumps(back))
+    _write(root, ".taskmaster/tasks/tasks.json", json.dumps({"master": {"tasks": [{"id": 1, "overlay": f"{OVERLAY}/_index.md"}]}}))
+
+
+class ReferenceGraphTests(unittest.TestCase):
+    def setUp(self) -> None:
+        reference_graph.reset_reference_graph()
+        self.addCleanup(reference_graph.reset_reference_graph)
+
+    def test_graph_should_answer_target_orphan_and_back_ref_queries(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _repo(root)
+            with mock.patch.dict(os.environ, {reference_graph.CACHE_ENV: "off"}, clear=False):
+                graph = reference_graph.load_reference_graph(root)
+
+                self.assertEqual({"ADR-0001", "ADR-0002"}, graph.adr_ids())
+                self.assertEqual([f"{OVERLAY}/_index.md"], graph.overlay_indexes())
+                self.assertNotIn(f"{OVERLAY}/assets", graph.overlay_paths())
+                self.assertIn(f"{OVERLAY}/assets", graph.overlay_paths(include_dirs=True))
+                self.assertEqual(
+                    [
+                        ("task:tasks_back.json#X-2", "adr:ADR-0009"),
+                        ("task:tasks_back.json#X-2", f"overlay:{OVERLAY}/missing.md"),
+                        ("task:tasks_back.json#X-2", "task:tasks_back.json#X-7"),
+                        (f"overlay:{OVERLAY}/ACCEPTANCE_CHECKLIST.md", "adr:ADR-0042"),
+                        (f"overlay:{OVERLAY}/ACCEPTANCE_CHECKLIST.md", "contract:Game.Core/Contracts/X/Gone.cs"),
+                    ],
+                    [(edge.source, edge.target) for edge in graph.missing_targets()],
+                )
+                self.assertEqual(["adr:ADR-0002"], graph.orphans("adr"))
+                self.assertEqual([f"overlay:{OVERLAY}/08-Unused.md"], graph.orphans("overlay"))
+                self.assertEqual(["contract:Game.Core/Contracts/X/XRemoved.cs"], graph.orphans("contract"))
+                self.assertEqual(
+                    ["task:tasks.json#1", "task:tasks_back.json#X-1"],
+                    [edge.source for edge in graph.back_refs(f"overlay:{OVERLAY}/_index.md")],
+                )
+                self.assertTrue(graph.exists("test:Game.Core.Tests/XTests.cs"))
+            self.assertFalse((root / "logs").exists())
+
+    def test_validators_should_keep_their_overlay_rules_on_the_graph(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _repo(root)
+            with mock.patch.dict(os.environ, {reference_graph.CACHE_ENV: "off"}, clear=False):
+                files_only = check_tasks_all_refs.collect_overlay_paths(root)
+                with_dirs = check_tasks_back_references.collect_overlay_paths(root)
+                indexes = remind_overlay_task_drift._task_derived_overlay_indexes(root)
+                stats = reference_graph.load_reference_graph(root).stats
+
+        self.assertEqual({f"{OVERLAY}/assets"}, with_dirs - files_only)
+        # Every task-side overlay ref (including the backslash one) maps to the same _index.md.
+        self.assertEqual([Path(f"{OVERLAY}/_index.md")], indexes)
+        # Only the task files were read; overlay docs are not needed for task-derived indexes.
+        self.assertEqual(2, stats["parsed"])
+
+    def test_cache_should_reparse_only_changed_files(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            _repo(root)
+            cache_file = root / "cache" / "graph.json"
+            with mock.patch.dict(os.environ, {reference_graph.CACHE_ENV: str(cache_file)}, clear=False):
+                first = reference_graph.load_reference_graph(root).edges()
+                self.assertEqual([cache_file], reference_graph.save_reference_graph())
+
+                reference_graph.reset_reference_graph()
+                graph = reference_graph.load_reference_graph(root)
+                self.assertEqual(first, graph.edges())
+                self.assertEqual({"parsed": 0, "reused": 5}, graph.stats)
+
+                _write(root, f"{OVERLAY}/08-Unused.md", "---\nADR-Refs:\n  - ADR-0002\n---\n")
+                reference_graph.reset_reference_graph()
+                graph = reference_graph.load_reference_graph(root)
+                orphans = graph.orphans("adr")
+
+        self.assertEqual({"parsed": 1, "reused": 4}, graph.stats)
+        self.assertEqual([], orphans)
+
+
+if __name__ == "__main__":
+    unittest.main()
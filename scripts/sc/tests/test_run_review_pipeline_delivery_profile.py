@@ -693,6 +693,59 @@ class RunReviewPipelineDeliveryProfileTests(unittest.TestCase):
 
             self.assertEqual({"security-auditor": 480}, overrides)
 
+    def test_derive_llm_agent_timeout_overrides_should_apply_latency_model_per_agent(self) -> None:
+        import _latency_model as latency_model
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            for seconds in range(100, 110):
+                latency_model.record_latency(latency_model.latency_key("sc-llm-review", agent="code-reviewer"), seconds, outcome="ok", root=root)
+
+            with mock.patch.object(run_review_pipeline_module, "repo_root", return_value=root):
+                overrides = run_review_pipeline_module._derive_llm_agent_timeout_overrides(
+                    current_out_dir=root / "logs" / "ci" / "2026-04-03" / "sc-review-pipeline-task-1-newrun",
+                    task_id="1",
+                    delivery_profile="fast-ship",
+                    security_profile="host-safe",
+                    llm_agents="code-reviewer,security-auditor",
+                    llm_semantic_gate="skip",
+                    llm_timeout_sec=900,
+                    llm_agent_timeout_sec=240,
+                )
+
+            self.assertEqual(["code-reviewer"], list(overrides))
+            self.assertLess(overrides["code-reviewer"], 240)
+            self.assertGreaterEqual(overrides["code-reviewer"], 100)
+
+    def test_derive_llm_agent_timeout_overrides_should_read_the_backend_llm_review_records_under(self) -> None:
+        import _latency_model as latency_model
+
+        with tempfile.TemporaryDirectory() as td, mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("SC_LLM_BACKEND", None)
+            root = Path(td)
+            for seconds in range(100, 110):
+                # The key _llm_review_engine records under for --llm-backend openai-api.
+                key = latency_model.latency_key("sc-llm-review", agent="code-reviewer", backend="openai-api", prompt_chars=9000)
+                latency_model.record_latency(key, seconds, outcome="ok", root=root)
+
+            kwargs = {
+                "current_out_dir": root / "logs" / "ci" / "2026-04-03" / "sc-review-pipeline-task-1-newrun",
+                "task_id": "1",
+                "delivery_profile": "fast-ship",
+                "security_profile": "host-safe",
+                "llm_agents": "code-reviewer",
+                "llm_semantic_gate": "skip",
+                "llm_timeout_sec": 900,
+                "llm_agent_timeout_sec": 240,
+            }
+            with mock.patch.object(run_review_pipeline_module, "repo_root", return_value=root):
+                openai_overrides = run_review_pipeline_module._derive_llm_agent_timeout_overrides(**kwargs, llm_backend="openai-api")
+                default_overrides = run_review_pipeline_module._derive_llm_agent_timeout_overrides(**kwargs)
+
+            self.assertEqual(["code-reviewer"], list(openai_overrides))
+            self.assertLess(openai_overrides["code-reviewer"], 240)
+            self.assertEqual({}, default_overrides)
+
     def test_resolve_pipeline_profiles_should_reject_explicit_mismatch_on_resume(self) -> None:
         with self.assertRaisesRegex(RuntimeError, "delivery profile"):
             run_review_pipeline_module._resolve_pipeline_profiles(
@@ -29,6 +29,7 @@ def _load_module(name: str, relative_path: str):
 
 
 lane = _load_module("single_task_light_lane_module", "scripts/python/run_single_task_light_lane.py")
+import _latency_model as latency_model  # noqa: E402
 
 
 def _write_master_tasks(path: Path, tasks: list[dict[str, object]]) -> None:
@@ -934,6 +935,198 @@ class RunSingleTaskLightLaneTests(unittest.TestCase):
             self.assertEqual("", payload["artifact_integrity"])
             self.assertEqual("no", payload["residual_recording"])
 
+    def test_main_jobs_should_run_tasks_concurrently_with_llm_cap_and_ordered_results(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            tasks_path = root / ".taskmaster" / "tasks" / "tasks.json"
+            _write_master_tasks(tasks_path, [{"id": task_id, "status": "in-progress"} for task_id in (11, 12, 13, 14)])
+            out_dir = root / "logs" / "ci" / "parallel"
+            argv = [
+                "run_single_task_light_lane.py",
+                "--task-ids",
+                "11,12,13,14",
+                "--batch-lane",
+                "standard",
+                "--jobs",
+                "4",
+                "--llm-concurrency",
+                "2",
+                "--out-dir",
+                str(out_dir),
+            ]
+            lock = lane.threading.Lock()
+            overlap = lane.threading.Event()
+            state = {"llm_running": 0, "llm_peak": 0, "task_order": {}}
+
+            def _fake_run_step(_root: Path, cmd: list[str], *, timeout_sec: int):
+                raw_ids = cmd[cmd.index("--task-id") + 1] if "--task-id" in cmd else cmd[cmd.index("--task-ids") + 1]
+                is_llm = "preflight_acceptance_extract_guard.py" not in " ".join(cmd)
+                with lock:
+                    for task_id in lane._parse_task_ids_csv(raw_ids):
+                        state["task_order"].setdefault(task_id, []).append(cmd[2])
+                    if is_llm:
+                        state["llm_running"] += 1
+                        state["llm_peak"] = max(state["llm_peak"], state["llm_running"])
+                        if state["llm_running"] >= 2:
+                            overlap.set()
+                # Hold LLM slots until a second one is taken so the peak does not depend on scheduler timing.
+                if is_llm:
+                    overlap.wait(timeout=2.0)
+                else:
+                    lane.time.sleep(0.01)
+                with lock:
+                    if is_llm:
+                        state["llm_running"] -= 1
+                return 0, "ok", ""
+
+            with mock.patch.object(sys, "argv", argv), \
+                mock.patch.object(lane, "_repo_root", return_value=root), \
+                mock.patch.object(lane, "_run_step", side_effect=_fake_run_step):
+                rc = lane.main()
+
+            self.assertEqual(0, rc)
+            self.assertLessEqual(state["llm_peak"], 2)
+            self.assertGreaterEqual(state["llm_peak"], 2)
+            payload = json.loads((out_dir / "summary.json").read_text(encoding="utf-8"))
+            self.assertEqual([11, 12, 13, 14], [row["task_id"] for row in payload["results"]])
+            self.assertEqual(4, payload["jobs"])
+            self.assertEqual(2, payload["llm_concurrency"])
+            self.assertEqual(4, payload["passed_tasks"])
+            self.assertEqual(4, payload["coalesce_stats"]["semantic_gate"]["requests"])
+            first_order = state["task_order"][11]
+            self.assertEqual("scripts/python/preflight_acceptance_extract_guard.py", first_order[0])
+            self.assertEqual("scripts/sc/llm_extract_task_obligations.py", first_order[1])
+            for order in state["task_order"].values():
+                self.assertEqual(first_order, order)
+
+    def test_isolate_shared_out_dirs_should_round_id_only_shared_dir_steps(self) -> None:
+        steps = lane._isolate_shared_out_dirs(lane._steps(align_apply=True, delivery_profile="fast-ship", llm_timeout_sec=None))
+        by_name = dict(steps)
+        self.assertEqual(["--round-id", "lane-t{id}"], by_name["align"][-2:])
+        self.assertEqual(["--round-id", "lane-t{id}"], by_name["fill_refs_write"][-2:])
+        self.assertNotIn("--round-id", by_name["extract"])
+        self.assertNotIn("--round-id", by_name["preflight_extract_guard"])
+
+    def test_run_step_with_retry_should_use_learned_timeout_and_record_latency(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            key = lane.latency_key("light-lane:extract")
+            for seconds in range(40, 50):
+                lane.record_latency(key, seconds, outcome="ok", root=root)
+            observed: list[tuple[list[str], int]] = []
+
+            def _fake_run_step(_root: Path, cmd: list[str], *, timeout_sec: int):
+                observed.append((list(cmd), int(timeout_sec)))
+                return 124, "", "timeout"
+
+            with mock.patch.object(lane, "_run_step", side_effect=_fake_run_step), \
+                mock.patch.object(lane, "plan_timeout_retry", return_value={"action": "stop", "reason": "deadline_budget_exhausted", "timeout_sec": 0}):
+                rc, _stdout, _stderr, meta = lane._run_step_with_retry(
+                    root=root,
+                    cmd=["py", "-3", "scripts/sc/llm_extract_task_obligations.py", "--task-id", "1"],
+                    step_name="extract",
+                    delivery_profile="fast-ship",
+                    explicit_timeout_sec=None,
+                    llm_timeout_sec=None,
+                )
+
+            self.assertEqual(124, rc)
+            self.assertEqual(1, len(observed))
+            inner_timeout = int(observed[0][0][observed[0][0].index("--timeout-sec") + 1])
+            self.assertLess(inner_timeout, 240)
+            self.assertEqual(inner_timeout + lane._TIMEOUT_BUFFER_SEC, observed[0][1])
+            self.assertEqual("model", meta["timeout_model"]["source"])
+            self.assertEqual("stop", meta["timeout_model"]["retry_plan"]["action"])
+            self.assertEqual(1, latency_model.load_model(root)[key].outcomes["timeout"])
+
+    def test_run_step_with_retry_should_keep_batch_latency_apart_from_single_task_latency(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            single_key = lane.latency_key("light-lane:semantic_gate")
+            batch_key = lane.latency_key("light-lane:semantic_gate", agent="batch-4")
+            for seconds in range(10, 20):
+                lane.record_latency(single_key, seconds, outcome="ok", root=root)
+            observed: list[list[str]] = []
+
+            def _fake_run_step(_root: Path, cmd: list[str], *, timeout_sec: int):
+                observed.append(list(cmd))
+                return 0, "", ""
+
+            with mock.patch.object(lane, "_run_step", side_effect=_fake_run_step):
+                _rc, _stdout, _stderr, meta = lane._run_step_with_retry(
+                    root=root,
+                    cmd=["py", "-3", "scripts/sc/llm_semantic_gate_all.py", "--task-ids", "1,2,3,4"],
+                    step_name="semantic_gate",
+                    delivery_profile="fast-ship",
+                    explicit_timeout_sec=None,
+                    llm_timeout_sec=None,
+                    batch_size=4,
+                )
+
+            model = latency_model.load_model(root)
+            self.assertEqual("static", meta["timeout_model"]["source"])
+            self.assertEqual(batch_key, meta["timeout_model"]["key"])
+            self.assertNotIn("--timeout-sec", observed[0])
+            self.assertEqual(10, model[single_key].samples)
+            self.assertEqual(1, model[batch_key].samples)
+
+    def test_run_coalesced_semantic_gate_should_split_one_batch_into_per_task_results(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            date_dir = root / "logs" / "ci" / "2026-03-28"
+            calls: list[list[str]] = []
+            batch_sizes: list[int] = []
+
+            def _fake_run(**kwargs):
+                cmd = list(kwargs["cmd"])
+                calls.append(cmd)
+                batch_sizes.append(kwargs["batch_size"])
+                batch_dir = date_dir / f"sc-semantic-gate-all-round-{cmd[cmd.index('--round-id') + 1]}"
+                batch_dir.mkdir(parents=True, exist_ok=True)
+                (batch_dir / "batch-01.tsv").write_text("T11\tOK\tfine\nT12\tNeeds Fix\tgap\n", encoding="utf-8")
+                summary = {
+                    "cmd": "sc-semantic-gate-all",
+                    "total_tasks": 2,
+                    "needs_fix": [12],
+                    "unknown": [],
+                    "findings": [
+                        {"task_id": 11, "verdict": "OK", "reason": "fine"},
+                        {"task_id": 12, "verdict": "Needs Fix", "reason": "gap"},
+                    ],
+                    "max_needs_fix": 0,
+                    "max_unknown": 3,
+                    "status": "fail",
+                    "batch_meta": [{"task_count": 2, "prompt_chars": 900}],
+                }
+                (batch_dir / "summary.json").write_text(json.dumps(summary) + "\n", encoding="utf-8")
+                stdout = f"SC_SEMANTIC_GATE_ALL status=fail needs_fix=1 unknown=0 out={batch_dir}\n"
+                return 1, stdout, "", {"retry_count": 0, "retry_rcs": [1], "attempt_count": 1, "attempts": [{"attempt": 1, "rc": 1, "cmd": cmd, "stdout": stdout, "stderr": ""}]}
+
+            base = ["py", "-3", "scripts/sc/llm_semantic_gate_all.py", "--task-ids", "{id}", "--max-needs-fix", "0", "--round-id", "lane-t{id}"]
+            items = [(task_id, [part.format(id=task_id) for part in base]) for task_id in (11, 12)]
+            with mock.patch.object(lane, "_run_step_with_retry", side_effect=_fake_run):
+                results = lane._run_coalesced_semantic_gate(
+                    items,
+                    root=root,
+                    delivery_profile="fast-ship",
+                    explicit_timeout_sec=None,
+                    llm_timeout_sec=None,
+                )
+
+            self.assertEqual(1, len(calls))
+            self.assertEqual("11,12", calls[0][calls[0].index("--task-ids") + 1])
+            self.assertEqual("2", calls[0][calls[0].index("--batch-size") + 1])
+            self.assertEqual([2], batch_sizes)
+            self.assertEqual(0, results[11][0])
+            self.assertEqual(1, results[12][0])
+            task_dir = date_dir / "sc-semantic-gate-all-round-lane-t11"
+            self.assertEqual(task_dir, lane._extract_inner_out_dir(results[11][1], results[11][2]))
+            task_summary = json.loads((task_dir / "summary.json").read_text(encoding="utf-8"))
+            self.assertEqual("ok", task_summary["status"])
+            self.assertEqual([11, 12], task_summary["coalesced"]["task_ids"])
+            self.assertEqual("T11\tOK\tfine\n", (task_dir / "batch-01.tsv").read_text(encoding="utf-8"))
+            self.assertEqual(task_dir, lane._extract_inner_out_dir(str(results[11][3]["attempts"][-1]["stdout"]), ""))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,6 +5,7 @@ import importlib.util
 import json
 import sys
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -779,6 +780,76 @@ class RunSingleTaskLightLaneBatchTests(unittest.TestCase):
             self.assertEqual(480, summary["rolling_extract"]["current_llm_timeout_sec"])
             self.assertEqual(2, summary["rolling_extract"]["current_max_tasks_per_shard"])
 
+    def test_parallel_shards_should_run_concurrently_and_merge_in_shard_order(self) -> None:
+        def _run(out_dir: Path, root: Path, parallel: int) -> tuple[dict, dict, list[int]]:
+            finished: list[int] = []
+            second_done = threading.Event()
+
+            def fake_run_command(_root: Path, cmd: list[str]):
+                task_ids = [int(part) for part in cmd[cmd.index("--task-ids") + 1].split(",")]
+                if parallel > 1 and task_ids[0] == 11:
+                    self.assertTrue(second_done.wait(5), "second shard never ran alongside the first")
+                shard_out_dir = Path(cmd[cmd.index("--out-dir") + 1])
+                shard_out_dir.mkdir(parents=True, exist_ok=True)
+                results = [
+                    {"task_id": task_id, "ok": True, "failed_steps": [], "first_failed_step": "", "steps": [{"step": "extract", "rc": 0}]}
+                    for task_id in task_ids
+                ]
+                payload = {"task_id_start": task_ids[0], "task_id_end": task_ids[-1], "task_count": len(task_ids), "status": "ok", "results": results}
+                (shard_out_dir / "summary.json").write_text(json.dumps(payload) + "\n", encoding="utf-8")
+                finished.append(task_ids[0])
+                if task_ids[0] == 13:
+                    second_done.set()
+
+                class _Result:
+                    returncode = 0
+                    stdout = "ok\n"
+                    stderr = ""
+
+                return _Result()
+
+            argv = [
+                "run_single_task_light_lane_batch.py",
+                "--task-ids",
+                "11,12,13,14",
+                "--max-tasks-per-shard",
+                "2",
+                "--parallel-shards",
+                str(parallel),
+                "--out-dir",
+                str(out_dir),
+            ]
+            with mock.patch.object(batch, "_repo_root", return_value=root), mock.patch.object(
+                batch, "_selected_task_ids", return_value=[11, 12, 13, 14]
+            ), mock.patch.object(batch, "_run_command", side_effect=fake_run_command), mock.patch.object(sys, "argv", argv):
+                self.assertEqual(0, batch.main())
+            summary = json.loads((out_dir / "summary.json").read_text(encoding="utf-8"))
+            merged = json.loads((out_dir / "merged" / "summary.json").read_text(encoding="utf-8"))
+            return summary, merged, finished
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            parallel_summary, parallel_merged, parallel_finished = _run(root / "logs" / "ci" / "run", root, 2)
+            sequential_summary, sequential_merged, _ = _run(root / "logs" / "ci" / "run", root, 1)
+
+        self.assertEqual([13, 11], parallel_finished)
+        self.assertEqual(2, parallel_summary["parallel_shards"])
+        self.assertEqual([1, 2], [shard["index"] for shard in parallel_summary["shards"]])
+        for key in ["covered_count", "passed_task_ids", "task_source_candidates", "validation"]:
+            self.assertEqual(sequential_merged.get(key), parallel_merged.get(key), key)
+        self.assertEqual(sequential_summary["covered_count"], parallel_summary["covered_count"])
+
+    def test_timeout_backoff_should_ignore_shards_launched_before_latest_adjustment(self) -> None:
+        args = batch.build_parser().parse_args(["--llm-timeout-sec", "300", "--max-tasks-per-shard", "4"])
+        state = batch._new_rolling_extract_state(args)
+        spike = {"extract_observed_tasks": 4, "extract_timeout_rate": 1.0}
+        state = batch._apply_timeout_backoff(state=state, shard_entry=spike, args=args, shard_index=1, launched_generation=0)
+        state = batch._apply_timeout_backoff(state=state, shard_entry=spike, args=args, shard_index=2, launched_generation=0)
+        self.assertEqual(1, state["backoff_adjustment_count"])
+        self.assertEqual(480, state["current_llm_timeout_sec"])
+        state = batch._apply_timeout_backoff(state=state, shard_entry=spike, args=args, shard_index=3, launched_generation=1)
+        self.assertEqual(660, state["current_llm_timeout_sec"])
+
 
 if __name__ == "__main__":
     unittest.main()
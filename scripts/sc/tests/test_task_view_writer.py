@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+SC_DIR = Path(__file__).resolve().parents[1]
+if str(SC_DIR) not in sys.path:
+    sys.path.insert(0, str(SC_DIR))
+
+import _task_view_writer as writer  # noqa: E402
+
+
+def _write_view(path: Path, entries: list[dict[str, object]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(entries, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def _read_view(path: Path) -> list[dict[str, object]]:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+class TaskViewWriterTests(unittest.TestCase):
+    def test_commits_from_stale_copies_should_not_clobber_each_other(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            view = root / ".taskmaster" / "tasks" / "tasks_back.json"
+            _write_view(view, [{"taskmaster_id": 1, "acceptance": ["a"]}, {"taskmaster_id": 2, "acceptance": ["b"]}, {"note": "keep"}])
+
+            worker_a = _read_view(view)
+            worker_b = _read_view(view)
+            worker_a[0]["acceptance"] = ["a2"]
+            worker_b[1]["acceptance"] = ["b2"]
+            writer.commit_view_entries(view, writer.collect_view_entries(worker_a, [1]), root=root)
+            result = writer.commit_view_entries(view, writer.collect_view_entries(worker_b, [2]), root=root)
+
+            self.assertEqual([2], result["task_ids"])
+            self.assertEqual(
+                [{"taskmaster_id": 1, "acceptance": ["a2"]}, {"taskmaster_id": 2, "acceptance": ["b2"]}, {"note": "keep"}],
+                _read_view(view),
+            )
+            self.assertFalse(writer.journal_path(view, root=root).exists())
+
+    def test_interrupted_commit_should_be_replayed_by_next_writer(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            view = root / "tasks_gameplay.json"
+            _write_view(view, [{"taskmaster_id": 1, "acceptance": []}, {"taskmaster_id": 2, "acceptance": []}])
+            journal = writer.journal_path(view, root=root)
+            journal.parent.mkdir(parents=True, exist_ok=True)
+            journal.write_text(
+                json.dumps({"entries": {"1": {"taskmaster_id": 1, "acceptance": ["from crashed writer"]}}}) + "\n" + '{"entries": {"2"',
+                encoding="utf-8",
+            )
+
+            result = writer.commit_view_entries(view, {2: {"taskmaster_id": 2, "acceptance": ["new"]}}, root=root)
+
+            self.assertEqual([1], result["replayed_task_ids"])
+            self.assertEqual(["from crashed writer"], _read_view(view)[0]["acceptance"])
+            self.assertEqual(["new"], _read_view(view)[1]["acceptance"])
+            self.assertFalse(journal.exists())
+
+    def test_failed_commit_should_not_be_replayed(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            view = root / "tasks_back.json"
+            view.write_text('[{"taskmaster_id": 1,', encoding="utf-8")
+            journal = writer.journal_path(view, root=root)
+
+            with self.assertRaises(ValueError):
+                writer.commit_view_entries(view, {1: {"taskmaster_id": 1, "acceptance": ["lost"]}}, root=root)
+            self.assertFalse(journal.is_file() and journal.read_text(encoding="utf-8").strip())
+
+            _write_view(view, [{"taskmaster_id": 1, "acceptance": []}, {"taskmaster_id": 2, "acceptance": []}])
+            with mock.patch.object(writer, "_write_view_atomic", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    writer.commit_view_entries(view, {2: {"taskmaster_id": 2, "acceptance": ["lost too"]}}, root=root)
+            self.assertEqual("", journal.read_text(encoding="utf-8"))
+
+            result = writer.commit_view_entries(view, {}, root=root)
+            self.assertEqual([], result["replayed_task_ids"])
+            self.assertEqual([{"taskmaster_id": 1, "acceptance": []}, {"taskmaster_id": 2, "acceptance": []}], _read_view(view))
+
+    def test_duplicate_ids_should_replace_only_the_first_row(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            view = root / "tasks_back.json"
+            rows = [{"taskmaster_id": 1, "acceptance": ["a"]}, {"taskmaster_id": 1, "acceptance": ["dup"]}, {"taskmaster_id": 2}]
+            _write_view(view, rows)
+
+            edited = _read_view(view)
+            edited[0]["acceptance"] = ["a2"]
+            writer.commit_view_entries(view, writer.collect_view_entries(edited, [1]), root=root)
+
+            self.assertEqual(
+                [{"taskmaster_id": 1, "acceptance": ["a2"]}, {"taskmaster_id": 1, "acceptance": ["dup"]}, {"taskmaster_id": 2}],
+                _read_view(view),
+            )
+
+    def test_view_lock_should_be_exclusive(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            view = root / "tasks_back.json"
+            entered = threading.Event()
+            release = threading.Event()
+
+            def _hold() -> None:
+                with writer.view_lock(view, root=root):
+                    entered.set()
+                    release.wait(5)
+
+            holder = threading.Thread(target=_hold)
+            holder.start()
+            try:
+                self.assertTrue(entered.wait(5))
+                with self.assertRaises(TimeoutError):
+                    with writer.view_lock(view, root=root, timeout_sec=0.1):
+                        pass
+            finally:
+                release.set()
+                holder.join(5)
+            with writer.view_lock(view, root=root, timeout_sec=1):
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
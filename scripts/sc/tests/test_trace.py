@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SC_DIR = Path(__file__).resolve().parents[1]
+if str(SC_DIR) not in sys.path:
+    sys.path.insert(0, str(SC_DIR))
+
+import _trace as trace  # noqa: E402
+
+
+def _span(span_id: str, parent_id: str, name: str, ts_us: int, dur_us: int, *, pid: int = 1, cat: str = "sc") -> dict[str, object]:
+    return {
+        "trace_id": "t",
+        "span_id": span_id,
+        "parent_id": parent_id,
+        "name": name,
+        "cat": cat,
+        "pid": pid,
+        "tid": 1,
+        "ts_us": ts_us,
+        "dur_us": dur_us,
+        "args": {},
+    }
+
+
+class TraceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        trace.end_trace()
+        self._saved_context = os.environ.pop(trace.CONTEXT_ENV, None)
+        self._saved_switch = os.environ.pop(trace.SWITCH_ENV, None)
+
+    def tearDown(self) -> None:
+        trace.end_trace()
+        for key, value in ((trace.CONTEXT_ENV, self._saved_context), (trace.SWITCH_ENV, self._saved_switch)):
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    def test_span_should_be_a_noop_without_an_active_trace(self) -> None:
+        with trace.span("idle") as attrs:
+            self.assertIsNone(attrs)
+
+        self.assertFalse(trace.tracing_active())
+        self.assertIsNone(trace.child_env())
+        self.assertIsNone(trace.finish_trace())
+
+    def test_switch_off_should_not_start_a_trace(self) -> None:
+        os.environ[trace.SWITCH_ENV] = "off"
+        with tempfile.TemporaryDirectory() as td:
+            self.assertIsNone(trace.start_trace(Path(td)))
+            self.assertFalse((Path(td) / trace.TRACE_DIRNAME).exists())
+
+    def test_nested_spans_should_record_parents_and_merge_into_chrome_trace(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            out_dir = Path(td)
+            trace_id = trace.start_trace(out_dir, name="pipeline")
+            self.assertTrue(trace_id)
+            self.assertIn(trace_id, os.environ[trace.CONTEXT_ENV])
+            with trace.span("outer", cat="step") as outer:
+                outer["rc"] = 0
+                with trace.span("inner", cat="io"):
+                    inner_parent = trace.current_span_id()
+            summary = trace.finish_trace(top_n=5)
+
+            self.assertNotIn(trace.CONTEXT_ENV, os.environ)
+            self.assertFalse(trace.tracing_active())
+            self.assertEqual(3, summary["span_count"])
+            self.assertEqual(1, summary["process_count"])
+            spans = {item["name"]: item for item in trace.load_spans(out_dir / trace.TRACE_DIRNAME, trace_id=trace_id)}
+            self.assertEqual("", spans["pipeline"]["parent_id"])
+            self.assertEqual(spans["pipeline"]["span_id"], spans["outer"]["parent_id"])
+            self.assertEqual(spans["outer"]["span_id"], spans["inner"]["parent_id"])
+            self.assertEqual(spans["inner"]["span_id"], inner_parent)
+            self.assertEqual({"rc": 0}, spans["outer"]["args"])
+
+            payload = json.loads((out_dir / trace.TRACE_FILE).read_text(encoding="utf-8"))
+            complete = [event for event in payload["traceEvents"] if event["ph"] == "X"]
+            metadata = [event for event in payload["traceEvents"] if event["ph"] == "M"]
+            self.assertEqual(["pipeline", "outer", "inner"], [event["name"] for event in complete])
+            self.assertEqual(0, complete[0]["ts"])
+            self.assertEqual([{"name": "pipeline"}], [event["args"] for event in metadata])
+            self.assertEqual(trace_id, payload["otherData"]["trace_id"])
+
+    def test_child_process_should_join_trace_under_spawning_span(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            out_dir = Path(td)
+            trace_id = trace.start_trace(out_dir, name="parent")
+            code = "import _trace\nwith _trace.span('child-work', cat='io'):\n    pass\n"
+            with trace.span("spawn", cat="subprocess"):
+                spawn_id = trace.current_span_id()
+                proc = subprocess.run([sys.executable, "-c", code], cwd=str(SC_DIR), env=trace.child_env(), capture_output=True, text=True, timeout=60)
+            summary = trace.finish_trace()
+
+            self.assertEqual(0, proc.returncode, proc.stderr)
+            spans = {item["name"]: item for item in trace.load_spans(out_dir / trace.TRACE_DIRNAME, trace_id=trace_id)}
+            self.assertEqual(2, summary["process_count"])
+            self.assertEqual(spawn_id, spans["-c"]["parent_id"])
+            self.assertEqual("process", spans["-c"]["cat"])
+            self.assertEqual(spans["-c"]["span_id"], spans["child-work"]["parent_id"])
+            self.assertNotEqual(spans["parent"]["pid"], spans["child-work"]["pid"])
+
+    def test_self_time_table_should_subtract_overlapping_children_once(self) -> None:
+        spans = [
+            _span("root", "", "root", 0, 1000, cat="process"),
+            _span("a", "root", "work", 100, 400),
+            _span("b", "root", "work", 300, 400),
+            _span("c", "a", "leaf", 150, 50, pid=2),
+        ]
+
+        rows = {row["name"]: row for row in trace.self_time_table(spans)}
+
+        self.assertEqual(0.4, rows["root"]["self_ms"])
+        self.assertEqual(40.0, rows["root"]["self_pct"])
+        self.assertEqual(2, rows["work"]["count"])
+        self.assertEqual(0.75, rows["work"]["self_ms"])
+        self.assertEqual(0.8, rows["work"]["total_ms"])
+        self.assertEqual(["work", "root", "leaf"], [row["name"] for row in trace.self_time_table(spans)])
+        self.assertEqual(1, len(trace.self_time_table(spans, top_n=1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
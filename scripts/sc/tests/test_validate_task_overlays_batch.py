@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PYTHON_DIR = REPO_ROOT / "scripts" / "python"
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHON_DIR))
+
+import _front_matter as front_matter  # noqa: E402
+import validate_task_overlays  # noqa: E402
+
+
+SECTIONS = "一、文档完整性验收\n二、架构设计验收\n三、代码实现验收\n四、测试框架验收\n"
+
+
+def _checklist(adr: str) -> str:
+    return f"---\nPRD-ID: PRD-X\nTitle: Sample\nStatus: Draft\nADR-Refs:\n  - {adr}\nTest-Refs:\n  - a.cs\n---\n\n{SECTIONS}"
+
+
+class ReadHeadTests(unittest.TestCase):
+    def test_head_should_parse_like_the_whole_file_across_chunk_boundaries(self) -> None:
+        samples = [
+            _checklist("ADR-0001"),
+            "---\n   \n\n\t\nTitle: spaced\n---\nbody\n---\nmore\n",
+            "---\nTitle: dashes\n----\nbody\n",
+            "---\nTitle: never closed\n",
+            "no front matter\n---\nTitle: x\n---\n",
+            "---",
+            "",
+        ]
+        for size in (1, 2, 3, 5, 64):
+            with mock.patch.object(front_matter, "HEAD_CHUNK_CHARS", size):
+                for text in samples:
+                    handle = io.StringIO(text)
+                    head = front_matter.read_head(handle)
+                    self.assertEqual(front_matter.extract_front_matter(text), front_matter.parse_front_matter(head), (size, text))
+                    self.assertEqual(text, head + handle.read())
+
+    def test_head_should_stop_at_the_closing_marker(self) -> None:
+        with mock.patch.object(front_matter, "HEAD_CHUNK_CHARS", 8):
+            handle = io.StringIO("---\nTitle: t\n---\n" + "x" * 1000)
+            head = front_matter.read_head(handle)
+
+        self.assertLess(len(head), 40)
+
+
+class ValidateTaskOverlaysBatchTests(unittest.TestCase):
+    def _repo(self, root: Path, overlays: int) -> list[dict]:
+        tasks = []
+        for index in range(overlays):
+            base = f"docs/architecture/overlays/PRD-{index:02d}/08"
+            (root / base).mkdir(parents=True)
+            (root / base / "_index.md").write_text("# Overlay\n", encoding="utf-8")
+            adr = "ADR-0001" if index % 2 else "ADR-0404"
+            (root / base / "ACCEPTANCE_CHECKLIST.md").write_text(_checklist(adr), encoding="utf-8")
+            for copy in range(3):
+                refs = [f"{base}/_index.md", f"{base}/ACCEPTANCE_CHECKLIST.md"]
+                if copy == 2:
+                    refs.append(f"{base}/missing.md")
+                tasks.append({"id": f"T-{index:02d}-{copy}", "overlay_refs": refs})
+        return tasks
+
+    def _run(self, root: Path, task_files: list[Path]) -> tuple[list[tuple[int, int]], str, int]:
+        results: dict = {}
+        out = io.StringIO()
+        with mock.patch.object(
+            validate_task_overlays, "validate_acceptance_checklist", wraps=validate_task_overlays.validate_acceptance_checklist
+        ) as checklist, contextlib.redirect_stdout(out):
+            counts = [
+                validate_task_overlays.validate_task_file(root, path, path.name, {"ADR-0001"}, overlay_results=results)
+                for path in task_files
+            ]
+        return counts, out.getvalue(), checklist.call_count
+
+    def test_each_checklist_should_be_validated_once_for_all_tasks_and_files(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            tasks = self._repo(root, overlays=4)
+            gameplay = root / "tasks_gameplay.json"
+            gameplay.write_text(json.dumps(tasks), encoding="utf-8")
+            master = root / "tasks.json"
+            master.write_text(json.dumps({"master": {"tasks": tasks[::3]}}), encoding="utf-8")
+
+            counts, output, calls = self._run(root, [gameplay, master])
+
+        self.assertEqual(4, calls)
+        self.assertEqual([(12, 4), (4, 2)], counts)
+        self.assertEqual(8, output.count("ADR-Refs points to missing ADR: ADR-0404"))
+        self.assertEqual(4, output.count("overlay file does not exist"))
+
+    def test_pool_should_match_serial_output(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            task_file = root / "tasks_gameplay.json"
+            task_file.write_text(json.dumps(self._repo(root, overlays=12)), encoding="utf-8")
+
+            serial = self._run(root, [task_file])
+            with mock.patch.object(validate_task_overlays, "OVERLAY_POOL_MIN", 1):
+                pooled = self._run(root, [task_file])
+
+        self.assertEqual(serial, pooled)
+        self.assertEqual(12, pooled[2])
+
+
+if __name__ == "__main__":
+    unittest.main()